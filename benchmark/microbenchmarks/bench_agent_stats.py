@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Measure Agent.update_performance cost and memory over long runs.
+
+Feeds many task metrics to one agent, with and without ``keep_history``,
+and reports the time per update in the first and last thousand updates
+(flat when updates are O(1)) and the memory the agent holds afterwards.
+
+    python microbenchmarks/bench_agent_stats.py --updates 200000
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from swarm_benchmark.core.models import Agent, PerformanceMetrics  # noqa: E402
+
+
+def run(updates: int, keep_history: bool):
+    metrics = [
+        PerformanceMetrics(execution_time=0.01 + (i % 97) / 1000, success_rate=float(i % 20 != 0))
+        for i in range(1000)
+    ]
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+
+    agent = Agent(keep_history=keep_history)
+    start = time.perf_counter()
+    for i in range(1000):
+        agent.update_performance(metrics[i])
+    first = time.perf_counter() - start
+    for i in range(1000, updates - 1000):
+        agent.update_performance(metrics[i % 1000])
+    start = time.perf_counter()
+    for i in range(1000):
+        agent.update_performance(metrics[i])
+    last = time.perf_counter() - start
+
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    summary = (agent.p50_execution_time, agent.p95_execution_time, agent.recent_success_rate)
+    return first / 1000, last / 1000, used, summary
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--updates", type=int, default=200_000)
+    args = parser.parse_args()
+
+    print(f"updates:  {args.updates}")
+    for keep_history in (False, True):
+        first, last, used, (p50, p95, recent) = run(args.updates, keep_history)
+        print(f"keep_history={keep_history!s:5}  "
+              f"first {first * 1e6:6.2f} us/update  last {last * 1e6:6.2f} us/update  "
+              f"held {used / 1024:9.1f} KiB  "
+              f"p50 {p50:.3f}s p95 {p95:.3f}s recent success {recent:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""Measure Benchmark id lookups as the result list grows.
+
+Fills a Benchmark with results and times a thousand get_results_by_task_id
+calls at each size; with the hash indexes the per-lookup time stays flat
+instead of growing with the number of results.
+
+    python microbenchmarks/bench_benchmark_lookup.py --sizes 1000 10000 100000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from swarm_benchmark.core.models import Benchmark, Result  # noqa: E402
+
+
+def run(size: int, lookups: int):
+    benchmark = Benchmark()
+    start = time.perf_counter()
+    for i in range(size):
+        benchmark.add_result(Result(task_id=f"task-{i}", agent_id=f"agent-{i % 50}"))
+    fill = time.perf_counter() - start
+
+    step = max(1, size // lookups)
+    ids = [f"task-{i}" for i in range(0, size, step)]
+    start = time.perf_counter()
+    for task_id in ids:
+        benchmark.get_results_by_task_id(task_id)
+    lookup = time.perf_counter() - start
+    return fill / size, lookup / len(ids)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--lookups", type=int, default=1000)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        fill, lookup = run(size, args.lookups)
+        print(f"results {size:>8}  add {fill * 1e6:6.2f} us/result  "
+              f"lookup {lookup * 1e6:6.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
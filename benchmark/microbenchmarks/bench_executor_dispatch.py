@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Microbenchmark for ParallelExecutor queue dispatch.
+
+Pushes no-op tasks through the executor so that only queueing, dispatch and
+bookkeeping are measured. Reports submit rate, end-to-end throughput and the
+distribution of queue wait (dispatch latency).
+
+    python microbenchmarks/bench_executor_dispatch.py --tasks 100000 --workers 16
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from swarm_benchmark.core.models import Result, Task  # noqa: E402
+from swarm_benchmark.core.parallel_executor import (  # noqa: E402
+    ExecutionMode, ParallelExecutor, ResourceLimits
+)
+
+
+class NoOpExecutor(ParallelExecutor):
+    """Executor whose tasks complete immediately."""
+
+    async def _execute_task(self, task: Task) -> Result:
+        return Result(task_id=task.id)
+
+
+def _percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def run(num_tasks: int, workers: int, queue_size: int, priority_levels: int) -> None:
+    limits = ResourceLimits(
+        max_concurrent_tasks=workers,
+        max_queue_size=queue_size,
+        max_cpu_percent=100.0 * 1024,
+        max_memory_mb=1024.0 * 1024,
+    )
+    executor = NoOpExecutor(mode=ExecutionMode.ASYNCIO, limits=limits)
+    await executor.start()
+
+    tasks = [(Task(objective=f"noop-{i}"), i % priority_levels) for i in range(num_tasks)]
+
+    try:
+        start = time.perf_counter()
+        await executor.submit_batch(tasks)
+        submitted = time.perf_counter()
+        await executor.wait_for_completion()
+        finished = time.perf_counter()
+    finally:
+        await executor.stop()
+
+    waits = [r.performance_metrics.queue_time * 1000 for r in executor.completed_tasks.values()]
+
+    print(f"tasks:              {num_tasks}")
+    print(f"workers:            {workers}")
+    print(f"queue size:         {queue_size}")
+    print(f"priority levels:    {priority_levels}")
+    print(f"submit time:        {submitted - start:.3f}s")
+    print(f"total time:         {finished - start:.3f}s")
+    print(f"throughput:         {num_tasks / (finished - start):,.0f} tasks/s")
+    print(f"dispatch mean:      {statistics.mean(waits) if waits else 0.0:.3f}ms")
+    print(f"dispatch p50:       {_percentile(waits, 50):.3f}ms")
+    print(f"dispatch p99:       {_percentile(waits, 99):.3f}ms")
+    print(f"completed/failed:   {executor.metrics.tasks_completed}/{executor.metrics.tasks_failed}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--queue-size", type=int, default=1000)
+    parser.add_argument("--priority-levels", type=int, default=1,
+                        help="Spread tasks over N priorities (low ones wait for high ones)")
+    args = parser.parse_args()
+
+    logging.getLogger("swarm_benchmark").setLevel(logging.WARNING)
+    asyncio.run(run(args.tasks, args.workers, args.queue_size, max(1, args.priority_levels)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Compare the per-pattern and single-pass claude-flow output parsers.
+
+    python microbenchmarks/bench_output_parser.py --megabytes 8
+    python microbenchmarks/bench_output_parser.py --log run1.log --log run2.log
+
+Without ``--log``, a synthetic log of progress lines, build noise and
+pretty-printed JSON is generated. Both parsers must produce the same result
+before timings are reported.
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from swarm_benchmark.core.integration_utils import (  # noqa: E402
+    JSONBlockDecoder, OutputParser, OutputStreamParser
+)
+
+
+def legacy_parse_output(output: str) -> dict:
+    """The previous parser: every pattern searched on every line."""
+    result = OutputParser.empty_result()
+    patterns = OutputParser.PATTERNS
+    for line in output.split("\n"):
+        for name, pattern in patterns.items():
+            if match := pattern.search(line):
+                OutputParser._store(name, match, result)
+    return result
+
+
+def legacy_extract_json_blocks(output: str) -> list:
+    """The previous JSON extraction: flat objects only."""
+    blocks = []
+    for match in re.finditer(r"\{[^{}]*\}", output, re.DOTALL):
+        try:
+            blocks.append(json.loads(match.group()))
+        except json.JSONDecodeError:
+            pass
+    return blocks
+
+
+def synthetic_log(megabytes: float, seed: int = 7) -> str:
+    """A claude-flow-like log of roughly ``megabytes`` MB."""
+    rng = random.Random(seed)
+    templates = [
+        "[{t}] INFO  coordinator: heartbeat ok ({n} agents active)",
+        "[{t}] DEBUG memory: cache hit for key swarm/{n}/context",
+        "  compiling src/module_{n}.ts ... done",
+        "Task created: task-{n}",
+        "✅ Task completed: task-{n}",
+        "Agent coder{n} started",
+        "Agent coder{n} completed",
+        "Created file: src/generated_{n}.py",
+        "Modified file: src/app_{n}.py",
+        "⚠️ Warning: slow response from agent-{n}",
+        "❌ Error: request {n} failed",
+        "✅ {n} tests passed",
+        "Coverage: {n}.5%",
+        "Duration: {n}ms",
+        "Stored in memory: swarm/result/{n}",
+    ]
+    weights = [40, 30, 30] + [1] * (len(templates) - 3)
+    lines = ["Swarm ID: swarm-1234"]
+    size = 0
+    while size < megabytes * 1024 * 1024:
+        if rng.random() < 0.01:
+            block = json.dumps({"task": rng.randint(1, 999), "result": {
+                "status": "ok", "metrics": {"tokens": rng.randint(1, 10 ** 5)}}}, indent=2)
+        else:
+            block = rng.choices(templates, weights)[0].format(
+                t=f"12:{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d}", n=rng.randint(1, 999))
+        lines.append(block)
+        size += len(block) + 1
+    return "\n".join(lines)
+
+
+def throughput(fn, text: str, rounds: int) -> float:
+    """Best MB/s over ``rounds`` runs."""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn(text)
+        best = min(best, time.perf_counter() - start)
+    return len(text.encode("utf-8")) / 1024 / 1024 / best
+
+
+def chunked(text: str, chunk_size: int = 64 * 1024) -> dict:
+    parser = OutputStreamParser(extract_json=False)
+    for i in range(0, len(text), chunk_size):
+        parser.feed(text[i:i + chunk_size])
+    return parser.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--megabytes", type=float, default=8.0)
+    parser.add_argument("--log", action="append", type=Path, default=[],
+                        help="claude-flow output to parse instead of a synthetic log")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    texts = [path.read_text(errors="replace") for path in args.log]
+    text = "\n".join(texts) if texts else synthetic_log(args.megabytes)
+
+    expected = legacy_parse_output(text)
+    if OutputParser.parse_output(text) != expected or chunked(text) != expected:
+        sys.exit("single-pass parser output differs from the per-pattern parser")
+    nested = OutputParser.extract_json_blocks(text)
+    print(f"log: {len(text) / 1024 / 1024:.1f} MB, {text.count(chr(10)) + 1} lines, "
+          f"{len(legacy_extract_json_blocks(text))} flat / {len(nested)} whole JSON objects")
+
+    results = {
+        "per-pattern": throughput(legacy_parse_output, text, args.rounds),
+        "single-pass": throughput(OutputParser.parse_output, text, args.rounds),
+        "single-pass (64 KiB chunks)": throughput(chunked, text, args.rounds),
+    }
+    baseline = results["per-pattern"]
+    for name, value in results.items():
+        print(f"{name:<28} {value:8.1f} MB/s  ({value / baseline:.1f}x)")
+
+    json_results = {
+        "regex (flat only)": throughput(legacy_extract_json_blocks, text, args.rounds),
+        "JSONBlockDecoder": throughput(lambda t: JSONBlockDecoder().feed(t, final=True),
+                                       text, args.rounds),
+    }
+    for name, value in json_results.items():
+        print(f"{name:<28} {value:8.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Compare psutil and the /proc fast path for sampling process metrics.
+
+    python microbenchmarks/bench_proc_reader.py --processes 50 --rounds 200
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import psutil
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from swarm_benchmark.metrics.performance_collector import sample_process  # noqa: E402
+from swarm_benchmark.metrics.proc_reader import ProcReader  # noqa: E402
+
+
+def rate(sample, pids, rounds: int) -> float:
+    """Sampled processes per millisecond."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for pid in pids:
+            sample(pid)
+    return len(pids) * rounds / ((time.perf_counter() - start) * 1000)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--processes", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    if not ProcReader.available():
+        sys.exit("ProcReader needs Linux /proc")
+
+    processes = [
+        subprocess.Popen([sys.executable, "-c", "import time; time.sleep(600)"])
+        for _ in range(args.processes)
+    ]
+    try:
+        pids = [p.pid for p in processes]
+        cached = {pid: psutil.Process(pid) for pid in pids}
+
+        results = {"psutil": rate(lambda pid: sample_process(cached[pid]), pids, args.rounds)}
+        for track_fds in (True, False):
+            reader = ProcReader(track_fds=track_fds)
+            results[f"/proc (fds={track_fds})"] = rate(reader.sample, pids, args.rounds)
+            reader.close()
+    finally:
+        for p in processes:
+            p.kill()
+            p.wait()
+
+    baseline = results["psutil"]
+    for name, value in results.items():
+        print(f"{name:<20} {value:8.1f} processes/ms  ({value / baseline:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
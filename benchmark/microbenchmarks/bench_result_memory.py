@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Compare memory per stored result: list of Result vs. ResultStore.
+
+Builds results shaped like the ones ParallelExecutor records (timings,
+resource usage, a handful of task/agent ids) and measures the retained
+allocation of each representation with tracemalloc.
+
+    python microbenchmarks/bench_result_memory.py --results 200000
+"""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from swarm_benchmark.core.models import (  # noqa: E402
+    PerformanceMetrics, ResourceUsage, Result, ResultStatus
+)
+from swarm_benchmark.core.result_store import ResultStore  # noqa: E402
+
+
+def make_result(i: int, tasks: int, agents: int) -> Result:
+    started = datetime(2024, 1, 1) + timedelta(milliseconds=i)
+    return Result(
+        task_id=f"task-{i % tasks}",
+        agent_id=f"agent-{i % agents}",
+        status=ResultStatus.SUCCESS if i % 20 else ResultStatus.FAILURE,
+        performance_metrics=PerformanceMetrics(
+            execution_time=0.01 + (i % 97) / 1000,
+            queue_time=(i % 13) / 1000,
+            success_rate=1.0,
+        ),
+        resource_usage=ResourceUsage(
+            cpu_percent=12.5 + i % 40,
+            memory_mb=256.0 + i % 64,
+            peak_memory_mb=300.0 + i % 64,
+        ),
+        started_at=started,
+        completed_at=started + timedelta(milliseconds=15),
+    )
+
+
+def measure(build) -> int:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    held = build()
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del held
+    return used
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--results", type=int, default=200_000)
+    parser.add_argument("--tasks", type=int, default=1_000, help="distinct task ids")
+    parser.add_argument("--agents", type=int, default=16, help="distinct agent ids")
+    args = parser.parse_args()
+    n = args.results
+
+    def build_list():
+        return [make_result(i, args.tasks, args.agents) for i in range(n)]
+
+    def build_store():
+        store = ResultStore()
+        for i in range(n):
+            store.append(make_result(i, args.tasks, args.agents))
+        return store
+
+    list_bytes = measure(build_list)
+    store_bytes = measure(build_store)
+
+    print(f"results:              {n}")
+    print(f"List[Result]:         {list_bytes / n:8.1f} bytes/result")
+    print(f"ResultStore:          {store_bytes / n:8.1f} bytes/result")
+    print(f"reduction:            {list_bytes / store_bytes:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
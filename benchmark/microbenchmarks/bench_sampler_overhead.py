@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Compare sampling CPU cost of per-command collector threads vs the shared sampler.
+
+    python microbenchmarks/bench_sampler_overhead.py --commands 1 10 50 --seconds 2
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from swarm_benchmark.metrics.performance_collector import PerformanceCollector  # noqa: E402
+from swarm_benchmark.metrics.resource_monitor import ResourceMonitor  # noqa: E402
+from swarm_benchmark.metrics.sampler import SamplingDaemon  # noqa: E402
+
+
+def spawn(count: int):
+    return [
+        subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+        for _ in range(count)
+    ]
+
+
+def measure(processes, seconds: float, sampler=None) -> float:
+    """Return sampler CPU seconds per wall second while tracking ``processes``."""
+    collectors = []
+    for process in processes:
+        collector = PerformanceCollector(sample_interval=0.05)
+        monitor = ResourceMonitor()
+        collector.start_collection(process, sampler=sampler)
+        monitor.start_monitoring(process.pid, sampler=sampler)
+        collectors.append((collector, monitor))
+
+    cpu_start = time.process_time()
+    time.sleep(seconds)
+    cpu = time.process_time() - cpu_start
+
+    for collector, monitor in collectors:
+        collector.stop_collection()
+        monitor.stop_monitoring()
+    return cpu / seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--commands", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--seconds", type=float, default=2.0)
+    args = parser.parse_args()
+
+    print(f"{'commands':>8}  {'threads':>10}  {'shared':>10}")
+    for count in args.commands:
+        processes = spawn(count)
+        try:
+            threaded = measure(processes, args.seconds)
+            sampler = SamplingDaemon()
+            shared = measure(processes, args.seconds, sampler=sampler)
+            sampler.stop()
+        finally:
+            for process in processes:
+                process.kill()
+                process.wait()
+        print(f"{count:>8}  {threaded:>9.1%}  {shared:>9.1%}")
+
+
+if __name__ == "__main__":
+    main()
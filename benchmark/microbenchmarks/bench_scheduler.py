@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Time TaskScheduler algorithms on large task and agent counts.
+
+    python microbenchmarks/bench_scheduler.py --tasks 100000 --agents 1000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from swarm_benchmark.core.models import Agent, AgentType, StrategyType, Task  # noqa: E402
+from swarm_benchmark.core.task_scheduler import SchedulingAlgorithm, TaskScheduler  # noqa: E402
+
+# name: (algorithm, scheduler method, scheduler options)
+ALGORITHMS = {
+    "capability_based": ("capability_based", "_schedule_capability_based", {}),
+    "priority_based": ("priority_based", "_schedule_priority_based", {}),
+    "dynamic": ("dynamic", "_schedule_dynamic", {}),
+    "dynamic_batched": ("dynamic", "_schedule_dynamic_batched", {"batch_size": 256}),
+    "dynamic_optimal": ("dynamic", "_schedule_dynamic_batched", {"batch_size": 64, "optimal": True}),
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--agents", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--skip-optimal", action="store_true",
+                        help="skip the (much slower) min-cost assignment mode")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    agents = [Agent(type=rng.choice(list(AgentType)), success_rate=rng.choice([0.8, 0.9, 1.0]))
+              for _ in range(args.agents)]
+    tasks = [Task(strategy=rng.choice(list(StrategyType)), priority=rng.randrange(1, 10))
+             for _ in range(args.tasks)]
+
+    for name, (algorithm, method, options) in ALGORITHMS.items():
+        if args.skip_optimal and options.get("optimal"):
+            continue
+        scheduler = TaskScheduler(algorithm=SchedulingAlgorithm(algorithm),
+                                  enable_work_stealing=False, **options)
+        scheduler._initialize_agent_capabilities(agents)
+        start = time.perf_counter()
+        getattr(scheduler, method)(tasks, agents)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<18} {elapsed * 1000:8.1f} ms  ({args.tasks} tasks, {args.agents} agents)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Time SQLiteManager.save_benchmark for a benchmark with many results.
+
+    python microbenchmarks/bench_sqlite_save.py --results 100000
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from swarm_benchmark.core.models import (  # noqa: E402
+    Benchmark, PerformanceMetrics, Result, ResultStatus, Task
+)
+from swarm_benchmark.output.sqlite_manager import SQLiteManager  # noqa: E402
+
+
+def build_benchmark(results: int, tasks: int) -> Benchmark:
+    benchmark = Benchmark(name="sqlite-bench")
+    task_list = [Task(objective=f"objective {i}") for i in range(tasks)]
+    for task in task_list:
+        benchmark.add_task(task)
+    for i in range(results):
+        benchmark.add_result(Result(
+            task_id=task_list[i % tasks].id,
+            agent_id=f"agent-{i % 16}",
+            status=ResultStatus.SUCCESS,
+            performance_metrics=PerformanceMetrics(execution_time=0.01 + (i % 100) / 1000),
+        ))
+    return benchmark
+
+
+async def run(args) -> None:
+    benchmark = build_benchmark(args.results, args.tasks)
+    with tempfile.TemporaryDirectory() as tmp:
+        async with SQLiteManager() as manager:
+            start = time.perf_counter()
+            await manager.save_benchmark(benchmark, Path(tmp))
+            elapsed = time.perf_counter() - start
+
+    print(f"results:    {args.results}")
+    print(f"save time:  {elapsed:.2f}s ({args.results / elapsed:,.0f} results/s)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--results", type=int, default=100_000)
+    parser.add_argument("--tasks", type=int, default=1_000)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
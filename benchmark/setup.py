@@ -42,7 +42,11 @@ setup(
             "flake8>=5.0",
             "mypy>=1.0",
             "pre-commit>=2.20",
-        ]
+        ],
+        # Parquet output; without it columnar output uses the built-in .swbc format
+        "parquet": [
+            "pyarrow>=10.0",
+        ],
     },
     entry_points={
         "console_scripts": [
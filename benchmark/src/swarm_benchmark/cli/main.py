@@ -2,7 +2,9 @@
 
 import click
 import asyncio
+import csv
 import json
+import sys
 from pathlib import Path
 from typing import Optional
 
@@ -10,6 +12,8 @@ from swarm_benchmark import __version__
 from swarm_benchmark.core.models import StrategyType, CoordinationMode, BenchmarkConfig
 from swarm_benchmark.core.benchmark_engine import BenchmarkEngine
 from swarm_benchmark.core.real_benchmark_engine import RealBenchmarkEngine
+from swarm_benchmark.core.result_cache import ResultCache
+from swarm_benchmark.output.sqlite_manager import SQLiteManager
 
 
 @click.group()
@@ -46,7 +50,7 @@ def cli(ctx, verbose, config):
 @click.option('--parallel', is_flag=True, help='Enable parallel execution')
 @click.option('--monitor', is_flag=True, help='Enable monitoring')
 @click.option('--output', '-o', 'output_formats', multiple=True, 
-              type=click.Choice(['json', 'sqlite', 'csv', 'html']),
+              type=click.Choice(['json', 'ndjson', 'sqlite', 'parquet', 'csv', 'html']),
               help='Output formats (default: json)')
 @click.option('--output-dir', type=click.Path(), default='./reports', 
               help='Output directory (default: ./reports)')
@@ -130,11 +134,23 @@ def run(ctx, objective, strategy, mode, max_agents, max_tasks, timeout, task_tim
 @click.option('--filter-strategy', help='Filter by strategy')
 @click.option('--filter-mode', help='Filter by coordination mode')
 @click.option('--limit', type=int, default=10, help='Limit number of results (default: 10)')
+@click.option('--group-by', type=click.Choice(['strategy', 'mode']),
+              help='Show execution time percentiles per strategy or mode instead of runs')
+@click.option('--output-dir', type=click.Path(), default='./reports',
+              help='Directory holding benchmark_results.db (default: ./reports)')
 @click.pass_context
-def list(ctx, output_format, filter_strategy, filter_mode, limit):
+def list(ctx, output_format, filter_strategy, filter_mode, limit, group_by, output_dir):
     """List recent benchmark runs."""
     try:
-        benchmarks = _get_recent_benchmarks(filter_strategy, filter_mode, limit)
+        if group_by:
+            stats = _get_result_aggregates(group_by, filter_strategy, filter_mode, output_dir)
+            if output_format == 'json':
+                click.echo(json.dumps(stats, indent=2))
+            else:
+                _display_aggregates(stats, group_by, csv_format=output_format == 'csv')
+            return 0
+        
+        benchmarks = _get_recent_benchmarks(filter_strategy, filter_mode, limit, output_dir)
         
         if output_format == 'table':
             _display_benchmarks_table(benchmarks)
@@ -156,11 +172,13 @@ def list(ctx, output_format, filter_strategy, filter_mode, limit):
               type=click.Choice(['json', 'summary', 'detailed']),
               default='summary',
               help='Output format (default: summary)')
+@click.option('--output-dir', type=click.Path(), default='./reports',
+              help='Directory holding benchmark_results.db (default: ./reports)')
 @click.pass_context
-def show(ctx, benchmark_id, output_format):
+def show(ctx, benchmark_id, output_format, output_dir):
     """Show details for a specific benchmark run."""
     try:
-        benchmark = _get_benchmark_details(benchmark_id)
+        benchmark = _get_benchmark_details(benchmark_id, output_dir)
         
         if not benchmark:
             click.echo(f"❌ Benchmark {benchmark_id} not found")
@@ -308,6 +326,87 @@ def real(ctx, objective, strategy, mode, sparc_mode, all_modes, max_agents, time
     return 0
 
 
+@cli.group()
+def cache():
+    """Inspect and invalidate the persistent result cache."""
+
+
+@cache.command('stats')
+@click.option('--format', 'output_format', type=click.Choice(['json', 'table']), default='table',
+              help='Output format (default: table)')
+@click.option('--output-dir', type=click.Path(), default='./reports',
+              help='Directory holding result_cache.db (default: ./reports)')
+def cache_stats(output_format, output_dir):
+    """Show cache size and hit/miss statistics."""
+    try:
+        result_cache = ResultCache(Path(output_dir))
+        stats = result_cache.stats()
+        result_cache.close()
+        
+        if output_format == 'json':
+            click.echo(json.dumps(stats, indent=2))
+        else:
+            click.echo(f"Cache: {stats['path']}")
+            click.echo(f"  • Entries: {stats['entries']}")
+            click.echo(f"  • Size: {stats['bytes'] / 1024:.1f} KB of {stats['max_bytes'] / 1024 / 1024:.0f} MB")
+            click.echo(f"  • Hits: {stats['hits']}  Misses: {stats['misses']}  "
+                       f"Hit rate: {stats['hit_rate']:.1%}")
+            click.echo(f"  • Evictions: {stats['evictions']}")
+    except Exception as e:
+        click.echo(f"❌ Error reading cache: {e}")
+        return 1
+    
+    return 0
+
+
+@cache.command('invalidate')
+@click.option('--key', help='Invalidate one cache key')
+@click.option('--strategy', help='Invalidate results for a strategy')
+@click.option('--mode', help='Invalidate results for a coordination mode')
+@click.option('--objective', help='Invalidate results for an objective')
+@click.option('--expired', is_flag=True, help='Only remove expired entries')
+@click.option('--output-dir', type=click.Path(), default='./reports',
+              help='Directory holding result_cache.db (default: ./reports)')
+def cache_invalidate(key, strategy, mode, objective, expired, output_dir):
+    """Remove matching entries from the cache."""
+    if not (key or strategy or mode or objective or expired):
+        click.echo("❌ Give --key, --strategy, --mode, --objective or --expired "
+                   "(use 'cache clear' to remove everything)")
+        return 1
+    
+    try:
+        result_cache = ResultCache(Path(output_dir))
+        if expired:
+            deleted = result_cache.purge_expired()
+        else:
+            deleted = result_cache.invalidate(key=key, strategy=strategy, mode=mode, objective=objective)
+        result_cache.close()
+        click.echo(f"✅ Invalidated {deleted} cached results")
+    except Exception as e:
+        click.echo(f"❌ Error invalidating cache: {e}")
+        return 1
+    
+    return 0
+
+
+@cache.command('clear')
+@click.option('--output-dir', type=click.Path(), default='./reports',
+              help='Directory holding result_cache.db (default: ./reports)')
+@click.confirmation_option(prompt='Are you sure you want to clear the result cache?')
+def cache_clear(output_dir):
+    """Remove every cached result and reset statistics."""
+    try:
+        result_cache = ResultCache(Path(output_dir))
+        deleted = result_cache.clear()
+        result_cache.close()
+        click.echo(f"✅ Cleared {deleted} cached results")
+    except Exception as e:
+        click.echo(f"❌ Error clearing cache: {e}")
+        return 1
+    
+    return 0
+
+
 async def _run_benchmark(objective: str, config: BenchmarkConfig, use_real_metrics: bool = False) -> Optional[dict]:
     """Run a benchmark with the given objective and configuration."""
     # Choose engine based on metrics flag
@@ -351,16 +450,43 @@ async def _run_real_benchmark(objective: str, config: BenchmarkConfig,
         engine.cleanup()
 
 
-def _get_recent_benchmarks(filter_strategy=None, filter_mode=None, limit=10):
+def _get_recent_benchmarks(filter_strategy=None, filter_mode=None, limit=10, output_dir='./reports'):
     """Get recent benchmark runs."""
-    # TODO: Implement database query
-    return []
+    async def query(manager):
+        return await manager.query_benchmarks(filter_strategy, filter_mode, limit)
+    return _query_database(output_dir, query) or []
 
 
-def _get_benchmark_details(benchmark_id: str):
+def _get_benchmark_details(benchmark_id: str, output_dir='./reports'):
     """Get details for a specific benchmark."""
-    # TODO: Implement database query
-    return None
+    async def query(manager):
+        return await manager.get_benchmark(benchmark_id)
+    return _query_database(output_dir, query)
+
+
+def _get_result_aggregates(group_by, filter_strategy=None, filter_mode=None, output_dir='./reports'):
+    """Get result aggregates per strategy or mode."""
+    async def query(manager):
+        return await manager.aggregate_results(group_by, strategy=filter_strategy, mode=filter_mode)
+    return _query_database(output_dir, query) or []
+
+
+def _query_database(output_dir, query):
+    """Run a query against the results database, if there is one."""
+    db_path = Path(output_dir) / "benchmark_results.db"
+    if not db_path.exists():
+        return None
+    
+    async def run():
+        async with SQLiteManager(db_path) as manager:
+            return await query(manager)
+    
+    return asyncio.run(run())
+
+
+def _format_seconds(value):
+    """Format an optional duration in seconds."""
+    return f"{value:.3f}s" if value is not None else "-"
 
 
 def _clean_benchmarks(all_results=False, older_than=None, strategy=None):
@@ -375,26 +501,90 @@ def _display_benchmarks_table(benchmarks):
         click.echo("No benchmarks found.")
         return
     
-    # TODO: Implement table display
-    click.echo("Benchmark results (table format not yet implemented)")
+    click.echo(f"{'ID':<10} {'Name':<24} {'Strategy':<12} {'Mode':<13} {'Status':<10} "
+               f"{'Results':>7} {'p50':>9} {'p95':>9}")
+    for benchmark in benchmarks:
+        stats = benchmark.get("result_stats") or {}
+        click.echo(
+            f"{benchmark['id'][:8]:<10} {benchmark['name'][:24]:<24} {benchmark['strategy']:<12} "
+            f"{benchmark['mode']:<13} {benchmark['status']:<10} {stats.get('results', 0):>7} "
+            f"{_format_seconds(stats.get('p50_execution_time')):>9} "
+            f"{_format_seconds(stats.get('p95_execution_time')):>9}"
+        )
 
 
 def _display_benchmarks_csv(benchmarks):
     """Display benchmarks in CSV format."""
-    # TODO: Implement CSV display
-    click.echo("CSV output not yet implemented")
+    writer = csv.writer(sys.stdout)
+    writer.writerow(["id", "name", "strategy", "mode", "status", "created_at", "duration",
+                     "results", "success_rate", "p50_execution_time", "p95_execution_time"])
+    for benchmark in benchmarks:
+        stats = benchmark.get("result_stats") or {}
+        writer.writerow([
+            benchmark["id"], benchmark["name"], benchmark["strategy"], benchmark["mode"],
+            benchmark["status"], benchmark["created_at"], benchmark["duration"],
+            stats.get("results", 0), stats.get("success_rate"),
+            stats.get("p50_execution_time"), stats.get("p95_execution_time"),
+        ])
+
+
+def _display_aggregates(stats, group_by, csv_format=False):
+    """Display per-group result aggregates."""
+    columns = ["results", "success_rate", "mean_execution_time", "p50_execution_time",
+               "p95_execution_time", "max_execution_time", "peak_memory_mb"]
+    if csv_format:
+        writer = csv.writer(sys.stdout)
+        writer.writerow([group_by] + columns)
+        for row in stats:
+            writer.writerow([row[group_by]] + [row[c] for c in columns])
+        return
+    
+    if not stats:
+        click.echo("No results found.")
+        return
+    
+    click.echo(f"{group_by.replace('_', ' ').capitalize():<14} {'Results':>8} {'Success':>8} {'Mean':>9} "
+               f"{'p50':>9} {'p95':>9} {'Max':>9}")
+    for row in stats:
+        click.echo(
+            f"{row[group_by]:<14} {row['results']:>8} {row['success_rate']:>8.1%} "
+            f"{_format_seconds(row['mean_execution_time']):>9} "
+            f"{_format_seconds(row['p50_execution_time']):>9} "
+            f"{_format_seconds(row['p95_execution_time']):>9} "
+            f"{_format_seconds(row['max_execution_time']):>9}"
+        )
 
 
 def _display_benchmark_summary(benchmark):
     """Display benchmark summary."""
-    # TODO: Implement summary display
-    click.echo("Summary display not yet implemented")
+    stats = benchmark.get("result_stats") or {}
+    click.echo(f"Benchmark: {benchmark['name']} ({benchmark['id']})")
+    click.echo(f"Status:    {benchmark['status']}")
+    click.echo(f"Strategy:  {benchmark['strategy']}  Mode: {benchmark['mode']}")
+    click.echo(f"Created:   {benchmark['created_at']}")
+    click.echo(f"Duration:  {_format_seconds(benchmark['duration'])}")
+    click.echo(f"Results:   {stats.get('results', 0)} "
+               f"(success rate {stats.get('success_rate') or 0:.1%})")
+    click.echo(f"Execution: mean {_format_seconds(stats.get('mean_execution_time'))}, "
+               f"p50 {_format_seconds(stats.get('p50_execution_time'))}, "
+               f"p95 {_format_seconds(stats.get('p95_execution_time'))}, "
+               f"max {_format_seconds(stats.get('max_execution_time'))}")
 
 
 def _display_benchmark_detailed(benchmark):
     """Display detailed benchmark information."""
-    # TODO: Implement detailed display
-    click.echo("Detailed display not yet implemented")
+    _display_benchmark_summary(benchmark)
+    
+    agent_stats = benchmark.get("agent_stats") or []
+    if agent_stats:
+        click.echo("")
+        _display_aggregates(agent_stats, "agent_id")
+    
+    if benchmark.get("metrics"):
+        click.echo("")
+        click.echo("Metrics:")
+        for key, value in json.loads(benchmark["metrics"]).items():
+            click.echo(f"  {key}: {value}")
 
 
 def main():
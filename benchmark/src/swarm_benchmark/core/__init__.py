@@ -8,13 +8,17 @@ from .models import (
     # Enums
     TaskStatus, AgentStatus, ResultStatus, StrategyType, CoordinationMode, AgentType
 )
+from .result_store import ResultStore, ResultRow
+from .result_cache import ResultCache
 from .benchmark_engine import BenchmarkEngine
 from .optimized_benchmark_engine import OptimizedBenchmarkEngine
 from .task_scheduler import TaskScheduler, SchedulingAlgorithm, SchedulingMetrics
+from .dag_executor import DAGExecutor, TaskGraph, DependencyCycleError
+from .duration_model import DurationEstimator
 from .result_aggregator import ResultAggregator
 from .parallel_executor import (
     ParallelExecutor, BatchExecutor, ExecutionMode, 
-    ResourceLimits, ExecutionMetrics, ResourceMonitor
+    ResourceLimits, ExecutionMetrics, ResourceMonitor, AdmissionController
 )
 from .orchestration_manager import (
     OrchestrationManager, OrchestrationConfig, ProgressTracker
@@ -32,6 +36,9 @@ __all__ = [
     "PerformanceMetrics", 
     "QualityMetrics",
     "ResourceUsage",
+    "ResultStore",
+    "ResultRow",
+    "ResultCache",
     # Enums
     "TaskStatus",
     "AgentStatus", 
@@ -45,6 +52,10 @@ __all__ = [
     "TaskScheduler",
     "SchedulingAlgorithm",
     "SchedulingMetrics",
+    "DAGExecutor",
+    "TaskGraph",
+    "DependencyCycleError",
+    "DurationEstimator",
     "ResultAggregator",
     # Parallel execution
     "ParallelExecutor",
@@ -53,6 +64,7 @@ __all__ = [
     "ResourceLimits",
     "ExecutionMetrics",
     "ResourceMonitor",
+    "AdmissionController",
     # Orchestration
     "OrchestrationManager",
     "OrchestrationConfig",
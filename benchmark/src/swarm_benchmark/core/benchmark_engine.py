@@ -1,14 +1,20 @@
 """Main benchmark engine for orchestrating swarm tests."""
 
 import asyncio
+import time
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, Iterable, List, Dict, Any, Mapping, Optional, Tuple
 from pathlib import Path
 
-from .models import Benchmark, Task, Result, BenchmarkConfig, TaskStatus, StrategyType, CoordinationMode
+from .models import Benchmark, Task, Result, ResultStatus, BenchmarkConfig, TaskStatus, StrategyType, CoordinationMode
+from .dag_executor import DAGExecutor
+from .deadline import effective_timeout, run_with_deadline, timeout_result
+from ..metrics.performance_collector import PerformanceCollector
 from ..strategies import create_strategy
-from ..output.json_writer import JSONWriter
+from ..strategies.base_strategy import BaseStrategy
+from ..output.json_writer import JSONWriter, ResultStream
 from ..output.sqlite_manager import SQLiteManager
+from ..output.parquet_writer import ParquetWriter
 
 
 class BenchmarkEngine:
@@ -20,6 +26,12 @@ class BenchmarkEngine:
         self.status = "READY"
         self.task_queue = []
         self.current_benchmark: Optional[Benchmark] = None
+        self._strategies: Dict[str, BaseStrategy] = {}
+    
+    @property
+    def concurrency(self) -> int:
+        """Most tasks ``execute_batch`` runs at once."""
+        return max(1, self.config.max_agents) if self.config.parallel else 1
     
     def submit_task(self, task: Task) -> None:
         """Submit a task to the benchmark queue."""
@@ -55,19 +67,33 @@ class BenchmarkEngine:
         benchmark.started_at = datetime.now()
         
         self.current_benchmark = benchmark
+        stream = self._result_stream(benchmark)
+        collector = self._sample_collector()
+        samples = None
         
         try:
-            # Execute the task using the specified strategy
-            strategy = create_strategy(self.config.strategy.value.lower())
-            result = await strategy.execute(main_task)
+            if stream is not None:
+                await stream.open()
+            
+            # Execute the task using the specified strategy, under its deadline
+            if collector is not None:
+                collector.start_collection()
+            try:
+                result = await self._execute_with_deadline(main_task)
+            finally:
+                if collector is not None:
+                    await asyncio.get_running_loop().run_in_executor(None, collector.stop_collection)
+                    samples = list(collector.sample_rows())
             
             # Add result to benchmark
             benchmark.add_result(result)
+            if stream is not None:
+                await stream.write_result(result)
             benchmark.status = TaskStatus.COMPLETED
             benchmark.completed_at = datetime.now()
             
             # Save results
-            await self._save_results(benchmark)
+            await self._save_results(benchmark, streamed=stream is not None, samples=samples)
             
             return {
                 "benchmark_id": benchmark.id,
@@ -88,41 +114,158 @@ class BenchmarkEngine:
                 "error": str(e),
                 "duration": benchmark.duration()
             }
+        finally:
+            if stream is not None:
+                await stream.close()
     
     async def execute_batch(self, tasks: List[Task]) -> List[Result]:
-        """Execute a batch of tasks."""
-        results = []
+        """Execute a batch of tasks.
         
-        for task in tasks:
+        Tasks run in dependency order (see ``DAGExecutor``), up to
+        ``concurrency`` at a time; a task whose dependency fails is not run
+        and gets a cancelled result.
+        
+        Returns:
+            One result per task, in the order the tasks were given
+        """
+        results = {task.id: result async for task, result in self._stream(tasks)}
+        return [results[task.id] for task in tasks]
+    
+    async def stream_batch(self, tasks: List[Task]) -> AsyncIterator[Result]:
+        """Execute a batch of tasks like ``execute_batch``, yielding each result as it completes."""
+        results = self._stream(tasks)
+        try:
+            async for _, result in results:
+                yield result
+        finally:
+            await results.aclose()
+    
+    async def _stream(self, tasks: List[Task]) -> AsyncIterator[Tuple[Task, Result]]:
+        """Run a batch through the DAG executor, appending results to the NDJSON stream if enabled.
+        
+        Results are written as they complete and not retained; the summary
+        line is written even if the batch fails or is abandoned.
+        """
+        benchmark = Benchmark(name=self.config.name, description=self.config.description,
+                              config=self.config)
+        stream = self._result_stream(benchmark)
+        results = DAGExecutor(self._execute_task, max_concurrency=self.concurrency).stream(tasks)
+        if stream is None:
             try:
-                strategy = create_strategy(task.strategy.value.lower() if hasattr(task.strategy, 'value') else task.strategy)
-                result = await strategy.execute(task)
-                results.append(result)
-            except Exception as e:
-                # Create error result
-                error_result = Result(
-                    task_id=task.id,
-                    agent_id="error-agent",
-                    status="ERROR",
-                    output={},
-                    errors=[str(e)]
-                )
-                results.append(error_result)
+                async for item in results:
+                    yield item
+            finally:
+                await results.aclose()
+            return
         
-        return results
+        for task in tasks:
+            benchmark.add_task(task)
+        benchmark.status = TaskStatus.RUNNING
+        benchmark.started_at = datetime.now()
+        try:
+            await stream.open()
+            async for task, result in results:
+                benchmark.metrics.update_from_result(result)
+                await stream.write_result(result)
+                yield task, result
+            benchmark.status = TaskStatus.COMPLETED
+        except (asyncio.CancelledError, GeneratorExit):
+            benchmark.status = TaskStatus.CANCELLED
+            raise
+        except Exception as e:
+            benchmark.status = TaskStatus.FAILED
+            benchmark.error_log.append(str(e))
+            raise
+        finally:
+            await results.aclose()
+            benchmark.completed_at = datetime.now()
+            await stream.close()
     
-    async def _save_results(self, benchmark: Benchmark) -> None:
-        """Save benchmark results to configured output formats."""
+    def _sample_collector(self) -> Optional[PerformanceCollector]:
+        """Collector for the columnar samples table when monitoring Parquet output."""
+        if self.config.monitoring and "parquet" in self.config.output_formats:
+            return PerformanceCollector()
+        return None
+    
+    def _result_stream(self, benchmark: Benchmark) -> Optional[ResultStream]:
+        """NDJSON stream for ``benchmark`` when that output format is configured."""
+        if "ndjson" not in self.config.output_formats:
+            return None
+        output_dir = Path(self.config.output_directory)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        return JSONWriter().stream(benchmark, output_dir, format_type="ndjson")
+    
+    def _strategy(self, strategy: Any) -> BaseStrategy:
+        """Shared strategy instance for a strategy type, created on first use."""
+        name = strategy.value.lower() if hasattr(strategy, 'value') else strategy
+        if name not in self._strategies:
+            self._strategies[name] = create_strategy(name)
+        return self._strategies[name]
+    
+    async def _execute_with_deadline(self, task: Task) -> Result:
+        """Execute one task with its strategy, bounded by its deadline.
+        
+        The deadline is the tighter of ``task.timeout`` and
+        ``config.task_timeout``.
+        
+        Returns:
+            The strategy's result, or a timeout result if the deadline passed
+            
+        Raises:
+            Exception: Whatever the strategy raised
+        """
+        timeout = effective_timeout(task.timeout, self.config.task_timeout)
+        started_at = time.time()
+        try:
+            strategy = self._strategy(task.strategy)
+            return await run_with_deadline(strategy.execute(task), timeout)
+        except asyncio.TimeoutError:
+            return timeout_result(task, timeout, started_at)
+    
+    async def _execute_task(self, task: Task) -> Result:
+        """Execute one task like ``_execute_with_deadline``, turning errors into results.
+        
+        Returns:
+            The strategy's result, or a timeout/error result on failure
+        """
+        try:
+            return await self._execute_with_deadline(task)
+        except Exception as e:
+            # Create error result
+            return Result(
+                task_id=task.id,
+                agent_id="error-agent",
+                status=ResultStatus.ERROR,
+                output={},
+                errors=[str(e)],
+                completed_at=datetime.now()
+            )
+    
+    async def _save_results(self, benchmark: Benchmark, streamed: bool = False,
+                            samples: Optional[Iterable[Mapping[str, Any]]] = None) -> None:
+        """Save benchmark results to configured output formats.
+        
+        Args:
+            benchmark: Benchmark to save
+            streamed: NDJSON was already written while the benchmark ran
+            samples: Time-series samples for the columnar ``samples`` table,
+                e.g. ``PerformanceCollector.sample_rows()``
+        """
         output_dir = Path(self.config.output_directory)
         output_dir.mkdir(exist_ok=True)
         
         for format_type in self.config.output_formats:
-            if format_type == "json":
+            if format_type == "ndjson" and streamed:
+                continue
+            if format_type in ("json", "ndjson"):
                 writer = JSONWriter()
-                await writer.save_benchmark(benchmark, output_dir)
+                await writer.save_benchmark(benchmark, output_dir, format_type=format_type)
             elif format_type == "sqlite":
-                manager = SQLiteManager()
-                await manager.save_benchmark(benchmark, output_dir)
+                async with SQLiteManager() as manager:
+                    await manager.save_benchmark(benchmark, output_dir)
+            elif format_type == "parquet":
+                writer = ParquetWriter()
+                await writer.save_benchmark(benchmark, output_dir, samples=samples)
     
     def _result_to_dict(self, result: Result) -> Dict[str, Any]:
         """Convert result to dictionary for JSON serialization."""
@@ -22,8 +22,8 @@ from enum import Enum
 import logging
 from datetime import datetime
 import asyncio
-import signal
-from contextlib import contextmanager
+
+from .process_tree import DEFAULT_GRACE_PERIOD, ProcessTree
 
 logger = logging.getLogger(__name__)
 
@@ -89,6 +89,7 @@ class ExecutionResult:
     timeout: bool = False
     output_files: Dict[str, str] = None
     metrics: Dict[str, Any] = None
+    leaked_pids: List[int] = None
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -185,7 +186,8 @@ class ClaudeFlowExecutor:
                  working_dir: Optional[str] = None,
                  env: Optional[Dict[str, str]] = None,
                  retry_attempts: int = 3,
-                 retry_delay: float = 2.0):
+                 retry_delay: float = 2.0,
+                 grace_period: float = DEFAULT_GRACE_PERIOD):
         """
         Initialize the executor.
         
@@ -195,12 +197,15 @@ class ClaudeFlowExecutor:
             env: Environment variables
             retry_attempts: Number of retry attempts for transient failures
             retry_delay: Delay between retries in seconds
+            grace_period: Seconds between SIGTERM and SIGKILL when stopping
+                a command's process tree
         """
         self.claude_flow_path = claude_flow_path or self._find_claude_flow()
         self.working_dir = Path(working_dir) if working_dir else Path.cwd()
         self.env = self._prepare_environment(env)
         self.retry_attempts = retry_attempts
         self.retry_delay = retry_delay
+        self.grace_period = grace_period
         
         logger.info(f"Initialized ClaudeFlowExecutor with path: {self.claude_flow_path}")
         
@@ -239,22 +244,6 @@ class ClaudeFlowExecutor:
             
         return base_env
         
-    @contextmanager
-    def _timeout_handler(self, timeout_seconds: int):
-        """Context manager for handling timeouts."""
-        def timeout_handler(signum, frame):
-            raise TimeoutError(f"Execution timed out after {timeout_seconds} seconds")
-            
-        # Set the signal handler
-        old_handler = signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(timeout_seconds)
-        
-        try:
-            yield
-        finally:
-            signal.alarm(0)
-            signal.signal(signal.SIGALRM, old_handler)
-            
     def _execute_command(self, 
                         command: List[str], 
                         timeout: Optional[int] = None,
@@ -262,6 +251,12 @@ class ClaudeFlowExecutor:
         """
         Execute a command with proper error handling.
         
+        The command runs in its own session. On timeout, the whole process
+        tree is stopped (SIGTERM, then SIGKILL after ``grace_period``), and
+        the output produced so far is returned. This works from any thread
+        (unlike SIGALRM). Descendants still running after the command exits
+        are stopped too and reported in ``leaked_pids``.
+        
         Args:
             command: Command to execute
             timeout: Timeout in seconds
@@ -276,40 +271,45 @@ class ClaudeFlowExecutor:
         try:
             logger.info(f"Executing command: {' '.join(command)}")
             
-            # Use subprocess.run for better control
-            result = subprocess.run(
+            pipe = subprocess.PIPE if capture_output else None
+            process = subprocess.Popen(
                 command,
                 cwd=str(self.working_dir),
                 env=self.env,
-                capture_output=capture_output,
+                stdout=pipe,
+                stderr=pipe,
                 text=True,
-                timeout=timeout
+                start_new_session=True
             )
             
-            duration = time.time() - start_time
-            
-            return ExecutionResult(
-                success=result.returncode == 0,
-                command=command,
-                stdout=result.stdout if capture_output else "",
-                stderr=result.stderr if capture_output else "",
-                exit_code=result.returncode,
-                duration=duration,
-                timeout=False
+            stdout, stderr, timed_out, leaked_pids = self._communicate(
+                process, ProcessTree(process.pid), timeout
             )
-            
-        except subprocess.TimeoutExpired as e:
             duration = time.time() - start_time
-            logger.error(f"Command timed out after {timeout} seconds")
+            
+            if timed_out:
+                logger.error(f"Command timed out after {timeout} seconds")
+                
+                return ExecutionResult(
+                    success=False,
+                    command=command,
+                    stdout=stdout or "",
+                    stderr=stderr or "",
+                    exit_code=-1,
+                    duration=duration,
+                    timeout=True,
+                    leaked_pids=leaked_pids
+                )
             
             return ExecutionResult(
-                success=False,
+                success=process.returncode == 0,
                 command=command,
-                stdout=e.stdout.decode() if e.stdout else "",
-                stderr=e.stderr.decode() if e.stderr else "",
-                exit_code=-1,
+                stdout=stdout or "",
+                stderr=stderr or "",
+                exit_code=process.returncode,
                 duration=duration,
-                timeout=True
+                timeout=False,
+                leaked_pids=leaked_pids
             )
             
         except Exception as e:
@@ -326,6 +326,45 @@ class ClaudeFlowExecutor:
                 timeout=False
             )
             
+    def _communicate(self,
+                     process: subprocess.Popen,
+                     tree: ProcessTree,
+                     timeout: Optional[float]) -> Tuple[str, str, bool, List[int]]:
+        """
+        Collect a command's output until it exits or times out.
+        
+        Descendants still running after the command exits are stopped, since
+        they would otherwise hold its output open until the timeout.
+        
+        Returns:
+            (stdout, stderr, timed out, leaked descendant PIDs)
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        leaked_pids: List[int] = []
+        
+        while True:
+            wait = 1.0 if deadline is None else max(0.0, min(1.0, deadline - time.monotonic()))
+            try:
+                stdout, stderr = process.communicate(timeout=wait)
+                break
+            except subprocess.TimeoutExpired:
+                if deadline is not None and time.monotonic() >= deadline:
+                    tree.terminate(self.grace_period)
+                    stdout, stderr = process.communicate()
+                    return stdout, stderr, True, tree.audit()
+                if process.poll() is not None and not leaked_pids:
+                    leaked_pids = tree.audit()
+                    if leaked_pids:
+                        logger.warning(f"Command left processes running: {leaked_pids}")
+                        tree.terminate(self.grace_period)
+        
+        if not leaked_pids:
+            leaked_pids = tree.audit()
+            if leaked_pids:
+                logger.warning(f"Command left processes running: {leaked_pids}")
+                tree.terminate(self.grace_period)
+        return stdout, stderr, False, leaked_pids
+        
     def _retry_execute(self, 
                       command: List[str], 
                       timeout: Optional[int] = None) -> ExecutionResult:
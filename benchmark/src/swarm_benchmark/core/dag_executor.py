@@ -0,0 +1,229 @@
+"""Dependency-aware task execution with bounded concurrency."""
+
+import asyncio
+import heapq
+import logging
+from collections import deque
+from datetime import datetime
+from typing import AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .models import Task, Result, ResultStatus
+
+
+logger = logging.getLogger(__name__)
+
+
+class DependencyCycleError(ValueError):
+    """Raised when task dependencies form a cycle."""
+
+    def __init__(self, cycle: List[str]):
+        self.cycle = cycle
+        super().__init__(f"Dependency cycle: {' -> '.join(cycle)}")
+
+
+class TaskGraph:
+    """Dependency index over a set of tasks.
+
+    A task depends on its ``dependencies`` and on its subtasks (listed in
+    ``subtasks`` or pointing back via ``parent_task_id``). Dependencies on
+    tasks outside the graph are treated as already satisfied. Construction
+    runs Kahn's algorithm, so cycles are reported up front, and computes
+    each task's critical-path length (``rank``): its own estimated duration
+    plus the longest chain of dependents after it.
+    """
+
+    def __init__(self, tasks: Iterable[Task], estimate: Optional[Callable[[Task], float]] = None):
+        """Build the graph.
+
+        Args:
+            tasks: Tasks to index
+            estimate: Expected duration of a task (defaults to 1 per task)
+
+        Raises:
+            DependencyCycleError: If the dependencies contain a cycle
+        """
+        self.tasks: Dict[str, Task] = {task.id: task for task in tasks}
+        self.dependencies: Dict[str, List[str]] = {task_id: [] for task_id in self.tasks}
+        self.dependents: Dict[str, List[str]] = {task_id: [] for task_id in self.tasks}
+
+        for task in self.tasks.values():
+            for dependency in task.dependencies:
+                self._add_edge(dependency, task.id)
+            for subtask in task.subtasks:
+                self._add_edge(subtask, task.id)
+            if task.parent_task_id:
+                self._add_edge(task.id, task.parent_task_id)
+
+        self.order = self._topological_order()
+
+        estimate = estimate or (lambda task: 1.0)
+        self.rank: Dict[str, float] = {}
+        for task_id in reversed(self.order):
+            after = max((self.rank[d] for d in self.dependents[task_id]), default=0.0)
+            self.rank[task_id] = estimate(self.tasks[task_id]) + after
+
+    def __len__(self) -> int:
+        return len(self.tasks)
+
+    def roots(self) -> List[str]:
+        """Tasks with no dependencies inside the graph."""
+        return [task_id for task_id in self.order if not self.dependencies[task_id]]
+
+    def critical_path(self) -> List[str]:
+        """Task ids along the longest estimated chain."""
+        if not self.tasks:
+            return []
+        path = [max(self.roots(), key=self.rank.__getitem__)]
+        while self.dependents[path[-1]]:
+            path.append(max(self.dependents[path[-1]], key=self.rank.__getitem__))
+        return path
+
+    def _add_edge(self, before: str, after: str) -> None:
+        """Record that ``after`` waits for ``before``."""
+        if before not in self.tasks or after not in self.tasks:
+            return
+        if before == after:
+            raise DependencyCycleError([before, after])
+        if before not in self.dependencies[after]:
+            self.dependencies[after].append(before)
+            self.dependents[before].append(after)
+
+    def _topological_order(self) -> List[str]:
+        """Kahn's algorithm; raises with one concrete cycle if it stalls."""
+        pending = {task_id: len(deps) for task_id, deps in self.dependencies.items()}
+        ready = deque(task_id for task_id, count in pending.items() if count == 0)
+        order = []
+
+        while ready:
+            task_id = ready.popleft()
+            order.append(task_id)
+            for dependent in self.dependents[task_id]:
+                pending[dependent] -= 1
+                if pending[dependent] == 0:
+                    ready.append(dependent)
+
+        if len(order) < len(self.tasks):
+            raise DependencyCycleError(self._find_cycle(pending))
+        return order
+
+    def _find_cycle(self, pending: Dict[str, int]) -> List[str]:
+        """Walk unfinished dependencies until a task repeats."""
+        node = next(task_id for task_id, count in pending.items() if count > 0)
+        seen: Dict[str, int] = {}
+        path = []
+        while node not in seen:
+            seen[node] = len(path)
+            path.append(node)
+            node = next(d for d in self.dependencies[node] if pending[d] > 0)
+        cycle = path[seen[node]:]
+        cycle.reverse()
+        return cycle + [cycle[0]]
+
+
+class DAGExecutor:
+    """Runs tasks in dependency order with at most ``max_concurrency`` at once.
+
+    Ready tasks wait in a heap ordered by critical-path length, then task
+    priority, then submission order, so the longest chain starts first.
+    Each completion releases its dependents by decrementing their pending
+    counts. When a task does not succeed, its dependents are not run and
+    get a ``CANCELLED`` result instead.
+    """
+
+    SUCCESS_STATUSES = (ResultStatus.SUCCESS, ResultStatus.PARTIAL)
+
+    def __init__(self,
+                 run: Callable[[Task], Awaitable[Result]],
+                 max_concurrency: int = 4,
+                 estimate: Optional[Callable[[Task], float]] = None):
+        """Initialize the executor.
+
+        Args:
+            run: Coroutine function executing one task
+            max_concurrency: Most tasks running at the same time
+            estimate: Expected duration of a task, used for critical-path
+                priority (defaults to 1 per task)
+        """
+        self.run = run
+        self.max_concurrency = max(1, max_concurrency)
+        self.estimate = estimate
+
+    async def execute(self, tasks: Iterable[Task]) -> Dict[str, Result]:
+        """Run all tasks and return results keyed by task id, in completion order."""
+        return {task.id: result async for task, result in self.stream(tasks)}
+
+    async def stream(self, tasks: Iterable[Task]) -> AsyncIterator[Tuple[Task, Result]]:
+        """Run all tasks, yielding each ``(task, result)`` as soon as it is available.
+
+        Raises:
+            DependencyCycleError: Before anything runs, if dependencies form a cycle
+        """
+        graph = TaskGraph(tasks, self.estimate)
+        pending = {task_id: len(deps) for task_id, deps in graph.dependencies.items()}
+        blocked_by: Dict[str, str] = {}
+        sequence = {task_id: i for i, task_id in enumerate(graph.tasks)}
+
+        ready: List[Tuple[float, int, int, str]] = []
+
+        def push(task_id: str) -> None:
+            task = graph.tasks[task_id]
+            heapq.heappush(ready, (-graph.rank[task_id], -task.priority, sequence[task_id], task_id))
+
+        for task_id in graph.roots():
+            push(task_id)
+
+        running: Dict[asyncio.Future, str] = {}
+        try:
+            while ready or running:
+                while ready and len(running) < self.max_concurrency:
+                    task_id = heapq.heappop(ready)[3]
+                    running[asyncio.ensure_future(self._run_task(graph.tasks[task_id]))] = task_id
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    task_id = running.pop(future)
+                    result = future.result()
+                    yield graph.tasks[task_id], result
+
+                    # Release dependents; skipped tasks release theirs in turn
+                    finished = deque([(task_id, result.status in self.SUCCESS_STATUSES)])
+                    while finished:
+                        finished_id, succeeded = finished.popleft()
+                        for dependent in graph.dependents[finished_id]:
+                            if not succeeded:
+                                blocked_by.setdefault(dependent, finished_id)
+                            pending[dependent] -= 1
+                            if pending[dependent]:
+                                continue
+                            if dependent in blocked_by:
+                                task = graph.tasks[dependent]
+                                yield task, self._skipped(task, blocked_by[dependent])
+                                finished.append((dependent, False))
+                            else:
+                                push(dependent)
+        finally:
+            for future in running:
+                future.cancel()
+
+    async def _run_task(self, task: Task) -> Result:
+        """Run one task, turning an exception into an ``ERROR`` result."""
+        try:
+            return await self.run(task)
+        except Exception as e:
+            logger.error(f"Task {task.id} failed: {e}")
+            return Result(
+                task_id=task.id,
+                status=ResultStatus.ERROR,
+                errors=[str(e)],
+                completed_at=datetime.now()
+            )
+
+    @staticmethod
+    def _skipped(task: Task, dependency: str) -> Result:
+        """Result for a task whose dependency did not succeed."""
+        return Result(
+            task_id=task.id,
+            status=ResultStatus.CANCELLED,
+            errors=[f"Dependency {dependency} did not succeed"],
+            completed_at=datetime.now()
+        )
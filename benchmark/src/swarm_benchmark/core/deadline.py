@@ -0,0 +1,54 @@
+"""Per-task deadlines shared by every execution mode."""
+
+import asyncio
+import time
+from datetime import datetime
+from typing import Awaitable, Optional, TypeVar
+
+from .models import Task, Result, ResultStatus, TaskStatus
+
+
+T = TypeVar("T")
+
+
+def effective_timeout(*timeouts: Optional[float]) -> Optional[float]:
+    """The tightest of several timeouts; unset or non-positive ones are ignored."""
+    limits = [t for t in timeouts if t is not None and t > 0]
+    return min(limits) if limits else None
+
+
+async def run_with_deadline(awaitable: Awaitable[T], timeout: Optional[float]) -> T:
+    """Await ``awaitable``, cancelling it once ``timeout`` seconds have passed.
+
+    Raises:
+        asyncio.TimeoutError: If the deadline passes first
+    """
+    if timeout is None:
+        return await awaitable
+    if hasattr(asyncio, "timeout"):
+        async with asyncio.timeout(timeout):
+            return await awaitable
+    return await asyncio.wait_for(awaitable, timeout)
+
+
+def timeout_result(task: Task, timeout: float, started_at: float) -> Result:
+    """Mark ``task`` timed out and build its result from what is known so far.
+
+    Args:
+        task: Task that missed its deadline
+        timeout: Deadline in seconds
+        started_at: ``time.time()`` when the task started
+
+    Returns:
+        A ``TIMEOUT`` result with start/end times and elapsed time filled in
+    """
+    task.status = TaskStatus.TIMEOUT
+    result = Result(
+        task_id=task.id,
+        status=ResultStatus.TIMEOUT,
+        errors=[f"Task timed out after {timeout:g} seconds"],
+        started_at=datetime.fromtimestamp(started_at),
+        completed_at=datetime.now()
+    )
+    result.performance_metrics.execution_time = time.time() - started_at
+    return result
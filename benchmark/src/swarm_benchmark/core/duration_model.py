@@ -0,0 +1,178 @@
+"""Learned task duration estimates for scheduling and progress reporting."""
+
+from __future__ import annotations
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+from .models import Result, ResultStatus, Task
+from .streaming_stats import QuantileSketch
+
+
+# Wildcard in pooled keys: any agent, strategy or complexity
+ANY = ""
+
+COMPLEXITY_LEVELS = ("simple", "medium", "complex")
+
+# Outcomes whose execution time says nothing about how long the task takes
+_CENSORED_STATUSES = (ResultStatus.TIMEOUT, ResultStatus.CANCELLED)
+
+
+def task_complexity(task: Task) -> str:
+    """Complexity bucket of a task: ``simple``, ``medium`` or ``complex``.
+
+    An explicit ``complexity`` parameter wins; otherwise the bucket comes
+    from the size of the objective, description and parameters.
+    """
+    explicit = task.parameters.get("complexity")
+    if explicit is not None:
+        return str(explicit)
+
+    score = (min(len(task.objective.split()) / 20.0, 1.0)
+             + min(len((task.description or "").split()) / 50.0, 1.0)
+             + min(len(task.parameters) / 10.0, 1.0)) / 3
+    return COMPLEXITY_LEVELS[min(int(score * len(COMPLEXITY_LEVELS)), len(COMPLEXITY_LEVELS) - 1)]
+
+
+class DurationStats:
+    """Exponentially weighted mean and quantile sketch of observed durations."""
+
+    def __init__(self, alpha: float = 0.3):
+        self.alpha = alpha
+        self.count = 0
+        self.ewma = 0.0
+        self.sketch = QuantileSketch()
+
+    def add(self, duration: float) -> None:
+        """Fold in one duration (seconds)."""
+        self.count += 1
+        if self.count == 1:
+            self.ewma = duration
+        else:
+            self.ewma += self.alpha * (duration - self.ewma)
+        self.sketch.add(duration)
+
+    def estimate(self, quantile: Optional[float] = None) -> float:
+        """The EWMA, or the given quantile of all observations."""
+        return self.ewma if quantile is None else self.sketch.quantile(quantile)
+
+
+class DurationEstimator:
+    """Predicts task durations per (agent, strategy, complexity).
+
+    Each completed result updates the stats for its exact key and for the
+    pooled keys (strategy and complexity over all agents, strategy alone,
+    everything). ``estimate`` uses the most specific key with at least
+    ``min_samples`` observations and ``default_duration`` when nothing is
+    known yet. Stats can be saved to and loaded from the results database
+    (see ``SQLiteManager.save_duration_model``).
+    """
+
+    def __init__(self, alpha: float = 0.3, min_samples: int = 1,
+                 default_duration: float = 60.0):
+        """Initialize the estimator.
+
+        Args:
+            alpha: EWMA weight of the newest observation
+            min_samples: Observations a key needs before it is used
+            default_duration: Seconds predicted with no usable history
+        """
+        self.alpha = alpha
+        self.min_samples = min_samples
+        self.default_duration = default_duration
+        self._stats: Dict[Tuple[str, str, str], DurationStats] = {}
+        # (strategy, complexity) -> agent id -> stats, for per-agent lookups
+        self._by_kind: Dict[Tuple[str, str], Dict[str, DurationStats]] = {}
+
+    def __len__(self) -> int:
+        return len(self._stats)
+
+    @staticmethod
+    def kind(task: Task) -> Tuple[str, str]:
+        """(strategy, complexity) of a task, the task part of every key."""
+        return task.strategy.value, task_complexity(task)
+
+    def observe(self, agent_id: str, task: Task, duration: float) -> None:
+        """Record that ``agent_id`` took ``duration`` seconds for ``task``."""
+        strategy, complexity = self.kind(task)
+        keys = [(ANY, strategy, complexity), (ANY, strategy, ANY), (ANY, ANY, ANY)]
+        if agent_id:
+            keys.insert(0, (agent_id, strategy, complexity))
+        for key in keys:
+            self._get(key).add(duration)
+
+    def observe_result(self, result: Result, task: Task,
+                       agent_id: Optional[str] = None) -> bool:
+        """Record a completed result's execution time.
+
+        Timed out and cancelled results, and results without a positive
+        execution time, are skipped.
+
+        Args:
+            result: Completed result
+            task: Task the result is for
+            agent_id: Pool agent that ran the task; strategies label
+                ``result.agent_id`` with their own names, so callers that
+                know the scheduled agent should pass it
+
+        Returns:
+            Whether the result was recorded
+        """
+        duration = result.performance_metrics.execution_time
+        if duration <= 0 or result.status in _CENSORED_STATUSES:
+            return False
+        if not agent_id:
+            agent_id = result.agent_id or (task.assigned_agents[-1] if task.assigned_agents else ANY)
+        self.observe(agent_id, task, duration)
+        return True
+
+    def estimate(self, agent_id: Optional[str] = None, task: Optional[Task] = None,
+                 quantile: Optional[float] = None) -> float:
+        """Predicted duration in seconds.
+
+        Args:
+            agent_id: Agent to run the task (None for any agent)
+            task: Task to run (None for a typical task)
+            quantile: Return this quantile instead of the EWMA, e.g. 0.9
+                for a conservative estimate
+        """
+        if task is None:
+            keys = [(ANY, ANY, ANY)]
+        else:
+            strategy, complexity = self.kind(task)
+            keys = [(ANY, strategy, complexity), (ANY, strategy, ANY), (ANY, ANY, ANY)]
+            if agent_id:
+                keys.insert(0, (agent_id, strategy, complexity))
+        for key in keys:
+            stats = self._stats.get(key)
+            if stats is not None and stats.count >= self.min_samples:
+                return stats.estimate(quantile)
+        return self.default_duration
+
+    def agent_estimates(self, task: Task, quantile: Optional[float] = None) -> Dict[str, float]:
+        """Predicted durations of ``task`` for agents with history of its kind.
+
+        Every other agent gets ``estimate(None, task)``.
+        """
+        return {
+            agent_id: stats.estimate(quantile)
+            for agent_id, stats in self._by_kind.get(self.kind(task), {}).items()
+            if stats.count >= self.min_samples
+        }
+
+    def items(self) -> Iterator[Tuple[Tuple[str, str, str], DurationStats]]:
+        """All ((agent, strategy, complexity), stats) pairs, pooled keys included."""
+        return iter(self._stats.items())
+
+    def load(self, items: Iterable[Tuple[Tuple[str, str, str], DurationStats]]) -> None:
+        """Replace the stats for the given keys (as yielded by ``items``)."""
+        for key, stats in items:
+            self._stats[key] = stats
+            if key[0] != ANY:
+                self._by_kind.setdefault(key[1:], {})[key[0]] = stats
+
+    def _get(self, key: Tuple[str, str, str]) -> DurationStats:
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = DurationStats(self.alpha)
+            if key[0] != ANY:
+                self._by_kind.setdefault(key[1:], {})[key[0]] = stats
+        return stats
@@ -165,6 +165,45 @@ class OutputParser:
         "swarm_id": re.compile(r"Swarm ID:\s*([^\n]+)"),
     }
     
+    # Literal that every match of a pattern contains -> patterns to try.
+    # Lines without any of these cannot match and are skipped.
+    TRIGGERS = {
+        "Task created:": ("task_created",),
+        "✅": ("task_completed", "test_passed"),
+        "Agent": ("agent_started", "agent_completed"),
+        "❌": ("error", "test_failed"),
+        "ERROR": ("error",),
+        "Error": ("error",),
+        "⚠️": ("warning",),
+        "WARNING": ("warning",),
+        "Warning": ("warning",),
+        "Created file:": ("file_created",),
+        "Modified file:": ("file_modified",),
+        "Coverage:": ("coverage",),
+        "Duration:": ("duration",),
+        "Stored in memory:": ("memory_stored",),
+        "Swarm ID:": ("swarm_id",),
+    }
+    TRIGGER_PATTERN = re.compile("|".join(re.escape(literal) for literal in TRIGGERS))
+    
+    # Pattern -> (result section or None for top level, key)
+    FIELDS = {
+        "task_created": ("tasks", "created"),
+        "task_completed": ("tasks", "completed"),
+        "agent_started": ("agents", "started"),
+        "agent_completed": ("agents", "completed"),
+        "file_created": ("files", "created"),
+        "file_modified": ("files", "modified"),
+        "test_passed": ("tests", "passed"),
+        "test_failed": ("tests", "failed"),
+        "coverage": ("tests", "coverage"),
+        "error": (None, "errors"),
+        "warning": (None, "warnings"),
+        "memory_stored": (None, "memory_keys"),
+        "swarm_id": (None, "swarm_id"),
+        "duration": (None, "duration"),
+    }
+    
     @classmethod
     def parse_output(cls, output: str) -> Dict[str, Any]:
         """
@@ -176,7 +215,14 @@ class OutputParser:
         Returns:
             Dictionary with parsed information
         """
-        result = {
+        result = cls.empty_result()
+        cls.parse_lines(output, result)
+        return result
+        
+    @classmethod
+    def empty_result(cls) -> Dict[str, Any]:
+        """Empty parse result, filled in line by line with ``parse_line``."""
+        return {
             "tasks": {
                 "created": [],
                 "completed": []
@@ -201,79 +247,188 @@ class OutputParser:
             "duration": None
         }
         
-        # Extract matches
-        for line in output.split('\n'):
-            # Tasks
-            if match := cls.PATTERNS["task_created"].search(line):
-                result["tasks"]["created"].append(match.group(1))
-            if match := cls.PATTERNS["task_completed"].search(line):
-                result["tasks"]["completed"].append(match.group(1))
-                
-            # Agents
-            if match := cls.PATTERNS["agent_started"].search(line):
-                result["agents"]["started"].append(match.group(1))
-            if match := cls.PATTERNS["agent_completed"].search(line):
-                result["agents"]["completed"].append(match.group(1))
-                
-            # Files
-            if match := cls.PATTERNS["file_created"].search(line):
-                result["files"]["created"].append(match.group(1))
-            if match := cls.PATTERNS["file_modified"].search(line):
-                result["files"]["modified"].append(match.group(1))
-                
-            # Tests
-            if match := cls.PATTERNS["test_passed"].search(line):
-                result["tests"]["passed"] = int(match.group(1))
-            if match := cls.PATTERNS["test_failed"].search(line):
-                result["tests"]["failed"] = int(match.group(1))
-            if match := cls.PATTERNS["coverage"].search(line):
-                result["tests"]["coverage"] = float(match.group(1))
-                
-            # Errors and warnings
-            if match := cls.PATTERNS["error"].search(line):
-                result["errors"].append(match.group(1))
-            if match := cls.PATTERNS["warning"].search(line):
-                result["warnings"].append(match.group(1))
-                
-            # Memory
-            if match := cls.PATTERNS["memory_stored"].search(line):
-                result["memory_keys"].append(match.group(1))
-                
-            # Swarm ID
-            if match := cls.PATTERNS["swarm_id"].search(line):
-                result["swarm_id"] = match.group(1)
-                
-            # Duration
-            if match := cls.PATTERNS["duration"].search(line):
-                value = float(match.group(1))
-                unit = match.group(2)
-                # Convert to seconds
-                if unit == "ms":
-                    value /= 1000
-                elif unit == "m":
-                    value *= 60
-                elif unit == "h":
-                    value *= 3600
-                result["duration"] = value
+    @classmethod
+    def parse_lines(cls, text: str, result: Dict[str, Any]) -> None:
+        """
+        Parse newline-separated output into ``result``.
+        
+        One scan of ``text`` for trigger literals finds the lines worth
+        parsing; all other lines are never split out.
+        
+        Args:
+            text: One or more lines of claude-flow output
+            result: Parse result from ``empty_result`` to update
+        """
+        line_end = -1
+        for trigger in cls.TRIGGER_PATTERN.finditer(text):
+            position = trigger.start()
+            if position < line_end:
+                continue
+            line_start = text.rfind("\n", 0, position) + 1
+            line_end = text.find("\n", position)
+            if line_end < 0:
+                line_end = len(text)
+            cls.parse_line(text[line_start:line_end], result)
+            
+    @classmethod
+    def parse_line(cls, line: str, result: Dict[str, Any]) -> None:
+        """
+        Parse a single line of output into ``result``.
+        
+        Args:
+            line: One line of claude-flow output
+            result: Parse result from ``empty_result`` to update
+        """
+        names = {
+            name
+            for trigger in cls.TRIGGER_PATTERN.findall(line)
+            for name in cls.TRIGGERS[trigger]
+        }
+        for name in names:
+            if match := cls.PATTERNS[name].search(line):
+                cls._store(name, match, result)
                 
-        return result
+    @classmethod
+    def _store(cls, name: str, match: re.Match, result: Dict[str, Any]) -> None:
+        """Record one pattern match in ``result``."""
+        section, key = cls.FIELDS[name]
+        target = result[section] if section else result
+        
+        if name in ("test_passed", "test_failed"):
+            value = int(match.group(1))
+        elif name == "coverage":
+            value = float(match.group(1))
+        elif name == "duration":
+            value = float(match.group(1))
+            unit = match.group(2)
+            # Convert to seconds
+            if unit == "ms":
+                value /= 1000
+            elif unit == "m":
+                value *= 60
+            elif unit == "h":
+                value *= 3600
+        else:
+            value = match.group(1)
+            
+        if isinstance(target[key], list):
+            target[key].append(value)
+        else:
+            target[key] = value
         
     @classmethod
     def extract_json_blocks(cls, output: str) -> List[Dict[str, Any]]:
-        """Extract JSON blocks from output."""
-        json_blocks = []
+        """Extract JSON objects, including nested ones, from output."""
+        return JSONBlockDecoder().feed(output, final=True)
+
+
+class JSONBlockDecoder:
+    """Incrementally extract top-level JSON objects from free-form text.
+    
+    Each ``{`` is tried as the start of an object with
+    ``json.JSONDecoder.raw_decode``, so nested objects are returned whole.
+    An object cut off at the end of a chunk is kept (up to ``max_bytes``)
+    and retried when the next chunk arrives.
+    """
+    
+    # Remainders of a truncated literal or number after the decoder gave up
+    _PARTIAL_TOKENS = ("true", "false", "null", "NaN", "Infinity", "-Infinity")
+    _PARTIAL_NUMBER = re.compile(r"[-+.\deE]+")
+    
+    def __init__(self, max_bytes: int = 1024 * 1024):
+        """
+        Initialize the decoder.
+        
+        Args:
+            max_bytes: Longest incomplete object held between chunks
+        """
+        self.max_bytes = max_bytes
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
         
-        # Find JSON-like blocks
-        json_pattern = re.compile(r'\{[^{}]*\}', re.DOTALL)
+    def feed(self, chunk: str, final: bool = False) -> List[Dict[str, Any]]:
+        """
+        Add text and return the objects completed by it.
+        
+        Args:
+            chunk: Next piece of output
+            final: No more text follows; give up on incomplete objects
+        """
+        text = self._buffer + chunk if self._buffer else chunk
+        self._buffer = ""
+        blocks = []
+        position = 0
         
-        for match in json_pattern.finditer(output):
+        while (start := text.find("{", position)) >= 0:
             try:
-                data = json.loads(match.group())
-                json_blocks.append(data)
-            except json.JSONDecodeError:
-                pass
-                
-        return json_blocks
+                data, end = self._decoder.raw_decode(text, start)
+            except json.JSONDecodeError as e:
+                if (not final and len(text) - start <= self.max_bytes
+                        and self._incomplete(text, e)):
+                    self._buffer = text[start:]
+                    break
+                position = start + 1
+                continue
+            blocks.append(data)
+            position = end
+            
+        return blocks
+        
+    def close(self) -> List[Dict[str, Any]]:
+        """Flush held text, returning any objects it still contains."""
+        return self.feed("", final=True)
+        
+    @classmethod
+    def _incomplete(cls, text: str, error: json.JSONDecodeError) -> bool:
+        """Whether decoding failed only because ``text`` ended too soon."""
+        tail = text[error.pos:].strip()
+        return (
+            not tail
+            or error.msg.startswith("Unterminated string")
+            or any(token.startswith(tail) for token in cls._PARTIAL_TOKENS)
+            or cls._PARTIAL_NUMBER.fullmatch(tail) is not None
+        )
+
+
+class OutputStreamParser:
+    """Incremental ``OutputParser`` for output that arrives in chunks.
+    
+    Chunks may split lines and JSON objects anywhere; complete lines are
+    parsed as soon as their newline arrives.
+    """
+    
+    def __init__(self, extract_json: bool = True):
+        """
+        Initialize the parser.
+        
+        Args:
+            extract_json: Also collect JSON objects into ``json_blocks``
+        """
+        self.result = OutputParser.empty_result()
+        self.json_blocks: List[Dict[str, Any]] = []
+        self._json = JSONBlockDecoder() if extract_json else None
+        self._pending: List[str] = []
+        
+    def feed(self, chunk: str) -> None:
+        """Parse the complete lines in ``chunk`` and hold the remainder."""
+        if self._json is not None:
+            self.json_blocks.extend(self._json.feed(chunk))
+            
+        cut = chunk.rfind("\n")
+        if cut < 0:
+            self._pending.append(chunk)
+            return
+        self._pending.append(chunk[:cut])
+        OutputParser.parse_lines("".join(self._pending), self.result)
+        self._pending = [chunk[cut + 1:]]
+        
+    def close(self) -> Dict[str, Any]:
+        """Parse the final partial line and return the result."""
+        OutputParser.parse_lines("".join(self._pending), self.result)
+        self._pending = []
+        if self._json is not None:
+            self.json_blocks.extend(self._json.close())
+        return self.result
 
 
 class CommandBuilder:
@@ -7,6 +7,15 @@ from enum import Enum
 from typing import Dict, List, Optional, Any, Union
 import uuid
 
+from .streaming_stats import QuantileSketch, Reservoir, RollingWindow
+
+
+# Agent statistics: tasks in the rolling windows, execution times sampled
+# for percentiles, and EWMA weight of the newest execution time
+AGENT_WINDOW_SIZE = 100
+AGENT_RESERVOIR_SIZE = 256
+AGENT_EWMA_ALPHA = 0.2
+
 
 class TaskStatus(Enum):
     """Task execution status."""
@@ -137,7 +146,14 @@ class Task:
 
 @dataclass
 class Agent:
-    """Agent model for benchmarking."""
+    """Agent model for benchmarking.
+    
+    Performance is summarized in constant time and memory: lifetime counts
+    and mean, an EWMA of execution time, rolling windows over the last
+    ``AGENT_WINDOW_SIZE`` tasks and a bounded reservoir sample for
+    execution time percentiles. Every ``PerformanceMetrics`` is also kept in
+    ``performance_history`` only when ``keep_history`` is set.
+    """
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     type: AgentType = AgentType.SPECIALIST
     name: str = ""
@@ -151,25 +167,82 @@ class Agent:
     total_tasks_failed: int = 0
     average_execution_time: float = 0.0
     success_rate: float = 1.0
+    ewma_execution_time: float = 0.0
+    keep_history: bool = False
+    
+    # Running accumulators behind update_performance; not part of the
+    # agent's identity or repr.
+    _execution_time_count: int = field(default=0, init=False, repr=False, compare=False)
+    _execution_time_sum: float = field(default=0.0, init=False, repr=False, compare=False)
+    _recent_execution_times: RollingWindow = field(
+        default_factory=lambda: RollingWindow(AGENT_WINDOW_SIZE), init=False, repr=False, compare=False
+    )
+    _recent_outcomes: RollingWindow = field(
+        default_factory=lambda: RollingWindow(AGENT_WINDOW_SIZE), init=False, repr=False, compare=False
+    )
+    _execution_time_sample: Reservoir = field(
+        default_factory=lambda: Reservoir(AGENT_RESERVOIR_SIZE), init=False, repr=False, compare=False
+    )
+    
+    def __hash__(self) -> int:
+        """Hash by id so agents can key assignment maps."""
+        return hash(self.id)
     
     def update_performance(self, metrics: PerformanceMetrics) -> None:
-        """Update agent performance metrics."""
-        self.performance_history.append(metrics)
+        """Fold one task's metrics into the agent's statistics in O(1)."""
+        if self.keep_history:
+            self.performance_history.append(metrics)
         self.last_active = datetime.now()
         
-        if metrics.success_rate > 0:
+        succeeded = metrics.success_rate > 0
+        if succeeded:
             self.total_tasks_completed += 1
         else:
             self.total_tasks_failed += 1
+        self._recent_outcomes.add(1.0 if succeeded else 0.0)
             
         total_tasks = self.total_tasks_completed + self.total_tasks_failed
         if total_tasks > 0:
             self.success_rate = self.total_tasks_completed / total_tasks
             
-        # Calculate average execution time
-        execution_times = [m.execution_time for m in self.performance_history if m.execution_time > 0]
-        if execution_times:
-            self.average_execution_time = sum(execution_times) / len(execution_times)
+        execution_time = metrics.execution_time
+        if execution_time > 0:
+            self._execution_time_count += 1
+            self._execution_time_sum += execution_time
+            self.average_execution_time = self._execution_time_sum / self._execution_time_count
+            if self._execution_time_count == 1:
+                self.ewma_execution_time = execution_time
+            else:
+                self.ewma_execution_time += AGENT_EWMA_ALPHA * (execution_time - self.ewma_execution_time)
+            self._recent_execution_times.add(execution_time)
+            self._execution_time_sample.add(execution_time)
+    
+    @property
+    def recent_success_rate(self) -> float:
+        """Success rate over the last ``AGENT_WINDOW_SIZE`` tasks."""
+        return self._recent_outcomes.mean(default=self.success_rate)
+    
+    @property
+    def recent_average_execution_time(self) -> float:
+        """Mean execution time over the last ``AGENT_WINDOW_SIZE`` timed tasks."""
+        return self._recent_execution_times.mean()
+    
+    @property
+    def p50_execution_time(self) -> float:
+        """Median execution time."""
+        return self.execution_time_percentile(0.5)
+    
+    @property
+    def p95_execution_time(self) -> float:
+        """95th percentile execution time."""
+        return self.execution_time_percentile(0.95)
+    
+    def execution_time_percentile(self, q: float) -> float:
+        """Execution time quantile (``q`` in [0, 1]) from the reservoir sample.
+        
+        Exact until ``AGENT_RESERVOIR_SIZE`` timed tasks, estimated after.
+        """
+        return self._execution_time_sample.quantile(q)
 
 
 @dataclass
@@ -216,31 +289,77 @@ class BenchmarkMetrics:
     total_cpu_time: float = 0.0
     network_overhead: float = 0.0
     
-    def update_from_results(self, results: List[Result]) -> None:
-        """Update metrics from result list."""
-        if not results:
-            return
-            
-        self.total_tasks = len(results)
-        self.completed_tasks = len([r for r in results if r.status == ResultStatus.SUCCESS])
-        self.failed_tasks = len([r for r in results if r.status in [ResultStatus.FAILURE, ResultStatus.ERROR]])
+    # Running accumulators behind the incremental update; not part of the
+    # serialized metrics.
+    _execution_time_count: int = field(default=0, init=False, repr=False, compare=False)
+    _quality_count: int = field(default=0, init=False, repr=False, compare=False)
+    _quality_sum: float = field(default=0.0, init=False, repr=False, compare=False)
+    _memory_sample_count: int = field(default=0, init=False, repr=False, compare=False)
+    _execution_time_sketch: QuantileSketch = field(
+        default_factory=QuantileSketch, init=False, repr=False, compare=False
+    )
+    
+    def update_from_result(self, result: Result) -> None:
+        """Fold a single new result into the metrics in constant time."""
+        self.total_tasks += 1
+        if result.status == ResultStatus.SUCCESS:
+            self.completed_tasks += 1
+        elif result.status in (ResultStatus.FAILURE, ResultStatus.ERROR):
+            self.failed_tasks += 1
+        self.success_rate = self.completed_tasks / self.total_tasks
         
-        if self.total_tasks > 0:
-            self.success_rate = self.completed_tasks / self.total_tasks
+        execution_time = result.performance_metrics.execution_time
+        if execution_time > 0:
+            self._execution_time_count += 1
+            if self._execution_time_count == 1:
+                self.total_execution_time = 0.0
+            self.total_execution_time += execution_time
+            self.average_execution_time = self.total_execution_time / self._execution_time_count
+            self._execution_time_sketch.add(execution_time)
             
-        execution_times = [r.performance_metrics.execution_time for r in results if r.performance_metrics.execution_time > 0]
-        if execution_times:
-            self.average_execution_time = sum(execution_times) / len(execution_times)
-            self.total_execution_time = sum(execution_times)
+        quality = result.quality_metrics.overall_quality
+        if quality > 0:
+            self._quality_count += 1
+            self._quality_sum += quality
+            self.quality_score = self._quality_sum / self._quality_count
             
-        quality_scores = [r.quality_metrics.overall_quality for r in results if r.quality_metrics.overall_quality > 0]
-        if quality_scores:
-            self.quality_score = sum(quality_scores) / len(quality_scores)
+        peak_memory = result.resource_usage.peak_memory_mb
+        if peak_memory > 0:
+            self._memory_sample_count += 1
+            if self._memory_sample_count == 1 or peak_memory > self.peak_memory_usage:
+                self.peak_memory_usage = peak_memory
+    
+    def update_from_results(self, results: List[Result]) -> None:
+        """Recompute metrics from the full result list.
+        
+        Produces the same numbers as feeding each result to
+        ``update_from_result`` in order.
+        """
+        if not results:
+            return
             
-        # Resource utilization
-        memory_usage = [r.resource_usage.peak_memory_mb for r in results if r.resource_usage.peak_memory_mb > 0]
-        if memory_usage:
-            self.peak_memory_usage = max(memory_usage)
+        self.reset_accumulators()
+        for result in results:
+            self.update_from_result(result)
+    
+    def reset_accumulators(self) -> None:
+        """Zero the running counters so results can be replayed."""
+        self.total_tasks = 0
+        self.completed_tasks = 0
+        self.failed_tasks = 0
+        self._execution_time_count = 0
+        self._quality_count = 0
+        self._quality_sum = 0.0
+        self._memory_sample_count = 0
+        self._execution_time_sketch.clear()
+    
+    def execution_time_percentile(self, q: float) -> float:
+        """Approximate execution time quantile (``q`` in [0, 1])."""
+        return self._execution_time_sketch.quantile(q)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Public metric fields as a plain dictionary."""
+        return {k: v for k, v in self.__dict__.items() if not k.startswith('_')}
 
 
 @dataclass
@@ -269,6 +388,48 @@ class BenchmarkConfig:
     verbose: bool = False
 
 
+class _TrackedList(list):
+    """List that reports mutations to the object indexing its contents.
+    
+    ``append`` reports the new item so indexes can be extended in place;
+    every other mutation only marks the index stale. Copies and pickles
+    degrade to a plain list.
+    """
+    __slots__ = ("_on_append", "_on_change")
+    
+    def __init__(self, iterable=(), on_append=None, on_change=None):
+        super().__init__(iterable)
+        self._on_append = on_append
+        self._on_change = on_change
+    
+    def __reduce__(self):
+        return (list, (list(self),))
+    
+    def append(self, item) -> None:
+        super().append(item)
+        if self._on_append is not None:
+            self._on_append(item)
+
+
+def _invalidating(name: str):
+    method = getattr(list, name)
+    
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        if self._on_change is not None:
+            self._on_change()
+        return result
+    
+    wrapper.__name__ = name
+    return wrapper
+
+
+for _name in ("extend", "insert", "remove", "pop", "clear", "sort", "reverse",
+              "__setitem__", "__delitem__", "__iadd__", "__imul__"):
+    setattr(_TrackedList, _name, _invalidating(_name))
+del _name
+
+
 @dataclass
 class Benchmark:
     """Benchmark model for complete benchmark runs."""
@@ -287,6 +448,19 @@ class Benchmark:
     error_log: List[str] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
     
+    # Hash indexes over tasks, agents and results, kept current by add_* and
+    # by the tracked lists; ids are treated as immutable once added.
+    _task_index: Dict[str, Task] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _agent_index: Dict[str, Agent] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _results_by_task: Dict[str, List[Result]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _results_by_agent: Dict[str, List[Result]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _tracked: Dict[str, List[Any]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _stale_indexes: set = field(default_factory=set, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        for name in ("tasks", "agents", "results"):
+            self._track(name)
+    
     def duration(self) -> Optional[float]:
         """Calculate benchmark duration in seconds."""
         if self.started_at and self.completed_at:
@@ -304,20 +478,67 @@ class Benchmark:
     def add_result(self, result: Result) -> None:
         """Add a result to the benchmark."""
         self.results.append(result)
-        self.metrics.update_from_results(self.results)
+        self.metrics.update_from_result(result)
     
     def get_task_by_id(self, task_id: str) -> Optional[Task]:
         """Get task by ID."""
-        return next((t for t in self.tasks if t.id == task_id), None)
+        self._ensure_index("tasks")
+        return self._task_index.get(task_id)
     
     def get_agent_by_id(self, agent_id: str) -> Optional[Agent]:
         """Get agent by ID."""
-        return next((a for a in self.agents if a.id == agent_id), None)
+        self._ensure_index("agents")
+        return self._agent_index.get(agent_id)
     
     def get_results_by_task_id(self, task_id: str) -> List[Result]:
         """Get all results for a specific task."""
-        return [r for r in self.results if r.task_id == task_id]
+        self._ensure_index("results")
+        return list(self._results_by_task.get(task_id, ()))
     
     def get_results_by_agent_id(self, agent_id: str) -> List[Result]:
         """Get all results for a specific agent."""
-        return [r for r in self.results if r.agent_id == agent_id]
\ No newline at end of file
+        self._ensure_index("results")
+        return list(self._results_by_agent.get(agent_id, ()))
+    
+    def _track(self, name: str) -> None:
+        """Wrap a collection so its mutations keep the index current."""
+        tracked = _TrackedList(
+            getattr(self, name),
+            on_append=getattr(self, f"_index_{name}"),
+            on_change=lambda: self._stale_indexes.add(name),
+        )
+        setattr(self, name, tracked)
+        self._tracked[name] = tracked
+        self._rebuild_index(name)
+    
+    def _ensure_index(self, name: str) -> None:
+        """Bring an index up to date after direct list mutation or reassignment."""
+        items = getattr(self, name)
+        if type(items) is not _TrackedList or items is not self._tracked.get(name):
+            self._track(name)
+        elif name in self._stale_indexes:
+            self._rebuild_index(name)
+    
+    def _rebuild_index(self, name: str) -> None:
+        if name == "tasks":
+            self._task_index.clear()
+        elif name == "agents":
+            self._agent_index.clear()
+        else:
+            self._results_by_task.clear()
+            self._results_by_agent.clear()
+        
+        index_item = getattr(self, f"_index_{name}")
+        for item in getattr(self, name):
+            index_item(item)
+        self._stale_indexes.discard(name)
+    
+    def _index_tasks(self, task: Task) -> None:
+        self._task_index.setdefault(task.id, task)
+    
+    def _index_agents(self, agent: Agent) -> None:
+        self._agent_index.setdefault(agent.id, agent)
+    
+    def _index_results(self, result: Result) -> None:
+        self._results_by_task.setdefault(result.task_id, []).append(result)
+        self._results_by_agent.setdefault(result.agent_id, []).append(result)
@@ -7,6 +7,7 @@ import time
 
 from .models import Benchmark, Task, Result, BenchmarkConfig, TaskStatus, StrategyType, CoordinationMode
 from .benchmark_engine import BenchmarkEngine
+from .result_cache import ResultCache, fingerprint, claude_flow_version
 from ..strategies import create_strategy
 from ..output.json_writer import JSONWriter
 from ..output.sqlite_manager import SQLiteManager
@@ -20,7 +21,6 @@ try:
     from src.swarm.optimizations import (
         OptimizedExecutor,
         CircularBuffer,
-        TTLMap,
         AsyncFileManager
     )
     OPTIMIZATIONS_AVAILABLE = True
@@ -32,12 +32,32 @@ except ImportError:
 class OptimizedBenchmarkEngine(BenchmarkEngine):
     """Optimized benchmark engine with performance improvements."""
     
-    def __init__(self, config: Optional[BenchmarkConfig] = None, enable_optimizations: bool = True):
-        """Initialize the optimized benchmark engine."""
+    def __init__(self, config: Optional[BenchmarkConfig] = None, enable_optimizations: bool = True,
+                 result_cache: Optional[ResultCache] = None,
+                 claude_flow_version: Optional[str] = None):
+        """Initialize the optimized benchmark engine.
+        
+        Args:
+            config: Benchmark configuration
+            enable_optimizations: Use the optimized executor when available and
+                cache results across runs
+            result_cache: Persistent result cache (defaults to
+                ``result_cache.db`` in the output directory)
+            claude_flow_version: claude-flow version for cache keys (detected
+                from ``claude-flow --version`` by default)
+        """
         super().__init__(config)
         
         self.optimizations_enabled = enable_optimizations and OPTIMIZATIONS_AVAILABLE
         
+        # Results are cached on disk whether or not the optimized executor
+        # is available; keys cover the whole configuration.
+        if enable_optimizations:
+            self.result_cache = result_cache or ResultCache(Path(self.config.output_directory))
+        else:
+            self.result_cache = None
+        self._claude_flow_version = claude_flow_version
+        
         if self.optimizations_enabled:
             # Initialize optimized components
             self.executor = OptimizedExecutor({
@@ -60,9 +80,6 @@ class OptimizedBenchmarkEngine(BenchmarkEngine):
             # Use circular buffer for task history
             self.task_history = CircularBuffer(1000)
             
-            # Use TTL map for result caching
-            self.result_cache = TTLMap({'defaultTTL': 3600000, 'maxSize': 500})
-            
             # Async file manager for outputs
             self.file_manager = AsyncFileManager()
             
@@ -72,7 +89,6 @@ class OptimizedBenchmarkEngine(BenchmarkEngine):
         else:
             self.executor = None
             self.task_history = []
-            self.result_cache = {}
             self.file_manager = None
             self.agent_capability_index = {}
     
@@ -88,17 +104,24 @@ class OptimizedBenchmarkEngine(BenchmarkEngine):
         """Run an optimized benchmark for the given objective."""
         start_time = time.time()
         
-        # Check cache first if optimizations are enabled
-        if self.optimizations_enabled:
-            cache_key = f"{self.config.strategy}-{self.config.mode}-{objective}"
-            cached_result = self.result_cache.get(cache_key)
+        # Check cache first; keying may run ``claude-flow --version`` and the
+        # lookup hits sqlite, so both stay off the event loop
+        cache_key = None
+        if self.result_cache is not None:
+            loop = asyncio.get_running_loop()
+            try:
+                cache_key = await loop.run_in_executor(None, self.cache_key, objective)
+            except TypeError:
+                # Parameters without a stable JSON form are run uncached
+                cache_key = None
+        if cache_key is not None:
+            cached_result = await self.result_cache.get_async(cache_key)
             if cached_result:
                 return {
-                    "benchmark_id": cached_result['benchmark_id'],
+                    **cached_result,
                     "status": "success",
                     "summary": f"Completed (cached) in {time.time() - start_time:.2f}s",
-                    "cached": True,
-                    **cached_result
+                    "cached": True
                 }
         
         # Create benchmark
@@ -134,14 +157,18 @@ class OptimizedBenchmarkEngine(BenchmarkEngine):
                 "summary": f"Completed {len(benchmark.results)} tasks in {benchmark.duration():.2f}s",
                 "duration": benchmark.duration(),
                 "optimized": self.optimizations_enabled,
-                "performance_metrics": self._get_performance_metrics(),
+                "performance_metrics": await self._get_performance_metrics(),
                 "results": [self._result_to_dict(r) for r in benchmark.results]
             }
             
-            # Cache result if optimizations enabled
-            if self.optimizations_enabled:
-                cache_key = f"{self.config.strategy}-{self.config.mode}-{objective}"
-                self.result_cache.set(cache_key, result_dict, 3600000)  # 1 hour TTL
+            # Cache result
+            if cache_key is not None:
+                await self.result_cache.put_async(
+                    cache_key, result_dict,
+                    strategy=self.config.strategy.value,
+                    mode=self.config.mode.value,
+                    objective=objective
+                )
             
             return result_dict
             
@@ -157,6 +184,17 @@ class OptimizedBenchmarkEngine(BenchmarkEngine):
                 "duration": benchmark.duration()
             }
     
+    def cache_key(self, objective: str) -> str:
+        """Result cache key for running ``objective`` with this engine's config."""
+        if self._claude_flow_version is None:
+            self._claude_flow_version = claude_flow_version() or ""
+        return fingerprint(
+            self.config,
+            objective,
+            self._decompose_objective(objective),
+            self._claude_flow_version or None
+        )
+    
     async def _run_optimized(self, objective: str, benchmark: Benchmark) -> List[Result]:
         """Run benchmark with optimizations."""
         # Create tasks based on strategy
@@ -279,12 +317,11 @@ class OptimizedBenchmarkEngine(BenchmarkEngine):
         json_path = f"./benchmark_outputs/{benchmark.name}_{benchmark.id}.json"
         await self.file_manager.writeJSON(json_path, benchmark.to_dict(), pretty=True)
         
-        # SQLite saving would remain synchronous for now
         if hasattr(self.config, 'output_formats') and 'sqlite' in self.config.output_formats:
-            sqlite_manager = SQLiteManager()
-            sqlite_manager.save_benchmark(benchmark)
+            async with SQLiteManager() as sqlite_manager:
+                await sqlite_manager.save_benchmark(benchmark, Path(self.config.output_directory))
     
-    def _get_performance_metrics(self) -> Dict[str, Any]:
+    async def _get_performance_metrics(self) -> Dict[str, Any]:
         """Get performance metrics from optimizations."""
         if not self.optimizations_enabled or not self.executor:
             return {}
@@ -292,7 +329,7 @@ class OptimizedBenchmarkEngine(BenchmarkEngine):
         metrics = self.executor.getMetrics()
         
         # Add cache statistics
-        cache_stats = self.result_cache.getStats() if hasattr(self.result_cache, 'getStats') else {}
+        cache_stats = await self.result_cache.stats_async() if self.result_cache is not None else {}
         
         # Add task history stats
         task_history_stats = {
@@ -315,17 +352,20 @@ class OptimizedBenchmarkEngine(BenchmarkEngine):
         if self.file_manager:
             await self.file_manager.waitForPendingOperations()
         
-        if hasattr(self.result_cache, 'destroy'):
-            self.result_cache.destroy()
+        if self.result_cache is not None:
+            self.result_cache.close()
     
     def _result_to_dict(self, result: Result) -> Dict[str, Any]:
         """Convert result to dictionary format."""
+        output = result.output
+        if isinstance(output, str) and len(output) > 200:
+            output = output[:200] + "..."
         return {
             "task_id": result.task_id,
             "agent_id": result.agent_id,
             "status": result.status.value if hasattr(result.status, 'value') else result.status,
-            "output": result.output[:200] + "..." if len(result.output) > 200 else result.output,
-            "execution_time": result.execution_time,
+            "output": output,
+            "execution_time": result.performance_metrics.execution_time,
             "metrics": {
                 "performance": result.performance_metrics.__dict__ if result.performance_metrics else {},
                 "quality": result.quality_metrics.__dict__ if result.quality_metrics else {},
@@ -3,12 +3,14 @@
 import asyncio
 import logging
 import time
+from collections import defaultdict
 from datetime import datetime
+from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 
 from .models import (
-    Benchmark, Task, Agent, Result, TaskStatus, AgentStatus, 
+    Benchmark, Task, Agent, Result, TaskStatus, AgentStatus, ResultStatus,
     BenchmarkConfig, StrategyType, CoordinationMode, AgentType,
     PerformanceMetrics, ResourceUsage
 )
@@ -20,6 +22,8 @@ from .task_scheduler import (
     TaskScheduler, SchedulingAlgorithm, SchedulingMetrics
 )
 from .benchmark_engine import BenchmarkEngine
+from .duration_model import DurationEstimator
+from ..output.sqlite_manager import SQLiteManager
 from .optimized_benchmark_engine import OptimizedBenchmarkEngine
 
 
@@ -32,6 +36,9 @@ class OrchestrationConfig:
     execution_mode: ExecutionMode = ExecutionMode.HYBRID
     scheduling_algorithm: SchedulingAlgorithm = SchedulingAlgorithm.DYNAMIC
     enable_work_stealing: bool = True
+    scheduling_batch_size: Optional[int] = None  # Vectorized DYNAMIC chunks (needs numpy)
+    optimal_scheduling: bool = False  # Min-cost assignment per chunk
+    duration_model_directory: Optional[str] = None  # Results DB to load/save learned durations
     enable_optimizations: bool = True
     max_parallel_benchmarks: int = 10
     max_agents_per_benchmark: int = 5
@@ -49,9 +56,13 @@ class OrchestrationManager:
         self.config = config or OrchestrationConfig()
         
         # Initialize components
+        self.duration_model = DurationEstimator()
         self.scheduler = TaskScheduler(
             algorithm=self.config.scheduling_algorithm,
-            enable_work_stealing=self.config.enable_work_stealing
+            enable_work_stealing=self.config.enable_work_stealing,
+            batch_size=self.config.scheduling_batch_size,
+            optimal=self.config.optimal_scheduling,
+            duration_model=self.duration_model
         )
         
         self.executor = ParallelExecutor(
@@ -68,7 +79,7 @@ class OrchestrationManager:
         self.benchmark_results: Dict[str, Dict[str, Any]] = {}
         
         # Progress tracking
-        self.progress_tracker = ProgressTracker()
+        self.progress_tracker = ProgressTracker(duration_model=self.duration_model)
         
         # Metrics
         self.orchestration_metrics = {
@@ -91,6 +102,11 @@ class OrchestrationManager:
         # Create agent pool
         self._create_agent_pool()
         
+        # Learned durations from earlier runs
+        if self.config.duration_model_directory:
+            async with SQLiteManager(self._duration_db_path()) as manager:
+                await manager.load_duration_model(self.duration_model)
+        
         # Start executor
         await self.executor.start()
         
@@ -117,8 +133,18 @@ class OrchestrationManager:
         # Stop executor
         await self.executor.stop()
         
+        if self.config.duration_model_directory and len(self.duration_model):
+            db_path = self._duration_db_path()
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            async with SQLiteManager(db_path) as manager:
+                await manager.save_duration_model(self.duration_model)
+        
         logger.info("OrchestrationManager shutdown complete")
     
+    def _duration_db_path(self) -> Path:
+        """Results database holding the learned duration model."""
+        return Path(self.config.duration_model_directory) / "benchmark_results.db"
+    
     def _create_agent_pool(self):
         """Create a pool of agents with diverse capabilities."""
         agent_configs = [
@@ -212,6 +238,7 @@ class OrchestrationManager:
         # Schedule tasks across agents
         available_agents = [a for a in self.agent_pool if a.status != AgentStatus.OFFLINE]
         task_assignments = self.scheduler.schedule_tasks(all_tasks, available_agents)
+        self.progress_tracker.track(all_tasks)
         
         # Submit tasks to executor
         task_priorities = []
@@ -225,17 +252,31 @@ class OrchestrationManager:
                 priority = task.priority
                 task_priorities.append((task, priority))
         
-        # Submit all tasks
-        task_ids = await self.executor.submit_batch(task_priorities)
-        
-        logger.info(f"Submitted {len(task_ids)} tasks across {len(benchmarks)} benchmarks")
-        
         # Monitor and collect results
         results = {}
-        
-        # Wait for all tasks with timeout
         timeout = max(b.config.timeout for b in benchmarks)
-        completed = await self.executor.wait_for_completion(timeout=timeout)
+        
+        if self.scheduler.enable_work_stealing:
+            # Agents drain their own deques and steal from the busiest peer
+            logger.info(f"Running {len(task_priorities)} tasks across {len(benchmarks)} benchmarks "
+                        f"on {len(available_agents)} agents with work stealing")
+            try:
+                await asyncio.wait_for(
+                    self.executor.execute_agent_queues(self.scheduler, available_agents,
+                                                       task_assignments),
+                    timeout=timeout
+                )
+                completed = True
+            except asyncio.TimeoutError:
+                completed = False
+        else:
+            # Submit all tasks
+            task_ids = await self.executor.submit_batch(task_priorities)
+            
+            logger.info(f"Submitted {len(task_ids)} tasks across {len(benchmarks)} benchmarks")
+            
+            # Wait for all tasks with timeout
+            completed = await self.executor.wait_for_completion(timeout=timeout)
         
         if not completed:
             logger.warning("Benchmark execution timed out")
@@ -247,10 +288,16 @@ class OrchestrationManager:
             benchmark_results = []
             
             for task in benchmark.tasks:
+                # The batch is over: stop counting the task in predicted agent load
+                self.scheduler.release_task(task.id)
                 if task.id in all_results:
                     result = all_results[task.id]
                     benchmark_results.append(result)
                     benchmark.add_result(result)
+                    # Learn under the pool agent that ran the task, not the
+                    # strategy's label in result.agent_id
+                    executed_by = task.assigned_agents[-1] if task.assigned_agents else None
+                    self.duration_model.observe_result(result, task, executed_by)
                     
                     # Update agent metrics
                     for agent_id in task.assigned_agents:
@@ -280,7 +327,7 @@ class OrchestrationManager:
                 'completed_tasks': len([r for r in benchmark_results if r.status == ResultStatus.SUCCESS]),
                 'failed_tasks': len([r for r in benchmark_results if r.status in [ResultStatus.FAILURE, ResultStatus.ERROR]]),
                 'duration': benchmark.duration(),
-                'metrics': benchmark.metrics.__dict__,
+                'metrics': benchmark.metrics.to_dict(),
                 'results': [self._result_to_dict(r) for r in benchmark_results]
             }
             
@@ -434,7 +481,10 @@ class OrchestrationManager:
                 'tasks_completed': agent.total_tasks_completed,
                 'tasks_failed': agent.total_tasks_failed,
                 'success_rate': agent.success_rate,
-                'average_execution_time': agent.average_execution_time
+                'recent_success_rate': agent.recent_success_rate,
+                'average_execution_time': agent.average_execution_time,
+                'p50_execution_time': agent.p50_execution_time,
+                'p95_execution_time': agent.p95_execution_time
             }
             for agent in self.agent_pool
         ]
@@ -474,6 +524,12 @@ class ProgressTracker:
     queued_tasks: int = 0
     last_report_time: float = field(default_factory=time.time)
     report_interval: float = 5.0  # seconds
+    duration_model: Optional[DurationEstimator] = None
+    tasks: List[Task] = field(default_factory=list)  # Followed for predicted time remaining
+    
+    def track(self, tasks: List[Task]) -> None:
+        """Follow these tasks (with their assigned agents) for time estimates."""
+        self.tasks = list(tasks)
     
     def update(self, tasks_completed: int, tasks_running: int, tasks_queued: int):
         """Update progress metrics."""
@@ -495,18 +551,58 @@ class ProgressTracker:
         
         completion_percent = (self.completed_tasks / self.total_tasks) * 100 if self.total_tasks > 0 else 0
         
-        return (
+        report = (
             f"Progress: {completion_percent:.1f}% "
             f"({self.completed_tasks}/{self.total_tasks} completed, "
             f"{self.running_tasks} running, {self.queued_tasks} queued)"
         )
+        if self.duration_model is not None and self.tasks:
+            report += f", ~{self.get_estimated_time_remaining():.0f}s remaining"
+        return report
     
-    def get_estimated_time_remaining(self, average_task_time: float) -> float:
-        """Estimate time remaining based on average task time."""
+    def get_estimated_time_remaining(self, average_task_time: Optional[float] = None) -> float:
+        """Estimate time remaining.
+        
+        With a duration model and tracked tasks, every unfinished task adds
+        its predicted duration on its assigned agent (less the time it has
+        already run) to that agent's queue. The estimate is the longest
+        queue, or all remaining work spread over the agents if that is
+        longer. Otherwise it is the remaining task count times
+        ``average_task_time`` (by default the model's typical duration),
+        divided by the number of running tasks.
+        """
+        if self.duration_model is not None and self.tasks:
+            return self._predicted_time_remaining()
+        if average_task_time is None:
+            average_task_time = self.duration_model.estimate() if self.duration_model else 0.0
+        
         remaining_tasks = self.total_tasks - self.completed_tasks
         if remaining_tasks <= 0 or average_task_time <= 0:
             return 0.0
         
         # Account for parallel execution
         parallel_factor = max(1, self.running_tasks)
-        return (remaining_tasks * average_task_time) / parallel_factor
\ No newline at end of file
+        return (remaining_tasks * average_task_time) / parallel_factor
+    
+    def _predicted_time_remaining(self) -> float:
+        """Longest predicted agent queue over the tracked unfinished tasks."""
+        now = datetime.now()
+        queues: Dict[str, float] = defaultdict(float)
+        unassigned = 0.0
+        for task in self.tasks:
+            if task.status not in (TaskStatus.PENDING, TaskStatus.RUNNING):
+                continue
+            agent_id = task.assigned_agents[-1] if task.assigned_agents else None
+            remaining = self.duration_model.estimate(agent_id, task)
+            if task.status == TaskStatus.RUNNING and task.started_at:
+                remaining = max(0.0, remaining - (now - task.started_at).total_seconds())
+            if agent_id:
+                queues[agent_id] += remaining
+            else:
+                unassigned += remaining
+        
+        if not queues and not unassigned:
+            return 0.0
+        workers = max(1, len(queues), self.running_tasks)
+        return max(max(queues.values(), default=0.0),
+                   (sum(queues.values()) + unassigned) / workers)
\ No newline at end of file
@@ -1,14 +1,18 @@
 """Parallel execution system for concurrent benchmark runs with resource management."""
 
 import asyncio
+import itertools
+import operator
+import os
 import time
 import psutil
 import threading
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
-from dataclasses import dataclass, field
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from enum import Enum
-from queue import PriorityQueue, Queue, Empty
+from queue import Queue
 from typing import Dict, List, Optional, Any, Callable, Tuple, Set
 import multiprocessing
 import logging
@@ -17,14 +21,23 @@ import sys
 
 from .models import (
     Task, Agent, Result, TaskStatus, AgentStatus, ResultStatus,
-    ResourceUsage, PerformanceMetrics, BenchmarkConfig
+    ResourceUsage, PerformanceMetrics, QualityMetrics, BenchmarkConfig,
+    StrategyType, CoordinationMode
 )
+from .result_store import ResultStore
+from .dag_executor import DAGExecutor
+from .task_scheduler import TaskScheduler
+from .deadline import effective_timeout, run_with_deadline, timeout_result
 
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Seconds a pool worker gets to return after its task's deadline before it
+# is killed and the pool replaced
+PROCESS_STOP_GRACE = 1.0
+
 
 class ExecutionMode(Enum):
     """Execution modes for parallel processing."""
@@ -43,6 +56,8 @@ class ResourceLimits:
     max_queue_size: int = 1000
     task_timeout: int = 300  # seconds
     monitoring_interval: float = 1.0  # seconds
+    headroom_reserve: float = 0.2  # fraction of a limit where admission starts shrinking
+    min_admitted_tasks: int = 1  # always admit this many so work keeps progressing
 
 
 @dataclass
@@ -52,6 +67,7 @@ class ExecutionMetrics:
     tasks_running: int = 0
     tasks_completed: int = 0
     tasks_failed: int = 0
+    tasks_timed_out: int = 0
     total_execution_time: float = 0.0
     average_execution_time: float = 0.0
     peak_cpu_usage: float = 0.0
@@ -59,6 +75,8 @@ class ExecutionMetrics:
     current_cpu_usage: float = 0.0
     current_memory_usage: float = 0.0
     queue_wait_time: float = 0.0
+    admission_capacity: int = 0
+    admission_wait_time: float = 0.0
     throughput: float = 0.0
     last_updated: datetime = field(default_factory=datetime.now)
 
@@ -66,17 +84,80 @@ class ExecutionMetrics:
 class TaskPriority:
     """Task priority wrapper for priority queue."""
     
-    def __init__(self, priority: int, task: Task, enqueue_time: float):
+    __slots__ = ("priority", "task", "enqueue_time", "sequence")
+    
+    def __init__(self, priority: int, task: Task, enqueue_time: float, sequence: int = 0):
         self.priority = priority
         self.task = task
         self.enqueue_time = enqueue_time
+        self.sequence = sequence
     
     def __lt__(self, other):
         # Higher priority value = higher priority (reverse normal order)
         if self.priority != other.priority:
             return self.priority > other.priority
         # For same priority, FIFO based on enqueue time
-        return self.enqueue_time < other.enqueue_time
+        if self.enqueue_time != other.enqueue_time:
+            return self.enqueue_time < other.enqueue_time
+        # Submission order breaks clock ties within a batch
+        return self.sequence < other.sequence
+
+
+class AdmissionController:
+    """Concurrency gate whose capacity follows resource headroom.
+    
+    The resource monitor publishes a new capacity after every sample. Workers
+    acquire a slot before running a task; while slots are free this never
+    suspends, and when they are not the worker awaits an event that is set
+    as soon as a task finishes or the monitor raises the capacity.
+    """
+    
+    def __init__(self, capacity: int):
+        self.max_capacity = capacity
+        self.capacity = capacity
+        self.in_flight = 0
+        self._available = asyncio.Event()
+        self._available.set()
+    
+    def set_capacity(self, capacity: int) -> None:
+        """Update the number of tasks allowed to run concurrently."""
+        self.capacity = max(0, min(capacity, self.max_capacity))
+        self._update_available()
+    
+    async def acquire(self) -> float:
+        """Wait for an admission slot and return the time spent waiting."""
+        if self.in_flight < self.capacity:
+            self.in_flight += 1
+            self._update_available()
+            return 0.0
+        
+        start_time = time.time()
+        while self.in_flight >= self.capacity:
+            await self._available.wait()
+        self.in_flight += 1
+        self._update_available()
+        return time.time() - start_time
+    
+    def release(self) -> None:
+        """Return an admission slot."""
+        self.in_flight = max(0, self.in_flight - 1)
+        self._update_available()
+    
+    def hold(self, future: "asyncio.Future") -> None:
+        """Keep an extra slot taken until ``future`` is done.
+        
+        Used for work that outlives its task, such as a pool thread still
+        running a strategy after the task timed out.
+        """
+        self.in_flight += 1
+        self._update_available()
+        future.add_done_callback(lambda _: self.release())
+    
+    def _update_available(self) -> None:
+        if self.in_flight < self.capacity:
+            self._available.set()
+        else:
+            self._available.clear()
 
 
 class ResourceMonitor:
@@ -87,20 +168,40 @@ class ResourceMonitor:
         self.process = psutil.Process()
         self.running = False
         self.monitor_thread = None
+        self._stop_event = threading.Event()
         self.resource_lock = threading.Lock()
         self.current_usage = ResourceUsage()
         self.violation_count = 0
         self.max_violations = 5
         
+        # Child processes (process pool workers) are sampled with the parent;
+        # psutil needs the same Process object across samples for cpu_percent
+        self._children: Dict[int, psutil.Process] = {}
+        
+        # Admission publishing
+        self._admission: Optional[AdmissionController] = None
+        self._admission_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._published_capacity: Optional[int] = None
+        
+    def attach_admission(self,
+                         controller: AdmissionController,
+                         loop: asyncio.AbstractEventLoop) -> None:
+        """Publish capacity changes to an admission controller on ``loop``."""
+        self._admission = controller
+        self._admission_loop = loop
+        self._published_capacity = None
+        
     def start(self):
         """Start resource monitoring."""
         self.running = True
+        self._stop_event.clear()
         self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self.monitor_thread.start()
         
     def stop(self):
         """Stop resource monitoring."""
         self.running = False
+        self._stop_event.set()
         if self.monitor_thread:
             self.monitor_thread.join(timeout=5)
     
@@ -108,42 +209,102 @@ class ResourceMonitor:
         """Main monitoring loop."""
         while self.running:
             try:
-                with self.resource_lock:
-                    # CPU usage
-                    self.current_usage.cpu_percent = self.process.cpu_percent(interval=None)
-                    
-                    # Memory usage
-                    memory_info = self.process.memory_info()
-                    self.current_usage.memory_mb = memory_info.rss / (1024 * 1024)
-                    
-                    # Network usage (if available)
-                    try:
-                        net_io = psutil.net_io_counters()
-                        self.current_usage.network_bytes_sent = net_io.bytes_sent
-                        self.current_usage.network_bytes_recv = net_io.bytes_recv
-                    except:
-                        pass
-                    
-                    # Check for violations
-                    if self.current_usage.cpu_percent > self.limits.max_cpu_percent:
-                        self.violation_count += 1
-                        logger.warning(f"CPU usage {self.current_usage.cpu_percent:.1f}% exceeds limit {self.limits.max_cpu_percent}%")
-                    
-                    if self.current_usage.memory_mb > self.limits.max_memory_mb:
-                        self.violation_count += 1
-                        logger.warning(f"Memory usage {self.current_usage.memory_mb:.1f}MB exceeds limit {self.limits.max_memory_mb}MB")
-                    
-                    # Update peak values
-                    self.current_usage.peak_memory_mb = max(
-                        self.current_usage.peak_memory_mb,
-                        self.current_usage.memory_mb
-                    )
-                    
-                time.sleep(self.limits.monitoring_interval)
-                
+                self._sample()
+                self._publish_capacity()
             except Exception as e:
                 logger.error(f"Resource monitoring error: {e}")
-                time.sleep(self.limits.monitoring_interval)
+            
+            self._stop_event.wait(self.limits.monitoring_interval)
+    
+    def _sample(self):
+        """Take one sample of the process tree."""
+        cpu_percent = self.process.cpu_percent(interval=None)
+        memory_mb = self.process.memory_info().rss / (1024 * 1024)
+        
+        try:
+            children = self.process.children(recursive=True)
+        except psutil.Error:
+            children = []
+        
+        alive = set()
+        for child in children:
+            tracked = self._children.setdefault(child.pid, child)
+            try:
+                cpu_percent += tracked.cpu_percent(interval=None)
+                memory_mb += tracked.memory_info().rss / (1024 * 1024)
+                alive.add(child.pid)
+            except psutil.Error:
+                continue
+        for pid in list(self._children):
+            if pid not in alive:
+                del self._children[pid]
+        
+        with self.resource_lock:
+            self.current_usage.cpu_percent = cpu_percent
+            self.current_usage.memory_mb = memory_mb
+            
+            # Network usage (if available)
+            try:
+                net_io = psutil.net_io_counters()
+                self.current_usage.network_bytes_sent = net_io.bytes_sent
+                self.current_usage.network_bytes_recv = net_io.bytes_recv
+            except:
+                pass
+            
+            # Check for violations
+            if self.current_usage.cpu_percent > self.limits.max_cpu_percent:
+                self.violation_count += 1
+                logger.warning(f"CPU usage {self.current_usage.cpu_percent:.1f}% exceeds limit {self.limits.max_cpu_percent}%")
+            
+            if self.current_usage.memory_mb > self.limits.max_memory_mb:
+                self.violation_count += 1
+                logger.warning(f"Memory usage {self.current_usage.memory_mb:.1f}MB exceeds limit {self.limits.max_memory_mb}MB")
+            
+            # Update peak values
+            self.current_usage.peak_memory_mb = max(
+                self.current_usage.peak_memory_mb,
+                self.current_usage.memory_mb
+            )
+    
+    def _publish_capacity(self):
+        """Push the current admission capacity to the event loop if it changed."""
+        if not self._admission or not self._admission_loop:
+            return
+        
+        capacity = self.admission_capacity()
+        if capacity == self._published_capacity:
+            return
+        
+        try:
+            self._admission_loop.call_soon_threadsafe(self._admission.set_capacity, capacity)
+            self._published_capacity = capacity
+        except RuntimeError:
+            # Event loop already closed
+            self._admission = None
+    
+    def admission_capacity(self) -> int:
+        """Number of tasks that may run given current CPU and memory headroom.
+        
+        Full capacity is granted until usage enters the reserve band below a
+        limit; inside the band capacity shrinks linearly, reaching the floor
+        of ``min_admitted_tasks`` at the limit.
+        """
+        with self.resource_lock:
+            cpu = self.current_usage.cpu_percent
+            memory = self.current_usage.memory_mb
+        
+        reserve = max(self.limits.headroom_reserve, 1e-6)
+        scale = 1.0
+        for used, limit in ((cpu, self.limits.max_cpu_percent),
+                            (memory, self.limits.max_memory_mb)):
+            if limit <= 0:
+                continue
+            headroom = max(0.0, 1.0 - used / limit)
+            scale = min(scale, headroom / reserve)
+        
+        maximum = self.limits.max_concurrent_tasks
+        floor = min(self.limits.min_admitted_tasks, maximum)
+        return max(floor, min(maximum, int(maximum * scale + 1e-9)))
     
     def check_resources(self) -> bool:
         """Check if resources are within limits."""
@@ -156,15 +317,6 @@ class ResourceMonitor:
         """Get current resource usage."""
         with self.resource_lock:
             return ResourceUsage(**self.current_usage.__dict__)
-    
-    def wait_for_resources(self, timeout: float = 30.0) -> bool:
-        """Wait for resources to become available."""
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            if self.check_resources():
-                return True
-            time.sleep(0.5)
-        return False
 
 
 class ParallelExecutor:
@@ -173,13 +325,19 @@ class ParallelExecutor:
     def __init__(self, 
                  mode: ExecutionMode = ExecutionMode.HYBRID,
                  limits: Optional[ResourceLimits] = None,
-                 config: Optional[BenchmarkConfig] = None):
+                 config: Optional[BenchmarkConfig] = None,
+                 result_store: Optional[ResultStore] = None):
         self.mode = mode
         self.limits = limits or ResourceLimits()
         self.config = config
+        # Optional columnar store; completed_tasks then holds row views
+        self.result_store = result_store
         
-        # Task management
-        self.task_queue = PriorityQueue(maxsize=self.limits.max_queue_size)
+        # Task management (asyncio-native so idle workers cost nothing)
+        self.task_queue: asyncio.PriorityQueue = asyncio.PriorityQueue(
+            maxsize=self.limits.max_queue_size
+        )
+        self._sequence = itertools.count()
         self.running_tasks: Dict[str, asyncio.Task] = {}
         self.completed_tasks: Dict[str, Result] = {}
         self.failed_tasks: Dict[str, Tuple[Task, Exception]] = {}
@@ -187,15 +345,24 @@ class ParallelExecutor:
         # Executors
         self.thread_executor: Optional[ThreadPoolExecutor] = None
         self.process_executor: Optional[ProcessPoolExecutor] = None
+        self._process_board: Optional[_WorkerBoard] = None
+        self._process_tickets = itertools.count(1)
+        self._recycling: Set[asyncio.Task] = set()
         
-        # Resource monitoring
+        # Resource monitoring and admission control
         self.resource_monitor = ResourceMonitor(self.limits)
+        self.admission = AdmissionController(self.limits.max_concurrent_tasks)
         self.metrics = ExecutionMetrics()
         
         # Control flags
         self.running = False
         self.shutdown_event = asyncio.Event()
         self._lock = asyncio.Lock()
+        self._all_done = asyncio.Event()
+        self._all_done.set()
+        self._idle_workers: Set[asyncio.Task] = set()
+        # Futures awaiting specific tasks (see execute_graph)
+        self._waiters: Dict[str, asyncio.Future] = {}
         
         # Task execution tracking
         self.task_start_times: Dict[str, float] = {}
@@ -214,19 +381,44 @@ class ParallelExecutor:
         
         if self.mode in [ExecutionMode.PROCESS, ExecutionMode.HYBRID]:
             # Use fewer processes to avoid overhead
-            max_processes = min(
+            max_processes = max(1, min(
                 self.limits.max_concurrent_tasks // 2,
                 multiprocessing.cpu_count()
-            )
-            self.process_executor = ProcessPoolExecutor(
-                max_workers=max_processes
-            )
+            ))
+            self._max_processes = max_processes
+            self._new_process_pool()
+    
+    def _new_process_pool(self) -> None:
+        """Start a fresh process pool (and its board) as ``process_executor``."""
+        # Long-lived workers keep an event loop and strategy instances
+        # warm between tasks (see _init_worker_process)
+        self._process_board = _WorkerBoard(self._max_processes)
+        self.process_executor = ProcessPoolExecutor(
+            max_workers=self._max_processes,
+            initializer=_init_worker_process,
+            initargs=(self._process_board,)
+        )
+    
+    async def _warm_process_pool(self) -> None:
+        """Spawn process workers ahead of the first task."""
+        loop = asyncio.get_running_loop()
+        pool = self.process_executor
+        await asyncio.gather(*[
+            loop.run_in_executor(pool, _warm_worker_process)
+            for _ in range(self._max_processes)
+        ])
     
     async def start(self):
         """Start the parallel executor."""
         self.running = True
+        self.resource_monitor.attach_admission(self.admission, asyncio.get_running_loop())
         self.resource_monitor.start()
         
+        # Spawn process workers up front so the first tasks don't pay for
+        # interpreter start-up and strategy imports
+        if self.process_executor:
+            await self._warm_process_pool()
+        
         # Start worker coroutines
         workers = []
         for i in range(self.limits.max_concurrent_tasks):
@@ -234,8 +426,8 @@ class ParallelExecutor:
             workers.append(worker)
         
         # Start metrics updater
-        metrics_task = asyncio.create_task(self._update_metrics())
-        workers.append(metrics_task)
+        self._metrics_task = asyncio.create_task(self._update_metrics())
+        workers.append(self._metrics_task)
         
         # Store workers for cleanup
         self._workers = workers
@@ -248,10 +440,18 @@ class ParallelExecutor:
         self.running = False
         self.shutdown_event.set()
         
-        # Wait for workers to finish
+        # Wake workers blocked on an empty queue; busy workers finish their
+        # current task and exit on the next loop check
         if hasattr(self, '_workers'):
+            for worker in self._workers:
+                if worker in self._idle_workers or worker is self._metrics_task:
+                    worker.cancel()
             await asyncio.gather(*self._workers, return_exceptions=True)
         
+        # Let pool recycling finish so no stuck worker is left behind
+        if self._recycling:
+            await asyncio.gather(*self._recycling, return_exceptions=True)
+        
         # Shutdown executors
         if self.thread_executor:
             self.thread_executor.shutdown(wait=True, cancel_futures=True)
@@ -264,55 +464,134 @@ class ParallelExecutor:
         logger.info("ParallelExecutor stopped")
     
     async def submit_task(self, task: Task, priority: int = 1) -> str:
-        """Submit a task for execution."""
+        """Submit a task for execution.
+        
+        Waits for queue space when the queue is full instead of failing.
+        """
         if not self.running:
             raise RuntimeError("Executor is not running")
         
-        # Check queue size
-        if self.task_queue.full():
-            raise RuntimeError(f"Task queue is full (max: {self.limits.max_queue_size})")
-        
-        # Create priority wrapper
-        task_priority = TaskPriority(priority, task, time.time())
-        
-        # Add to queue
-        await asyncio.get_event_loop().run_in_executor(
-            None, self.task_queue.put, task_priority
-        )
-        
-        async with self._lock:
-            self.metrics.tasks_queued += 1
+        task_priority = TaskPriority(priority, task, time.time(), next(self._sequence))
+        await self.task_queue.put(task_priority)
+        self._count_queued()
         
         logger.debug(f"Submitted task {task.id} with priority {priority}")
         return task.id
     
     async def submit_batch(self, tasks: List[Tuple[Task, int]]) -> List[str]:
-        """Submit multiple tasks as a batch."""
+        """Submit multiple tasks as a batch.
+        
+        Tasks are enqueued without suspending while the queue has room and
+        the batch only waits (backpressure) once the queue fills up.
+        """
+        if not self.running:
+            raise RuntimeError("Executor is not running")
+        
         task_ids = []
+        if not tasks:
+            return task_ids
+        
+        enqueue_time = time.time()
         for task, priority in tasks:
-            task_id = await self.submit_task(task, priority)
-            task_ids.append(task_id)
+            if self.task_queue.full():
+                await self.task_queue.put(
+                    TaskPriority(priority, task, time.time(), next(self._sequence))
+                )
+                # Anything enqueued after blocking must not inherit the
+                # stale batch timestamp or it would jump ahead in FIFO order
+                enqueue_time = time.time()
+            else:
+                self.task_queue.put_nowait(
+                    TaskPriority(priority, task, enqueue_time, next(self._sequence))
+                )
+            self._count_queued()
+            task_ids.append(task.id)
+        
+        logger.debug(f"Submitted batch of {len(task_ids)} tasks")
         return task_ids
     
+    async def execute_graph(self, tasks: List[Task], priority: int = 1) -> Dict[str, Result]:
+        """Run tasks in dependency order through the worker pool.
+        
+        A task is only queued once everything it depends on has completed;
+        independent branches run concurrently, longest chain first. Tasks
+        whose dependencies fail are not run and get cancelled results.
+        
+        Args:
+            tasks: Tasks whose ``dependencies``/``subtasks`` form a DAG
+            priority: Queue priority for every task
+            
+        Returns:
+            Results keyed by task id, in completion order
+            
+        Raises:
+            DependencyCycleError: If the dependencies contain a cycle
+        """
+        async def run(task: Task) -> Result:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters[task.id] = waiter
+            await self.submit_task(task, priority)
+            return await waiter
+        
+        dag = DAGExecutor(run, max_concurrency=self.limits.max_concurrent_tasks)
+        return await dag.execute(tasks)
+    
+    async def execute_agent_queues(self, scheduler: TaskScheduler, agents: List[Agent],
+                                   assignments: Optional[Dict[Agent, List[Task]]] = None
+                                   ) -> Dict[str, Result]:
+        """Drain the scheduler's per-agent deques with one worker per agent.
+        
+        Each agent works through the front of its own deque. Once that is
+        empty, it steals from the back of the most loaded peer's deque (see
+        ``TaskScheduler.next_task``), so skewed assignments still finish
+        close to the balanced makespan. Admission control, deadlines and
+        result bookkeeping are shared with the queue workers.
+        
+        Args:
+            scheduler: Scheduler whose deques to drain
+            agents: Agents to run a worker for
+            assignments: Schedule from ``scheduler.schedule_tasks`` to queue
+                on the deques first; tasks already queued with ``enqueue``
+                run as well
+            
+        Returns:
+            Results keyed by task id, in completion order
+        """
+        if not self.running:
+            raise RuntimeError("Executor is not running")
+        
+        for agent, tasks in (assignments or {}).items():
+            scheduler.enqueue(agent.id, tasks)
+        
+        results: Dict[str, Result] = {}
+        start_time = time.time()
+        
+        async def agent_worker(agent: Agent) -> None:
+            while self.running:
+                task = scheduler.next_task(agent)
+                if task is None:
+                    return
+                task.status = TaskStatus.RUNNING
+                self._count_queued()
+                
+                result = await self._run_task(task, start_time, agent.id)
+                scheduler.mark_task_completed(task.id)
+                if task.status == TaskStatus.RUNNING:
+                    task.status = (TaskStatus.FAILED if task.id in self.failed_tasks
+                                   else TaskStatus.COMPLETED)
+                results[task.id] = result
+        
+        await asyncio.gather(*(agent_worker(agent) for agent in agents))
+        return results
+    
     async def get_result(self, task_id: str, timeout: Optional[float] = None) -> Optional[Result]:
         """Get result for a specific task."""
         start_time = time.time()
         
         while True:
-            # Check completed tasks
-            if task_id in self.completed_tasks:
-                return self.completed_tasks[task_id]
-            
-            # Check failed tasks
-            if task_id in self.failed_tasks:
-                task, error = self.failed_tasks[task_id]
-                # Create error result
-                return Result(
-                    task_id=task_id,
-                    status=ResultStatus.ERROR,
-                    errors=[str(error)],
-                    completed_at=datetime.now()
-                )
+            result = self._finished_result(task_id)
+            if result is not None:
+                return result
             
             # Check timeout
             if timeout and (time.time() - start_time) > timeout:
@@ -321,6 +600,24 @@ class ParallelExecutor:
             # Wait a bit before checking again
             await asyncio.sleep(0.1)
     
+    def _finished_result(self, task_id: str) -> Optional[Result]:
+        """Result of a completed or failed task; None while it is pending."""
+        # Check completed tasks
+        if task_id in self.completed_tasks:
+            return self.completed_tasks[task_id]
+        
+        # Check failed tasks
+        if task_id in self.failed_tasks:
+            task, error = self.failed_tasks[task_id]
+            # Create error result
+            return Result(
+                task_id=task_id,
+                status=ResultStatus.ERROR,
+                errors=[str(error)],
+                completed_at=datetime.now()
+            )
+        return None
+    
     async def get_all_results(self) -> Dict[str, Result]:
         """Get all completed results."""
         async with self._lock:
@@ -328,85 +625,49 @@ class ParallelExecutor:
     
     async def wait_for_completion(self, timeout: Optional[float] = None) -> bool:
         """Wait for all tasks to complete."""
-        start_time = time.time()
+        try:
+            await asyncio.wait_for(self._all_done.wait(), timeout=timeout or None)
+            return True
+        except asyncio.TimeoutError:
+            return False
+    
+    def _count_queued(self) -> None:
+        """Register a task that was just put on the queue.
         
-        while True:
-            async with self._lock:
-                if (self.metrics.tasks_queued == 
-                    self.metrics.tasks_completed + self.metrics.tasks_failed):
-                    return True
-            
-            if timeout and (time.time() - start_time) > timeout:
-                return False
-            
-            await asyncio.sleep(0.5)
+        Called right after a successful put, before the caller yields, so no
+        worker can finish the task first; a submission cancelled while
+        waiting for queue space counts nothing.
+        """
+        self.metrics.tasks_queued += 1
+        self._all_done.clear()
+    
+    def _check_all_done(self) -> None:
+        """Signal waiters once every queued task has finished."""
+        if (self.metrics.tasks_queued ==
+                self.metrics.tasks_completed + self.metrics.tasks_failed):
+            self._all_done.set()
     
     async def _worker(self, worker_id: str):
         """Worker coroutine that processes tasks from the queue."""
         logger.debug(f"Worker {worker_id} started")
+        current = asyncio.current_task()
         
         while self.running:
             try:
-                # Get task from queue with timeout
-                task_priority = await asyncio.get_event_loop().run_in_executor(
-                    None, self._get_task_with_timeout, 1.0
-                )
-                
-                if task_priority is None:
-                    continue
+                # Block on the queue without holding a thread
+                self._idle_workers.add(current)
+                try:
+                    task_priority = await self.task_queue.get()
+                except asyncio.CancelledError:
+                    break
+                finally:
+                    self._idle_workers.discard(current)
                 
                 task = task_priority.task
-                queue_wait_time = time.time() - task_priority.enqueue_time
-                
-                # Update metrics
-                async with self._lock:
-                    self.metrics.tasks_running += 1
-                    self.metrics.queue_wait_time = (
-                        self.metrics.queue_wait_time * 0.9 + queue_wait_time * 0.1
-                    )
-                
-                # Wait for resources if needed
-                if not await self._wait_for_resources_async():
-                    # Put task back in queue
-                    await self.submit_task(task, task_priority.priority)
-                    continue
-                
-                # Execute task
-                logger.debug(f"Worker {worker_id} executing task {task.id}")
-                start_time = time.time()
-                self.task_start_times[task.id] = start_time
-                
                 try:
-                    result = await self._execute_task(task)
-                    execution_time = time.time() - start_time
-                    
-                    # Update result metrics
-                    result.performance_metrics.execution_time = execution_time
-                    result.performance_metrics.queue_time = queue_wait_time
-                    result.resource_usage = self.resource_monitor.get_usage()
-                    
-                    # Store result
-                    async with self._lock:
-                        self.completed_tasks[task.id] = result
-                        self.metrics.tasks_completed += 1
-                        self.metrics.total_execution_time += execution_time
-                        self.metrics.average_execution_time = (
-                            self.metrics.total_execution_time / self.metrics.tasks_completed
-                        )
-                    
-                    logger.info(f"Task {task.id} completed in {execution_time:.2f}s")
-                    
-                except Exception as e:
-                    logger.error(f"Task {task.id} failed: {e}")
-                    async with self._lock:
-                        self.failed_tasks[task.id] = (task, e)
-                        self.metrics.tasks_failed += 1
-                
+                    await self._run_task(task, task_priority.enqueue_time, worker_id)
                 finally:
-                    async with self._lock:
-                        self.metrics.tasks_running -= 1
-                    if task.id in self.task_start_times:
-                        del self.task_start_times[task.id]
+                    self.task_queue.task_done()
                 
             except Exception as e:
                 logger.error(f"Worker {worker_id} error: {e}")
@@ -414,17 +675,98 @@ class ParallelExecutor:
         
         logger.debug(f"Worker {worker_id} stopped")
     
-    def _get_task_with_timeout(self, timeout: float) -> Optional[TaskPriority]:
-        """Get task from queue with timeout."""
+    async def _run_task(self, task: Task, enqueue_time: float, worker_id: str) -> Optional[Result]:
+        """Run one task under admission control and record its outcome.
+        
+        Returns:
+            The stored result (an error result if the task raised)
+        """
+        admitted = running = False
         try:
-            return self.task_queue.get(timeout=timeout)
-        except Empty:
-            return None
-    
-    async def _wait_for_resources_async(self) -> bool:
-        """Async wrapper for resource waiting."""
-        return await asyncio.get_event_loop().run_in_executor(
-            None, self.resource_monitor.wait_for_resources, 5.0
+            # Wait for admission; returns immediately when there is headroom.
+            # acquire() takes the slot without yielding afterwards, so from
+            # here on the finally block is what gives it back.
+            admission_wait_time = await self.admission.acquire()
+            admitted = True
+            
+            queue_wait_time = time.time() - enqueue_time
+            
+            # Update metrics
+            async with self._lock:
+                self.metrics.tasks_running += 1
+                running = True
+                self.metrics.queue_wait_time = (
+                    self.metrics.queue_wait_time * 0.9 + queue_wait_time * 0.1
+                )
+                self.metrics.admission_wait_time = (
+                    self.metrics.admission_wait_time * 0.9 + admission_wait_time * 0.1
+                )
+            
+            # Execute task
+            logger.debug(f"Worker {worker_id} executing task {task.id}")
+            start_time = time.time()
+            self.task_start_times[task.id] = start_time
+            timeout = self._task_timeout(task)
+            
+            try:
+                try:
+                    result = await run_with_deadline(self._execute_task(task), timeout)
+                except asyncio.TimeoutError:
+                    # The worker moves on; threads and pool processes
+                    # stop the strategy at the same deadline on their side
+                    logger.warning(f"Task {task.id} timed out after {timeout:g}s")
+                    result = timeout_result(task, timeout, start_time)
+                execution_time = time.time() - start_time
+                
+                # Update result metrics
+                result.performance_metrics.execution_time = execution_time
+                result.performance_metrics.queue_time = queue_wait_time
+                result.resource_usage = self.resource_monitor.get_usage()
+                
+                # Store result
+                async with self._lock:
+                    if self.result_store is not None:
+                        result = self.result_store.append(result)
+                    self.completed_tasks[task.id] = result
+                    self.metrics.tasks_completed += 1
+                    if result.status == ResultStatus.TIMEOUT:
+                        self.metrics.tasks_timed_out += 1
+                    self.metrics.total_execution_time += execution_time
+                    self.metrics.average_execution_time = (
+                        self.metrics.total_execution_time / self.metrics.tasks_completed
+                    )
+                
+                logger.info(f"Task {task.id} completed in {execution_time:.2f}s")
+            
+            except Exception as e:
+                logger.error(f"Task {task.id} failed: {e}")
+                async with self._lock:
+                    self.failed_tasks[task.id] = (task, e)
+                    self.metrics.tasks_failed += 1
+        
+        finally:
+            if admitted:
+                self.admission.release()
+            async with self._lock:
+                if running:
+                    self.metrics.tasks_running -= 1
+                self._check_all_done()
+            waiter = self._waiters.pop(task.id, None)
+            if waiter is not None and not waiter.done():
+                result = self._finished_result(task.id)
+                if result is None:
+                    waiter.cancel()
+                else:
+                    waiter.set_result(result)
+            self.task_start_times.pop(task.id, None)
+        return self._finished_result(task.id)
+    
+    def _task_timeout(self, task: Task) -> Optional[float]:
+        """Deadline for a task: the tightest of its own, the limits' and the config's."""
+        return effective_timeout(
+            task.timeout,
+            self.limits.task_timeout,
+            self.config.task_timeout if self.config else None
         )
     
     async def _execute_task(self, task: Task) -> Result:
@@ -456,34 +798,104 @@ class ParallelExecutor:
         return result
     
     async def _execute_in_thread(self, task: Task) -> Result:
-        """Execute task in thread pool."""
+        """Execute task in thread pool.
+        
+        The strategy is cancelled at the deadline inside the thread, but a
+        strategy that blocks synchronously cannot be interrupted: its thread
+        stays busy after the task times out. Its admission slot stays taken
+        until the thread returns, so no more tasks are admitted than there
+        are free threads.
+        """
         loop = asyncio.get_event_loop()
         
         # Import strategy dynamically
         from ..strategies import create_strategy
         
+        timeout = self._task_timeout(task)
+        
         def run_task():
             strategy = create_strategy(task.strategy.value.lower())
             # Create new event loop for thread
             thread_loop = asyncio.new_event_loop()
             asyncio.set_event_loop(thread_loop)
             try:
-                return thread_loop.run_until_complete(strategy.execute(task))
+                # Cancel the strategy at the deadline so the thread is freed
+                return thread_loop.run_until_complete(
+                    run_with_deadline(strategy.execute(task), timeout)
+                )
             finally:
                 thread_loop.close()
         
-        return await loop.run_in_executor(self.thread_executor, run_task)
+        future = loop.run_in_executor(self.thread_executor, run_task)
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if not future.done():
+                self.admission.hold(future)
+                future.add_done_callback(_consume_result)
+            raise
     
     async def _execute_in_process(self, task: Task) -> Result:
-        """Execute task in process pool."""
+        """Execute task in process pool.
+        
+        A worker still busy ``PROCESS_STOP_GRACE`` seconds after its task
+        was cancelled (e.g. a strategy blocking past the deadline) is
+        killed and the pool replaced; tasks that were queued on or running
+        in the old pool are run again on the new one.
+        """
         loop = asyncio.get_event_loop()
         
-        # Use a wrapper function that can be pickled
-        return await loop.run_in_executor(
-            self.process_executor,
-            _execute_task_in_process,
-            task
-        )
+        while True:
+            pool, board = self.process_executor, self._process_board
+            ticket = next(self._process_tickets)
+            # Only the fields strategies need cross the process boundary, and
+            # the result comes back as a flat tuple
+            future = loop.run_in_executor(
+                pool,
+                _execute_task_in_process,
+                _task_to_message(task),
+                self._task_timeout(task),
+                ticket
+            )
+            try:
+                values = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.done():
+                    future.add_done_callback(_consume_result)
+                    recycler = asyncio.ensure_future(
+                        self._recycle_if_stuck(pool, board, ticket, future)
+                    )
+                    self._recycling.add(recycler)
+                    recycler.add_done_callback(self._recycling.discard)
+                raise
+            except BrokenProcessPool:
+                if pool is self.process_executor:
+                    raise
+                logger.info(f"Re-running task {task.id} on the replacement process pool")
+                continue
+            return _result_from_tuple(values)
+    
+    async def _recycle_if_stuck(self, pool: ProcessPoolExecutor, board: "_WorkerBoard",
+                                ticket: int, future: asyncio.Future) -> None:
+        """Kill the worker running ``ticket`` and replace its pool if it does not return."""
+        done, _ = await asyncio.wait([future], timeout=PROCESS_STOP_GRACE)
+        if done:
+            return
+        
+        pid = board.pid_running(ticket)
+        if pool is self.process_executor:
+            self._new_process_pool()
+        if pid:
+            logger.warning(f"Killing process worker {pid}, still busy after its task was cancelled")
+            try:
+                os.kill(pid, getattr(signal, "SIGKILL", signal.SIGTERM))
+            except OSError:
+                pass
+        # Killing a worker breaks the pool, failing its other work with
+        # BrokenProcessPool, which _execute_in_process runs again
+        pool.shutdown(wait=False)
+        if self.running and self.process_executor is not pool:
+            await self._warm_process_pool()
     
     async def _update_metrics(self):
         """Periodically update execution metrics."""
@@ -494,6 +906,7 @@ class ParallelExecutor:
                     usage = self.resource_monitor.get_usage()
                     self.metrics.current_cpu_usage = usage.cpu_percent
                     self.metrics.current_memory_usage = usage.memory_mb
+                    self.metrics.admission_capacity = self.admission.capacity
                     self.metrics.peak_cpu_usage = max(
                         self.metrics.peak_cpu_usage,
                         usage.cpu_percent
@@ -526,22 +939,177 @@ class ParallelExecutor:
         return self.task_queue.qsize()
 
 
-def _execute_task_in_process(task: Task) -> Result:
-    """Execute task in a separate process (pickleable function)."""
-    # Import inside function to avoid pickling issues
-    import asyncio
+def _consume_result(future: "asyncio.Future") -> None:
+    """Retrieve an abandoned future's outcome so it is not logged as unhandled."""
+    if not future.cancelled():
+        future.exception()
+
+
+class _WorkerBoard:
+    """Shared table of which task each worker of a process pool is running.
+    
+    Each worker claims a slot when it starts and writes the ticket of its
+    current task there, so the parent can find the PID of a stuck worker.
+    """
+    
+    def __init__(self, size: int):
+        self.pids = multiprocessing.Array("q", size, lock=False)
+        self.tickets = multiprocessing.Array("q", size, lock=False)
+        self.claimed = multiprocessing.Value("i", 0)
+    
+    def claim(self) -> Optional[int]:
+        """Slot for the calling worker process (None if the board is full)."""
+        with self.claimed.get_lock():
+            slot = self.claimed.value
+            if slot >= len(self.pids):
+                return None
+            self.claimed.value += 1
+        self.pids[slot] = os.getpid()
+        return slot
+    
+    def pid_running(self, ticket: int) -> Optional[int]:
+        """PID of the worker running ``ticket``, if any."""
+        for slot in range(min(self.claimed.value, len(self.pids))):
+            if self.tickets[slot] == ticket:
+                return self.pids[slot]
+        return None
+
+
+# Per-process state for warm pool workers
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+_worker_strategies: Dict[str, Any] = {}
+_worker_board: Optional[_WorkerBoard] = None
+_worker_slot: Optional[int] = None
+
+
+def _init_worker_process(board: Optional[_WorkerBoard] = None) -> None:
+    """Initialize a pool worker: persistent event loop and strategy imports."""
+    global _worker_loop, _worker_board, _worker_slot
+    from ..strategies import create_strategy  # noqa: F401  (pre-import)
+    
+    _worker_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_worker_loop)
+    _worker_strategies.clear()
+    if board is not None:
+        _worker_board, _worker_slot = board, board.claim()
+
+
+def _warm_worker_process() -> int:
+    """No-op used to spawn pool workers ahead of the first task."""
+    return multiprocessing.current_process().pid or 0
+
+
+def _task_to_message(task: Task) -> tuple:
+    """Encode the task fields strategies use into a compact tuple."""
+    return (
+        task.id,
+        task.objective,
+        task.description,
+        task.strategy.value,
+        task.mode.value,
+        task.parameters or None,
+    )
+
+
+def _message_to_task(message: tuple) -> Task:
+    """Rebuild a Task from a message produced by _task_to_message."""
+    task_id, objective, description, strategy, mode, parameters = message
+    return Task(
+        id=task_id,
+        objective=objective,
+        description=description,
+        strategy=StrategyType(strategy),
+        mode=CoordinationMode(mode),
+        parameters=parameters or {},
+    )
+
+
+def _timestamp(value: Optional[datetime]) -> Optional[float]:
+    return value.timestamp() if value else None
+
+
+def _from_timestamp(value: Optional[float]) -> Optional[datetime]:
+    return datetime.fromtimestamp(value) if value is not None else None
+
+
+# Metric dataclass fields in the order they are flattened into result
+# tuples, derived from the dataclasses so adding a field cannot shift others
+_PERF_FIELDS = tuple(f.name for f in fields(PerformanceMetrics) if f.init)
+_QUALITY_FIELDS = tuple(f.name for f in fields(QualityMetrics) if f.init)
+_USAGE_FIELDS = tuple(f.name for f in fields(ResourceUsage) if f.init)
+_PERF_END = len(_PERF_FIELDS)
+_QUALITY_END = _PERF_END + len(_QUALITY_FIELDS)
+_USAGE_END = _QUALITY_END + len(_USAGE_FIELDS)
+_perf_values = operator.attrgetter(*_PERF_FIELDS)
+_quality_values = operator.attrgetter(*_QUALITY_FIELDS)
+_usage_values = operator.attrgetter(*_USAGE_FIELDS)
+
+
+def _result_to_tuple(result: Result) -> tuple:
+    """Flatten a Result into plain values for the trip back to the parent."""
+    return (
+        result.id, result.task_id, result.agent_id, result.status.value,
+        result.output or None, result.errors or None, result.warnings or None,
+        *_perf_values(result.performance_metrics),
+        *_quality_values(result.quality_metrics),
+        *_usage_values(result.resource_usage),
+        result.execution_details or None,
+        _timestamp(result.created_at), _timestamp(result.started_at),
+        _timestamp(result.completed_at),
+    )
+
+
+def _result_from_tuple(values: tuple) -> Result:
+    """Rehydrate a Result from _result_to_tuple output."""
+    (result_id, task_id, agent_id, status, output, errors, warnings,
+     *rest) = values
+    execution_details, created_at, started_at, completed_at = rest[_USAGE_END:]
+    return Result(
+        id=result_id,
+        task_id=task_id,
+        agent_id=agent_id,
+        status=ResultStatus(status),
+        output=output or {},
+        errors=errors or [],
+        warnings=warnings or [],
+        performance_metrics=PerformanceMetrics(*rest[:_PERF_END]),
+        quality_metrics=QualityMetrics(*rest[_PERF_END:_QUALITY_END]),
+        resource_usage=ResourceUsage(*rest[_QUALITY_END:_USAGE_END]),
+        execution_details=execution_details or {},
+        created_at=_from_timestamp(created_at),
+        started_at=_from_timestamp(started_at),
+        completed_at=_from_timestamp(completed_at),
+    )
+
+
+def _execute_task_in_process(message: tuple, timeout: Optional[float] = None,
+                             ticket: int = 0) -> tuple:
+    """Execute a task message in a warm pool worker (pickleable function).
+    
+    The strategy is cancelled after ``timeout`` seconds so the worker
+    process is free for the next task. ``ticket`` is published on the
+    worker board while the task runs.
+    """
     from ..strategies import create_strategy
     
-    # Create new event loop for process
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
+    if _worker_loop is None or _worker_loop.is_closed():
+        _init_worker_process()
     
+    task = _message_to_task(message)
+    strategy_name = task.strategy.value.lower()
+    strategy = _worker_strategies.get(strategy_name)
+    if strategy is None:
+        strategy = _worker_strategies[strategy_name] = create_strategy(strategy_name)
+    
+    tracked = _worker_board is not None and _worker_slot is not None
+    if tracked:
+        _worker_board.tickets[_worker_slot] = ticket
     try:
-        strategy = create_strategy(task.strategy.value.lower())
-        result = loop.run_until_complete(strategy.execute(task))
-        return result
+        result = _worker_loop.run_until_complete(run_with_deadline(strategy.execute(task), timeout))
     finally:
-        loop.close()
+        if tracked:
+            _worker_board.tickets[_worker_slot] = 0
+    return _result_to_tuple(result)
 
 
 class BatchExecutor:
@@ -0,0 +1,200 @@
+"""Termination, reaping and leak auditing for subprocess trees.
+
+Commands are started in their own session (``start_new_session=True``), so
+every process they spawn shares the leader's session id even after it is
+re-parented. ``ProcessTree`` uses that to find descendants once the leader
+is gone, to stop the whole tree (SIGTERM, then SIGKILL after a grace period) and to report any
+that survive a run.
+"""
+
+import ctypes
+import logging
+import os
+import signal
+import sys
+import time
+from typing import Dict, Iterable, List, Optional
+
+import psutil
+
+
+logger = logging.getLogger(__name__)
+
+# Seconds between SIGTERM and SIGKILL
+DEFAULT_GRACE_PERIOD = 3.0
+_PR_SET_CHILD_SUBREAPER = 36
+
+
+def enable_child_subreaper() -> bool:
+    """Adopt orphaned descendants so ``ProcessTree.reap`` can collect them.
+
+    Without this, descendants whose parent exits are re-parented to init and
+    their zombies are outside our control. Linux only.
+
+    Returns:
+        True if the process is now a child subreaper
+    """
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        return libc.prctl(_PR_SET_CHILD_SUBREAPER, 1, 0, 0, 0) == 0
+    except (OSError, AttributeError):
+        return False
+
+
+def _alive(process: psutil.Process) -> bool:
+    """Running and not a zombie (does not reap)."""
+    try:
+        return process.is_running() and process.status() != psutil.STATUS_ZOMBIE
+    except psutil.Error:
+        return False
+
+
+def _wait_gone(processes: Iterable[psutil.Process], timeout: float) -> List[psutil.Process]:
+    """Poll until the processes exit; returns those still alive at the timeout.
+
+    Polling rather than ``psutil.wait_procs`` keeps the leader's exit status
+    for its owner (Popen or asyncio), which must be the one to reap it.
+    """
+    deadline = time.monotonic() + timeout
+    alive = [p for p in processes if _alive(p)]
+    while alive and time.monotonic() < deadline:
+        time.sleep(0.05)
+        alive = [p for p in alive if _alive(p)]
+    return alive
+
+
+class ProcessTree:
+    """A subprocess started in its own session plus everything it spawns.
+
+    While the leader exists, descendants are read from its child list; the
+    system-wide session scan is only needed once it has been reaped and its
+    orphans can no longer be reached that way. The child list also catches
+    processes that start a session of their own, as long as ``snapshot``
+    saw them while their parent was alive. The leader itself is signalled
+    but never waited on here.
+
+    Must be created while the leader is still unreaped, so that a later
+    process reusing its PID is not mistaken for it.
+    """
+
+    def __init__(self, pid: int):
+        """Track the tree rooted at ``pid`` (a session leader)."""
+        self.pid = pid
+        self._seen: Dict[int, psutil.Process] = {}
+        try:
+            self._leader: Optional[psutil.Process] = psutil.Process(pid)
+        except psutil.Error:
+            self._leader = None
+
+    def _leader_present(self) -> bool:
+        """True while the leader is running or an unreaped zombie.
+
+        Until it is reaped its PID, and with it the process group id, cannot
+        be handed to another process.
+        """
+        try:
+            return self._leader is not None and self._leader.is_running()
+        except psutil.Error:
+            return False
+
+    def snapshot(self) -> None:
+        """Remember the leader's current descendants."""
+        for child in self._children():
+            self._seen.setdefault(child.pid, child)
+
+    def descendants(self, include_zombies: bool = False) -> List[psutil.Process]:
+        """Descendants of the leader (not the leader itself)."""
+        found: Dict[int, psutil.Process] = {}
+        if self._leader_present():
+            found.update((child.pid, child) for child in self._children())
+        # Checked again: the leader may have been reaped while listing
+        if not self._leader_present():
+            found.update(self._session_members())
+        for pid, process in self._seen.items():
+            if pid not in found and process.is_running():
+                found[pid] = process
+        if include_zombies:
+            return list(found.values())
+        return [p for p in found.values() if _alive(p)]
+
+    def terminate(self, grace_period: float = DEFAULT_GRACE_PERIOD) -> List[int]:
+        """Stop the whole tree: SIGTERM, then SIGKILL after ``grace_period``.
+
+        Returns:
+            PIDs that ignored SIGTERM and had to be killed
+        """
+        self.snapshot()
+        targets = self.descendants()
+        if self._leader is not None and _alive(self._leader):
+            targets.append(self._leader)
+
+        self._signal(targets, signal.SIGTERM)
+        stubborn = _wait_gone(targets, grace_period)
+        if stubborn:
+            self._signal(stubborn, getattr(signal, "SIGKILL", signal.SIGTERM))
+            _wait_gone(stubborn, 1.0)
+        self.reap()
+        return [p.pid for p in stubborn]
+
+    def reap(self) -> int:
+        """Collect zombie descendants that are our children.
+
+        Returns:
+            Number of zombies reaped
+        """
+        reaped = 0
+        for process in self.descendants(include_zombies=True):
+            try:
+                if os.waitpid(process.pid, os.WNOHANG)[0]:
+                    reaped += 1
+            except (ChildProcessError, OSError):
+                continue
+        return reaped
+
+    def audit(self) -> List[int]:
+        """PIDs of descendants still running after the leader finished."""
+        self.reap()
+        return sorted(p.pid for p in self.descendants())
+
+    def _children(self) -> List[psutil.Process]:
+        """The leader's current descendants, or none once it is gone."""
+        if self._leader is None:
+            return []
+        try:
+            return self._leader.children(recursive=True)
+        except psutil.Error:
+            return []
+
+    def _session_members(self) -> Dict[int, psutil.Process]:
+        """Every other process in the leader's session (scans all PIDs)."""
+        found: Dict[int, psutil.Process] = {}
+        if not hasattr(os, "getsid"):
+            return found
+        for pid in psutil.pids():
+            if pid == self.pid:
+                continue
+            try:
+                if os.getsid(pid) == self.pid:
+                    found[pid] = psutil.Process(pid)
+            except (OSError, psutil.Error):
+                continue
+        return found
+
+    def _signal(self, processes: List[psutil.Process], sig: int) -> None:
+        """Signal the leader's process group, then each process individually.
+
+        The group is only signalled while the leader is unreaped; after
+        that its id may belong to an unrelated group.
+        """
+        if hasattr(os, "killpg") and self._leader_present():
+            try:
+                os.killpg(self.pid, sig)
+            except OSError:
+                pass
+        for process in processes:
+            try:
+                process.send_signal(sig)
+            except psutil.Error:
+                continue
@@ -0,0 +1,356 @@
+"""Persistent, content-addressed cache of benchmark results.
+
+Entries are keyed by ``fingerprint``: a SHA-256 of the whole benchmark
+configuration, the objective, the parameters of the tasks it decomposes
+into and the claude-flow version. Any change to those produces a new key,
+so stale results are never returned; unchanged runs (for example sweep
+cells re-run in CI) are answered from disk.
+"""
+
+from __future__ import annotations
+import asyncio
+import enum
+import functools
+import hashlib
+import json
+import shutil
+import sqlite3
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from .models import BenchmarkConfig, Task
+
+
+# Bumped when the fingerprint input or the table layout changes
+CACHE_VERSION = 1
+
+# Config fields that only affect where and how results are reported
+_OUTPUT_ONLY_FIELDS = ("output_formats", "output_directory", "verbose")
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS entries (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        strategy TEXT,
+        mode TEXT,
+        objective TEXT,
+        created_at REAL NOT NULL,
+        accessed_at REAL NOT NULL,
+        expires_at REAL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries(accessed_at)",
+    """
+    CREATE TABLE IF NOT EXISTS counters (
+        name TEXT PRIMARY KEY,
+        value INTEGER NOT NULL
+    )
+    """,
+)
+
+
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+def _canonical(value: Any) -> Any:
+    """JSON-ready form of config values with a stable representation.
+
+    Raises:
+        TypeError: If ``value`` contains something with no stable JSON form
+    """
+    if isinstance(value, enum.Enum):
+        return _canonical(value.value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, dict):
+        canonical = {}
+        for k, v in value.items():
+            key = _canonical(k)
+            if not isinstance(key, _JSON_SCALARS):
+                raise TypeError(f"Cannot fingerprint mapping key {k!r}")
+            canonical[str(key)] = _canonical(v)
+        return canonical
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = [_canonical(v) for v in value]
+        if isinstance(value, (set, frozenset)):
+            return sorted(items, key=lambda item: json.dumps(item, sort_keys=True))
+        return items
+    if isinstance(value, _JSON_SCALARS):
+        return value
+    raise TypeError(f"Cannot fingerprint value of type {type(value).__name__}: {value!r}")
+
+
+def fingerprint(
+    config: BenchmarkConfig,
+    objective: str,
+    tasks: Iterable[Task] = (),
+    claude_flow_version: Optional[str] = None
+) -> str:
+    """Stable cache key for running ``objective`` under ``config``.
+
+    Args:
+        config: Benchmark configuration (output-only fields are ignored)
+        objective: Benchmark objective
+        tasks: Tasks the objective is decomposed into; their ids are ignored
+        claude_flow_version: Version of the claude-flow executable, if any
+
+    Returns:
+        Hex SHA-256 digest
+
+    Raises:
+        TypeError: If a config or task parameter value is not JSON-like
+            (enums, datetimes and sets are normalized)
+    """
+    config_fields = asdict(config)
+    for name in _OUTPUT_ONLY_FIELDS:
+        config_fields.pop(name, None)
+
+    payload = {
+        "version": CACHE_VERSION,
+        "config": config_fields,
+        "objective": objective,
+        "tasks": [
+            {
+                "objective": task.objective,
+                "description": task.description,
+                "strategy": task.strategy,
+                "mode": task.mode,
+                "parameters": task.parameters,
+                "timeout": task.timeout,
+                "max_retries": task.max_retries,
+                "priority": task.priority,
+            }
+            for task in tasks
+        ],
+        "claude_flow_version": claude_flow_version,
+    }
+    encoded = json.dumps(_canonical(payload), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def claude_flow_version(executable: str = "claude-flow") -> Optional[str]:
+    """Version reported by ``<executable> --version``; None if unavailable."""
+    if shutil.which(executable) is None:
+        return None
+    try:
+        completed = subprocess.run(
+            [executable, "--version"], capture_output=True, text=True, timeout=30
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if completed.returncode != 0:
+        return None
+    return completed.stdout.strip() or None
+
+
+class ResultCache:
+    """SQLite-backed result cache with TTL and size-based LRU eviction.
+
+    Values are JSON documents. Reads refresh an entry's access time; once
+    the stored values exceed ``max_bytes``, the least recently used entries
+    are evicted. Hit, miss and eviction counts persist with the cache.
+    Coroutines should use the ``*_async`` methods, which run the database
+    calls on a dedicated thread.
+    """
+
+    DB_NAME = "result_cache.db"
+
+    def __init__(self, path: Path, max_bytes: int = 64 * 1024 * 1024,
+                 ttl: Optional[float] = 7 * 24 * 3600):
+        """Initialize the cache.
+
+        Args:
+            path: Database file, or a directory to hold ``result_cache.db``
+            max_bytes: Total size of stored values before LRU eviction
+            ttl: Default entry lifetime in seconds (None for no expiry)
+        """
+        path = Path(path)
+        self.path = path / self.DB_NAME if path.suffix != ".db" else path
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    async def get_async(self, key: str) -> Optional[Any]:
+        """``get`` without blocking the event loop."""
+        return await self._run(self.get, key)
+
+    async def put_async(self, key: str, value: Any, **kwargs: Any) -> None:
+        """``put`` without blocking the event loop."""
+        await self._run(lambda: self.put(key, value, **kwargs))
+
+    async def stats_async(self) -> Dict[str, Any]:
+        """``stats`` without blocking the event loop."""
+        return await self._run(self.stats)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for ``key``, or None on a miss."""
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT value, expires_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            with conn:
+                if row is None or (row[1] is not None and row[1] <= now):
+                    if row is not None:
+                        conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                    self._count(conn, "misses")
+                    return None
+                conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+                self._count(conn, "hits")
+        return json.loads(row[0])
+
+    def put(self, key: str, value: Any, ttl: Optional[float] = None,
+            strategy: Optional[str] = None, mode: Optional[str] = None,
+            objective: Optional[str] = None) -> None:
+        """Store ``value`` under ``key``.
+
+        Args:
+            key: Cache key, normally from ``fingerprint``
+            value: JSON-serializable value
+            ttl: Lifetime in seconds (defaults to the cache TTL)
+            strategy, mode, objective: Labels used by ``invalidate``
+        """
+        encoded = json.dumps(value, default=str)
+        now = time.time()
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = now + ttl if ttl is not None else None
+
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries "
+                    "(key, value, size, strategy, mode, objective, created_at, accessed_at, expires_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (key, encoded, len(encoded), strategy, mode, objective, now, now, expires_at)
+                )
+                self._evict(conn)
+
+    def invalidate(self, key: Optional[str] = None, strategy: Optional[str] = None,
+                   mode: Optional[str] = None, objective: Optional[str] = None) -> int:
+        """Delete matching entries; with no filters, delete everything.
+
+        Returns:
+            Number of entries deleted
+        """
+        conditions = []
+        params = []
+        for column, value in (("key", key), ("strategy", strategy),
+                              ("mode", mode), ("objective", objective)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                return conn.execute(f"DELETE FROM entries{where}", params).rowcount
+
+    def clear(self) -> int:
+        """Delete all entries and reset the statistics."""
+        deleted = self.invalidate()
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM counters")
+        return deleted
+
+    def purge_expired(self) -> int:
+        """Delete expired entries, returning how many were removed."""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                return conn.execute(
+                    "DELETE FROM entries WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                    (time.time(),)
+                ).rowcount
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count, stored bytes and hit/miss/eviction counts."""
+        with self._lock:
+            conn = self._connect()
+            entries, size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+            counters = dict(conn.execute("SELECT name, value FROM counters"))
+
+        hits = counters.get("hits", 0)
+        misses = counters.get("misses", 0)
+        return {
+            "path": str(self.path),
+            "entries": entries,
+            "bytes": size,
+            "max_bytes": self.max_bytes,
+            "hits": hits,
+            "misses": misses,
+            "evictions": counters.get("evictions", 0),
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0
+        }
+
+    def close(self) -> None:
+        """Close the database connection and the async worker thread."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    async def _run(self, func, *args):
+        """Run a cache call on the cache's worker thread."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="result-cache")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use (caller holds the lock)."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            if conn.execute("PRAGMA user_version").fetchone()[0] != CACHE_VERSION:
+                with conn:
+                    conn.execute("DROP TABLE IF EXISTS entries")
+                    for statement in _SCHEMA:
+                        conn.execute(statement)
+                    conn.execute(f"PRAGMA user_version = {CACHE_VERSION}")
+            self._conn = conn
+        return self._conn
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Drop least recently used entries until within ``max_bytes``."""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        evicted = []
+        for key, size in conn.execute("SELECT key, size FROM entries ORDER BY accessed_at, rowid"):
+            if total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM entries WHERE key = ?", evicted)
+        self._count(conn, "evictions", len(evicted))
+
+    @staticmethod
+    def _count(conn: sqlite3.Connection, name: str, amount: int = 1) -> None:
+        conn.execute(
+            "INSERT INTO counters (name, value) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            (name, amount)
+        )
@@ -0,0 +1,484 @@
+"""Columnar, memory-lean storage for large numbers of results.
+
+A ``Result`` dataclass costs over a kilobyte once its nested metrics,
+containers and datetimes are counted. ``ResultStore`` keeps the numeric
+metrics in typed ``array`` columns, interns repeated strings (task and agent
+ids, statuses), packs uuid result ids into two integers and only allocates
+a column once it holds a non-default value. ``ResultRow`` exposes the
+``Result`` API as a lightweight read/write view over one row.
+"""
+
+from __future__ import annotations
+import math
+import sys
+import uuid
+from array import array
+from dataclasses import fields
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .models import (
+    Result, ResultStatus, PerformanceMetrics, QualityMetrics, ResourceUsage
+)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is an optional accelerator
+    np = None
+
+
+_METRIC_GROUPS = {
+    "performance_metrics": PerformanceMetrics,
+    "quality_metrics": QualityMetrics,
+    "resource_usage": ResourceUsage,
+}
+_OBJECT_FIELDS = {
+    "output": dict,
+    "errors": list,
+    "warnings": list,
+    "execution_details": dict,
+}
+_TIMESTAMP_FIELDS = ("created_at", "started_at", "completed_at")
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_NO_TIMESTAMP = -(2 ** 63)
+_AWARE_TIMESTAMP = _NO_TIMESTAMP + 1
+
+
+def _same(a: Any, b: Any) -> bool:
+    """Equality that treats NaN as equal to itself."""
+    return a == b or (a != a and b != b)
+
+
+class _Column:
+    """Typed column that stays unallocated while every value is the default."""
+    __slots__ = ("typecode", "default", "data")
+
+    def __init__(self, typecode: str, default: Any):
+        self.typecode = typecode
+        self.default = default
+        self.data: Optional[array] = None
+
+    def append(self, value: Any, length: int) -> None:
+        if self.data is None:
+            if _same(value, self.default):
+                return
+            self._materialize(length)
+        self.data.append(value)
+
+    def get(self, row: int) -> Any:
+        return self.default if self.data is None else self.data[row]
+
+    def set(self, row: int, value: Any, length: int) -> None:
+        if self.data is None:
+            if _same(value, self.default):
+                return
+            self._materialize(length)
+        self.data[row] = value
+
+    def values(self, length: int) -> array:
+        if self.data is None:
+            return array(self.typecode, [self.default]) * length
+        return array(self.typecode, self.data)
+
+    def nbytes(self) -> int:
+        if self.data is None:
+            return 0
+        return self.data.buffer_info()[1] * self.data.itemsize
+
+    def _materialize(self, length: int) -> None:
+        self.data = array(self.typecode, [self.default]) * length
+
+
+class _Interner:
+    """Map repeated hashable values to small integer codes."""
+    __slots__ = ("values", "codes")
+
+    def __init__(self, seed: Iterable[Any] = ()):
+        self.values: List[Any] = list(seed)
+        self.codes: Dict[Any, int] = {v: i for i, v in enumerate(self.values)}
+
+    def code(self, value: Any) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.values.append(value)
+            self.codes[value] = code
+        return code
+
+
+class _MetricField:
+    """Encoding for one numeric metric field stored as a float64 column."""
+    __slots__ = ("group", "name", "is_int", "optional")
+
+    def __init__(self, group: str, name: str, type_hint: str):
+        self.group = group
+        self.name = name
+        self.is_int = type_hint == "int"
+        self.optional = type_hint.startswith("Optional")
+
+    def encode(self, value: Any) -> float:
+        if value is None:
+            return math.nan
+        return float(value)
+
+    def decode(self, stored: float) -> Any:
+        if stored != stored:
+            return None if self.optional else stored
+        if self.is_int and stored.is_integer():
+            return int(stored)
+        return stored
+
+
+def _metric_fields() -> Dict[str, _MetricField]:
+    metric_fields = {}
+    for group, cls in _METRIC_GROUPS.items():
+        for f in fields(cls):
+            type_hint = f.type if isinstance(f.type, str) else getattr(f.type, "__name__", "")
+            metric_fields[f"{group}.{f.name}"] = _MetricField(group, f.name, type_hint)
+    return metric_fields
+
+
+_METRIC_FIELDS = _metric_fields()
+_METRIC_ALIASES = {mf.name: key for key, mf in _METRIC_FIELDS.items()}
+
+
+class ResultStore:
+    """Append-only columnar store of task results."""
+
+    def __init__(self):
+        self._length = 0
+        self._id_hi = array("Q")
+        self._id_lo = array("Q")
+        self._odd_ids: Dict[int, str] = {}
+        self._strings = _Interner([""])
+        self._statuses = _Interner([ResultStatus.SUCCESS])
+        self._task_ids = _Column("I", 0)
+        self._agent_ids = _Column("I", 0)
+        self._status = _Column("H", 0)
+        self._timestamps = {name: _Column("q", _NO_TIMESTAMP) for name in _TIMESTAMP_FIELDS}
+        self._aware_timestamps: Dict[Tuple[str, int], datetime] = {}
+        self._metrics = {
+            key: _Column("d", metric.encode(getattr(_METRIC_GROUPS[metric.group](), metric.name)))
+            for key, metric in _METRIC_FIELDS.items()
+        }
+        self._objects: Dict[str, Dict[int, Any]] = {name: {} for name in _OBJECT_FIELDS}
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, row: int) -> "ResultRow":
+        if row < 0:
+            row += self._length
+        if not 0 <= row < self._length:
+            raise IndexError("result index out of range")
+        return ResultRow(self, row)
+
+    def __iter__(self) -> Iterator["ResultRow"]:
+        for row in range(self._length):
+            yield ResultRow(self, row)
+
+    def append(self, result: Result) -> "ResultRow":
+        """Store a result and return a view over its row."""
+        row = self._length
+        self._append_id(result.id, row)
+        self._task_ids.append(self._strings.code(result.task_id), row)
+        self._agent_ids.append(self._strings.code(result.agent_id), row)
+        self._status.append(self._statuses.code(result.status), row)
+
+        for name, column in self._timestamps.items():
+            column.append(self._encode_timestamp(name, row, getattr(result, name)), row)
+
+        for key, metric in _METRIC_FIELDS.items():
+            value = getattr(getattr(result, metric.group), metric.name)
+            self._metrics[key].append(metric.encode(value), row)
+
+        for name in _OBJECT_FIELDS:
+            value = getattr(result, name)
+            if value:
+                self._objects[name][row] = value
+
+        self._length += 1
+        return ResultRow(self, row)
+
+    def extend(self, results: Iterable[Result]) -> None:
+        """Store several results."""
+        for result in results:
+            self.append(result)
+
+    def column(self, name: str):
+        """Return a copy of a numeric metric column.
+
+        Args:
+            name: Field name, optionally qualified by its group
+                (``"execution_time"`` or ``"performance_metrics.execution_time"``)
+
+        Returns:
+            A float64 NumPy array when NumPy is available, otherwise an
+            ``array('d')``. Missing optional values are NaN.
+        """
+        key = name if name in self._metrics else _METRIC_ALIASES.get(name)
+        if key is None:
+            raise KeyError(f"Unknown metric column: {name}")
+        values = self._metrics[key].values(self._length)
+        if np is not None:
+            return np.frombuffer(values, dtype=np.float64).copy()
+        return values
+
+    def to_results(self) -> List[Result]:
+        """Materialize every row as a ``Result``."""
+        return [row.to_result() for row in self]
+
+    def memory_usage(self) -> int:
+        """Approximate bytes held by the store (excluding shared payload objects)."""
+        total = sys.getsizeof(self)
+        for column in self._all_columns():
+            total += column.nbytes()
+        total += self._id_hi.buffer_info()[1] * 8 + self._id_lo.buffer_info()[1] * 8
+        total += sys.getsizeof(self._odd_ids) + sum(sys.getsizeof(v) for v in self._odd_ids.values())
+        total += sys.getsizeof(self._strings.values) + sys.getsizeof(self._strings.codes)
+        total += sum(sys.getsizeof(v) for v in self._strings.values)
+        total += sum(sys.getsizeof(objects) for objects in self._objects.values())
+        total += sys.getsizeof(self._aware_timestamps)
+        return total
+
+    # Row access used by ResultRow and the metric views
+
+    def _all_columns(self) -> Iterator[_Column]:
+        yield self._task_ids
+        yield self._agent_ids
+        yield self._status
+        yield from self._timestamps.values()
+        yield from self._metrics.values()
+
+    def _append_id(self, result_id: str, row: int) -> None:
+        hi, lo = self._pack_id(result_id, row)
+        self._id_hi.append(hi)
+        self._id_lo.append(lo)
+
+    def _pack_id(self, result_id: str, row: int) -> Tuple[int, int]:
+        self._odd_ids.pop(row, None)
+        try:
+            value = uuid.UUID(result_id).int
+        except (ValueError, TypeError, AttributeError):
+            value = None
+        if value is None or str(uuid.UUID(int=value)) != result_id:
+            self._odd_ids[row] = result_id
+            return 0, 0
+        return value >> 64, value & 0xFFFFFFFFFFFFFFFF
+
+    def _get_id(self, row: int) -> str:
+        odd = self._odd_ids.get(row)
+        if odd is not None:
+            return odd
+        return str(uuid.UUID(int=(self._id_hi[row] << 64) | self._id_lo[row]))
+
+    def _set_id(self, row: int, value: str) -> None:
+        self._id_hi[row], self._id_lo[row] = self._pack_id(value, row)
+
+    def _get_string(self, column: _Column, row: int) -> str:
+        return self._strings.values[column.get(row)]
+
+    def _set_string(self, column: _Column, row: int, value: str) -> None:
+        column.set(row, self._strings.code(value), self._length)
+
+    def _get_status(self, row: int) -> Any:
+        return self._statuses.values[self._status.get(row)]
+
+    def _set_status(self, row: int, value: Any) -> None:
+        self._status.set(row, self._statuses.code(value), self._length)
+
+    def _encode_timestamp(self, name: str, row: int, value: Optional[datetime]) -> int:
+        self._aware_timestamps.pop((name, row), None)
+        if value is None:
+            return _NO_TIMESTAMP
+        if value.tzinfo is not None:
+            self._aware_timestamps[(name, row)] = value
+            return _AWARE_TIMESTAMP
+        return (value - _EPOCH) // _MICROSECOND
+
+    def _get_timestamp(self, name: str, row: int) -> Optional[datetime]:
+        stored = self._timestamps[name].get(row)
+        if stored == _NO_TIMESTAMP:
+            return None
+        if stored == _AWARE_TIMESTAMP:
+            return self._aware_timestamps[(name, row)]
+        return _EPOCH + timedelta(microseconds=stored)
+
+    def _set_timestamp(self, name: str, row: int, value: Optional[datetime]) -> None:
+        self._timestamps[name].set(row, self._encode_timestamp(name, row, value), self._length)
+
+    def _get_object(self, name: str, row: int) -> Any:
+        objects = self._objects[name]
+        value = objects.get(row)
+        if value is None:
+            # Allocate on first access so in-place edits through the view persist.
+            value = objects[row] = _OBJECT_FIELDS[name]()
+        return value
+
+    def _set_object(self, name: str, row: int, value: Any) -> None:
+        if value:
+            self._objects[name][row] = value
+        else:
+            self._objects[name].pop(row, None)
+
+    def _get_metric(self, key: str, row: int) -> Any:
+        return _METRIC_FIELDS[key].decode(self._metrics[key].get(row))
+
+    def _set_metric(self, key: str, row: int, value: Any) -> None:
+        self._metrics[key].set(row, _METRIC_FIELDS[key].encode(value), self._length)
+
+
+class _MetricsView:
+    """Write-through view of one metrics group of a stored result."""
+    __slots__ = ("_store", "_row", "_group")
+
+    def __init__(self, store: ResultStore, row: int, group: str):
+        object.__setattr__(self, "_store", store)
+        object.__setattr__(self, "_row", row)
+        object.__setattr__(self, "_group", group)
+
+    def __getattr__(self, name: str) -> Any:
+        key = f"{self._group}.{name}"
+        if key not in _METRIC_FIELDS:
+            raise AttributeError(name)
+        return self._store._get_metric(key, self._row)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        key = f"{self._group}.{name}"
+        if key not in _METRIC_FIELDS:
+            raise AttributeError(name)
+        self._store._set_metric(key, self._row, value)
+
+    def to_dataclass(self):
+        """Materialize the group as its dataclass."""
+        cls = _METRIC_GROUPS[self._group]
+        return cls(**{f.name: getattr(self, f.name) for f in fields(cls)})
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, _MetricsView):
+            other = other.to_dataclass()
+        return self.to_dataclass() == other
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr(self.to_dataclass())
+
+
+def _string_property(column_attr: str) -> property:
+    def fget(self):
+        return self._store._get_string(getattr(self._store, column_attr), self._row)
+
+    def fset(self, value):
+        self._store._set_string(getattr(self._store, column_attr), self._row, value)
+
+    return property(fget, fset)
+
+
+def _timestamp_property(name: str) -> property:
+    def fget(self):
+        return self._store._get_timestamp(name, self._row)
+
+    def fset(self, value):
+        self._store._set_timestamp(name, self._row, value)
+
+    return property(fget, fset)
+
+
+def _object_property(name: str) -> property:
+    def fget(self):
+        return self._store._get_object(name, self._row)
+
+    def fset(self, value):
+        self._store._set_object(name, self._row, value)
+
+    return property(fget, fset)
+
+
+def _metrics_property(group: str) -> property:
+    def fget(self):
+        return _MetricsView(self._store, self._row, group)
+
+    def fset(self, value):
+        for f in fields(_METRIC_GROUPS[group]):
+            self._store._set_metric(f"{group}.{f.name}", self._row, getattr(value, f.name))
+
+    return property(fget, fset)
+
+
+class ResultRow:
+    """``Result``-compatible view over one row of a ``ResultStore``."""
+    __slots__ = ("_store", "_row")
+
+    def __init__(self, store: ResultStore, row: int):
+        self._store = store
+        self._row = row
+
+    @property
+    def id(self) -> str:
+        return self._store._get_id(self._row)
+
+    @id.setter
+    def id(self, value: str) -> None:
+        self._store._set_id(self._row, value)
+
+    @property
+    def status(self) -> Any:
+        return self._store._get_status(self._row)
+
+    @status.setter
+    def status(self, value: Any) -> None:
+        self._store._set_status(self._row, value)
+
+    task_id = _string_property("_task_ids")
+    agent_id = _string_property("_agent_ids")
+    output = _object_property("output")
+    errors = _object_property("errors")
+    warnings = _object_property("warnings")
+    execution_details = _object_property("execution_details")
+    performance_metrics = _metrics_property("performance_metrics")
+    quality_metrics = _metrics_property("quality_metrics")
+    resource_usage = _metrics_property("resource_usage")
+    created_at = _timestamp_property("created_at")
+    started_at = _timestamp_property("started_at")
+    completed_at = _timestamp_property("completed_at")
+
+    def duration(self) -> Optional[float]:
+        """Calculate result duration in seconds."""
+        started_at, completed_at = self.started_at, self.completed_at
+        if started_at and completed_at:
+            return (completed_at - started_at).total_seconds()
+        return None
+
+    def to_result(self) -> Result:
+        """Materialize the row as a standalone ``Result``."""
+        return Result(
+            id=self.id,
+            task_id=self.task_id,
+            agent_id=self.agent_id,
+            status=self.status,
+            output=self._store._objects["output"].get(self._row, {}),
+            errors=self._store._objects["errors"].get(self._row, []),
+            warnings=self._store._objects["warnings"].get(self._row, []),
+            performance_metrics=self.performance_metrics.to_dataclass(),
+            quality_metrics=self.quality_metrics.to_dataclass(),
+            resource_usage=self.resource_usage.to_dataclass(),
+            execution_details=self._store._objects["execution_details"].get(self._row, {}),
+            created_at=self.created_at,
+            started_at=self.started_at,
+            completed_at=self.completed_at,
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, ResultRow):
+            other = other.to_result()
+        if isinstance(other, Result):
+            return self.to_result() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"ResultRow({self._row}, {self.to_result()!r})"
@@ -0,0 +1,243 @@
+"""Constant-time streaming statistics used by models and schedulers."""
+
+from __future__ import annotations
+import math
+import random
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional
+
+
+class QuantileSketch:
+    """Streaming quantile estimator with bounded relative error.
+
+    Values are counted in logarithmically sized buckets (the DDSketch
+    layout), so ``add`` is O(1), memory grows with the log of the value
+    range rather than the number of samples, and any quantile is returned
+    within ``relative_accuracy`` of the exact answer. Intended for
+    non-negative measurements such as durations; values <= 0 share a single
+    zero bucket.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        """Initialize the sketch.
+
+        Args:
+            relative_accuracy: Maximum relative error of reported quantiles
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets: Dict[int, int] = {}
+        self._zero_count = 0
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        """Add a single value."""
+        self.count += 1
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+        if value <= 0:
+            self._zero_count += 1
+            return
+
+        key = math.ceil(math.log(value) / self._log_gamma)
+        self._buckets[key] = self._buckets.get(key, 0) + 1
+
+    def extend(self, values: Iterable[float]) -> None:
+        """Add several values."""
+        for value in values:
+            self.add(value)
+
+    def quantile(self, q: float) -> float:
+        """Estimate the ``q`` quantile (0 <= q <= 1); 0.0 when empty."""
+        if self.count == 0:
+            return 0.0
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+
+        rank = q * (self.count - 1)
+        if rank < self._zero_count:
+            return 0.0
+
+        seen = self._zero_count
+        for key in sorted(self._buckets):
+            seen += self._buckets[key]
+            if seen > rank:
+                estimate = 2 * self._gamma ** key / (self._gamma + 1)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Fold another sketch with the same accuracy into this one."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different accuracy")
+        for key, count in other._buckets.items():
+            self._buckets[key] = self._buckets.get(key, 0) + count
+        self._zero_count += other._zero_count
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-ready state, restored by ``from_dict``."""
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "buckets": {str(key): count for key, count in self._buckets.items()},
+            "zero_count": self._zero_count,
+            "count": self.count,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> "QuantileSketch":
+        """Rebuild a sketch saved with ``to_dict``."""
+        sketch = cls(state["relative_accuracy"])
+        sketch._buckets = {int(key): count for key, count in state["buckets"].items()}
+        sketch._zero_count = state["zero_count"]
+        sketch.count = state["count"]
+        if sketch.count:
+            sketch.min = state["min"]
+            sketch.max = state["max"]
+        return sketch
+
+    def clear(self) -> None:
+        """Drop all values."""
+        self._buckets.clear()
+        self._zero_count = 0
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __repr__(self) -> str:
+        return (f"QuantileSketch(count={self.count}, "
+                f"relative_accuracy={self.relative_accuracy})")
+
+
+class RollingWindow:
+    """The last ``size`` values with a running sum.
+
+    ``add`` evicts the oldest value once the window is full, so the mean of
+    the window is available in O(1) and memory stays fixed. The sum is
+    recomputed exactly every ``size`` evictions, so rounding error from the
+    subtractions cannot build up over long runs.
+    """
+
+    def __init__(self, size: int = 100):
+        """Initialize the window.
+
+        Args:
+            size: Number of most recent values kept
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self.size = size
+        self._values: Deque[float] = deque(maxlen=size)
+        self.total = 0.0
+        self._evictions = 0
+
+    def add(self, value: float) -> None:
+        """Add a value, dropping the oldest one if the window is full."""
+        if len(self._values) == self.size:
+            self.total -= self._values[0]
+            self._evictions += 1
+        self._values.append(value)
+        if self._evictions >= self.size:
+            # O(size) once per size evictions: amortized O(1)
+            self._evictions = 0
+            self.total = math.fsum(self._values)
+        else:
+            self.total += value
+
+    def mean(self, default: float = 0.0) -> float:
+        """Mean of the values in the window; ``default`` when empty."""
+        return self.total / len(self._values) if self._values else default
+
+    def clear(self) -> None:
+        """Forget all values."""
+        self._values.clear()
+        self.total = 0.0
+        self._evictions = 0
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        return f"RollingWindow(size={self.size}, count={len(self._values)})"
+
+
+class Reservoir:
+    """Uniform random sample of at most ``size`` values from a stream.
+
+    Uses Algorithm R: the first ``size`` values are kept, after which the
+    n-th value replaces a random slot with probability ``size / n``.
+    Quantiles are exact until the reservoir fills and unbiased estimates
+    afterwards; the sorted sample is cached between additions.
+    """
+
+    def __init__(self, size: int = 256, seed: Optional[int] = None):
+        """Initialize the reservoir.
+
+        Args:
+            size: Most values kept
+            seed: Seed for the replacement choices (None for random)
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self.size = size
+        self.count = 0
+        self._values: List[float] = []
+        self._sorted: Optional[List[float]] = None
+        self._random = random.Random(seed)
+
+    def add(self, value: float) -> None:
+        """Offer a value to the sample."""
+        self.count += 1
+        if len(self._values) < self.size:
+            self._values.append(value)
+        else:
+            slot = self._random.randrange(self.count)
+            if slot >= self.size:
+                return
+            self._values[slot] = value
+        self._sorted = None
+
+    def quantile(self, q: float) -> float:
+        """Linearly interpolated ``q`` quantile (0 <= q <= 1); 0.0 when empty."""
+        if not self._values:
+            return 0.0
+        if self._sorted is None:
+            self._sorted = sorted(self._values)
+        values = self._sorted
+        rank = min(max(q, 0.0), 1.0) * (len(values) - 1)
+        lower = int(rank)
+        if lower + 1 >= len(values):
+            return values[-1]
+        return values[lower] + (values[lower + 1] - values[lower]) * (rank - lower)
+
+    def clear(self) -> None:
+        """Forget all values."""
+        self.count = 0
+        self._values.clear()
+        self._sorted = None
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        return f"Reservoir(size={self.size}, count={self.count})"
@@ -2,20 +2,31 @@
 
 import heapq
 import logging
+import time
 from collections import defaultdict, deque
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import List, Dict, Set, Optional, Tuple, Callable
+from typing import Any, Iterable, List, Dict, Set, Optional, Tuple, Callable
 
 from .models import (
     Task, Agent, TaskStatus, AgentStatus, AgentType,
     StrategyType, CoordinationMode
 )
+from .dag_executor import DependencyCycleError
+from .duration_model import DurationEstimator
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is an optional accelerator
+    np = None
 
 
 logger = logging.getLogger(__name__)
 
+# Margin that keeps score pruning safe from floating-point rounding
+_SCORE_EPSILON = 1e-9
+
 
 class SchedulingAlgorithm(Enum):
     """Task scheduling algorithms."""
@@ -25,6 +36,7 @@ class SchedulingAlgorithm(Enum):
     PRIORITY_BASED = "priority_based"
     DYNAMIC = "dynamic"
     WORK_STEALING = "work_stealing"
+    SHORTEST_EXPECTED_FINISH = "shortest_expected_finish"
 
 
 @dataclass
@@ -37,6 +49,153 @@ class SchedulingMetrics:
     average_wait_time: float = 0.0
     max_agent_load: int = 0
     min_agent_load: int = 0
+    steal_attempts: int = 0
+    successful_steals: int = 0
+    average_steal_latency: float = 0.0  # seconds per successful steal
+    max_steal_latency: float = 0.0
+
+
+class _AgentGroup:
+    """Agents that score identically apart from their workload."""
+    __slots__ = ("agent", "heap")
+    
+    def __init__(self, agent: Agent):
+        self.agent = agent  # representative member
+        self.heap: List[Tuple[int, int]] = []  # (workload, position in agent list)
+
+
+class _AgentIndex:
+    """Agents grouped by a scoring key, each group a workload min-heap.
+    
+    Within a group the best agent is the least loaded one, earliest in the
+    agent list on ties, so a scheduler only has to score one agent per
+    group. Heaps are updated lazily: ``assign`` pushes the new workload and
+    outdated entries are dropped when they reach the top.
+    """
+    
+    def __init__(self, agents: List[Agent], workload: Dict[str, int],
+                 key: Callable[[Agent], Any] = lambda agent: None,
+                 track_minimum: bool = False):
+        """Build the index.
+        
+        Args:
+            agents: Agents in scheduling order
+            workload: Workload counters, updated in place by ``assign``
+            key: Groups agents whose scores can only differ by workload
+            track_minimum: Also keep a heap over all agents for ``min_workload``
+        """
+        self.agents = agents
+        self.agent_ids = [agent.id for agent in agents]
+        self.workload = workload
+        self.groups: List[_AgentGroup] = []
+        self._group_of: List[_AgentGroup] = []
+        
+        groups: Dict[Any, _AgentGroup] = {}
+        for position, agent in enumerate(agents):
+            group_key = key(agent)
+            group = groups.get(group_key)
+            if group is None:
+                group = groups[group_key] = _AgentGroup(agent)
+                self.groups.append(group)
+            group.heap.append((workload[agent.id], position))
+            self._group_of.append(group)
+        for group in self.groups:
+            heapq.heapify(group.heap)
+        
+        self._everyone: Optional[_AgentGroup] = None
+        if track_minimum and agents:
+            self._everyone = _AgentGroup(agents[0])
+            self._everyone.heap = [(workload[agent_id], position)
+                                   for position, agent_id in enumerate(self.agent_ids)]
+            heapq.heapify(self._everyone.heap)
+    
+    def least_loaded(self, group: _AgentGroup) -> Tuple[int, int]:
+        """(workload, position) of the group's least loaded agent."""
+        heap = group.heap
+        while heap[0][0] != self.workload[self.agent_ids[heap[0][1]]]:
+            heapq.heappop(heap)
+        return heap[0]
+    
+    def min_workload(self) -> int:
+        """Lowest workload of any agent (needs ``track_minimum``)."""
+        return self.least_loaded(self._everyone)[0]
+    
+    def assign(self, position: int) -> Agent:
+        """Count one more task for the agent at ``position``."""
+        agent_id = self.agent_ids[position]
+        self.workload[agent_id] += 1
+        entry = (self.workload[agent_id], position)
+        heapq.heappush(self._group_of[position].heap, entry)
+        if self._everyone is not None:
+            heapq.heappush(self._everyone.heap, entry)
+        return self.agents[position]
+
+
+def _min_cost_assignment(cost: "np.ndarray") -> "np.ndarray":
+    """Column assigned to each row minimizing total cost (rows <= columns).
+    
+    Hungarian algorithm in its shortest augmenting path form: each row
+    runs Dijkstra over reduced costs until it reaches a free column, then
+    the potentials are updated and the path flipped. The scan over
+    columns is vectorized, O(rows^2 * columns) overall.
+    """
+    rows, columns = cost.shape
+    u = np.zeros(rows)
+    v = np.zeros(columns)
+    column_of = np.full(rows, -1, dtype=np.int64)
+    row_of = np.full(columns, -1, dtype=np.int64)
+    final_distance = np.empty(columns)
+    final_via = np.empty(columns, dtype=np.int64)
+    
+    for start in range(rows):
+        # Unvisited columns with their tentative distance and predecessor row
+        remaining = np.arange(columns)
+        distance = np.full(columns, np.inf)
+        via = np.full(columns, -1, dtype=np.int64)
+        visited_rows = []
+        visited_columns = []
+        shortest = 0.0
+        row = start
+        while True:
+            visited_rows.append(row)
+            reduced = shortest + cost[row, remaining] - u[row] - v[remaining]
+            improved = reduced < distance
+            distance[improved] = reduced[improved]
+            via[improved] = row
+            
+            nearest = int(distance.argmin())
+            shortest = float(distance[nearest])
+            column = int(remaining[nearest])
+            final_distance[column] = shortest
+            final_via[column] = via[nearest]
+            visited_columns.append(column)
+            
+            # Drop the visited column by moving the last one into its place
+            last = remaining.size - 1
+            remaining[nearest] = remaining[last]
+            distance[nearest] = distance[last]
+            via[nearest] = via[last]
+            remaining, distance, via = remaining[:last], distance[:last], via[:last]
+            
+            if row_of[column] < 0:
+                break
+            row = int(row_of[column])
+        
+        u[start] += shortest
+        for visited in visited_rows[1:]:
+            u[visited] += shortest - final_distance[column_of[visited]]
+        visited_columns = np.array(visited_columns)
+        v[visited_columns] -= shortest - final_distance[visited_columns]
+        
+        # Flip the augmenting path ending at the free column
+        while True:
+            row = int(final_via[column])
+            row_of[column] = row
+            column_of[row], column = column, column_of[row]
+            if row == start:
+                break
+    
+    return column_of
 
 
 class TaskScheduler:
@@ -44,16 +203,39 @@ class TaskScheduler:
     
     def __init__(self, 
                  algorithm: SchedulingAlgorithm = SchedulingAlgorithm.DYNAMIC,
-                 enable_work_stealing: bool = True):
-        """Initialize the task scheduler."""
+                 enable_work_stealing: bool = True,
+                 batch_size: Optional[int] = None,
+                 optimal: bool = False,
+                 duration_model: Optional[DurationEstimator] = None):
+        """Initialize the task scheduler.
+        
+        Args:
+            algorithm: Scheduling algorithm
+            enable_work_stealing: Let idle agents steal from their peers'
+                deques (see ``next_task``)
+            batch_size: Score DYNAMIC tasks in vectorized chunks of this
+                size (needs numpy; None scores one task at a time)
+            optimal: Solve each chunk as a min-cost assignment instead of
+                filling it greedily
+            duration_model: Predicted task durations for
+                SHORTEST_EXPECTED_FINISH (a fresh estimator by default)
+        """
         self.algorithm = algorithm
         self.enable_work_stealing = enable_work_stealing
+        self.batch_size = batch_size
+        self.optimal = optimal
+        # An estimator without history is falsy (empty), so test for None
+        self.duration_model = duration_model if duration_model is not None else DurationEstimator()
         
-        # Task queues per agent
+        # Task deques per agent: owners take from the front, idle agents
+        # steal from the back (see next_task/steal_work)
         self.agent_queues: Dict[str, deque] = defaultdict(deque)
         
         # Agent workload tracking
         self.agent_workload: Dict[str, int] = defaultdict(int)
+        self.agent_expected_load: Dict[str, float] = defaultdict(float)  # Predicted seconds
+        # Task id -> (agent id, predicted seconds) still counted in agent_expected_load
+        self._expected_durations: Dict[str, Tuple[str, float]] = {}
         self.agent_capabilities: Dict[str, Set[str]] = {}
         
         # Task dependencies
@@ -63,9 +245,6 @@ class TaskScheduler:
         # Scheduling metrics
         self.metrics = SchedulingMetrics()
         
-        # Work stealing queue for idle agents
-        self.work_steal_queue: deque = deque()
-        
         # Strategy to capability mapping
         self.strategy_capabilities = {
             StrategyType.RESEARCH: {'research', 'analysis', 'web_search'},
@@ -118,19 +297,20 @@ class TaskScheduler:
         elif self.algorithm == SchedulingAlgorithm.PRIORITY_BASED:
             assignments = self._schedule_priority_based(sorted_tasks, available_agents)
         elif self.algorithm == SchedulingAlgorithm.DYNAMIC:
-            assignments = self._schedule_dynamic(sorted_tasks, available_agents)
+            if self.batch_size and np is not None:
+                assignments = self._schedule_dynamic_batched(sorted_tasks, available_agents)
+            else:
+                assignments = self._schedule_dynamic(sorted_tasks, available_agents)
         elif self.algorithm == SchedulingAlgorithm.WORK_STEALING:
             assignments = self._schedule_work_stealing(sorted_tasks, available_agents)
+        elif self.algorithm == SchedulingAlgorithm.SHORTEST_EXPECTED_FINISH:
+            assignments = self._schedule_shortest_expected_finish(sorted_tasks, available_agents)
         else:
             assignments = self._schedule_round_robin(sorted_tasks, available_agents)
         
         # Update metrics
         self._update_metrics(assignments, start_time)
         
-        # Enable work stealing if configured
-        if self.enable_work_stealing:
-            self._enable_work_stealing(assignments)
-        
         return assignments
     
     def _initialize_agent_capabilities(self, agents: List[Agent]):
@@ -157,30 +337,41 @@ class TaskScheduler:
         ))
     
     def _calculate_dependency_levels(self, tasks: List[Task]) -> Dict[str, int]:
-        """Calculate dependency levels for topological sorting."""
+        """Calculate dependency levels for topological sorting.
+        
+        Uses an explicit stack so deep dependency chains cannot hit the
+        recursion limit.
+        
+        Raises:
+            DependencyCycleError: If the dependencies contain a cycle
+        """
         levels = {}
         task_map = {t.id: t for t in tasks}
         
-        def calculate_level(task_id: str) -> int:
-            if task_id in levels:
-                return levels[task_id]
-            
-            task = task_map.get(task_id)
-            if not task or not task.dependencies:
-                levels[task_id] = 0
-                return 0
-            
-            max_dep_level = 0
-            for dep_id in task.dependencies:
-                if dep_id in task_map:
-                    dep_level = calculate_level(dep_id)
-                    max_dep_level = max(max_dep_level, dep_level)
-            
-            levels[task_id] = max_dep_level + 1
-            return levels[task_id]
-        
         for task in tasks:
-            calculate_level(task.id)
+            if task.id in levels:
+                continue
+            stack = [(task, iter(task.dependencies))]
+            on_stack = {task.id}
+            while stack:
+                current, remaining = stack[-1]
+                for dep_id in remaining:
+                    if dep_id in task_map and dep_id not in levels:
+                        if dep_id in on_stack:
+                            cycle = [t.id for t, _ in stack]
+                            raise DependencyCycleError(cycle[cycle.index(dep_id):] + [dep_id])
+                        stack.append((task_map[dep_id], iter(task_map[dep_id].dependencies)))
+                        on_stack.add(dep_id)
+                        break
+                else:
+                    stack.pop()
+                    on_stack.discard(current.id)
+                    if current.dependencies:
+                        levels[current.id] = 1 + max(
+                            (levels[d] for d in current.dependencies if d in task_map), default=0
+                        )
+                    else:
+                        levels[current.id] = 0
         
         return levels
     
@@ -224,39 +415,55 @@ class TaskScheduler:
     def _schedule_capability_based(self, 
                                  tasks: List[Task], 
                                  agents: List[Agent]) -> Dict[Agent, List[Task]]:
-        """Schedule based on agent capabilities."""
+        """Schedule based on agent capabilities.
+        
+        Each task goes to the agent maximising capability match divided by
+        (1 + workload), the earliest agent on ties. Agents with the same
+        capability set are grouped, and an inverted index from capability to
+        groups means only groups sharing a required capability are scored.
+        Tasks no agent matches are distributed least-loaded.
+        """
         assignments = {agent: [] for agent in agents}
         unassigned_tasks = []
         
+        index = _AgentIndex(agents, self.agent_workload, key=self._capability_key)
+        groups_by_capability: Dict[str, List[_AgentGroup]] = defaultdict(list)
+        for group in index.groups:
+            for capability in self.agent_capabilities.get(group.agent.id, set()):
+                groups_by_capability[capability].append(group)
+        
+        # (group, capability match score) per strategy
+        candidates: Dict[Any, List[Tuple[_AgentGroup, float]]] = {}
+        
         for task in tasks:
-            # Get required capabilities for task
-            required_caps = self.strategy_capabilities.get(task.strategy, set())
-            
-            # Find best matching agent
-            best_agent = None
-            best_score = -1
-            
-            for agent in agents:
-                agent_caps = self.agent_capabilities.get(agent.id, set())
-                
-                # Calculate capability match score
+            if task.strategy not in candidates:
+                # Get required capabilities for task
+                required_caps = self.strategy_capabilities.get(task.strategy, set())
                 if not required_caps:
-                    score = 1.0  # No specific requirements
+                    candidates[task.strategy] = [(group, 1.0) for group in index.groups]
                 else:
-                    matching_caps = agent_caps.intersection(required_caps)
-                    score = len(matching_caps) / len(required_caps)
-                
-                # Consider workload
-                workload_factor = 1.0 / (1 + self.agent_workload[agent.id])
-                final_score = score * workload_factor
-                
-                if final_score > best_score:
+                    matching_groups = {id(group): group for capability in required_caps
+                                       for group in groups_by_capability.get(capability, ())}
+                    candidates[task.strategy] = [
+                        (group, len(self.agent_capabilities[group.agent.id].intersection(required_caps))
+                         / len(required_caps))
+                        for group in matching_groups.values()
+                    ]
+            
+            # Find best matching agent
+            best_score = 0.0
+            best_position = None
+            for group, score in candidates[task.strategy]:
+                workload, position = index.least_loaded(group)
+                final_score = score * (1.0 / (1 + workload))
+                if final_score > best_score or (
+                        final_score == best_score and best_position is not None
+                        and position < best_position):
                     best_score = final_score
-                    best_agent = agent
+                    best_position = position
             
-            if best_agent and best_score > 0:
-                assignments[best_agent].append(task)
-                self.agent_workload[best_agent.id] += 1
+            if best_position is not None:
+                assignments[index.assign(best_position)].append(task)
             else:
                 unassigned_tasks.append(task)
         
@@ -275,121 +482,381 @@ class TaskScheduler:
         assignments = {agent: [] for agent in agents}
         
         # Rank agents by performance
-        ranked_agents = sorted(agents, key=lambda a: (
-            a.success_rate,
-            -a.average_execution_time,
-            a.total_tasks_completed
+        ranked_positions = sorted(range(len(agents)), key=lambda i: (
+            agents[i].success_rate,
+            -agents[i].average_execution_time,
+            agents[i].total_tasks_completed
         ), reverse=True)
         
+        # Least loaded agent (earliest on ties) for normal priority
+        index = _AgentIndex(agents, self.agent_workload)
+        everyone = index.groups[0]
+        
         # Assign high-priority tasks to best agents
         agent_index = 0
         for task in tasks:
             if task.priority >= 5:  # High priority threshold
                 # Assign to best available agent
-                agent = ranked_agents[agent_index % len(ranked_agents)]
+                position = ranked_positions[agent_index % len(ranked_positions)]
                 agent_index += 1
             else:
                 # Use least loaded for normal priority
-                min_load = min(self.agent_workload[a.id] for a in agents)
-                agent = next(a for a in agents if self.agent_workload[a.id] == min_load)
+                position = index.least_loaded(everyone)[1]
             
-            assignments[agent].append(task)
-            self.agent_workload[agent.id] += 1
+            assignments[index.assign(position)].append(task)
         
         return assignments
     
     def _schedule_dynamic(self, 
                         tasks: List[Task], 
                         agents: List[Agent]) -> Dict[Agent, List[Task]]:
-        """Dynamic scheduling based on multiple factors."""
+        """Dynamic scheduling based on multiple factors.
+        
+        Each task goes to the agent with the best weighted capability,
+        workload and performance score, the earliest agent on ties. Agents
+        with the same capabilities and success rate are grouped, so only
+        each group's least loaded agent is scored. Groups are visited in
+        order of their workload-independent score, stopping once even the
+        least loaded agent overall could not beat the best found.
+        """
         assignments = {agent: [] for agent in agents}
         
+        index = _AgentIndex(
+            agents, self.agent_workload,
+            key=lambda agent: (self._capability_key(agent), agent.success_rate),
+            track_minimum=True
+        )
+        total_workload = sum(self.agent_workload.values())
+        
+        # (static score, group heap, capability match score, success rate)
+        # per strategy, best first
+        candidates: Dict[Any, List[Tuple[float, list, float, float]]] = {}
+        workload_of = self.agent_workload
+        agent_ids = index.agent_ids
+        agent_count = len(agents)
+        
         for task in tasks:
-            # Calculate scores for each agent
-            agent_scores = []
-            
-            for agent in agents:
+            if task.strategy not in candidates:
                 # Capability match
                 required_caps = self.strategy_capabilities.get(task.strategy, set())
-                agent_caps = self.agent_capabilities.get(agent.id, set())
-                
-                if required_caps:
-                    cap_score = len(agent_caps.intersection(required_caps)) / len(required_caps)
-                else:
-                    cap_score = 0.5  # Neutral score
-                
-                # Workload balance
-                avg_workload = sum(self.agent_workload.values()) / len(agents)
-                workload_score = 1.0 - (self.agent_workload[agent.id] / (avg_workload + 1))
-                
-                # Performance history
-                perf_score = agent.success_rate
+                scored = []
+                for group in index.groups:
+                    if required_caps:
+                        agent_caps = self.agent_capabilities.get(group.agent.id, set())
+                        cap_score = len(agent_caps.intersection(required_caps)) / len(required_caps)
+                    else:
+                        cap_score = 0.5  # Neutral score
+                    success_rate = group.agent.success_rate
+                    static_score = 0.4 * cap_score + 0.3 * success_rate
+                    scored.append((static_score, group.heap, cap_score, success_rate))
+                scored.sort(key=lambda entry: -entry[0])
+                candidates[task.strategy] = scored
+            
+            # Workload balance
+            avg_workload = total_workload / agent_count
+            top_workload_score = 1.0 - (index.min_workload() / (avg_workload + 1))
+            
+            best_score = None
+            best_position = None
+            for static_score, heap, cap_score, success_rate in candidates[task.strategy]:
+                if (best_score is not None and
+                        static_score + 0.3 * top_workload_score < best_score - _SCORE_EPSILON):
+                    break
+                # Inlined _AgentIndex.least_loaded: this loop dominates
+                workload, position = heap[0]
+                while workload_of[agent_ids[position]] != workload:
+                    heapq.heappop(heap)
+                    workload, position = heap[0]
+                workload_score = 1.0 - (workload / (avg_workload + 1))
                 
-                # Combine scores with weights
+                # Combine scores with weights (performance history last)
                 total_score = (
                     0.4 * cap_score +
                     0.3 * workload_score +
-                    0.3 * perf_score
+                    0.3 * success_rate
                 )
                 
-                agent_scores.append((total_score, agent))
+                if best_score is None or total_score > best_score or (
+                        total_score == best_score and position < best_position):
+                    best_score = total_score
+                    best_position = position
             
             # Select best agent
-            agent_scores.sort(reverse=True)
-            best_agent = agent_scores[0][1]
-            
-            assignments[best_agent].append(task)
-            self.agent_workload[best_agent.id] += 1
+            assignments[index.assign(best_position)].append(task)
+            total_workload += 1
         
         return assignments
     
-    def _schedule_work_stealing(self, 
-                              tasks: List[Task], 
-                              agents: List[Agent]) -> Dict[Agent, List[Task]]:
-        """Schedule with work stealing support."""
-        # Initial distribution using dynamic scheduling
-        assignments = self._schedule_dynamic(tasks, agents)
+    def _schedule_dynamic_batched(self, 
+                                tasks: List[Task], 
+                                agents: List[Agent]) -> Dict[Agent, List[Task]]:
+        """Dynamic scheduling scored ``batch_size`` tasks at a time with numpy.
+        
+        Uses the weights of ``_schedule_dynamic``, holding the average
+        workload fixed within a chunk. An agent's n-th extra task in the
+        chunk is scored as if its workload had already grown by n, so the
+        tasks of each strategy take the best of these (agent, n) slots,
+        earliest agent on ties. With ``optimal`` set, each chunk is solved
+        as a min-cost assignment instead, so strategies do not compete
+        greedily for the same agents. A chunk of one task reproduces
+        ``_schedule_dynamic`` exactly.
+        """
+        assignments = {agent: [] for agent in agents}
         
-        # Mark tasks as stealable
-        for agent, agent_tasks in assignments.items():
-            for task in agent_tasks:
-                if task.priority < 5:  # Only low-priority tasks are stealable
-                    self.work_steal_queue.append((agent.id, task))
+        workload = np.array([self.agent_workload[agent.id] for agent in agents], dtype=np.float64)
+        performance = 0.3 * np.array([agent.success_rate for agent in agents], dtype=np.float64)
+        capability: Dict[Any, np.ndarray] = {}  # Weighted capability match per strategy
+        # Same total as _schedule_dynamic, including agents filtered out
+        total_workload = sum(self.agent_workload.values())
         
+        for start in range(0, len(tasks), self.batch_size):
+            chunk = tasks[start:start + self.batch_size]
+            avg_workload = total_workload / len(agents)
+            
+            by_strategy: Dict[Any, List[Task]] = {}
+            for task in chunk:
+                by_strategy.setdefault(task.strategy, []).append(task)
+            for strategy in by_strategy:
+                if strategy not in capability:
+                    capability[strategy] = 0.4 * self._capability_scores(strategy, agents)
+            
+            def slot_scores(strategy, positions: np.ndarray, slots: int) -> np.ndarray:
+                # Rows: agents at ``positions``; columns: their n-th extra task
+                extra = workload[positions][:, None] + np.arange(slots)
+                return (capability[strategy][positions][:, None] +
+                        0.3 * (1.0 - (extra / (avg_workload + 1))) +
+                        performance[positions][:, None])
+            
+            if self.optimal:
+                picks = self._solve_chunk(chunk, by_strategy, slot_scores, len(agents))
+                for task, position in zip(chunk, picks):
+                    assignments[agents[position]].append(task)
+                workload += np.bincount(picks, minlength=len(agents))
+            else:
+                for strategy, strategy_tasks in by_strategy.items():
+                    picks = self._best_slots(strategy, slot_scores, len(agents), len(strategy_tasks))
+                    for task, position in zip(strategy_tasks, picks):
+                        assignments[agents[position]].append(task)
+                    workload += np.bincount(picks, minlength=len(agents))
+            total_workload += len(chunk)
+        
+        for agent, count in zip(agents, workload):
+            self.agent_workload[agent.id] = int(count)
         return assignments
     
-    def steal_work(self, idle_agent: Agent) -> Optional[Task]:
-        """Allow idle agent to steal work from busy agents."""
-        if not self.enable_work_stealing or not self.work_steal_queue:
-            return None
+    @staticmethod
+    def _best_slots(strategy, slot_scores: Callable, agent_count: int, count: int) -> "np.ndarray":
+        """Agent positions of the ``count`` best slots, best first.
+        
+        Only agents whose first slot ranks in the top ``count`` can hold
+        one of the best ``count`` slots, so just those are expanded.
+        """
+        first = slot_scores(strategy, np.arange(agent_count), 1)[:, 0]
+        if count < agent_count:
+            threshold = np.partition(first, agent_count - count)[agent_count - count]
+            positions = np.flatnonzero(first >= threshold)
+        else:
+            positions = np.arange(agent_count)
         
-        # Find a task to steal
-        while self.work_steal_queue:
-            original_agent_id, task = self.work_steal_queue.popleft()
+        scores = slot_scores(strategy, positions, count).ravel()
+        if scores.size > count:
+            threshold = np.partition(scores, scores.size - count)[scores.size - count]
+            candidates = np.flatnonzero(scores >= threshold)
+        else:
+            candidates = np.arange(scores.size)
+        rows, slots = np.divmod(candidates, count)
+        order = np.lexsort((slots, positions[rows], -scores[candidates]))[:count]
+        return positions[rows[order]]
+    
+    def _solve_chunk(self, chunk: List[Task], by_strategy: Dict[Any, List[Task]],
+                     slot_scores: Callable, agent_count: int) -> "np.ndarray":
+        """Agent position per chunk task maximizing the chunk's total score.
+        
+        Each task is only matched against its strategy's best ``len(chunk)``
+        slots, since the other tasks can occupy at most ``len(chunk) - 1``
+        of them.
+        """
+        slot_counts = np.zeros(agent_count, dtype=np.int64)
+        for strategy in by_strategy:
+            picks = self._best_slots(strategy, slot_scores, agent_count, len(chunk))
+            np.maximum(slot_counts, np.bincount(picks, minlength=agent_count), out=slot_counts)
+        
+        # One column per (agent, n-th extra task) candidate slot
+        positions = np.flatnonzero(slot_counts)
+        counts = slot_counts[positions]
+        column_rows = np.repeat(np.arange(positions.size), counts)
+        column_slots = np.arange(column_rows.size) - np.repeat(np.cumsum(counts) - counts, counts)
+        column_agents = positions[column_rows]
+        
+        slots = int(counts.max())
+        strategy_rows = {
+            strategy: -slot_scores(strategy, positions, slots)[column_rows, column_slots]
+            for strategy in by_strategy
+        }
+        cost = np.stack([strategy_rows[task.strategy] for task in chunk])
+        return column_agents[_min_cost_assignment(cost)]
+    
+    def _capability_scores(self, strategy, agents: List[Agent]) -> "np.ndarray":
+        """Capability match of each agent for ``strategy``, as in ``_schedule_dynamic``."""
+        required_caps = self.strategy_capabilities.get(strategy, set())
+        if not required_caps:
+            return np.full(len(agents), 0.5)  # Neutral score
+        return np.array([
+            len(self.agent_capabilities.get(agent.id, set()).intersection(required_caps))
+            / len(required_caps)
+            for agent in agents
+        ], dtype=np.float64)
+    
+    def _schedule_shortest_expected_finish(self, 
+                                         tasks: List[Task], 
+                                         agents: List[Agent]) -> Dict[Agent, List[Task]]:
+        """Assign each task to the agent predicted to finish it first.
+        
+        Tasks are placed longest expected duration first (LPT), each on the
+        agent whose predicted queue plus the task's predicted duration on
+        that agent ends earliest, the earliest agent on ties. A task's
+        prediction leaves its agent's queue again through
+        ``mark_task_completed`` or ``release_task``. Agents with no
+        history for a task's strategy and complexity share the pooled
+        estimate, so only the least loaded of them is compared with the
+        agents that have history.
+        """
+        model = self.duration_model
+        assignments = {agent: [] for agent in agents}
+        position_of = {agent.id: position for position, agent in enumerate(agents)}
+        
+        # Lazy (predicted finish, position) heap; stale entries are skipped
+        ready = [self.agent_expected_load[agent.id] for agent in agents]
+        heap = [(finish, position) for position, finish in enumerate(ready)]
+        heapq.heapify(heap)
+        
+        # Stable sort keeps priority order among equally long tasks
+        ordered = sorted(((model.estimate(None, task), task) for task in tasks),
+                         key=lambda entry: -entry[0])
+        
+        # (strategy, complexity) -> {position: estimate} for agents with history
+        known_by_kind: Dict[Tuple[str, str], Dict[int, float]] = {}
+        
+        for pooled, task in ordered:
+            kind = model.kind(task)
+            if kind not in known_by_kind:
+                known_by_kind[kind] = {
+                    position_of[agent_id]: estimate
+                    for agent_id, estimate in model.agent_estimates(task).items()
+                    if agent_id in position_of
+                }
+            known = known_by_kind[kind]
             
-            # Check if task is still pending
+            # Least loaded agent without history of its own
+            best = None
+            skipped = []
+            while heap:
+                finish, position = heap[0]
+                if finish != ready[position]:
+                    heapq.heappop(heap)
+                elif position in known:
+                    skipped.append(heapq.heappop(heap))
+                else:
+                    best = (finish + pooled, position)
+                    break
+            for entry in skipped:
+                heapq.heappush(heap, entry)
+            
+            for position, estimate in known.items():
+                candidate = (ready[position] + estimate, position)
+                if best is None or candidate < best:
+                    best = candidate
+            
+            finish, position = best
+            self._expected_durations[task.id] = (agents[position].id, finish - ready[position])
+            ready[position] = finish
+            heapq.heappush(heap, (finish, position))
+            assignments[agents[position]].append(task)
+            self.agent_workload[agents[position].id] += 1
+        
+        for agent, finish in zip(agents, ready):
+            self.agent_expected_load[agent.id] = finish
+        return assignments
+    
+    def _capability_key(self, agent: Agent) -> frozenset:
+        """Capability set of an agent, usable as a grouping key."""
+        return frozenset(self.agent_capabilities.get(agent.id, ()))
+    
+    def _schedule_work_stealing(self, 
+                              tasks: List[Task], 
+                              agents: List[Agent]) -> Dict[Agent, List[Task]]:
+        """Schedule with work stealing support.
+        
+        The initial distribution is dynamic; imbalance is corrected at run
+        time by idle agents stealing from the agent deques.
+        """
+        return self._schedule_dynamic(tasks, agents)
+    
+    def enqueue(self, agent_id: str, tasks: Iterable[Task]) -> None:
+        """Append tasks to the back of an agent's deque, in execution order.
+        
+        Only callers that drain the deques with ``next_task`` should fill
+        them (see ``ParallelExecutor.execute_agent_queues``); queued tasks
+        stay until taken or collected by ``rebalance_workload``.
+        """
+        self.agent_queues[agent_id].extend(tasks)
+    
+    def next_task(self, agent: Agent) -> Optional[Task]:
+        """Next task for ``agent``: the front of its own deque, else a stolen one.
+        
+        Tasks that are no longer pending are dropped on the way.
+        """
+        queue = self.agent_queues.get(agent.id)
+        while queue:
+            task = queue.popleft()
             if task.status == TaskStatus.PENDING:
-                # Update workload
-                self.agent_workload[original_agent_id] -= 1
-                self.agent_workload[idle_agent.id] += 1
-                
-                logger.info(f"Agent {idle_agent.id} stole task {task.id} from agent {original_agent_id}")
                 return task
-        
-        return None
+        return self.steal_work(agent)
     
-    def _enable_work_stealing(self, assignments: Dict[Agent, List[Task]]):
-        """Enable work stealing for assignments."""
-        # Find agents with high workload
-        avg_workload = sum(len(tasks) for tasks in assignments.values()) / len(assignments)
+    def steal_work(self, idle_agent: Agent) -> Optional[Task]:
+        """Steal a pending task from the back of the most loaded peer's deque.
         
-        for agent, tasks in assignments.items():
-            if len(tasks) > avg_workload * 1.5:  # 50% above average
-                # Mark some tasks as stealable
-                stealable_count = int((len(tasks) - avg_workload) / 2)
-                for task in tasks[-stealable_count:]:  # Last tasks are stealable
-                    if task.priority < 5:
-                        self.work_steal_queue.append((agent.id, task))
+        The thief replaces the victim in ``task.assigned_agents`` and takes
+        over the task's predicted duration, so results and learned
+        durations are credited to the agent that runs it.
+        """
+        if not self.enable_work_stealing:
+            return None
+        
+        start = time.perf_counter()
+        self.metrics.steal_attempts += 1
+        while True:
+            victim_id = max(
+                (agent_id for agent_id, queue in self.agent_queues.items()
+                 if queue and agent_id != idle_agent.id),
+                key=lambda agent_id: len(self.agent_queues[agent_id]),
+                default=None
+            )
+            if victim_id is None:
+                return None
+            task = self.agent_queues[victim_id].pop()
+            if task.status == TaskStatus.PENDING:
+                break
+        
+        latency = time.perf_counter() - start
+        self.agent_workload[victim_id] -= 1
+        self.agent_workload[idle_agent.id] += 1
+        if victim_id in task.assigned_agents:
+            task.assigned_agents[task.assigned_agents.index(victim_id)] = idle_agent.id
+        expected = self._expected_durations.get(task.id)
+        if expected is not None:
+            self.release_task(task.id)
+            self._expected_durations[task.id] = (idle_agent.id, expected[1])
+            self.agent_expected_load[idle_agent.id] += expected[1]
+        
+        self.metrics.successful_steals += 1
+        self.metrics.average_steal_latency += (
+            (latency - self.metrics.average_steal_latency) / self.metrics.successful_steals
+        )
+        self.metrics.max_steal_latency = max(self.metrics.max_steal_latency, latency)
+        
+        logger.debug(f"Agent {idle_agent.id} stole task {task.id} from agent {victim_id}")
+        return task
     
     def _update_metrics(self, 
                        assignments: Dict[Agent, List[Task]], 
@@ -416,8 +883,20 @@ class TaskScheduler:
         return SchedulingMetrics(**self.metrics.__dict__)
     
     def mark_task_completed(self, task_id: str):
-        """Mark a task as completed for dependency tracking."""
+        """Mark a task as completed for dependency tracking.
+        
+        Its predicted duration is also taken off the expected load of the
+        agent it was scheduled on.
+        """
         self.completed_tasks.add(task_id)
+        self.release_task(task_id)
+    
+    def release_task(self, task_id: str) -> None:
+        """Stop counting a finished or abandoned task in its agent's expected load."""
+        expected = self._expected_durations.pop(task_id, None)
+        if expected is not None:
+            agent_id, duration = expected
+            self.agent_expected_load[agent_id] = max(0.0, self.agent_expected_load[agent_id] - duration)
     
     def can_execute_task(self, task: Task) -> bool:
         """Check if a task's dependencies are satisfied."""
@@ -431,7 +910,11 @@ class TaskScheduler:
         return self.agent_workload.get(agent_id, 0)
     
     def rebalance_workload(self, agents: List[Agent]) -> Dict[Agent, List[Task]]:
-        """Rebalance workload across agents."""
+        """Rebalance workload across agents.
+        
+        Pending tasks are taken off every deque, rescheduled and queued
+        again according to the new assignments.
+        """
         # Collect all pending tasks from agent queues
         all_tasks = []
         for agent_id, queue in self.agent_queues.items():
@@ -442,6 +925,11 @@ class TaskScheduler:
         
         # Clear workload counters
         self.agent_workload.clear()
+        self.agent_expected_load.clear()
+        self._expected_durations.clear()
         
         # Reschedule all tasks
-        return self.schedule_tasks(all_tasks, agents)
\ No newline at end of file
+        assignments = self.schedule_tasks(all_tasks, agents)
+        for agent, tasks in assignments.items():
+            self.enqueue(agent.id, tasks)
+        return assignments
\ No newline at end of file
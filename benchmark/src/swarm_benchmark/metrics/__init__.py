@@ -4,10 +4,13 @@ from .performance_collector import PerformanceCollector
 from .resource_monitor import ResourceMonitor
 from .process_tracker import ProcessTracker
 from .metrics_aggregator import MetricsAggregator
+from .sampler import SamplingDaemon, get_sampler
 
 __all__ = [
     "PerformanceCollector",
     "ResourceMonitor", 
     "ProcessTracker",
-    "MetricsAggregator"
+    "MetricsAggregator",
+    "SamplingDaemon",
+    "get_sampler"
 ]
\ No newline at end of file
@@ -6,14 +6,17 @@ import time
 import psutil
 import subprocess
 import threading
-from typing import Dict, List, Optional, Any, Tuple
+from collections import deque
+from typing import Deque, Dict, Iterator, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 import json
+import math
 import os
 from pathlib import Path
 
 from ..core.models import PerformanceMetrics, ResourceUsage
+from .sample_buffer import TieredSampleBuffer
 
 
 @dataclass
@@ -37,33 +40,129 @@ class CollectionInterval:
     system_metrics: Dict[str, Any]
     
 
+def sample_process(proc: psutil.Process) -> ProcessMetrics:
+    """Sample a single process.
+    
+    Raises:
+        psutil.NoSuchProcess, psutil.AccessDenied: If the process cannot be read
+    """
+    with proc.oneshot():
+        pm = ProcessMetrics(
+            pid=proc.pid,
+            name=proc.name(),
+            cpu_percent=proc.cpu_percent(interval=None),
+            memory_mb=proc.memory_info().rss / 1024 / 1024,
+            num_threads=proc.num_threads(),
+            create_time=proc.create_time()
+        )
+        
+        # Try to get file descriptors (may not be available on all platforms)
+        try:
+            pm.num_fds = proc.num_fds()
+        except (AttributeError, psutil.AccessDenied):
+            pm.num_fds = 0
+            
+    return pm
+    
+
+def collect_system_metrics() -> Dict[str, Any]:
+    """Collect system-wide metrics."""
+    try:
+        # CPU metrics
+        cpu_percent = psutil.cpu_percent(interval=None, percpu=True)
+        cpu_freq = psutil.cpu_freq()
+        
+        # Memory metrics
+        memory = psutil.virtual_memory()
+        swap = psutil.swap_memory()
+        
+        # Disk I/O
+        disk_io = psutil.disk_io_counters()
+        
+        # Network I/O
+        net_io = psutil.net_io_counters()
+        
+        return {
+            "cpu": {
+                "percent": sum(cpu_percent) / len(cpu_percent),
+                "percent_per_core": cpu_percent,
+                "frequency_mhz": cpu_freq.current if cpu_freq else 0,
+                "core_count": psutil.cpu_count()
+            },
+            "memory": {
+                "total_mb": memory.total / 1024 / 1024,
+                "used_mb": memory.used / 1024 / 1024,
+                "available_mb": memory.available / 1024 / 1024,
+                "percent": memory.percent,
+                "swap_used_mb": swap.used / 1024 / 1024
+            },
+            "disk_io": {
+                "read_bytes": disk_io.read_bytes if disk_io else 0,
+                "write_bytes": disk_io.write_bytes if disk_io else 0,
+                "read_count": disk_io.read_count if disk_io else 0,
+                "write_count": disk_io.write_count if disk_io else 0
+            },
+            "network_io": {
+                "bytes_sent": net_io.bytes_sent if net_io else 0,
+                "bytes_recv": net_io.bytes_recv if net_io else 0,
+                "packets_sent": net_io.packets_sent if net_io else 0,
+                "packets_recv": net_io.packets_recv if net_io else 0
+            }
+        }
+    except Exception as e:
+        return {"error": str(e)}
+    
+
 class PerformanceCollector:
     """Collects real performance metrics from claude-flow executions."""
     
-    def __init__(self, sample_interval: float = 0.1):
+    # Sample buffer column -> (system metrics group, key)
+    _SYSTEM_COLUMNS = {
+        "system_cpu_percent": ("cpu", "percent"),
+        "system_memory_mb": ("memory", "used_mb"),
+        "system_memory_percent": ("memory", "percent"),
+        "disk_read_bytes": ("disk_io", "read_bytes"),
+        "disk_write_bytes": ("disk_io", "write_bytes"),
+        "net_bytes_sent": ("network_io", "bytes_sent"),
+        "net_bytes_recv": ("network_io", "bytes_recv")
+    }
+    
+    # Full intervals (per-process and per-core detail) kept alongside the buffer
+    RECENT_INTERVALS = 100
+    
+    def __init__(self, sample_interval: float = 0.1, proc_reader=None, buffer_capacity: int = 3600):
         """Initialize the performance collector.
         
         Args:
             sample_interval: How often to sample metrics (seconds)
+            proc_reader: Optional ``ProcReader`` used instead of psutil to
+                sample processes on Linux
+            buffer_capacity: Samples kept per resolution tier (raw, 1 s, 10 s)
         """
         self.sample_interval = sample_interval
+        self.proc_reader = proc_reader
         self._collection_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
-        self._metrics_buffer: List[CollectionInterval] = []
+        self._metrics_buffer = TieredSampleBuffer(capacity=buffer_capacity)
+        self._recent_intervals: Deque[CollectionInterval] = deque(maxlen=self.RECENT_INTERVALS)
         self._process_map: Dict[int, ProcessMetrics] = {}
         self._start_time: Optional[float] = None
         self._end_time: Optional[float] = None
         self._tracked_pids: List[int] = []
         self._main_process: Optional[psutil.Process] = None
+        self._subscription = None
         
-    def start_collection(self, process: Optional[subprocess.Popen] = None) -> None:
+    def start_collection(self, process: Optional[subprocess.Popen] = None, sampler=None) -> None:
         """Start collecting metrics.
         
         Args:
             process: Optional subprocess to track (will track it and all children)
+            sampler: Optional shared ``SamplingDaemon``; when given with a process,
+                the process tree is registered with it instead of starting a thread
         """
         self._stop_event.clear()
         self._metrics_buffer.clear()
+        self._recent_intervals.clear()
         self._process_map.clear()
         self._start_time = time.time()
         self._end_time = None
@@ -75,6 +174,14 @@ class PerformanceCollector:
             except psutil.NoSuchProcess:
                 self._main_process = None
                 
+        if sampler is not None and self._main_process is not None:
+            self._subscription = sampler.register(
+                process.pid,
+                interval=self.sample_interval,
+                callback=self.record_sample
+            )
+            return
+            
         self._collection_thread = threading.Thread(
             target=self._collect_metrics,
             daemon=True
@@ -86,11 +193,43 @@ class PerformanceCollector:
         self._stop_event.set()
         self._end_time = time.time()
         
-        if self._collection_thread:
+        if self._subscription is not None:
+            self._subscription.close()
+            self._subscription = None
+        elif self._collection_thread:
             self._collection_thread.join(timeout=5.0)
             
         return self._aggregate_metrics()
         
+    def record_sample(self, sample) -> None:
+        """Record a ``TreeSample`` delivered by the shared sampler."""
+        for pm in sample.processes:
+            self._process_map[pm.pid] = pm
+        self._record_interval(CollectionInterval(
+            timestamp=sample.timestamp,
+            duration_ms=sample.duration_ms,
+            process_metrics=sample.processes,
+            system_metrics=sample.system_metrics
+        ))
+        
+    def _record_interval(self, interval: CollectionInterval) -> None:
+        """Store an interval's numeric totals in the sample buffer."""
+        self._recent_intervals.append(interval)
+        
+        values = {
+            "timestamp": interval.timestamp.timestamp(),
+            "duration_ms": interval.duration_ms,
+            "process_count": len(interval.process_metrics),
+            "cpu_percent": sum(pm.cpu_percent for pm in interval.process_metrics),
+            "memory_mb": sum(pm.memory_mb for pm in interval.process_metrics)
+        }
+        system = interval.system_metrics
+        for column, (group, key) in self._SYSTEM_COLUMNS.items():
+            if key in system.get(group, {}):
+                values[column] = system[group][key]
+                
+        self._metrics_buffer.append(**values)
+        
     def _collect_metrics(self) -> None:
         """Background thread that collects metrics."""
         while not self._stop_event.is_set():
@@ -111,7 +250,7 @@ class PerformanceCollector:
                 system_metrics=system_metrics
             )
             
-            self._metrics_buffer.append(interval)
+            self._record_interval(interval)
             
             # Sleep for the remainder of the interval
             sleep_time = max(0, self.sample_interval - (time.time() - interval_start))
@@ -129,28 +268,14 @@ class PerformanceCollector:
                 
                 for proc in processes:
                     try:
-                        # Get process info
-                        with proc.oneshot():
-                            pm = ProcessMetrics(
-                                pid=proc.pid,
-                                name=proc.name(),
-                                cpu_percent=proc.cpu_percent(interval=None),
-                                memory_mb=proc.memory_info().rss / 1024 / 1024,
-                                num_threads=proc.num_threads(),
-                                create_time=proc.create_time()
-                            )
-                            
-                            # Try to get file descriptors (may not be available on all platforms)
-                            try:
-                                pm.num_fds = proc.num_fds()
-                            except (AttributeError, psutil.AccessDenied):
-                                pm.num_fds = 0
-                                
-                            metrics.append(pm)
-                            self._process_map[pm.pid] = pm
-                            
+                        if self.proc_reader is not None:
+                            pm = self.proc_reader.sample(proc.pid)
+                        else:
+                            pm = sample_process(proc)
                     except (psutil.NoSuchProcess, psutil.AccessDenied):
                         continue
+                    metrics.append(pm)
+                    self._process_map[pm.pid] = pm
                         
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 self._main_process = None
@@ -159,50 +284,7 @@ class PerformanceCollector:
         
     def _collect_system_metrics(self) -> Dict[str, Any]:
         """Collect system-wide metrics."""
-        try:
-            # CPU metrics
-            cpu_percent = psutil.cpu_percent(interval=None, percpu=True)
-            cpu_freq = psutil.cpu_freq()
-            
-            # Memory metrics
-            memory = psutil.virtual_memory()
-            swap = psutil.swap_memory()
-            
-            # Disk I/O
-            disk_io = psutil.disk_io_counters()
-            
-            # Network I/O
-            net_io = psutil.net_io_counters()
-            
-            return {
-                "cpu": {
-                    "percent": sum(cpu_percent) / len(cpu_percent),
-                    "percent_per_core": cpu_percent,
-                    "frequency_mhz": cpu_freq.current if cpu_freq else 0,
-                    "core_count": psutil.cpu_count()
-                },
-                "memory": {
-                    "total_mb": memory.total / 1024 / 1024,
-                    "used_mb": memory.used / 1024 / 1024,
-                    "available_mb": memory.available / 1024 / 1024,
-                    "percent": memory.percent,
-                    "swap_used_mb": swap.used / 1024 / 1024
-                },
-                "disk_io": {
-                    "read_bytes": disk_io.read_bytes if disk_io else 0,
-                    "write_bytes": disk_io.write_bytes if disk_io else 0,
-                    "read_count": disk_io.read_count if disk_io else 0,
-                    "write_count": disk_io.write_count if disk_io else 0
-                },
-                "network_io": {
-                    "bytes_sent": net_io.bytes_sent if net_io else 0,
-                    "bytes_recv": net_io.bytes_recv if net_io else 0,
-                    "packets_sent": net_io.packets_sent if net_io else 0,
-                    "packets_recv": net_io.packets_recv if net_io else 0
-                }
-            }
-        except Exception as e:
-            return {"error": str(e)}
+        return collect_system_metrics()
             
     def _aggregate_metrics(self) -> PerformanceMetrics:
         """Aggregate collected metrics into final performance metrics."""
@@ -212,45 +294,23 @@ class PerformanceCollector:
         # Calculate execution time
         execution_time = (self._end_time or time.time()) - self._start_time
         
-        # Aggregate process metrics
-        total_cpu = 0.0
-        peak_memory_mb = 0.0
-        avg_memory_mb = 0.0
-        total_samples = 0
+        # Aggregate process metrics (whole-run totals survive downsampling)
+        buffer = self._metrics_buffer
+        avg_cpu_percent = buffer.cpu_percent_sum / buffer.sample_count
+        avg_memory_mb = buffer.memory_mb_sum / buffer.sample_count
+        peak_memory_mb = buffer.peak_memory_mb
         
-        for interval in self._metrics_buffer:
-            interval_cpu = sum(pm.cpu_percent for pm in interval.process_metrics)
-            interval_memory = sum(pm.memory_mb for pm in interval.process_metrics)
-            
-            total_cpu += interval_cpu
-            peak_memory_mb = max(peak_memory_mb, interval_memory)
-            avg_memory_mb += interval_memory
-            total_samples += 1
-            
-        if total_samples > 0:
-            avg_cpu_percent = total_cpu / total_samples
-            avg_memory_mb = avg_memory_mb / total_samples
-        else:
-            avg_cpu_percent = 0.0
-            avg_memory_mb = 0.0
-            
         # Calculate network and disk I/O deltas
         network_bytes_sent = 0
         network_bytes_recv = 0
         disk_bytes_read = 0
         disk_bytes_write = 0
         
-        if len(self._metrics_buffer) >= 2:
-            first_metrics = self._metrics_buffer[0].system_metrics
-            last_metrics = self._metrics_buffer[-1].system_metrics
-            
-            if "network_io" in first_metrics and "network_io" in last_metrics:
-                network_bytes_sent = last_metrics["network_io"]["bytes_sent"] - first_metrics["network_io"]["bytes_sent"]
-                network_bytes_recv = last_metrics["network_io"]["bytes_recv"] - first_metrics["network_io"]["bytes_recv"]
-                
-            if "disk_io" in first_metrics and "disk_io" in last_metrics:
-                disk_bytes_read = last_metrics["disk_io"]["read_bytes"] - first_metrics["disk_io"]["read_bytes"]
-                disk_bytes_write = last_metrics["disk_io"]["write_bytes"] - first_metrics["disk_io"]["write_bytes"]
+        if buffer.sample_count >= 2:
+            network_bytes_sent = self._counter_delta("net_bytes_sent")
+            network_bytes_recv = self._counter_delta("net_bytes_recv")
+            disk_bytes_read = self._counter_delta("disk_read_bytes")
+            disk_bytes_write = self._counter_delta("disk_write_bytes")
                 
         # Create ResourceUsage
         resource_usage = ResourceUsage(
@@ -277,6 +337,11 @@ class PerformanceCollector:
             communication_latency=0.0   # Will be calculated separately
         )
         
+    def _counter_delta(self, column: str) -> int:
+        """Change in a cumulative system counter over the run (0 if unavailable)."""
+        delta = self._metrics_buffer.last[column] - self._metrics_buffer.first[column]
+        return int(delta) if not math.isnan(delta) else 0
+        
     def get_detailed_metrics(self) -> Dict[str, Any]:
         """Get detailed metrics for analysis."""
         return {
@@ -284,7 +349,7 @@ class PerformanceCollector:
                 "start_time": self._start_time,
                 "end_time": self._end_time,
                 "duration": (self._end_time or time.time()) - self._start_time if self._start_time else 0,
-                "sample_count": len(self._metrics_buffer),
+                "sample_count": self._metrics_buffer.sample_count,
                 "process_count": len(self._process_map)
             },
             "processes": [
@@ -299,50 +364,91 @@ class PerformanceCollector:
                 for pm in self._process_map.values()
             ],
             "intervals": [
-                {
-                    "timestamp": interval.timestamp.isoformat(),
-                    "duration_ms": interval.duration_ms,
-                    "process_count": len(interval.process_metrics),
-                    "total_cpu_percent": sum(pm.cpu_percent for pm in interval.process_metrics),
-                    "total_memory_mb": sum(pm.memory_mb for pm in interval.process_metrics)
-                }
-                for interval in self._metrics_buffer[-100:]  # Last 100 samples
+                self._interval_totals(row)
+                for row in self._metrics_buffer.tail(100)  # Last 100 samples
             ]
         }
         
+    def sample_rows(self) -> Iterator[Dict[str, Any]]:
+        """Totals of every stored interval, oldest first.
+        
+        Rows have the shape of ``get_detailed_metrics()["intervals"]``;
+        older rows may be downsampled averages.
+        """
+        for row in self._metrics_buffer.rows():
+            yield self._interval_totals(row)
+            
+    @staticmethod
+    def _interval_totals(row: Dict[str, float]) -> Dict[str, Any]:
+        return {
+            "timestamp": datetime.fromtimestamp(row["timestamp"]).isoformat(),
+            "duration_ms": row["duration_ms"],
+            "process_count": int(row["process_count"]),
+            "total_cpu_percent": row["cpu_percent"],
+            "total_memory_mb": row["memory_mb"]
+        }
+        
     def save_raw_metrics(self, filepath: Path) -> None:
-        """Save raw metrics data for later analysis."""
+        """Save raw metrics data for later analysis.
+        
+        Older intervals may be downsampled rows (``samples`` > 1) with
+        system totals only; the most recent intervals keep per-process and
+        per-core detail.
+        """
+        recent = {interval.timestamp.timestamp(): interval for interval in self._recent_intervals}
         data = {
             "collection_info": {
                 "start_time": self._start_time,
                 "end_time": self._end_time,
                 "sample_interval": self.sample_interval,
-                "sample_count": len(self._metrics_buffer)
+                "sample_count": self._metrics_buffer.sample_count,
+                "stored_intervals": len(self._metrics_buffer)
             },
             "intervals": [
-                {
-                    "timestamp": interval.timestamp.isoformat(),
-                    "duration_ms": interval.duration_ms,
-                    "processes": [
-                        {
-                            "pid": pm.pid,
-                            "name": pm.name,
-                            "cpu_percent": pm.cpu_percent,
-                            "memory_mb": pm.memory_mb,
-                            "num_threads": pm.num_threads,
-                            "num_fds": pm.num_fds
-                        }
-                        for pm in interval.process_metrics
-                    ],
-                    "system": interval.system_metrics
-                }
-                for interval in self._metrics_buffer
+                self._raw_interval(row, recent.get(row["timestamp"]))
+                for row in self._metrics_buffer.rows()
             ]
         }
         
         with open(filepath, "w") as f:
             json.dump(data, f, indent=2)
             
+    def _raw_interval(self, row: Dict[str, float], interval: Optional[CollectionInterval]) -> Dict[str, Any]:
+        """Serialize a stored row, with full detail when the raw interval is still held."""
+        if interval is None or row["samples"] != 1:
+            system: Dict[str, Any] = {}
+            for column, (group, key) in self._SYSTEM_COLUMNS.items():
+                if not math.isnan(row[column]):
+                    system.setdefault(group, {})[key] = row[column]
+            return {
+                "timestamp": datetime.fromtimestamp(row["timestamp"]).isoformat(),
+                "duration_ms": row["duration_ms"],
+                "samples": int(row["samples"]),
+                "process_count": int(row["process_count"]),
+                "total_cpu_percent": row["cpu_percent"],
+                "total_memory_mb": row["memory_mb"],
+                "peak_memory_mb": row["peak_memory_mb"],
+                "system": system
+            }
+            
+        return {
+            "timestamp": interval.timestamp.isoformat(),
+            "duration_ms": interval.duration_ms,
+            "samples": 1,
+            "processes": [
+                {
+                    "pid": pm.pid,
+                    "name": pm.name,
+                    "cpu_percent": pm.cpu_percent,
+                    "memory_mb": pm.memory_mb,
+                    "num_threads": pm.num_threads,
+                    "num_fds": pm.num_fds
+                }
+                for pm in interval.process_metrics
+            ],
+            "system": interval.system_metrics
+        }
+            
 
 class AsyncPerformanceCollector(PerformanceCollector):
     """Async version of the performance collector."""
@@ -0,0 +1,191 @@
+"""Direct /proc reader for process metrics on Linux."""
+
+from __future__ import annotations
+import os
+import sys
+import time
+from typing import Dict, Optional
+
+import psutil
+
+from .performance_collector import ProcessMetrics
+
+
+class _ProcEntry:
+    """Open /proc files and cached static fields for one PID."""
+
+    __slots__ = ("stat_fd", "statm_fd", "name", "create_time", "cpu_time", "sampled_at")
+
+    def __init__(self, stat_fd: int, statm_fd: int):
+        self.stat_fd = stat_fd
+        self.statm_fd = statm_fd
+        self.name = ""
+        self.create_time = 0.0
+        self.cpu_time: Optional[float] = None
+        self.sampled_at = 0.0
+
+
+class ProcReader:
+    """Samples processes straight from /proc, producing psutil-equivalent metrics.
+
+    Each PID's ``stat`` and ``statm`` files stay open and are re-read with
+    ``preadv`` into one reusable buffer, so a sample costs two reads instead
+    of psutil's opens and parses. Name and create time are read once per PID.
+    An open ``stat`` file also pins the process: once it exits, reads fail
+    with ESRCH even if the PID is reused. Past ``MAX_OPEN_PIDS`` processes,
+    files are opened per read to stay well inside the descriptor limit.
+    """
+
+    MAX_OPEN_PIDS = 256
+
+    def __init__(self, track_fds: bool = True):
+        """Initialize the reader.
+
+        Args:
+            track_fds: Count open file descriptors (lists /proc/<pid>/fd)
+        """
+        if not self.available():
+            raise RuntimeError("ProcReader requires Linux /proc")
+        self.track_fds = track_fds
+        self._entries: Dict[int, _ProcEntry] = {}
+        self._open_pids = 0
+        self._buffer = bytearray(4096)
+        self._clock_ticks = os.sysconf("SC_CLK_TCK")
+        self._page_mb = os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+        self._boot_time = psutil.boot_time()
+
+    @staticmethod
+    def available() -> bool:
+        """Whether the /proc fast path can be used on this platform."""
+        return (sys.platform.startswith("linux") and hasattr(os, "preadv")
+                and os.path.exists("/proc/self/stat"))
+
+    def sample(self, pid: int) -> ProcessMetrics:
+        """Sample a process; same fields and semantics as ``sample_process``.
+
+        Raises:
+            psutil.NoSuchProcess, psutil.AccessDenied: If the process cannot be
+                read; its cached files are closed first
+        """
+        entry = self._entries.get(pid)
+        if entry is None:
+            entry = self._open(pid)
+
+        try:
+            stat = self._read_file(pid, entry.stat_fd, "stat")
+            # Fields after "(comm)": state is proc(5) field 3, so field N is index N - 3
+            fields = stat[stat.rindex(b")") + 2:].split()
+            cpu_time = (int(fields[11]) + int(fields[12])) / self._clock_ticks
+            num_threads = int(fields[17])
+            rss_pages = int(self._read_file(pid, entry.statm_fd, "statm").split()[1])
+        except OSError as e:
+            self.forget(pid)
+            raise self._psutil_error(pid, e) from e
+
+        now = time.monotonic()
+        cpu_percent = 0.0
+        if entry.cpu_time is not None and now > entry.sampled_at:
+            cpu_percent = round((cpu_time - entry.cpu_time) / (now - entry.sampled_at) * 100, 1)
+        entry.cpu_time = cpu_time
+        entry.sampled_at = now
+
+        num_fds = 0
+        if self.track_fds:
+            try:
+                num_fds = len(os.listdir(f"/proc/{pid}/fd"))
+            except PermissionError:
+                num_fds = 0
+            except OSError as e:
+                self.forget(pid)
+                raise self._psutil_error(pid, e) from e
+
+        return ProcessMetrics(
+            pid=pid,
+            name=entry.name,
+            cpu_percent=cpu_percent,
+            memory_mb=rss_pages * self._page_mb,
+            num_threads=num_threads,
+            num_fds=num_fds,
+            create_time=entry.create_time
+        )
+
+    def forget(self, pid: int) -> None:
+        """Close a PID's files and drop its cached fields."""
+        entry = self._entries.pop(pid, None)
+        if entry is not None and entry.stat_fd >= 0:
+            os.close(entry.stat_fd)
+            os.close(entry.statm_fd)
+            self._open_pids -= 1
+
+    def close(self) -> None:
+        """Close all open /proc files."""
+        for pid in list(self._entries):
+            self.forget(pid)
+
+    def _open(self, pid: int) -> _ProcEntry:
+        """Open a PID's /proc files and read its static fields."""
+        stat_fd = statm_fd = -1
+        try:
+            if self._open_pids < self.MAX_OPEN_PIDS:
+                stat_fd = os.open(f"/proc/{pid}/stat", os.O_RDONLY)
+                try:
+                    statm_fd = os.open(f"/proc/{pid}/statm", os.O_RDONLY)
+                except OSError:
+                    os.close(stat_fd)
+                    raise
+            stat = self._read_file(pid, stat_fd, "stat")
+        except OSError as e:
+            if statm_fd >= 0:
+                os.close(stat_fd)
+                os.close(statm_fd)
+            raise self._psutil_error(pid, e) from e
+
+        entry = _ProcEntry(stat_fd, statm_fd)
+        self._entries[pid] = entry
+        if stat_fd >= 0:
+            self._open_pids += 1
+
+        end = stat.rindex(b")")
+        entry.name = os.fsdecode(bytes(stat[stat.index(b"(") + 1:end]))
+        entry.create_time = int(stat[end + 2:].split()[19]) / self._clock_ticks + self._boot_time
+        if len(entry.name) >= 15:
+            entry.name = self._full_name(pid, entry.name)
+        return entry
+
+    @staticmethod
+    def _psutil_error(pid: int, error: OSError) -> psutil.Error:
+        """psutil exception for a failed /proc read, as ``sample_process`` would raise.
+
+        Permission errors mean AccessDenied; any other failure (ESRCH, ENOENT,
+        EIO from a vanishing process, ...) is treated as the process being gone.
+        """
+        if isinstance(error, PermissionError):
+            return psutil.AccessDenied(pid)
+        return psutil.NoSuchProcess(pid)
+
+    def _full_name(self, pid: int, name: str) -> str:
+        """Resolve a truncated comm from the cmdline, as psutil does."""
+        try:
+            with open(f"/proc/{pid}/cmdline", "rb") as f:
+                argv0 = f.read().split(b"\0", 1)[0]
+        except OSError:
+            return name
+        extended = os.path.basename(os.fsdecode(argv0))
+        return extended if extended.startswith(name) else name
+
+    def _read_file(self, pid: int, fd: int, name: str) -> bytearray:
+        """Read /proc/<pid>/<name>, through ``fd`` when it is kept open."""
+        if fd >= 0:
+            return self._read(fd)
+        fd = os.open(f"/proc/{pid}/{name}", os.O_RDONLY)
+        try:
+            return self._read(fd)
+        finally:
+            os.close(fd)
+
+    def _read(self, fd: int) -> bytearray:
+        """Re-read an open /proc file into the shared buffer."""
+        size = os.preadv(fd, [self._buffer], 0)
+        if size == 0:
+            raise ProcessLookupError(fd)
+        return self._buffer[:size]
@@ -6,16 +6,37 @@ import asyncio
 import time
 import os
 import signal
+import logging
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 import json
+import tempfile
+from collections import deque
 import psutil
 
 from .performance_collector import PerformanceCollector
 from .resource_monitor import ResourceMonitor
+from .sampler import SamplingDaemon, get_sampler
 from ..core.models import PerformanceMetrics, ResourceUsage
+from ..core.integration_utils import OutputParser, ProgressTracker
+from ..core.process_tree import DEFAULT_GRACE_PERIOD, ProcessTree, enable_child_subreaper
+
+
+# Retained output per stream before older lines spill to disk
+DEFAULT_MAX_OUTPUT_BYTES = 1024 * 1024
+# Longest partial line held while waiting for its newline
+MAX_LINE_BYTES = 64 * 1024
+READ_CHUNK_BYTES = 64 * 1024
+# How long output may stay open after the command exits before its
+# holders are treated as leaked
+OUTPUT_DRAIN_SECONDS = 1.0
+# StreamReader buffer limit, as for asyncio.create_subprocess_exec
+STREAM_LIMIT = 64 * 1024
+ERROR_MARKERS = ("error", "failed", "exception")
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -33,8 +54,95 @@ class ProcessExecutionResult:
     output_size: int
     error_count: int
     success: bool
+    stdout_path: Optional[Path] = None
+    stderr_path: Optional[Path] = None
+    parsed_output: Dict[str, Any] = field(default_factory=dict)
+    events: List[Dict[str, Any]] = field(default_factory=list)
+    leaked_pids: List[int] = field(default_factory=list)
+    
+
+class OutputCapture:
+    """Bounded line capture for one output stream.
+    
+    The newest lines are kept in memory up to ``max_bytes``. The first time
+    that cap is exceeded, a spill file is created holding every line so far,
+    and all later lines are appended to it, so the full output is still
+    available on disk.
+    """
+    
+    def __init__(self, name: str, max_bytes: int = DEFAULT_MAX_OUTPUT_BYTES,
+                 spill_dir: Optional[Path] = None):
+        """Initialize the capture.
+        
+        Args:
+            name: Stream name, used in the spill file name
+            max_bytes: Bytes of output retained in memory
+            spill_dir: Directory for spill files (defaults to the temp dir)
+        """
+        self.name = name
+        self.max_bytes = max_bytes
+        self.spill_dir = spill_dir
+        self.spill_path: Optional[Path] = None
+        self.line_count = 0
+        self._lines: deque = deque()
+        self._retained_bytes = 0
+        self._spill_file = None
+        
+    def append(self, line: str, nbytes: int) -> None:
+        """Add a decoded line whose raw size was ``nbytes``."""
+        self.line_count += 1
+        self._lines.append((line, nbytes))
+        self._retained_bytes += nbytes
+        
+        if self._spill_file is not None:
+            self._spill_file.write(line + "\n")
+        elif self._retained_bytes > self.max_bytes:
+            self._spill()
+            
+        while self._retained_bytes > self.max_bytes and len(self._lines) > 1:
+            _, dropped = self._lines.popleft()
+            self._retained_bytes -= dropped
+            
+    @property
+    def text(self) -> str:
+        """Retained output (the newest lines once spilled)."""
+        return "\n".join(line for line, _ in self._lines)
+        
+    def close(self) -> None:
+        """Close the spill file, if any."""
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+            
+    def _spill(self) -> None:
+        """Start the spill file with everything captured so far."""
+        fd, path = tempfile.mkstemp(
+            prefix=f"claude-flow-{self.name}-", suffix=".log",
+            dir=str(self.spill_dir) if self.spill_dir else None
+        )
+        self.spill_path = Path(path)
+        self._spill_file = open(fd, "w", encoding="utf-8")
+        for line, _ in self._lines:
+            self._spill_file.write(line + "\n")
     
 
+class _ExitNotifyingProtocol(asyncio.subprocess.SubprocessStreamProtocol):
+    """Subprocess stream protocol that also reports the moment the process exits.
+    
+    ``Process.wait()`` only returns once the output pipes have closed too,
+    which never happens while a leaked descendant still holds them.
+    """
+    
+    def __init__(self, limit: int, loop: asyncio.AbstractEventLoop):
+        super().__init__(limit=limit, loop=loop)
+        self.exited: asyncio.Future = loop.create_future()
+        
+    def process_exited(self) -> None:
+        super().process_exited()
+        if not self.exited.done():
+            self.exited.set_result(None)
+
+
 @dataclass
 class CommandMetrics:
     """Metrics for a specific command execution."""
@@ -51,13 +159,24 @@ class CommandMetrics:
 class ProcessTracker:
     """Tracks claude-flow process executions with metrics."""
     
-    def __init__(self, claude_flow_path: str = "claude-flow"):
+    def __init__(self, claude_flow_path: str = "claude-flow", sampler: Optional[SamplingDaemon] = None,
+                 grace_period: float = DEFAULT_GRACE_PERIOD, reap_orphans: bool = False):
         """Initialize process tracker.
         
         Args:
             claude_flow_path: Path to claude-flow executable
+            sampler: Sampling daemon shared by all commands (defaults to the
+                process-wide sampler)
+            grace_period: Seconds between SIGTERM and SIGKILL when stopping
+                a command's process tree
+            reap_orphans: Make this process a child subreaper (Linux) so
+                zombies of orphaned descendants are reaped here
         """
         self.claude_flow_path = claude_flow_path
+        self.sampler = sampler or get_sampler()
+        self.grace_period = grace_period
+        if reap_orphans and not enable_child_subreaper():
+            logger.warning("Could not become a child subreaper; orphaned zombies go to init")
         self._command_metrics: Dict[str, CommandMetrics] = {}
         self._execution_history: List[ProcessExecutionResult] = []
         
@@ -66,15 +185,59 @@ class ProcessTracker:
         command: List[str],
         timeout: Optional[float] = None,
         env: Optional[Dict[str, str]] = None,
-        cwd: Optional[str] = None
+        cwd: Optional[str] = None,
+        max_output_bytes: int = DEFAULT_MAX_OUTPUT_BYTES,
+        spill_dir: Optional[Path] = None
     ) -> ProcessExecutionResult:
         """Execute a claude-flow command and collect metrics.
         
+        Runs ``execute_command_async`` in a new event loop, so it must not be
+        called from a running loop; use ``execute_command_async`` there.
+        
         Args:
             command: Command arguments (without claude-flow prefix)
             timeout: Command timeout in seconds
             env: Environment variables
             cwd: Working directory
+            max_output_bytes: Output retained in memory per stream
+            spill_dir: Directory for spilled output
+            
+        Returns:
+            ProcessExecutionResult with metrics
+        """
+        return asyncio.run(self.execute_command_async(
+            command, timeout, env, cwd, max_output_bytes, spill_dir
+        ))
+        
+    async def execute_command_async(
+        self,
+        command: List[str],
+        timeout: Optional[float] = None,
+        env: Optional[Dict[str, str]] = None,
+        cwd: Optional[str] = None,
+        max_output_bytes: int = DEFAULT_MAX_OUTPUT_BYTES,
+        spill_dir: Optional[Path] = None
+    ) -> ProcessExecutionResult:
+        """Execute a claude-flow command, streaming its output.
+        
+        stdout and stderr are read incrementally. Each line is parsed by
+        ``ProgressTracker`` and ``OutputParser`` as it arrives, so event
+        timestamps are exact. Only the newest ``max_output_bytes`` of each
+        stream are kept in memory; the full output of a stream that exceeds
+        the cap is written to a spill file (``stdout_path``/``stderr_path``).
+        
+        The command runs in its own session. On timeout, its whole process
+        tree is stopped (SIGTERM, then SIGKILL after ``grace_period``).
+        Descendants still running once the command finishes are stopped
+        too and reported in ``leaked_pids``.
+        
+        Args:
+            command: Command arguments (without claude-flow prefix)
+            timeout: Command timeout in seconds
+            env: Environment variables
+            cwd: Working directory
+            max_output_bytes: Output retained in memory per stream
+            spill_dir: Directory for spilled output
             
         Returns:
             ProcessExecutionResult with metrics
@@ -90,75 +253,118 @@ class ProcessTracker:
         # Create collectors
         perf_collector = PerformanceCollector(sample_interval=0.05)
         resource_monitor = ResourceMonitor()
+        stdout = OutputCapture("stdout", max_output_bytes, spill_dir)
+        stderr = OutputCapture("stderr", max_output_bytes, spill_dir)
+        progress = ProgressTracker()
+        parsed = OutputParser.empty_result()
+        error_count = 0
         
+        def on_line(capture: OutputCapture, raw: bytearray) -> None:
+            nonlocal error_count
+            line = raw.decode("utf-8", errors="replace").rstrip("\r")
+            capture.append(line, len(raw) + 1)
+            progress.parse_output_stream(line)
+            OutputParser.parse_line(line, parsed)
+            lowered = line.lower()
+            if any(err in lowered for err in ERROR_MARKERS):
+                error_count += 1
+                
         # Track execution
         start_time = time.time()
-        stdout_lines = []
-        stderr_lines = []
+        progress.start()
         exit_code = -1
+        loop = asyncio.get_running_loop()
+        tree: Optional[ProcessTree] = None
+        leaked_pids: List[int] = []
         
         try:
             # Start process
-            process = subprocess.Popen(
-                full_command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
+            transport, protocol = await loop.subprocess_exec(
+                lambda: _ExitNotifyingProtocol(STREAM_LIMIT, loop),
+                *full_command,
+                stdin=None,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
                 env=process_env,
-                cwd=cwd
+                cwd=cwd,
+                start_new_session=True
             )
+            process = asyncio.subprocess.Process(transport, protocol, loop)
+            tree = ProcessTree(process.pid)
             
             # Start monitoring
-            perf_collector.start_collection(process)
-            resource_monitor.start_monitoring(process.pid)
+            perf_collector.start_collection(process, sampler=self.sampler)
+            resource_monitor.start_monitoring(process.pid, sampler=self.sampler)
             
-            try:
-                # Wait for completion
-                stdout, stderr = process.communicate(timeout=timeout)
-                exit_code = process.returncode
-                stdout_lines = stdout.splitlines() if stdout else []
-                stderr_lines = stderr.splitlines() if stderr else []
-                
-            except subprocess.TimeoutExpired:
-                # Kill process on timeout
-                process.kill()
-                stdout, stderr = process.communicate()
+            readers = [
+                asyncio.ensure_future(self._read_lines(process.stdout, stdout, on_line)),
+                asyncio.ensure_future(self._read_lines(process.stderr, stderr, on_line))
+            ]
+            waiter = asyncio.ensure_future(self._wait_exit(process, protocol.exited))
+            await asyncio.wait([waiter], timeout=timeout)
+            
+            timed_out = not waiter.done()
+            if timed_out:
+                # Stop the whole tree on timeout and keep what was already written
+                waiter.cancel()
+                await loop.run_in_executor(None, tree.terminate, self.grace_period)
+                await self._wait_exit(process, protocol.exited)
                 exit_code = -15  # SIGTERM
-                stdout_lines = stdout.splitlines() if stdout else []
-                stderr_lines = stderr.splitlines() if stderr else []
-                stderr_lines.append(f"Process timed out after {timeout} seconds")
+            else:
+                exit_code = process.returncode
+            
+            # Output still open after the command exited is held by leaked
+            # descendants; stopping them lets the readers reach end of file
+            _, unfinished = await asyncio.wait(readers, timeout=OUTPUT_DRAIN_SECONDS)
+            leaked_pids = await loop.run_in_executor(None, tree.audit)
+            if leaked_pids:
+                logger.warning(f"{full_command[0]} left processes running: {leaked_pids}")
+                await loop.run_in_executor(None, tree.terminate, self.grace_period)
+                if unfinished:
+                    _, unfinished = await asyncio.wait(unfinished, timeout=1.0)
+            for reader in unfinished:
+                reader.cancel()
+            
+            if timed_out:
+                stderr.append(f"Process timed out after {timeout} seconds", 0)
                 
         except Exception as e:
-            stderr_lines.append(f"Process execution failed: {str(e)}")
+            stderr.append(f"Process execution failed: {str(e)}", 0)
+            error_count += 1
             
         finally:
+            if tree is not None and process.returncode is None:
+                # Cancelled mid-run: do not leave the tree behind
+                await loop.run_in_executor(None, tree.terminate, self.grace_period)
+            
             # Stop monitoring
             performance_metrics = perf_collector.stop_collection()
             resource_usage = resource_monitor.stop_monitoring()
+            stdout.close()
+            stderr.close()
             
         end_time = time.time()
         duration = end_time - start_time
         
-        # Count errors in output
-        error_count = sum(
-            1 for line in stderr_lines + stdout_lines
-            if any(err in line.lower() for err in ["error", "failed", "exception"])
-        )
-        
         # Create result
         result = ProcessExecutionResult(
             command=full_command,
             exit_code=exit_code,
-            stdout="\n".join(stdout_lines),
-            stderr="\n".join(stderr_lines),
+            stdout=stdout.text,
+            stderr=stderr.text,
             start_time=start_time,
             end_time=end_time,
             duration=duration,
             performance_metrics=performance_metrics,
             resource_usage=resource_usage,
-            output_size=len(stdout_lines) + len(stderr_lines),
+            output_size=stdout.line_count + stderr.line_count,
             error_count=error_count,
-            success=(exit_code == 0)
+            success=(exit_code == 0),
+            stdout_path=stdout.spill_path,
+            stderr_path=stderr.spill_path,
+            parsed_output=parsed,
+            events=progress.events,
+            leaked_pids=leaked_pids
         )
         
         # Update metrics
@@ -167,24 +373,40 @@ class ProcessTracker:
         
         return result
         
-    async def execute_command_async(
-        self,
-        command: List[str],
-        timeout: Optional[float] = None,
-        env: Optional[Dict[str, str]] = None,
-        cwd: Optional[str] = None
-    ) -> ProcessExecutionResult:
-        """Execute command asynchronously."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            self.execute_command,
-            command,
-            timeout,
-            env,
-            cwd
-        )
+    @staticmethod
+    async def _wait_exit(process: asyncio.subprocess.Process, exited: asyncio.Future) -> int:
+        """Wait for the process itself to exit, not for its output to close.
+        
+        Args:
+            process: The process
+            exited: ``_ExitNotifyingProtocol.exited`` of its protocol
+        """
+        await asyncio.shield(exited)
+        return process.returncode
+        
+    @staticmethod
+    async def _read_lines(stream: asyncio.StreamReader, capture: OutputCapture, on_line) -> None:
+        """Read a stream in chunks, passing each complete line to ``on_line``.
         
+        Lines longer than ``MAX_LINE_BYTES`` are passed on in pieces.
+        """
+        pending = bytearray()
+        while True:
+            chunk = await stream.read(READ_CHUNK_BYTES)
+            if not chunk:
+                break
+            pending += chunk
+            start = 0
+            while (end := pending.find(b"\n", start)) >= 0:
+                on_line(capture, pending[start:end])
+                start = end + 1
+            del pending[:start]
+            while len(pending) > MAX_LINE_BYTES:
+                on_line(capture, pending[:MAX_LINE_BYTES])
+                del pending[:MAX_LINE_BYTES]
+        if pending:
+            on_line(capture, pending)
+            
     def _update_command_metrics(self, command: List[str], result: ProcessExecutionResult) -> None:
         """Update command-specific metrics."""
         if not command:
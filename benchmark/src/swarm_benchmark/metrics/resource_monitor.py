@@ -68,16 +68,20 @@ class ResourceMonitor:
         self._monitor_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
         self._process: Optional[psutil.Process] = None
+        self._subscription = None
+        self._total_memory_bytes = 0
         
     def set_thresholds(self, thresholds: Dict[str, float]) -> None:
         """Set resource alert thresholds."""
         self._thresholds.update(thresholds)
         
-    def start_monitoring(self, pid: Optional[int] = None) -> None:
+    def start_monitoring(self, pid: Optional[int] = None, sampler=None) -> None:
         """Start monitoring resources.
         
         Args:
             pid: Process ID to monitor (None for current process)
+            sampler: Optional shared ``SamplingDaemon`` to register with instead
+                of starting a monitoring thread
         """
         self._stop_event.clear()
         self._monitoring = True
@@ -90,6 +94,18 @@ class ResourceMonitor:
             self._process = None
             return
             
+        if sampler is not None:
+            self._total_memory_bytes = psutil.virtual_memory().total
+            self._subscription = sampler.register(
+                self._process.pid,
+                interval=0.1,
+                callback=self.record_sample,
+                include_children=False,
+                system=False,
+                io=True
+            )
+            return
+            
         self._monitor_thread = threading.Thread(
             target=self._monitor_loop,
             daemon=True
@@ -101,11 +117,39 @@ class ResourceMonitor:
         self._monitoring = False
         self._stop_event.set()
         
-        if self._monitor_thread:
+        if self._subscription is not None:
+            self._subscription.close()
+            self._subscription = None
+        elif self._monitor_thread:
             self._monitor_thread.join(timeout=5.0)
             
         return self._calculate_aggregate_usage()
         
+    def record_sample(self, sample) -> None:
+        """Record a ``TreeSample`` delivered by the shared sampler."""
+        if not sample.processes:
+            return
+            
+        pm = sample.processes[0]
+        io_counters = sample.io_counters.get(pm.pid)
+        snapshot = ResourceSnapshot(
+            timestamp=sample.timestamp.timestamp(),
+            cpu_percent=pm.cpu_percent,
+            memory_mb=pm.memory_mb,
+            memory_percent=(
+                pm.memory_mb * 1024 * 1024 / self._total_memory_bytes * 100
+                if self._total_memory_bytes else 0.0
+            ),
+            thread_count=pm.num_threads,
+            fd_count=pm.num_fds,
+            io_read_bytes=io_counters.read_bytes if io_counters else 0,
+            io_write_bytes=io_counters.write_bytes if io_counters else 0,
+            io_read_count=io_counters.read_count if io_counters else 0,
+            io_write_count=io_counters.write_count if io_counters else 0
+        )
+        self._history.append(snapshot)
+        self._check_thresholds(snapshot)
+        
     def _monitor_loop(self) -> None:
         """Main monitoring loop."""
         while self._monitoring and not self._stop_event.is_set():
@@ -0,0 +1,201 @@
+"""Fixed-memory, downsampling storage for numeric metric samples."""
+
+from __future__ import annotations
+import math
+from array import array
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+# (column, how samples are combined when downsampled)
+SAMPLE_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("timestamp", "first"),
+    ("samples", "sum"),
+    ("duration_ms", "mean"),
+    ("process_count", "max"),
+    ("cpu_percent", "mean"),
+    ("memory_mb", "mean"),
+    ("peak_memory_mb", "max"),
+    ("system_cpu_percent", "mean"),
+    ("system_memory_mb", "mean"),
+    ("system_memory_percent", "mean"),
+    ("disk_read_bytes", "last"),
+    ("disk_write_bytes", "last"),
+    ("net_bytes_sent", "last"),
+    ("net_bytes_recv", "last"),
+)
+
+_COLUMN_NAMES = tuple(name for name, _ in SAMPLE_COLUMNS)
+_SAMPLES = _COLUMN_NAMES.index("samples")
+
+
+class _Ring:
+    """Fixed-capacity ring of rows stored column-wise in ``array('d')``."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._columns = [array("d", bytes(8 * capacity)) for _ in SAMPLE_COLUMNS]
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, row: Sequence[float]) -> Optional[List[float]]:
+        """Append a row, returning the evicted oldest row when full."""
+        evicted = None
+        if self._size == self.capacity:
+            evicted = self._row(self._start)
+            index = self._start
+            self._start = (self._start + 1) % self.capacity
+        else:
+            index = (self._start + self._size) % self.capacity
+            self._size += 1
+        for column, value in zip(self._columns, row):
+            column[index] = value
+        return evicted
+
+    def rows(self) -> Iterator[List[float]]:
+        """Rows from oldest to newest."""
+        for i in range(self._size):
+            yield self._row((self._start + i) % self.capacity)
+
+    def clear(self) -> None:
+        self._start = 0
+        self._size = 0
+
+    def _row(self, index: int) -> List[float]:
+        return [column[index] for column in self._columns]
+
+
+class _Bucket:
+    """Accumulates rows that fall into one downsampling window."""
+
+    def __init__(self, key: int, row: Sequence[float]):
+        self.key = key
+        self.values = list(row)
+        self._weight(self.values, row[_SAMPLES])
+
+    def add(self, row: Sequence[float]) -> None:
+        weight = row[_SAMPLES]
+        for i, (_, how) in enumerate(SAMPLE_COLUMNS):
+            value = row[i]
+            if how == "sum":
+                self.values[i] += value
+            elif how == "mean":
+                self.values[i] += value * weight
+            elif how == "max":
+                self.values[i] = max(self.values[i], value)
+            elif how == "last":
+                self.values[i] = value
+
+    def finish(self) -> List[float]:
+        """The combined row, with weighted means resolved."""
+        samples = self.values[_SAMPLES]
+        return [
+            value / samples if how == "mean" and samples else value
+            for value, (_, how) in zip(self.values, SAMPLE_COLUMNS)
+        ]
+
+    @staticmethod
+    def _weight(values: List[float], weight: float) -> None:
+        for i, (_, how) in enumerate(SAMPLE_COLUMNS):
+            if how == "mean":
+                values[i] *= weight
+
+
+class TieredSampleBuffer:
+    """Array-backed ring buffer that downsamples into coarser tiers.
+
+    New samples go into the raw tier. Once a tier is full, its oldest row
+    is merged into the next tier's bucket for that row's time window
+    (1 s, then 10 s by default). The coarsest tier drops its oldest rows.
+    Memory use is fixed at ``capacity`` rows per tier. Whole-run totals
+    (sample count, CPU and memory sums, peak memory, and the first and last
+    rows) are tracked separately, so summaries stay exact.
+    """
+
+    def __init__(self, capacity: int = 3600, resolutions: Sequence[float] = (1.0, 10.0)):
+        """Initialize the buffer.
+
+        Args:
+            capacity: Rows kept per tier
+            resolutions: Window (seconds) of each downsampled tier, finest first
+        """
+        self.capacity = capacity
+        self.resolutions = tuple(resolutions)
+        self._tiers = [_Ring(capacity) for _ in range(len(self.resolutions) + 1)]
+        self._buckets: List[Optional[_Bucket]] = [None] * len(self.resolutions)
+        self.clear()
+
+    def clear(self) -> None:
+        """Drop all samples and totals."""
+        for tier in self._tiers:
+            tier.clear()
+        self._buckets = [None] * len(self.resolutions)
+        self.sample_count = 0
+        self.cpu_percent_sum = 0.0
+        self.memory_mb_sum = 0.0
+        self.peak_memory_mb = 0.0
+        self.first: Optional[Dict[str, float]] = None
+        self.last: Optional[Dict[str, float]] = None
+
+    def __len__(self) -> int:
+        """Number of stored rows across all tiers."""
+        return (sum(len(tier) for tier in self._tiers)
+                + sum(1 for bucket in self._buckets if bucket is not None))
+
+    def __bool__(self) -> bool:
+        return self.sample_count > 0
+
+    def append(self, **values: float) -> None:
+        """Append one raw sample; missing columns are stored as NaN."""
+        values.setdefault("samples", 1)
+        values.setdefault("peak_memory_mb", values.get("memory_mb", math.nan))
+        row = [float(values.get(name, math.nan)) for name in _COLUMN_NAMES]
+
+        self.sample_count += 1
+        self.cpu_percent_sum += values.get("cpu_percent", 0.0)
+        self.memory_mb_sum += values.get("memory_mb", 0.0)
+        self.peak_memory_mb = max(self.peak_memory_mb, values.get("memory_mb", 0.0))
+        self.last = dict(zip(_COLUMN_NAMES, row))
+        if self.first is None:
+            self.first = self.last
+
+        evicted = self._tiers[0].append(row)
+        level = 0
+        while evicted is not None and level < len(self.resolutions):
+            evicted = self._fold(level, evicted)
+            level += 1
+
+    def rows(self) -> Iterator[Dict[str, float]]:
+        """Stored rows, oldest (coarsest) first."""
+        for level in range(len(self._tiers) - 1, -1, -1):
+            for row in self._tiers[level].rows():
+                yield dict(zip(_COLUMN_NAMES, row))
+            if level > 0 and self._buckets[level - 1] is not None:
+                yield dict(zip(_COLUMN_NAMES, self._buckets[level - 1].finish()))
+
+    def tail(self, count: int) -> List[Dict[str, float]]:
+        """The newest ``count`` rows, oldest first."""
+        rows: List[Dict[str, float]] = []
+        for level, tier in enumerate(self._tiers):
+            if len(rows) >= count:
+                break
+            level_rows = [dict(zip(_COLUMN_NAMES, row)) for row in tier.rows()]
+            if level > 0 and self._buckets[level - 1] is not None:
+                level_rows.append(dict(zip(_COLUMN_NAMES, self._buckets[level - 1].finish())))
+            rows = level_rows[-(count - len(rows)):] + rows
+        return rows
+
+    def _fold(self, level: int, row: List[float]) -> Optional[List[float]]:
+        """Merge a row evicted from tier ``level`` into tier ``level + 1``."""
+        key = math.floor(row[0] / self.resolutions[level])
+        bucket = self._buckets[level]
+        if bucket is not None and bucket.key == key:
+            bucket.add(row)
+            return None
+
+        self._buckets[level] = _Bucket(key, row)
+        if bucket is None:
+            return None
+        return self._tiers[level + 1].append(bucket.finish())
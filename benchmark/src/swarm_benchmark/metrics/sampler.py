@@ -0,0 +1,319 @@
+"""Process-wide sampling daemon shared by metrics collectors."""
+
+from __future__ import annotations
+import logging
+import math
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+import psutil
+
+from .performance_collector import ProcessMetrics, collect_system_metrics, sample_process
+from .proc_reader import ProcReader
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TreeSample:
+    """One sampler tick for a registered process tree."""
+    timestamp: datetime
+    duration_ms: float
+    processes: List[ProcessMetrics]
+    system_metrics: Dict[str, Any]
+    io_counters: Dict[int, Any] = field(default_factory=dict)
+
+
+class SamplerSubscription:
+    """A process tree registered with a ``SamplingDaemon``.
+
+    Samples go to ``callback`` when one is given, otherwise into the
+    ``samples`` ring buffer.
+    """
+
+    def __init__(
+        self,
+        sampler: SamplingDaemon,
+        pid: int,
+        interval: float,
+        callback: Optional[Callable[[TreeSample], None]],
+        include_children: bool,
+        system: bool,
+        io: bool,
+        capacity: int
+    ):
+        self.pid = pid
+        self.interval = interval
+        self.callback = callback
+        self.include_children = include_children
+        self.system = system
+        self.io = io
+        self.samples: Deque[TreeSample] = deque(maxlen=capacity)
+        self.next_due = time.monotonic()
+        self._sampler = sampler
+
+    @property
+    def active(self) -> bool:
+        """Whether the subscription is still registered."""
+        return self._sampler.is_registered(self)
+
+    def close(self) -> None:
+        """Unregister; no samples are delivered once this returns."""
+        self._sampler.unregister(self)
+
+    def _deliver(self, sample: TreeSample) -> None:
+        if self.callback is None:
+            self.samples.append(sample)
+        else:
+            self.callback(sample)
+
+
+class SamplingDaemon:
+    """Samples every registered process tree from a single thread.
+
+    Each tick lists processes once, samples every PID that belongs to a due
+    tree once (even if several subscriptions share it) and reads system-wide
+    counters once, then fans the results out to the due subscriptions.
+    """
+
+    # Ticks after which an unsampled process is dropped from the cache
+    STALE_TICKS = 100
+
+    def __init__(self, fast_path: Optional[bool] = None, track_fds: bool = True):
+        """Initialize the sampling daemon.
+
+        Args:
+            fast_path: Read process metrics directly from /proc; defaults to
+                on wherever ``ProcReader`` is available
+            track_fds: Count open file descriptors per process
+        """
+        if fast_path is None:
+            fast_path = ProcReader.available()
+        self._proc_reader = ProcReader(track_fds=track_fds) if fast_path else None
+        self._subscriptions: Set[SamplerSubscription] = set()
+        self._processes: Dict[int, psutil.Process] = {}
+        self._last_sampled: Dict[int, int] = {}
+        self._condition = threading.Condition()
+        self._deliver_lock = threading.RLock()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self.tick_count = 0
+
+    def register(
+        self,
+        pid: int,
+        interval: float = 0.05,
+        callback: Optional[Callable[[TreeSample], None]] = None,
+        include_children: bool = True,
+        system: bool = True,
+        io: bool = False,
+        capacity: int = 1000
+    ) -> SamplerSubscription:
+        """Register a process tree for sampling.
+
+        Args:
+            pid: Root process ID
+            interval: Sampling interval in seconds
+            callback: Called with each ``TreeSample`` on the sampler thread
+            include_children: Sample all descendants of ``pid``
+            system: Include system-wide metrics in samples
+            io: Include per-process I/O counters in samples
+            capacity: Ring buffer size when no callback is given
+
+        Returns:
+            The subscription; close it to stop sampling
+        """
+        subscription = SamplerSubscription(
+            self, pid, interval, callback, include_children, system, io, capacity
+        )
+        with self._condition:
+            self._subscriptions.add(subscription)
+            if not self._running:
+                self._running = True
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="swarm-benchmark-sampler",
+                    daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+        return subscription
+
+    def unregister(self, subscription: SamplerSubscription) -> None:
+        """Remove a subscription."""
+        with self._deliver_lock, self._condition:
+            self._subscriptions.discard(subscription)
+
+    def is_registered(self, subscription: SamplerSubscription) -> bool:
+        """Whether ``subscription`` is registered."""
+        with self._condition:
+            return subscription in self._subscriptions
+
+    def stop(self) -> None:
+        """Stop the sampler thread and drop all subscriptions."""
+        with self._condition:
+            self._running = False
+            self._subscriptions.clear()
+            self._condition.notify()
+            thread, self._thread = self._thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5.0)
+        self._processes.clear()
+        self._last_sampled.clear()
+        if self._proc_reader is not None:
+            self._proc_reader.close()
+
+    def _run(self) -> None:
+        """Sampler thread: wait for the next due subscription and tick."""
+        while True:
+            with self._condition:
+                while self._running and not self._subscriptions:
+                    self._condition.wait()
+                if not self._running:
+                    return
+
+                now = time.monotonic()
+                delay = min(s.next_due for s in self._subscriptions) - now
+                if delay > 0:
+                    self._condition.wait(delay)
+                    continue
+                due = [s for s in self._subscriptions if s.next_due <= now]
+
+            try:
+                self.sample(due)
+            except Exception:
+                logger.exception("Sampler tick failed")
+
+    def sample(self, subscriptions: List[SamplerSubscription]) -> None:
+        """Take one sample for ``subscriptions`` and deliver it."""
+        if not subscriptions:
+            return
+
+        start = time.monotonic()
+        children = (
+            self._children_map()
+            if any(s.include_children for s in subscriptions) else {}
+        )
+
+        trees: Dict[Tuple[int, bool], List[int]] = {}
+        for s in subscriptions:
+            key = (s.pid, s.include_children)
+            if key not in trees:
+                trees[key] = self._tree(s.pid, children) if s.include_children else [s.pid]
+
+        wanted = {pid for pids in trees.values() for pid in pids}
+        io_pids = {pid for s in subscriptions if s.io for pid in trees[(s.pid, s.include_children)]}
+        metrics, io_counters = self._sample_processes(wanted, io_pids)
+        system_metrics = collect_system_metrics() if any(s.system for s in subscriptions) else {}
+
+        timestamp = datetime.now()
+        duration_ms = (time.monotonic() - start) * 1000
+        self.tick_count += 1
+
+        with self._deliver_lock:
+            for s in subscriptions:
+                # Align to a grid so subscriptions with compatible intervals share ticks
+                s.next_due = (math.floor(start / s.interval) + 1) * s.interval
+                if s not in self._subscriptions:
+                    continue
+
+                pids = trees[(s.pid, s.include_children)]
+                sample = TreeSample(
+                    timestamp=timestamp,
+                    duration_ms=duration_ms,
+                    processes=[metrics[pid] for pid in pids if pid in metrics],
+                    system_metrics=system_metrics if s.system else {},
+                    io_counters={pid: io_counters[pid] for pid in pids if pid in io_counters} if s.io else {}
+                )
+                try:
+                    s._deliver(sample)
+                except Exception:
+                    logger.exception("Sampler callback failed for pid %s", s.pid)
+
+    def _children_map(self) -> Dict[int, List[int]]:
+        """Map each PID to its direct children with a single process listing.
+
+        ``Process.children()`` lists every process on each call, so one
+        shared map keeps a tick at one pass however many roots are due.
+        """
+        children: Dict[int, List[int]] = {}
+        for proc in psutil.process_iter(["ppid"]):
+            ppid = proc.info["ppid"]
+            if ppid:
+                children.setdefault(ppid, []).append(proc.pid)
+        return children
+
+    def _tree(self, root: int, children: Dict[int, List[int]]) -> List[int]:
+        """Root PID followed by all of its descendants."""
+        pids = [root]
+        seen = {root}
+        i = 0
+        while i < len(pids):
+            for child in children.get(pids[i], ()):
+                if child not in seen:
+                    seen.add(child)
+                    pids.append(child)
+            i += 1
+        return pids
+
+    def _sample_processes(
+        self, pids: Set[int], io_pids: Set[int]
+    ) -> Tuple[Dict[int, ProcessMetrics], Dict[int, Any]]:
+        """Sample each PID once, keeping per-process state for CPU deltas."""
+        metrics: Dict[int, ProcessMetrics] = {}
+        io_counters: Dict[int, Any] = {}
+
+        for pid in pids:
+            try:
+                if self._proc_reader is not None:
+                    metrics[pid] = self._proc_reader.sample(pid)
+                else:
+                    metrics[pid] = sample_process(self._process(pid))
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                self._forget(pid)
+                continue
+            self._last_sampled[pid] = self.tick_count
+
+            if pid in io_pids:
+                try:
+                    io_counters[pid] = self._process(pid).io_counters()
+                except (AttributeError, psutil.NoSuchProcess, psutil.AccessDenied):
+                    pass
+
+        # Forget processes that have not been part of any due tree for a while
+        stale = self.tick_count - self.STALE_TICKS
+        for pid in [pid for pid, tick in self._last_sampled.items() if tick < stale]:
+            self._forget(pid)
+
+        return metrics, io_counters
+
+    def _process(self, pid: int) -> psutil.Process:
+        """Cached ``psutil.Process`` for a PID."""
+        proc = self._processes.get(pid)
+        if proc is None:
+            proc = self._processes[pid] = psutil.Process(pid)
+        return proc
+
+    def _forget(self, pid: int) -> None:
+        """Drop all cached state for a PID."""
+        self._processes.pop(pid, None)
+        self._last_sampled.pop(pid, None)
+        if self._proc_reader is not None:
+            self._proc_reader.forget(pid)
+
+
+_default_sampler: Optional[SamplingDaemon] = None
+_default_sampler_lock = threading.Lock()
+
+
+def get_sampler() -> SamplingDaemon:
+    """Get the process-wide sampling daemon."""
+    global _default_sampler
+    with _default_sampler_lock:
+        if _default_sampler is None:
+            _default_sampler = SamplingDaemon()
+        return _default_sampler
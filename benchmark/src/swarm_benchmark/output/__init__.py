@@ -1,6 +1,7 @@
 """Output modules for benchmark results."""
 
-from .json_writer import JSONWriter
+from .json_writer import JSONWriter, ResultStream
 from .sqlite_manager import SQLiteManager
+from .parquet_writer import ParquetWriter, ParquetReader
 
-__all__ = ["JSONWriter", "SQLiteManager"]
\ No newline at end of file
+__all__ = ["JSONWriter", "ResultStream", "SQLiteManager", "ParquetWriter", "ParquetReader"]
\ No newline at end of file
@@ -1,8 +1,10 @@
 """JSON output writer for benchmark results."""
 
+import asyncio
 import json
+import os
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, List, Optional
 from datetime import datetime
 
 from ..core.models import Benchmark, Result
@@ -15,25 +17,100 @@ class JSONWriter:
         """Initialize the JSON writer."""
         pass
     
-    async def save_benchmark(self, benchmark: Benchmark, output_dir: Path) -> Path:
+    async def save_benchmark(self, benchmark: Benchmark, output_dir: Path,
+                             format_type: str = "json") -> Path:
         """Save benchmark to JSON file.
         
         Args:
             benchmark: Benchmark to save
             output_dir: Output directory
+            format_type: ``"json"`` for a single document or ``"ndjson"`` for
+                one record per line, written result by result
             
         Returns:
             Path to saved file
         """
+        if format_type == "ndjson":
+            async with self.stream(benchmark, output_dir, format_type="ndjson") as stream:
+                for result in benchmark.results:
+                    await stream.write_result(result)
+            return stream.path
+        
         output_file = output_dir / f"{benchmark.name}_{benchmark.id}.json"
         
         benchmark_data = self._benchmark_to_dict(benchmark)
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(benchmark_data, f, indent=2, default=self._json_serializer)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._dump_json, output_file, benchmark_data)
         
         return output_file
     
+    def stream(self, benchmark: Benchmark, output_dir: Path,
+               format_type: str = "ndjson", batch_size: int = 100,
+               fsync_every: int = 1000) -> "ResultStream":
+        """Create a stream that writes results to disk as they complete.
+        
+        Args:
+            benchmark: Benchmark the results belong to
+            output_dir: Output directory
+            format_type: ``"ndjson"`` or ``"json"`` (incrementally written array)
+            batch_size: Results buffered before a write
+            fsync_every: Results written between fsync checkpoints
+            
+        Returns:
+            Unopened ``ResultStream``; use it as an async context manager
+        """
+        return ResultStream(self, benchmark, output_dir, format_type, batch_size, fsync_every)
+    
+    @staticmethod
+    def read_results(path: Path) -> Iterator[Dict[str, Any]]:
+        """Yield result records from a streamed file, including partial ones.
+        
+        Handles NDJSON streams and JSON documents, skipping a torn trailing
+        record left by a crash.
+        """
+        path = Path(path)
+        if path.suffix == ".ndjson":
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if record.get("type") == "result":
+                        record.pop("type")
+                        yield record
+            return
+        
+        text = path.read_text(encoding='utf-8')
+        try:
+            yield from json.loads(text).get("results", [])
+            return
+        except json.JSONDecodeError:
+            pass
+        
+        # Unterminated stream: decode array elements until the data runs out.
+        start = text.find('"results": [')
+        if start < 0:
+            return
+        decoder = json.JSONDecoder()
+        pos = start + len('"results": [')
+        while True:
+            while pos < len(text) and text[pos] in ' \t\r\n,':
+                pos += 1
+            if pos >= len(text) or text[pos] == ']':
+                return
+            try:
+                record, pos = decoder.raw_decode(text, pos)
+            except json.JSONDecodeError:
+                return
+            yield record
+    
+    def _dump_json(self, output_file: Path, data: Dict[str, Any]) -> None:
+        """Write a complete JSON document (runs in a worker thread)."""
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, default=self._json_serializer)
+    
     def _benchmark_to_dict(self, benchmark: Benchmark) -> Dict[str, Any]:
         """Convert benchmark to dictionary."""
         return {
@@ -53,6 +130,29 @@ class JSONWriter:
             "metadata": benchmark.metadata
         }
     
+    def _benchmark_header(self, benchmark: Benchmark) -> Dict[str, Any]:
+        """Benchmark fields known before any result is written."""
+        return {
+            "id": benchmark.id,
+            "name": benchmark.name,
+            "description": benchmark.description,
+            "config": self._config_to_dict(benchmark.config),
+            "created_at": benchmark.created_at.isoformat(),
+            "started_at": benchmark.started_at.isoformat() if benchmark.started_at else None,
+        }
+    
+    def _benchmark_trailer(self, benchmark: Benchmark) -> Dict[str, Any]:
+        """Benchmark fields that are only final once every result is written."""
+        return {
+            "status": benchmark.status.value,
+            "tasks": [self._task_to_dict(task) for task in benchmark.tasks],
+            "metrics": self._metrics_to_dict(benchmark.metrics),
+            "completed_at": benchmark.completed_at.isoformat() if benchmark.completed_at else None,
+            "duration": benchmark.duration(),
+            "error_log": benchmark.error_log,
+            "metadata": benchmark.metadata
+        }
+    
     def _config_to_dict(self, config) -> Dict[str, Any]:
         """Convert config to dictionary."""
         return {
@@ -168,4 +268,126 @@ class JSONWriter:
         """JSON serializer for datetime and other objects."""
         if isinstance(obj, datetime):
             return obj.isoformat()
-        raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
\ No newline at end of file
+        raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
+
+
+class ResultStream:
+    """Appends results to a JSON or NDJSON file as they complete.
+    
+    NDJSON streams hold a ``benchmark`` header line, one ``result`` line per
+    result and a closing ``summary`` line. JSON streams write one document
+    whose ``results`` array grows in place and is terminated on close. Only
+    the pending batch is kept in memory, file I/O runs in the default thread
+    pool, and anything flushed before a crash stays readable through
+    ``JSONWriter.read_results``.
+    """
+    
+    def __init__(self, writer: JSONWriter, benchmark: Benchmark, output_dir: Path,
+                 format_type: str = "ndjson", batch_size: int = 100,
+                 fsync_every: int = 1000):
+        if format_type not in ("ndjson", "json"):
+            raise ValueError(f"Unsupported stream format: {format_type}")
+        self.writer = writer
+        self.benchmark = benchmark
+        self.format_type = format_type
+        self.batch_size = max(1, batch_size)
+        self.fsync_every = max(1, fsync_every)
+        self.path = Path(output_dir) / f"{benchmark.name}_{benchmark.id}.{format_type}"
+        self.results_written = 0
+        
+        self._file = None
+        self._pending: List[str] = []
+        self._unsynced = 0
+        self._lock = asyncio.Lock()
+        self._closed = False
+    
+    async def __aenter__(self) -> "ResultStream":
+        await self.open()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+    
+    async def open(self) -> None:
+        """Create the file and write the header."""
+        async with self._lock:
+            if self._file is not None:
+                return
+            header = self.writer._benchmark_header(self.benchmark)
+            if self.format_type == "ndjson":
+                text = self._line({"type": "benchmark", **header})
+            else:
+                text = json.dumps(header, default=self.writer._json_serializer)[:-1] + ', "results": ['
+            await self._run(self._open_file, text)
+    
+    async def write_result(self, result: Result) -> None:
+        """Queue a result, writing the batch once it is full."""
+        if self._closed:
+            raise RuntimeError("ResultStream is closed")
+        if self._file is None:
+            await self.open()
+        
+        record = self.writer._result_to_dict(result)
+        if self.format_type == "ndjson":
+            text = self._line({"type": "result", **record})
+        else:
+            separator = "\n  " if self.results_written + len(self._pending) == 0 else ",\n  "
+            text = separator + json.dumps(record, default=self.writer._json_serializer)
+        self._pending.append(text)
+        
+        if len(self._pending) >= self.batch_size:
+            await self.flush()
+    
+    async def flush(self, fsync: bool = False) -> None:
+        """Write the pending batch; fsync on request or at the checkpoint interval."""
+        async with self._lock:
+            if self._file is None:
+                return
+            batch, self._pending = self._pending, []
+            self.results_written += len(batch)
+            self._unsynced += len(batch)
+            sync = fsync or self._unsynced >= self.fsync_every
+            if sync:
+                self._unsynced = 0
+            if batch or sync:
+                await self._run(self._write, "".join(batch), sync)
+    
+    async def checkpoint(self) -> None:
+        """Flush and fsync everything written so far."""
+        await self.flush(fsync=True)
+    
+    async def close(self) -> None:
+        """Flush remaining results, write the summary and close the file."""
+        if self._closed:
+            return
+        if self._file is None:
+            await self.open()
+        await self.flush()
+        
+        trailer = self.writer._benchmark_trailer(self.benchmark)
+        if self.format_type == "ndjson":
+            text = self._line({"type": "summary", **trailer})
+        else:
+            text = "\n], " + json.dumps(trailer, default=self.writer._json_serializer)[1:] + "\n"
+        
+        async with self._lock:
+            self._closed = True
+            await self._run(self._write, text, True)
+            await self._run(self._file.close)
+    
+    def _line(self, record: Dict[str, Any]) -> str:
+        return json.dumps(record, default=self.writer._json_serializer) + "\n"
+    
+    async def _run(self, func, *args) -> None:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, func, *args)
+    
+    def _open_file(self, header: str) -> None:
+        self._file = open(self.path, 'w', encoding='utf-8')
+        self._write(header, True)
+    
+    def _write(self, text: str, fsync: bool = False) -> None:
+        self._file.write(text)
+        self._file.flush()
+        if fsync:
+            os.fsync(self._file.fileno())
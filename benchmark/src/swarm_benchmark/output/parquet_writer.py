@@ -0,0 +1,489 @@
+"""Columnar (Parquet) output for benchmark results.
+
+Results, tasks and time-series samples are written as one file per benchmark
+and table, partitioned Hive-style by date, strategy and mode::
+
+    <output_dir>/columnar/results/date=2024-05-01/strategy=auto/mode=centralized/<id>.parquet
+
+Parquet is used when pyarrow is installed (``pip install swarm-benchmark[parquet]``).
+Without it, which is the default install, the same layout is written in a
+compact pure-Python columnar format (``.swbc``: typed arrays and
+length-prefixed strings, zlib-compressed per column) that ``ParquetReader``
+loads the same way.
+"""
+
+import asyncio
+import json
+import math
+import struct
+import sys
+import zlib
+from array import array
+from dataclasses import fields
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from ..core.models import (
+    Benchmark, Task, Result, TaskStatus, ResultStatus, StrategyType, CoordinationMode,
+    PerformanceMetrics, QualityMetrics, ResourceUsage
+)
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+PARQUET_SUFFIX = ".parquet"
+FALLBACK_SUFFIX = ".swbc"
+
+_MAGIC = b"SWBC"
+_FORMAT_VERSION = 1
+_NULL_TIMESTAMP = -(2 ** 63)
+_NULL_INT = -(2 ** 63)
+_NULL_LENGTH = -1
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+_METRIC_GROUPS = (
+    ("performance_metrics", PerformanceMetrics),
+    ("quality_metrics", QualityMetrics),
+    ("resource_usage", ResourceUsage),
+)
+
+# Column layouts: (name, kind) where kind is str, json, float, int or timestamp
+_RESULT_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("id", "str"),
+    ("benchmark_id", "str"),
+    ("task_id", "str"),
+    ("agent_id", "str"),
+    ("status", "str"),
+    ("output", "json"),
+    ("errors", "json"),
+    ("warnings", "json"),
+    ("execution_details", "json"),
+    ("created_at", "timestamp"),
+    ("started_at", "timestamp"),
+    ("completed_at", "timestamp"),
+) + tuple(
+    (f.name, "int" if f.type in ("int", int) else "float")
+    for _, cls in _METRIC_GROUPS for f in fields(cls)
+)
+
+_TASK_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("id", "str"),
+    ("benchmark_id", "str"),
+    ("objective", "str"),
+    ("description", "str"),
+    ("strategy", "str"),
+    ("mode", "str"),
+    ("parameters", "json"),
+    ("timeout", "int"),
+    ("max_retries", "int"),
+    ("priority", "int"),
+    ("status", "str"),
+    ("created_at", "timestamp"),
+    ("started_at", "timestamp"),
+    ("completed_at", "timestamp"),
+    ("assigned_agents", "json"),
+    ("parent_task_id", "str"),
+    ("subtasks", "json"),
+    ("dependencies", "json"),
+)
+
+_SAMPLE_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("benchmark_id", "str"),
+    ("timestamp", "timestamp"),
+    ("duration_ms", "float"),
+    ("process_count", "int"),
+    ("total_cpu_percent", "float"),
+    ("total_memory_mb", "float"),
+)
+
+TABLES: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    "results": _RESULT_COLUMNS,
+    "tasks": _TASK_COLUMNS,
+    "samples": _SAMPLE_COLUMNS,
+}
+
+
+class ParquetWriter:
+    """Writes benchmark results, tasks and samples as partitioned columnar files."""
+
+    def __init__(self, use_pyarrow: Optional[bool] = None):
+        """Initialize the writer.
+
+        Args:
+            use_pyarrow: Force Parquet (True) or the pure-Python format (False);
+                defaults to Parquet whenever pyarrow is importable
+        """
+        if use_pyarrow and not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is required for Parquet output")
+        self.use_pyarrow = PYARROW_AVAILABLE if use_pyarrow is None else use_pyarrow
+
+    async def save_benchmark(self, benchmark: Benchmark, output_dir: Path,
+                             samples: Optional[Iterable[Mapping[str, Any]]] = None) -> Path:
+        """Save benchmark tables under ``output_dir/columnar``.
+
+        Args:
+            benchmark: Benchmark to save
+            output_dir: Output directory
+            samples: Optional time-series samples, e.g. the ``intervals`` of
+                ``PerformanceCollector.get_detailed_metrics()``
+
+        Returns:
+            Root directory of the columnar dataset
+        """
+        tables = {
+            "results": _result_columns(benchmark),
+            "tasks": _task_columns(benchmark),
+        }
+        if samples is not None:
+            tables["samples"] = _sample_columns(benchmark.id, samples)
+
+        root = Path(output_dir) / "columnar"
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._write_tables, root, benchmark, tables)
+        return root
+
+    def _write_tables(self, root: Path, benchmark: Benchmark,
+                      tables: Dict[str, Dict[str, List[Any]]]) -> None:
+        suffix = PARQUET_SUFFIX if self.use_pyarrow else FALLBACK_SUFFIX
+        for table, columns in tables.items():
+            path = partition_dir(root, table, benchmark) / f"{benchmark.id}{suffix}"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if self.use_pyarrow:
+                _write_parquet(path, TABLES[table], columns)
+            else:
+                write_columnar(path, TABLES[table], columns)
+
+
+class ParquetReader:
+    """Loads a columnar dataset written by ``ParquetWriter``."""
+
+    def __init__(self, root: Path):
+        """Initialize the reader.
+
+        Args:
+            root: Dataset root (the ``columnar`` directory)
+        """
+        self.root = Path(root)
+
+    def read_table(self, table: str, date: Optional[str] = None,
+                   strategy: Optional[str] = None,
+                   mode: Optional[str] = None) -> Dict[str, List[Any]]:
+        """Read a table as a dict of columns, including partition columns.
+
+        Args:
+            table: ``results``, ``tasks`` or ``samples``
+            date: Only this ``YYYY-MM-DD`` partition
+            strategy: Only this strategy partition
+            mode: Only this mode partition
+        """
+        if table not in TABLES:
+            raise ValueError(f"Unknown table: {table}")
+
+        spec = TABLES[table]
+        columns: Dict[str, List[Any]] = {name: [] for name, _ in spec}
+        for key in ("date", "strategy", "mode"):
+            columns[key] = []
+
+        for path, partitions in self._files(table, date, strategy, mode):
+            if path.suffix == PARQUET_SUFFIX:
+                if not PYARROW_AVAILABLE:
+                    raise ImportError(f"pyarrow is required to read {path}")
+                data = pq.read_table(path).to_pydict()
+            else:
+                data = read_columnar(path)
+            rows = len(next(iter(data.values()), []))
+            for name, _ in spec:
+                columns[name].extend(data.get(name, [None] * rows))
+            for key, value in partitions.items():
+                columns[key].extend([value] * rows)
+        return columns
+
+    def load_results(self, **filters) -> List[Result]:
+        """Load results back into ``Result`` models."""
+        columns = self.read_table("results", **filters)
+        results = []
+        for row in _rows(columns):
+            metrics = [
+                cls(**{f.name: _metric_value(row[f.name], f) for f in fields(cls)})
+                for _, cls in _METRIC_GROUPS
+            ]
+            results.append(Result(
+                id=row["id"],
+                task_id=row["task_id"],
+                agent_id=row["agent_id"],
+                status=_enum(ResultStatus, row["status"]),
+                output=json.loads(row["output"]),
+                errors=json.loads(row["errors"]),
+                warnings=json.loads(row["warnings"]),
+                performance_metrics=metrics[0],
+                quality_metrics=metrics[1],
+                resource_usage=metrics[2],
+                execution_details=json.loads(row["execution_details"]),
+                created_at=row["created_at"],
+                started_at=row["started_at"],
+                completed_at=row["completed_at"],
+            ))
+        return results
+
+    def load_tasks(self, **filters) -> List[Task]:
+        """Load tasks back into ``Task`` models."""
+        columns = self.read_table("tasks", **filters)
+        return [
+            Task(
+                id=row["id"],
+                objective=row["objective"],
+                description=row["description"],
+                strategy=_enum(StrategyType, row["strategy"]),
+                mode=_enum(CoordinationMode, row["mode"]),
+                parameters=json.loads(row["parameters"]),
+                timeout=row["timeout"],
+                max_retries=row["max_retries"],
+                priority=row["priority"],
+                status=_enum(TaskStatus, row["status"]),
+                created_at=row["created_at"],
+                started_at=row["started_at"],
+                completed_at=row["completed_at"],
+                assigned_agents=json.loads(row["assigned_agents"]),
+                parent_task_id=row["parent_task_id"],
+                subtasks=json.loads(row["subtasks"]),
+                dependencies=json.loads(row["dependencies"]),
+            )
+            for row in _rows(columns)
+        ]
+
+    def load_samples(self, **filters) -> List[Dict[str, Any]]:
+        """Load time-series samples as dictionaries."""
+        return list(_rows(self.read_table("samples", **filters)))
+
+    def to_dataframe(self, table: str, **filters):
+        """Load a table into a pandas DataFrame."""
+        import pandas as pd
+        return pd.DataFrame(self.read_table(table, **filters))
+
+    def _files(self, table: str, date: Optional[str], strategy: Optional[str],
+               mode: Optional[str]) -> Iterable[Tuple[Path, Dict[str, str]]]:
+        wanted = {"date": date, "strategy": strategy, "mode": mode}
+        table_dir = self.root / table
+        if not table_dir.exists():
+            return
+        for path in sorted(table_dir.glob("date=*/strategy=*/mode=*/*")):
+            if path.suffix not in (PARQUET_SUFFIX, FALLBACK_SUFFIX):
+                continue
+            partitions = dict(part.split("=", 1) for part in path.parent.relative_to(table_dir).parts)
+            if all(value is None or partitions[key] == value for key, value in wanted.items()):
+                yield path, partitions
+
+
+def partition_dir(root: Path, table: str, benchmark: Benchmark) -> Path:
+    """Directory for a benchmark's rows of ``table``."""
+    return (Path(root) / table
+            / f"date={benchmark.created_at.date().isoformat()}"
+            / f"strategy={_enum_value(benchmark.config.strategy)}"
+            / f"mode={_enum_value(benchmark.config.mode)}")
+
+
+def write_columnar(path: Path, spec: Sequence[Tuple[str, str]],
+                   columns: Mapping[str, Sequence[Any]]) -> None:
+    """Write columns in the pure-Python ``.swbc`` format."""
+    rows = len(columns[spec[0][0]]) if spec else 0
+    header = {"rows": rows, "columns": []}
+    blobs = []
+    for name, kind in spec:
+        blob = zlib.compress(_encode_column(kind, columns[name]))
+        header["columns"].append({"name": name, "kind": kind, "size": len(blob)})
+        blobs.append(blob)
+
+    header_bytes = json.dumps(header).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(_MAGIC)
+        f.write(struct.pack("<BI", _FORMAT_VERSION, len(header_bytes)))
+        f.write(header_bytes)
+        for blob in blobs:
+            f.write(blob)
+
+
+def read_columnar(path: Path) -> Dict[str, List[Any]]:
+    """Read a ``.swbc`` file into a dict of columns."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if data[:4] != _MAGIC:
+        raise ValueError(f"{path} is not a columnar benchmark file")
+    version, header_size = struct.unpack_from("<BI", data, 4)
+    if version != _FORMAT_VERSION:
+        raise ValueError(f"Unsupported columnar format version {version}")
+
+    offset = 4 + struct.calcsize("<BI")
+    header = json.loads(data[offset:offset + header_size])
+    offset += header_size
+
+    columns = {}
+    for column in header["columns"]:
+        raw = zlib.decompress(data[offset:offset + column["size"]])
+        offset += column["size"]
+        columns[column["name"]] = _decode_column(column["kind"], raw, header["rows"])
+    return columns
+
+
+def _encode_column(kind: str, values: Sequence[Any]) -> bytes:
+    if kind == "float":
+        return _array_bytes(array("d", (math.nan if v is None else float(v) for v in values)))
+    if kind == "int":
+        return _array_bytes(array("q", (_NULL_INT if v is None else int(v) for v in values)))
+    if kind == "timestamp":
+        return _array_bytes(array("q", (_micros(v) for v in values)))
+
+    encoded = [None if v is None else v.encode("utf-8") for v in values]
+    lengths = array("q", (_NULL_LENGTH if v is None else len(v) for v in encoded))
+    return _array_bytes(lengths) + b"".join(v for v in encoded if v)
+
+
+def _decode_column(kind: str, raw: bytes, rows: int) -> List[Any]:
+    if kind == "float":
+        return [None if v != v else v for v in _array_from(raw, "d")]
+    if kind == "int":
+        return [None if v == _NULL_INT else v for v in _array_from(raw, "q")]
+    if kind == "timestamp":
+        return [None if v == _NULL_TIMESTAMP else _EPOCH + timedelta(microseconds=v)
+                for v in _array_from(raw, "q")]
+
+    lengths = _array_from(raw[:rows * 8], "q")
+    values, offset = [], rows * 8
+    for length in lengths:
+        if length == _NULL_LENGTH:
+            values.append(None)
+            continue
+        values.append(raw[offset:offset + length].decode("utf-8"))
+        offset += length
+    return values
+
+
+def _array_bytes(values: array) -> bytes:
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values.tobytes()
+
+
+def _array_from(raw: bytes, typecode: str) -> array:
+    values = array(typecode)
+    values.frombytes(raw)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def _write_parquet(path: Path, spec: Sequence[Tuple[str, str]],
+                   columns: Mapping[str, Sequence[Any]]) -> None:
+    arrow_types = {
+        "str": pa.string(), "json": pa.string(), "float": pa.float64(),
+        "int": pa.int64(), "timestamp": pa.timestamp("us"),
+    }
+    schema = pa.schema([(name, arrow_types[kind]) for name, kind in spec])
+    pq.write_table(pa.Table.from_pydict(dict(columns), schema=schema), path)
+
+
+def _result_columns(benchmark: Benchmark) -> Dict[str, List[Any]]:
+    results = benchmark.results
+    columns = {
+        "id": [r.id for r in results],
+        "benchmark_id": [benchmark.id] * len(results),
+        "task_id": [r.task_id for r in results],
+        "agent_id": [r.agent_id for r in results],
+        "status": [_enum_value(r.status) for r in results],
+        "output": [_json(r.output) for r in results],
+        "errors": [_json(r.errors) for r in results],
+        "warnings": [_json(r.warnings) for r in results],
+        "execution_details": [_json(r.execution_details) for r in results],
+        "created_at": [r.created_at for r in results],
+        "started_at": [r.started_at for r in results],
+        "completed_at": [r.completed_at for r in results],
+    }
+    for group, cls in _METRIC_GROUPS:
+        for f in fields(cls):
+            columns[f.name] = [getattr(getattr(r, group), f.name) for r in results]
+    return columns
+
+
+def _task_columns(benchmark: Benchmark) -> Dict[str, List[Any]]:
+    tasks = benchmark.tasks
+    return {
+        "id": [t.id for t in tasks],
+        "benchmark_id": [benchmark.id] * len(tasks),
+        "objective": [t.objective for t in tasks],
+        "description": [t.description for t in tasks],
+        "strategy": [_enum_value(t.strategy) for t in tasks],
+        "mode": [_enum_value(t.mode) for t in tasks],
+        "parameters": [_json(t.parameters) for t in tasks],
+        "timeout": [t.timeout for t in tasks],
+        "max_retries": [t.max_retries for t in tasks],
+        "priority": [t.priority for t in tasks],
+        "status": [_enum_value(t.status) for t in tasks],
+        "created_at": [t.created_at for t in tasks],
+        "started_at": [t.started_at for t in tasks],
+        "completed_at": [t.completed_at for t in tasks],
+        "assigned_agents": [_json(t.assigned_agents) for t in tasks],
+        "parent_task_id": [t.parent_task_id for t in tasks],
+        "subtasks": [_json(t.subtasks) for t in tasks],
+        "dependencies": [_json(t.dependencies) for t in tasks],
+    }
+
+
+def _sample_columns(benchmark_id: str, samples: Iterable[Mapping[str, Any]]) -> Dict[str, List[Any]]:
+    samples = list(samples)
+    return {
+        "benchmark_id": [benchmark_id] * len(samples),
+        "timestamp": [_datetime(s.get("timestamp")) for s in samples],
+        "duration_ms": [s.get("duration_ms", 0.0) for s in samples],
+        "process_count": [int(s.get("process_count", 0)) for s in samples],
+        "total_cpu_percent": [s.get("total_cpu_percent", 0.0) for s in samples],
+        "total_memory_mb": [s.get("total_memory_mb", 0.0) for s in samples],
+    }
+
+
+def _rows(columns: Dict[str, List[Any]]) -> Iterable[Dict[str, Any]]:
+    names = list(columns)
+    for values in zip(*(columns[name] for name in names)):
+        yield dict(zip(names, values))
+
+
+def _json(value: Any) -> str:
+    return json.dumps(value, default=str)
+
+
+def _enum_value(value: Any) -> Any:
+    return getattr(value, "value", value)
+
+
+def _enum(enum_cls, value: Any) -> Any:
+    try:
+        return enum_cls(value)
+    except ValueError:
+        return value
+
+
+def _metric_value(value: Any, f) -> Any:
+    if value is None and not str(f.type).startswith("Optional"):
+        return f.default
+    return value
+
+
+def _datetime(value: Any) -> Optional[datetime]:
+    if value is None or isinstance(value, datetime):
+        return value
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value)
+    return datetime.fromisoformat(value)
+
+
+def _micros(value: Optional[datetime]) -> int:
+    if value is None:
+        return _NULL_TIMESTAMP
+    if value.tzinfo is not None:
+        value = value.astimezone().replace(tzinfo=None)
+    return (value - _EPOCH) // _MICROSECOND
@@ -1,20 +1,239 @@
 """SQLite database manager for benchmark results."""
 
-import aiosqlite
+import asyncio
 import json
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 from datetime import datetime
 
+from ..core.duration_model import DurationEstimator, DurationStats
 from ..core.models import Benchmark, Task, Result, BenchmarkMetrics
+from ..core.streaming_stats import QuantileSketch
+
+
+# Bumped whenever the table layout changes; stored in PRAGMA user_version.
+# 1: metrics stored as JSON text in the results table
+# 2: metrics stored as typed columns
+# 3: duration_stats table for the learned duration model
+SCHEMA_VERSION = 3
+
+# Typed metric columns of the results table, grouped by the model they come from
+_PERFORMANCE_COLUMNS = (
+    ("execution_time", "REAL"),
+    ("queue_time", "REAL"),
+    ("throughput", "REAL"),
+    ("success_rate", "REAL"),
+    ("error_rate", "REAL"),
+    ("retry_count", "INTEGER"),
+    ("coordination_overhead", "REAL"),
+    ("communication_latency", "REAL"),
+)
+_QUALITY_COLUMNS = (
+    ("accuracy_score", "REAL"),
+    ("completeness_score", "REAL"),
+    ("consistency_score", "REAL"),
+    ("relevance_score", "REAL"),
+    ("overall_quality", "REAL"),
+    ("review_score", "REAL"),
+    ("automated_score", "REAL"),
+)
+_RESOURCE_COLUMNS = (
+    ("cpu_percent", "REAL"),
+    ("memory_mb", "REAL"),
+    ("network_bytes_sent", "INTEGER"),
+    ("network_bytes_recv", "INTEGER"),
+    ("disk_bytes_read", "INTEGER"),
+    ("disk_bytes_write", "INTEGER"),
+    ("peak_memory_mb", "REAL"),
+    ("average_cpu_percent", "REAL"),
+)
+_METRIC_COLUMNS = (
+    [("performance_metrics", name, kind) for name, kind in _PERFORMANCE_COLUMNS]
+    + [("quality_metrics", name, kind) for name, kind in _QUALITY_COLUMNS]
+    + [("resource_usage", name, kind) for name, kind in _RESOURCE_COLUMNS]
+)
+
+_RESULT_BASE_COLUMNS = (
+    "id", "benchmark_id", "task_id", "agent_id", "status", "output", "errors",
+    "warnings", "execution_details", "created_at", "started_at", "completed_at", "duration"
+)
+_RESULT_COLUMNS = _RESULT_BASE_COLUMNS + tuple(name for _, name, _ in _METRIC_COLUMNS)
+
+_RESULTS_TABLE = """
+    CREATE TABLE IF NOT EXISTS {table} (
+        id TEXT PRIMARY KEY,
+        benchmark_id TEXT NOT NULL,
+        task_id TEXT NOT NULL,
+        agent_id TEXT NOT NULL,
+        status TEXT NOT NULL,
+        output TEXT,
+        errors TEXT,
+        warnings TEXT,
+        execution_details TEXT,
+        created_at TEXT NOT NULL,
+        started_at TEXT,
+        completed_at TEXT,
+        duration REAL,
+        """ + ",\n        ".join(f"{name} {kind}" for _, name, kind in _METRIC_COLUMNS) + """,
+        FOREIGN KEY (benchmark_id) REFERENCES benchmarks (id),
+        FOREIGN KEY (task_id) REFERENCES tasks (id)
+    )
+"""
+
+# Columns benchmark/result aggregates may be grouped by
+_AGGREGATE_GROUPS = {
+    "strategy": "b.strategy",
+    "mode": "b.mode",
+    "benchmark_id": "r.benchmark_id",
+    "agent_id": "r.agent_id",
+    "status": "r.status",
+}
+
+_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS benchmarks (
+        id TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        description TEXT,
+        status TEXT NOT NULL,
+        strategy TEXT NOT NULL,
+        mode TEXT NOT NULL,
+        config TEXT,
+        metrics TEXT,
+        created_at TEXT NOT NULL,
+        started_at TEXT,
+        completed_at TEXT,
+        duration REAL,
+        error_log TEXT,
+        metadata TEXT
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS tasks (
+        id TEXT PRIMARY KEY,
+        benchmark_id TEXT NOT NULL,
+        objective TEXT NOT NULL,
+        description TEXT,
+        strategy TEXT NOT NULL,
+        mode TEXT NOT NULL,
+        parameters TEXT,
+        timeout INTEGER,
+        max_retries INTEGER,
+        priority INTEGER,
+        status TEXT NOT NULL,
+        created_at TEXT NOT NULL,
+        started_at TEXT,
+        completed_at TEXT,
+        duration REAL,
+        assigned_agents TEXT,
+        parent_task_id TEXT,
+        subtasks TEXT,
+        dependencies TEXT,
+        FOREIGN KEY (benchmark_id) REFERENCES benchmarks (id)
+    )
+    """,
+    _RESULTS_TABLE.format(table="results"),
+    """
+    CREATE TABLE IF NOT EXISTS duration_stats (
+        agent_id TEXT NOT NULL,
+        strategy TEXT NOT NULL,
+        complexity TEXT NOT NULL,
+        samples INTEGER NOT NULL,
+        ewma REAL NOT NULL,
+        sketch TEXT NOT NULL,
+        updated_at TEXT NOT NULL,
+        PRIMARY KEY (agent_id, strategy, complexity)
+    )
+    """,
+    # Indexes for better query performance
+    "CREATE INDEX IF NOT EXISTS idx_benchmarks_created_at ON benchmarks (created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_benchmarks_strategy ON benchmarks (strategy)",
+    "CREATE INDEX IF NOT EXISTS idx_benchmarks_mode ON benchmarks (mode)",
+    "CREATE INDEX IF NOT EXISTS idx_tasks_benchmark_id ON tasks (benchmark_id)",
+    "CREATE INDEX IF NOT EXISTS idx_results_benchmark_status ON results (benchmark_id, status)",
+    "CREATE INDEX IF NOT EXISTS idx_results_task_id ON results (task_id)",
+    "CREATE INDEX IF NOT EXISTS idx_results_agent_id ON results (agent_id)",
+    "CREATE INDEX IF NOT EXISTS idx_results_execution_time ON results (execution_time)",
+]
+
+_INSERT_BENCHMARK = """
+    INSERT OR REPLACE INTO benchmarks (
+        id, name, description, status, strategy, mode, config, metrics,
+        created_at, started_at, completed_at, duration, error_log, metadata
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_TASK = """
+    INSERT OR REPLACE INTO tasks (
+        id, benchmark_id, objective, description, strategy, mode, parameters,
+        timeout, max_retries, priority, status, created_at, started_at,
+        completed_at, duration, assigned_agents, parent_task_id, subtasks, dependencies
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_RESULT = (
+    f"INSERT OR REPLACE INTO results ({', '.join(_RESULT_COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in _RESULT_COLUMNS)})"
+)
+
+
+def _dumps(value: Any) -> str:
+    """json.dumps with a shortcut for the (common) empty containers."""
+    if not value:
+        if isinstance(value, dict):
+            return "{}"
+        if isinstance(value, list):
+            return "[]"
+    return json.dumps(value)
+
+
+def _nearest_rank(q: float) -> str:
+    """SQL for the 1-based nearest-rank position of quantile ``q`` among ``n`` rows."""
+    return f"MAX(1, CAST({q} * n AS INTEGER) + ({q} * n > CAST({q} * n AS INTEGER)))"
+
+
+def _json_extract(document: Optional[str], path: str) -> Any:
+    """Fallback for SQLite builds without JSON1 (handles ``$.key`` paths)."""
+    if document is None:
+        return None
+    value = json.loads(document)
+    for key in path[2:].split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
 
 
 class SQLiteManager:
-    """Manages SQLite database for benchmark results."""
+    """Manages SQLite database for benchmark results.
+    
+    Each database gets one persistent connection in WAL mode, owned by a
+    dedicated writer thread, so a save is a single thread hop and a single
+    transaction, and the schema version is checked once per connection.
+    Call ``close()`` (or use ``async with``) when done.
+    """
     
-    def __init__(self):
-        """Initialize the SQLite manager."""
-        self.db_path: Optional[Path] = None
+    def __init__(self, db_path: Optional[Path] = None, max_group_size: int = 32):
+        """Initialize the SQLite manager.
+        
+        Args:
+            db_path: Existing database to query; set by ``save_benchmark`` otherwise
+            max_group_size: Benchmarks the background writer commits together
+        """
+        self.db_path: Optional[Path] = Path(db_path) if db_path else None
+        self.max_group_size = max_group_size
+        self._connections: Dict[Path, sqlite3.Connection] = {}
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite-writer")
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+    
+    async def __aenter__(self) -> "SQLiteManager":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
     
     async def save_benchmark(self, benchmark: Benchmark, output_dir: Path) -> Path:
         """Save benchmark to SQLite database.
@@ -27,116 +246,200 @@ class SQLiteManager:
             Path to database file
         """
         self.db_path = output_dir / "benchmark_results.db"
+        await self._run(self._write_benchmarks, self.db_path, [benchmark])
+        return self.db_path
+    
+    async def submit_benchmark(self, benchmark: Benchmark, output_dir: Path) -> "asyncio.Future[Path]":
+        """Queue a save on the background writer.
+        
+        Saves submitted while a write is in flight are committed together in
+        one transaction. Await the returned future for the database path.
+        """
+        if self._writer_task is None or self._writer_task.done():
+            self._queue = asyncio.Queue()
+            self._writer_task = asyncio.create_task(self._writer_loop())
         
-        await self._ensure_database()
+        self.db_path = output_dir / "benchmark_results.db"
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((self.db_path, benchmark, future))
+        return future
+    
+    async def flush(self) -> None:
+        """Wait until every queued save has been written."""
+        if self._queue is not None:
+            await self._queue.join()
+    
+    async def close(self) -> None:
+        """Drain the background writer and close all connections."""
+        await self.flush()
+        if self._writer_task is not None:
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+            self._writer_task = None
         
-        async with aiosqlite.connect(self.db_path) as db:
-            # Insert benchmark
-            await self._insert_benchmark(db, benchmark)
+        await self._run(self._close_connections)
+        self._executor.shutdown(wait=True)
+    
+    async def _writer_loop(self) -> None:
+        """Commit queued saves, grouping whatever has accumulated."""
+        while True:
+            group = [await self._queue.get()]
+            while len(group) < self.max_group_size and not self._queue.empty():
+                group.append(self._queue.get_nowait())
             
-            # Insert tasks
-            for task in benchmark.tasks:
-                await self._insert_task(db, task, benchmark.id)
+            by_path: Dict[Path, List[Tuple[Benchmark, asyncio.Future]]] = {}
+            for db_path, benchmark, future in group:
+                by_path.setdefault(db_path, []).append((benchmark, future))
             
-            # Insert results
-            for result in benchmark.results:
-                await self._insert_result(db, result, benchmark.id)
+            for db_path, items in by_path.items():
+                try:
+                    await self._run(self._write_benchmarks, db_path, [b for b, _ in items])
+                except Exception as e:
+                    for _, future in items:
+                        if not future.done():
+                            future.set_exception(e)
+                else:
+                    for _, future in items:
+                        if not future.done():
+                            future.set_result(db_path)
             
-            await db.commit()
+            for _ in group:
+                self._queue.task_done()
+    
+    async def _run(self, func, *args):
+        """Run a database call on the writer thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+    
+    def _connect(self, db_path: Path) -> sqlite3.Connection:
+        """Return the persistent connection for a database (writer thread only)."""
+        conn = self._connections.get(db_path)
+        if conn is None:
+            conn = sqlite3.connect(str(db_path), check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._ensure_database(conn)
+            self._connections[db_path] = conn
+        return conn
+    
+    def _close_connections(self) -> None:
+        for conn in self._connections.values():
+            conn.close()
+        self._connections.clear()
+    
+    def _ensure_database(self, conn: sqlite3.Connection) -> None:
+        """Create or migrate the schema; runs once per persistent connection."""
+        if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+            return
         
-        return self.db_path
+        # Take the write lock before re-reading the version so concurrent
+        # processes cannot both migrate.
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+                result_columns = {row[1] for row in conn.execute("PRAGMA table_info(results)")}
+                if "performance_metrics" in result_columns:
+                    self._migrate_metric_columns(conn)
+                for statement in _SCHEMA:
+                    conn.execute(statement)
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
     
-    async def _ensure_database(self) -> None:
-        """Ensure database and tables exist."""
-        async with aiosqlite.connect(self.db_path) as db:
-            # Create benchmarks table
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS benchmarks (
-                    id TEXT PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    description TEXT,
-                    status TEXT NOT NULL,
-                    strategy TEXT NOT NULL,
-                    mode TEXT NOT NULL,
-                    config TEXT,
-                    metrics TEXT,
-                    created_at TEXT NOT NULL,
-                    started_at TEXT,
-                    completed_at TEXT,
-                    duration REAL,
-                    error_log TEXT,
-                    metadata TEXT
-                )
-            """)
-            
-            # Create tasks table
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS tasks (
-                    id TEXT PRIMARY KEY,
-                    benchmark_id TEXT NOT NULL,
-                    objective TEXT NOT NULL,
-                    description TEXT,
-                    strategy TEXT NOT NULL,
-                    mode TEXT NOT NULL,
-                    parameters TEXT,
-                    timeout INTEGER,
-                    max_retries INTEGER,
-                    priority INTEGER,
-                    status TEXT NOT NULL,
-                    created_at TEXT NOT NULL,
-                    started_at TEXT,
-                    completed_at TEXT,
-                    duration REAL,
-                    assigned_agents TEXT,
-                    parent_task_id TEXT,
-                    subtasks TEXT,
-                    dependencies TEXT,
-                    FOREIGN KEY (benchmark_id) REFERENCES benchmarks (id)
+    def _migrate_metric_columns(self, conn: sqlite3.Connection) -> None:
+        """Move JSON metric blobs (schema 1) into typed result columns."""
+        try:
+            conn.execute("SELECT json_extract('{}', '$.x')")
+        except sqlite3.OperationalError:
+            conn.create_function("json_extract", 2, _json_extract, deterministic=True)
+        
+        extracted = [
+            f"json_extract({group}, '$.{name}')" for group, name, _ in _METRIC_COLUMNS
+        ]
+        conn.execute("ALTER TABLE results RENAME TO results_v1")
+        conn.execute(_RESULTS_TABLE.format(table="results"))
+        conn.execute(
+            f"INSERT INTO results ({', '.join(_RESULT_COLUMNS)}) "
+            f"SELECT {', '.join(_RESULT_BASE_COLUMNS)}, {', '.join(extracted)} FROM results_v1"
+        )
+        # Dropping the old table also drops its indexes; _SCHEMA recreates them.
+        conn.execute("DROP TABLE results_v1")
+    
+    def _write_benchmarks(self, db_path: Path, benchmarks: List[Benchmark]) -> None:
+        """Write benchmarks, their tasks and results in one transaction."""
+        conn = self._connect(db_path)
+        with conn:
+            conn.executemany(_INSERT_BENCHMARK, (self._benchmark_row(b) for b in benchmarks))
+            for benchmark in benchmarks:
+                conn.executemany(
+                    _INSERT_TASK,
+                    (self._task_row(task, benchmark.id) for task in benchmark.tasks)
                 )
-            """)
-            
-            # Create results table
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS results (
-                    id TEXT PRIMARY KEY,
-                    benchmark_id TEXT NOT NULL,
-                    task_id TEXT NOT NULL,
-                    agent_id TEXT NOT NULL,
-                    status TEXT NOT NULL,
-                    output TEXT,
-                    errors TEXT,
-                    warnings TEXT,
-                    performance_metrics TEXT,
-                    quality_metrics TEXT,
-                    resource_usage TEXT,
-                    execution_details TEXT,
-                    created_at TEXT NOT NULL,
-                    started_at TEXT,
-                    completed_at TEXT,
-                    duration REAL,
-                    FOREIGN KEY (benchmark_id) REFERENCES benchmarks (id),
-                    FOREIGN KEY (task_id) REFERENCES tasks (id)
+                conn.executemany(
+                    _INSERT_RESULT,
+                    (self._result_row(result, benchmark.id) for result in benchmark.results)
                 )
-            """)
-            
-            # Create indexes for better query performance
-            await db.execute("CREATE INDEX IF NOT EXISTS idx_benchmarks_created_at ON benchmarks (created_at)")
-            await db.execute("CREATE INDEX IF NOT EXISTS idx_benchmarks_strategy ON benchmarks (strategy)")
-            await db.execute("CREATE INDEX IF NOT EXISTS idx_benchmarks_mode ON benchmarks (mode)")
-            await db.execute("CREATE INDEX IF NOT EXISTS idx_tasks_benchmark_id ON tasks (benchmark_id)")
-            await db.execute("CREATE INDEX IF NOT EXISTS idx_results_benchmark_id ON results (benchmark_id)")
-            await db.execute("CREATE INDEX IF NOT EXISTS idx_results_task_id ON results (task_id)")
+    
+    async def save_duration_model(self, model: DurationEstimator,
+                                  output_dir: Optional[Path] = None) -> Path:
+        """Store a duration model's stats, replacing earlier stats for the same keys.
+        
+        Args:
+            model: Estimator to save
+            output_dir: Directory of the results database (defaults to ``db_path``)
             
-            await db.commit()
+        Returns:
+            Path to database file
+        """
+        if output_dir is not None:
+            self.db_path = Path(output_dir) / "benchmark_results.db"
+        if self.db_path is None:
+            raise ValueError("No database path; pass output_dir")
+        await self._run(self._write_duration_stats, self.db_path, list(model.items()))
+        return self.db_path
+    
+    async def load_duration_model(self, model: Optional[DurationEstimator] = None) -> DurationEstimator:
+        """Load stored duration stats into ``model`` (a new estimator by default)."""
+        model = model if model is not None else DurationEstimator()
+        if not self.db_path or not self.db_path.exists():
+            return model
+        rows = await self._run(self._query, self.db_path, "SELECT * FROM duration_stats", ())
+        items = []
+        for row in rows:
+            stats = DurationStats(model.alpha)
+            stats.count = row["samples"]
+            stats.ewma = row["ewma"]
+            stats.sketch = QuantileSketch.from_dict(json.loads(row["sketch"]))
+            items.append(((row["agent_id"], row["strategy"], row["complexity"]), stats))
+        model.load(items)
+        return model
+    
+    def _write_duration_stats(self, db_path: Path,
+                              items: List[Tuple[Tuple[str, str, str], DurationStats]]) -> None:
+        conn = self._connect(db_path)
+        updated_at = datetime.now().isoformat()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO duration_stats "
+                "(agent_id, strategy, complexity, samples, ewma, sketch, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key + (stats.count, stats.ewma, json.dumps(stats.sketch.to_dict()), updated_at)
+                 for key, stats in items)
+            )
     
-    async def _insert_benchmark(self, db: aiosqlite.Connection, benchmark: Benchmark) -> None:
-        """Insert benchmark into database."""
-        await db.execute("""
-            INSERT OR REPLACE INTO benchmarks (
-                id, name, description, status, strategy, mode, config, metrics,
-                created_at, started_at, completed_at, duration, error_log, metadata
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+    def _query(self, db_path: Path, query: str, params: Iterable[Any]) -> List[Dict[str, Any]]:
+        conn = self._connect(db_path)
+        return [dict(row) for row in conn.execute(query, tuple(params)).fetchall()]
+    
+    def _benchmark_row(self, benchmark: Benchmark) -> Tuple:
+        """Row values for the benchmarks table."""
+        return (
             benchmark.id,
             benchmark.name,
             benchmark.description,
@@ -149,26 +452,20 @@ class SQLiteManager:
             benchmark.started_at.isoformat() if benchmark.started_at else None,
             benchmark.completed_at.isoformat() if benchmark.completed_at else None,
             benchmark.duration(),
-            json.dumps(benchmark.error_log),
-            json.dumps(benchmark.metadata)
-        ))
+            _dumps(benchmark.error_log),
+            _dumps(benchmark.metadata)
+        )
     
-    async def _insert_task(self, db: aiosqlite.Connection, task: Task, benchmark_id: str) -> None:
-        """Insert task into database."""
-        await db.execute("""
-            INSERT OR REPLACE INTO tasks (
-                id, benchmark_id, objective, description, strategy, mode, parameters,
-                timeout, max_retries, priority, status, created_at, started_at,
-                completed_at, duration, assigned_agents, parent_task_id, subtasks, dependencies
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+    def _task_row(self, task: Task, benchmark_id: str) -> Tuple:
+        """Row values for the tasks table."""
+        return (
             task.id,
             benchmark_id,
             task.objective,
             task.description,
             task.strategy.value,
             task.mode.value,
-            json.dumps(task.parameters),
+            _dumps(task.parameters),
             task.timeout,
             task.max_retries,
             task.priority,
@@ -177,44 +474,41 @@ class SQLiteManager:
             task.started_at.isoformat() if task.started_at else None,
             task.completed_at.isoformat() if task.completed_at else None,
             task.duration(),
-            json.dumps(task.assigned_agents),
+            _dumps(task.assigned_agents),
             task.parent_task_id,
-            json.dumps(task.subtasks),
-            json.dumps(task.dependencies)
-        ))
+            _dumps(task.subtasks),
+            _dumps(task.dependencies)
+        )
     
-    async def _insert_result(self, db: aiosqlite.Connection, result: Result, benchmark_id: str) -> None:
-        """Insert result into database."""
-        await db.execute("""
-            INSERT OR REPLACE INTO results (
-                id, benchmark_id, task_id, agent_id, status, output, errors, warnings,
-                performance_metrics, quality_metrics, resource_usage, execution_details,
-                created_at, started_at, completed_at, duration
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+    def _result_row(self, result: Result, benchmark_id: str) -> Tuple:
+        """Row values for the results table."""
+        return (
             result.id,
             benchmark_id,
             result.task_id,
             result.agent_id,
             result.status.value,
-            json.dumps(result.output),
-            json.dumps(result.errors),
-            json.dumps(result.warnings),
-            json.dumps(self._performance_metrics_to_dict(result.performance_metrics)),
-            json.dumps(self._quality_metrics_to_dict(result.quality_metrics)),
-            json.dumps(self._resource_usage_to_dict(result.resource_usage)),
-            json.dumps(result.execution_details),
+            _dumps(result.output),
+            _dumps(result.errors),
+            _dumps(result.warnings),
+            _dumps(result.execution_details),
             result.created_at.isoformat(),
             result.started_at.isoformat() if result.started_at else None,
             result.completed_at.isoformat() if result.completed_at else None,
-            result.duration()
-        ))
+            result.duration(),
+        ) + tuple(
+            getattr(getattr(result, group), name) for group, name, _ in _METRIC_COLUMNS
+        )
     
     async def query_benchmarks(self, 
                               strategy: Optional[str] = None,
                               mode: Optional[str] = None,
                               limit: int = 10) -> List[Dict[str, Any]]:
-        """Query benchmarks from database."""
+        """Query benchmarks from database.
+        
+        Each row carries its result aggregates (count, success rate and
+        execution time mean/p50/p95/max) under ``result_stats``.
+        """
         if not self.db_path or not self.db_path.exists():
             return []
         
@@ -232,22 +526,111 @@ class SQLiteManager:
         query += " ORDER BY created_at DESC LIMIT ?"
         params.append(limit)
         
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            cursor = await db.execute(query, params)
-            rows = await cursor.fetchall()
-            return [dict(row) for row in rows]
+        benchmarks = await self._run(self._query, self.db_path, query, params)
+        if benchmarks:
+            stats = await self.aggregate_results(
+                group_by="benchmark_id", benchmark_ids=[b["id"] for b in benchmarks]
+            )
+            by_id = {row.pop("benchmark_id"): row for row in stats}
+            for benchmark in benchmarks:
+                benchmark["result_stats"] = by_id.get(benchmark["id"])
+        return benchmarks
     
     async def get_benchmark(self, benchmark_id: str) -> Optional[Dict[str, Any]]:
-        """Get specific benchmark by ID."""
+        """Get specific benchmark by ID, with result aggregates per agent."""
         if not self.db_path or not self.db_path.exists():
             return None
         
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            cursor = await db.execute("SELECT * FROM benchmarks WHERE id = ?", (benchmark_id,))
-            row = await cursor.fetchone()
-            return dict(row) if row else None
+        rows = await self._run(
+            self._query, self.db_path, "SELECT * FROM benchmarks WHERE id = ?", (benchmark_id,)
+        )
+        if not rows:
+            return None
+        
+        benchmark = rows[0]
+        stats = await self.aggregate_results(group_by="benchmark_id", benchmark_ids=[benchmark_id])
+        benchmark["result_stats"] = stats[0] if stats else None
+        if benchmark["result_stats"]:
+            benchmark["result_stats"].pop("benchmark_id")
+        benchmark["agent_stats"] = await self.aggregate_results(
+            group_by="agent_id", benchmark_ids=[benchmark_id]
+        )
+        return benchmark
+    
+    async def aggregate_results(self,
+                                group_by: str = "strategy",
+                                strategy: Optional[str] = None,
+                                mode: Optional[str] = None,
+                                benchmark_ids: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Aggregate result metrics per group, computed inside SQLite.
+        
+        Args:
+            group_by: One of ``strategy``, ``mode``, ``benchmark_id``,
+                ``agent_id`` or ``status``
+            strategy: Only include benchmarks with this strategy
+            mode: Only include benchmarks with this coordination mode
+            benchmark_ids: Only include these benchmarks
+            
+        Returns:
+            One row per group with ``results``, ``success_rate``,
+            ``mean_execution_time``, ``p50_execution_time``,
+            ``p95_execution_time``, ``max_execution_time`` and
+            ``peak_memory_mb``. Percentiles use the nearest-rank method over
+            results with a positive execution time.
+        """
+        if group_by not in _AGGREGATE_GROUPS:
+            raise ValueError(f"Cannot group results by {group_by!r}")
+        if not self.db_path or not self.db_path.exists():
+            return []
+        
+        conditions = []
+        params: List[Any] = []
+        if strategy:
+            conditions.append("b.strategy = ?")
+            params.append(strategy)
+        if mode:
+            conditions.append("b.mode = ?")
+            params.append(mode)
+        if benchmark_ids is not None:
+            conditions.append(f"r.benchmark_id IN ({', '.join('?' for _ in benchmark_ids)})")
+            params.extend(benchmark_ids)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        
+        group = _AGGREGATE_GROUPS[group_by]
+        query = f"""
+            WITH scoped AS (
+                SELECT {group} AS grp, r.status, r.execution_time, r.peak_memory_mb
+                FROM results r JOIN benchmarks b ON b.id = r.benchmark_id
+                {where}
+            ),
+            totals AS (
+                SELECT grp, COUNT(*) AS results,
+                       AVG(status = 'success') AS success_rate,
+                       MAX(peak_memory_mb) AS peak_memory_mb
+                FROM scoped GROUP BY grp
+            ),
+            ranked AS (
+                SELECT grp, execution_time,
+                       ROW_NUMBER() OVER (PARTITION BY grp ORDER BY execution_time) AS rn,
+                       COUNT(*) OVER (PARTITION BY grp) AS n
+                FROM scoped WHERE execution_time > 0
+            ),
+            timings AS (
+                SELECT grp,
+                       AVG(execution_time) AS mean_execution_time,
+                       MAX(CASE WHEN rn = {_nearest_rank(0.50)} THEN execution_time END) AS p50_execution_time,
+                       MAX(CASE WHEN rn = {_nearest_rank(0.95)} THEN execution_time END) AS p95_execution_time,
+                       MAX(execution_time) AS max_execution_time
+                FROM ranked GROUP BY grp
+            )
+            SELECT totals.grp AS {group_by}, totals.results, totals.success_rate,
+                   timings.mean_execution_time, timings.p50_execution_time,
+                   timings.p95_execution_time, timings.max_execution_time,
+                   totals.peak_memory_mb
+            FROM totals LEFT JOIN timings ON timings.grp = totals.grp
+            ORDER BY totals.grp
+        """
+        return await self._run(self._query, self.db_path, query, params)
     
     def _config_to_dict(self, config) -> Dict[str, Any]:
         """Convert config to dictionary."""
@@ -290,41 +673,3 @@ class SQLiteManager:
             "total_cpu_time": metrics.total_cpu_time,
             "network_overhead": metrics.network_overhead
         }
-    
-    def _performance_metrics_to_dict(self, metrics) -> Dict[str, Any]:
-        """Convert performance metrics to dictionary."""
-        return {
-            "execution_time": metrics.execution_time,
-            "queue_time": metrics.queue_time,
-            "throughput": metrics.throughput,
-            "success_rate": metrics.success_rate,
-            "error_rate": metrics.error_rate,
-            "retry_count": metrics.retry_count,
-            "coordination_overhead": metrics.coordination_overhead,
-            "communication_latency": metrics.communication_latency
-        }
-    
-    def _quality_metrics_to_dict(self, metrics) -> Dict[str, Any]:
-        """Convert quality metrics to dictionary."""
-        return {
-            "accuracy_score": metrics.accuracy_score,
-            "completeness_score": metrics.completeness_score,
-            "consistency_score": metrics.consistency_score,
-            "relevance_score": metrics.relevance_score,
-            "overall_quality": metrics.overall_quality,
-            "review_score": metrics.review_score,
-            "automated_score": metrics.automated_score
-        }
-    
-    def _resource_usage_to_dict(self, usage) -> Dict[str, Any]:
-        """Convert resource usage to dictionary."""
-        return {
-            "cpu_percent": usage.cpu_percent,
-            "memory_mb": usage.memory_mb,
-            "network_bytes_sent": usage.network_bytes_sent,
-            "network_bytes_recv": usage.network_bytes_recv,
-            "disk_bytes_read": usage.disk_bytes_read,
-            "disk_bytes_write": usage.disk_bytes_write,
-            "peak_memory_mb": usage.peak_memory_mb,
-            "average_cpu_percent": usage.average_cpu_percent
-        }
\ No newline at end of file
@@ -0,0 +1,115 @@
+"""Unit tests for constant-time agent performance statistics."""
+
+import statistics
+import unittest
+
+from swarm_benchmark.core.models import (
+    AGENT_RESERVOIR_SIZE, AGENT_WINDOW_SIZE, Agent, PerformanceMetrics
+)
+from swarm_benchmark.core.streaming_stats import Reservoir, RollingWindow
+
+
+def _metrics(seconds: float, succeeded: bool = True) -> PerformanceMetrics:
+    return PerformanceMetrics(execution_time=seconds, success_rate=1.0 if succeeded else 0.0)
+
+
+class TestRollingWindow(unittest.TestCase):
+    """Test RollingWindow eviction and running sum."""
+
+    def test_mean_of_last_values(self):
+        """Test only the newest ``size`` values count."""
+        window = RollingWindow(3)
+        self.assertEqual(window.mean(default=7.0), 7.0)
+        for value in (1.0, 2.0, 3.0, 10.0):
+            window.add(value)
+
+        self.assertEqual(list(window), [2.0, 3.0, 10.0])
+        self.assertEqual(window.total, 15.0)
+        self.assertEqual(window.mean(), 5.0)
+
+    def test_running_sum_does_not_drift(self):
+        """Test the sum is resynced after values of mixed magnitude."""
+        window = RollingWindow(4)
+        for _ in range(50):
+            for value in (1e16, 1.0, -1e16, 1.0):
+                window.add(value)
+        for _ in range(4):
+            window.add(0.5)
+
+        self.assertEqual(window.total, 2.0)
+        self.assertEqual(window.mean(), 0.5)
+
+
+class TestReservoir(unittest.TestCase):
+    """Test Reservoir sampling and quantiles."""
+
+    def test_exact_until_full(self):
+        """Test interpolated quantiles match the data below capacity."""
+        reservoir = Reservoir(size=10)
+        for value in (5.0, 1.0, 4.0, 2.0, 3.0):
+            reservoir.add(value)
+
+        self.assertEqual(reservoir.quantile(0.0), 1.0)
+        self.assertEqual(reservoir.quantile(0.5), 3.0)
+        self.assertEqual(reservoir.quantile(0.875), 4.5)
+        self.assertEqual(reservoir.quantile(1.0), 5.0)
+
+    def test_bounded_and_representative(self):
+        """Test the sample stays at capacity and tracks the distribution."""
+        reservoir = Reservoir(size=200, seed=7)
+        for value in range(10000):
+            reservoir.add(float(value))
+
+        self.assertEqual(len(reservoir), 200)
+        self.assertEqual(reservoir.count, 10000)
+        self.assertAlmostEqual(reservoir.quantile(0.5), 5000.0, delta=1000.0)
+
+
+class TestAgentStatistics(unittest.TestCase):
+    """Test Agent.update_performance summaries."""
+
+    def test_history_is_opt_in(self):
+        """Test metrics are only retained when ``keep_history`` is set."""
+        agent = Agent()
+        tracked = Agent(keep_history=True)
+        for seconds in (1.0, 2.0):
+            agent.update_performance(_metrics(seconds))
+            tracked.update_performance(_metrics(seconds))
+
+        self.assertEqual(agent.performance_history, [])
+        self.assertEqual(len(tracked.performance_history), 2)
+        self.assertEqual(agent.average_execution_time, tracked.average_execution_time)
+
+    def test_lifetime_and_recent_statistics(self):
+        """Test exact lifetime figures alongside the rolling window."""
+        agent = Agent()
+        times = [float(i % 50 + 1) for i in range(1000)]
+        for i, seconds in enumerate(times):
+            agent.update_performance(_metrics(seconds, succeeded=i < 900))
+        agent.update_performance(_metrics(0.0))
+
+        self.assertEqual(agent.total_tasks_completed, 901)
+        self.assertEqual(agent.total_tasks_failed, 100)
+        self.assertAlmostEqual(agent.average_execution_time, statistics.mean(times))
+        self.assertAlmostEqual(agent.recent_success_rate, 1 / AGENT_WINDOW_SIZE)
+        self.assertAlmostEqual(agent.recent_average_execution_time,
+                               statistics.mean(times[-AGENT_WINDOW_SIZE:]))
+        self.assertEqual(len(agent._execution_time_sample), AGENT_RESERVOIR_SIZE)
+        self.assertLessEqual(agent.p50_execution_time, agent.p95_execution_time)
+        self.assertGreater(agent.p95_execution_time, 40.0)
+
+    def test_percentiles_and_ewma(self):
+        """Test percentiles are exact for short histories and the EWMA follows recent times."""
+        agent = Agent()
+        self.assertEqual(agent.p95_execution_time, 0.0)
+        self.assertEqual(agent.recent_success_rate, 1.0)
+        for seconds in range(1, 21):
+            agent.update_performance(_metrics(float(seconds)))
+
+        self.assertEqual(agent.p50_execution_time, 10.5)
+        self.assertAlmostEqual(agent.p95_execution_time, 19.05)
+        self.assertGreater(agent.ewma_execution_time, agent.average_execution_time)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,10 +2,16 @@
 
 import unittest
 import asyncio
+import json
+import tempfile
+import time
+from pathlib import Path
 from unittest.mock import patch, MagicMock
 from swarm_benchmark.core.benchmark_engine import BenchmarkEngine
+from swarm_benchmark.output.json_writer import JSONWriter
+from swarm_benchmark.output.parquet_writer import ParquetReader
 from swarm_benchmark.core.models import (
-    BenchmarkConfig, Task, StrategyType, CoordinationMode, TaskStatus
+    BenchmarkConfig, Task, StrategyType, CoordinationMode, TaskStatus, Result, ResultStatus
 )
 
 
@@ -143,5 +149,140 @@ class TestBenchmarkEngine(unittest.TestCase):
         self.assertEqual(result_dict["resource_usage"]["memory_mb"], 128.0)
 
 
+class SleepStrategy:
+    """Strategy stand-in that sleeps for the seconds in the task parameters."""
+    
+    def __init__(self):
+        self.execution_history = []
+    
+    async def execute(self, task):
+        await asyncio.sleep(task.parameters.get("sleep", 0))
+        if task.parameters.get("fail"):
+            raise RuntimeError("strategy failed")
+        self.execution_history.append(task.id)
+        return Result(task_id=task.id, status=ResultStatus.SUCCESS)
+
+
+class HangingStrategy(SleepStrategy):
+    """Strategy stand-in that never finishes."""
+    
+    async def execute(self, task):
+        await asyncio.Event().wait()
+
+
+@patch('swarm_benchmark.core.benchmark_engine.create_strategy', side_effect=lambda name: SleepStrategy())
+class TestBatchExecution(unittest.TestCase):
+    """Test concurrent BenchmarkEngine.execute_batch."""
+    
+    def _engine(self, **config):
+        return BenchmarkEngine(BenchmarkConfig(**config))
+    
+    def test_concurrent_batch_and_strategy_reuse(self, mock_create_strategy):
+        """Test batches run max_agents at a time with one strategy per type."""
+        engine = self._engine(max_agents=4, parallel=True)
+        tasks = [Task(objective=f"t{i}", strategy=StrategyType.AUTO if i % 2 else StrategyType.RESEARCH,
+                      parameters={"sleep": 0.1}) for i in range(8)]
+        
+        start = time.perf_counter()
+        results = asyncio.run(engine.execute_batch(tasks))
+        elapsed = time.perf_counter() - start
+        
+        self.assertEqual([r.task_id for r in results], [t.id for t in tasks])
+        self.assertLess(elapsed, 0.1 * 8 / 2)
+        self.assertEqual(mock_create_strategy.call_count, 2)
+        self.assertEqual(len(engine._strategy(StrategyType.AUTO).execution_history), 4)
+    
+    def test_sequential_without_parallel(self, mock_create_strategy):
+        """Test the batch runs one task at a time unless parallel is set."""
+        self.assertEqual(self._engine(max_agents=4).concurrency, 1)
+    
+    def test_stream_timeout_and_errors(self, mock_create_strategy):
+        """Test results stream in completion order with timeout and error statuses."""
+        engine = self._engine(max_agents=3, parallel=True)
+        slow = Task(objective="slow", parameters={"sleep": 5}, timeout=0.05)
+        broken = Task(objective="broken", parameters={"sleep": 0.02, "fail": True})
+        quick = Task(objective="quick")
+        
+        async def collect():
+            return [result async for result in engine.stream_batch([slow, broken, quick])]
+        
+        results = asyncio.run(collect())
+        
+        self.assertEqual([r.task_id for r in results], [quick.id, broken.id, slow.id])
+        self.assertEqual(results[1].status, ResultStatus.ERROR)
+        self.assertEqual(results[1].errors, ["strategy failed"])
+        self.assertEqual(results[2].status, ResultStatus.TIMEOUT)
+    
+    def test_stream_batch_writes_ndjson_while_running(self, mock_create_strategy):
+        """Test NDJSON output is written during the batch and closed when it is abandoned."""
+        tasks = [Task(objective=f"t{i}", parameters={"sleep": 0.01 * i}) for i in range(4)]
+        
+        async def collect(engine, limit):
+            seen = []
+            batches = engine.stream_batch(tasks)
+            async for result in batches:
+                seen.append(result)
+                if len(seen) == limit:
+                    break
+            await batches.aclose()
+            return seen
+        
+        for limit, status in ((None, "completed"), (2, "cancelled")):
+            with tempfile.TemporaryDirectory() as tmp:
+                engine = self._engine(max_agents=4, parallel=True, output_formats=["ndjson"],
+                                      output_directory=tmp)
+                results = asyncio.run(collect(engine, limit))
+                path, = Path(tmp).glob("*.ndjson")
+                records = [json.loads(line) for line in path.read_text().splitlines()]
+                streamed = [r["task_id"] for r in JSONWriter.read_results(path)]
+            
+            self.assertEqual(records[0]["type"], "benchmark")
+            self.assertEqual(records[-1]["type"], "summary")
+            self.assertEqual(records[-1]["status"], status)
+            self.assertEqual(streamed, [r.task_id for r in results])
+    
+    def test_run_benchmark_streams_ndjson(self, mock_create_strategy):
+        """Test run_benchmark writes its NDJSON file once, through the stream."""
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = self._engine(output_formats=["ndjson"], output_directory=tmp)
+            with patch.object(JSONWriter, "save_benchmark") as save_benchmark:
+                outcome = asyncio.run(engine.run_benchmark("objective"))
+            
+            save_benchmark.assert_not_called()
+            path, = Path(tmp).glob("*.ndjson")
+            records = [json.loads(line) for line in path.read_text().splitlines()]
+        
+        self.assertEqual([r["type"] for r in records], ["benchmark", "result", "summary"])
+        self.assertEqual(records[1]["id"], outcome["results"][0]["id"])
+        self.assertEqual(records[-1]["status"], "completed")
+    
+    def test_run_benchmark_times_out(self, mock_create_strategy):
+        """Test the main benchmark task gets a timeout result at its deadline."""
+        mock_create_strategy.side_effect = lambda name: HangingStrategy()
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = self._engine(task_timeout=0.05, output_directory=tmp)
+            start = time.perf_counter()
+            outcome = asyncio.run(engine.run_benchmark("objective"))
+            elapsed = time.perf_counter() - start
+        
+        self.assertLess(elapsed, 2)
+        self.assertEqual(outcome["status"], "success")
+        self.assertEqual(outcome["results"][0]["status"], ResultStatus.TIMEOUT.value)
+        self.assertEqual(engine.current_benchmark.tasks[0].status, TaskStatus.TIMEOUT)
+    
+    def test_run_benchmark_writes_samples_table(self, mock_create_strategy):
+        """Test monitored columnar output includes the collector's time series."""
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = self._engine(output_formats=["parquet"], output_directory=tmp)
+            asyncio.run(engine.run_benchmark("objective"))
+            reader = ParquetReader(Path(tmp) / "columnar")
+            samples = reader.load_samples()
+            results = reader.load_results()
+        
+        self.assertEqual(len(results), 1)
+        self.assertGreater(len(samples), 0)
+        self.assertEqual({s["benchmark_id"] for s in samples}, {engine.current_benchmark.id})
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,6 +1,7 @@
 """Comprehensive unit tests for data models."""
 
 import unittest
+from unittest.mock import patch
 from datetime import datetime, timedelta
 from swarm_benchmark.core.models import (
     Task, Agent, Result, Benchmark, BenchmarkConfig,
@@ -199,6 +200,47 @@ class TestBenchmarkMetrics(unittest.TestCase):
         self.assertEqual(metrics.total_execution_time, 30.0)
         self.assertAlmostEqual(metrics.quality_score, 0.85, places=2)
         self.assertEqual(metrics.peak_memory_usage, 150.0)
+    
+    def test_incremental_update_matches_full_recompute(self):
+        """Test per-result updates give the same numbers as a full recompute."""
+        statuses = [ResultStatus.SUCCESS, ResultStatus.FAILURE, ResultStatus.ERROR,
+                    ResultStatus.TIMEOUT, ResultStatus.SUCCESS]
+        results = [
+            Result(
+                status=statuses[i % len(statuses)],
+                performance_metrics=PerformanceMetrics(execution_time=(i % 7) * 0.37),
+                quality_metrics=QualityMetrics(overall_quality=(i % 4) * 0.21),
+                resource_usage=ResourceUsage(peak_memory_mb=(i * 13) % 97)
+            )
+            for i in range(500)
+        ]
+        
+        benchmark = Benchmark()
+        for result in results:
+            benchmark.add_result(result)
+        
+        recomputed = BenchmarkMetrics()
+        recomputed.update_from_results(results)
+        
+        self.assertEqual(benchmark.metrics, recomputed)
+        self.assertEqual(benchmark.metrics.execution_time_percentile(0.95),
+                         recomputed.execution_time_percentile(0.95))
+        
+        # A second recompute must not double count.
+        benchmark.metrics.update_from_results(benchmark.results)
+        self.assertEqual(benchmark.metrics, recomputed)
+    
+    def test_execution_time_percentiles(self):
+        """Test execution time quantiles are tracked within sketch accuracy."""
+        metrics = BenchmarkMetrics()
+        for i in range(1, 1001):
+            metrics.update_from_result(
+                Result(performance_metrics=PerformanceMetrics(execution_time=i / 100))
+            )
+        
+        self.assertAlmostEqual(metrics.execution_time_percentile(0.5), 5.0, delta=0.1)
+        self.assertAlmostEqual(metrics.execution_time_percentile(0.95), 9.5, delta=0.2)
+        self.assertNotIn('_execution_time_sketch', metrics.to_dict())
 
 
 class TestBenchmark(unittest.TestCase):
@@ -266,6 +308,49 @@ class TestBenchmark(unittest.TestCase):
         self.assertEqual(task_results[0], result)
         self.assertEqual(agent_results[0], result)
     
+    def test_benchmark_indexes_follow_direct_list_mutation(self):
+        """Test lookups stay correct when lists are mutated or replaced directly."""
+        benchmark = Benchmark()
+        first, second = Task(objective="first"), Task(objective="second")
+        
+        benchmark.tasks.append(first)
+        self.assertIs(benchmark.get_task_by_id(first.id), first)
+        
+        benchmark.tasks[0] = second
+        self.assertIsNone(benchmark.get_task_by_id(first.id))
+        self.assertIs(benchmark.get_task_by_id(second.id), second)
+        
+        benchmark.tasks = [first]
+        self.assertIs(benchmark.get_task_by_id(first.id), first)
+        self.assertIsNone(benchmark.get_task_by_id(second.id))
+        
+        results = [Result(task_id=first.id, agent_id="a"), Result(task_id=first.id, agent_id="b")]
+        benchmark.results.extend(results)
+        self.assertEqual(benchmark.get_results_by_task_id(first.id), results)
+        benchmark.results.remove(results[0])
+        self.assertEqual(benchmark.get_results_by_agent_id("a"), [])
+        self.assertEqual(benchmark.get_results_by_task_id(first.id), [results[1]])
+    
+    def test_benchmark_lookups_hit_index(self):
+        """Test lookups are served from the index and rebuilt only after direct mutation."""
+        benchmark = Benchmark()
+        results = [Result(task_id=f"task-{i}", agent_id=f"agent-{i % 5}") for i in range(100)]
+        for result in results:
+            benchmark.add_result(result)
+        
+        with patch.object(benchmark, "_rebuild_index", wraps=benchmark._rebuild_index) as rebuild:
+            for i in range(100):
+                self.assertEqual(benchmark.get_results_by_task_id(f"task-{i}"), [results[i]])
+            self.assertEqual(len(benchmark.get_results_by_agent_id("agent-0")), 20)
+            benchmark.add_result(Result(task_id="task-0", agent_id="agent-0"))
+            self.assertEqual(len(benchmark.get_results_by_task_id("task-0")), 2)
+            self.assertEqual(rebuild.call_count, 0)
+            
+            benchmark.results.pop()
+            self.assertEqual(benchmark.get_results_by_task_id("task-0"), [results[0]])
+            self.assertEqual(benchmark.get_results_by_agent_id("agent-0"), results[::5])
+            self.assertEqual(rebuild.call_count, 1)
+    
     def test_benchmark_duration_calculation(self):
         """Test benchmark duration calculation."""
         benchmark = Benchmark()
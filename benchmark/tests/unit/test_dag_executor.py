@@ -0,0 +1,166 @@
+"""Unit tests for dependency-aware task execution."""
+
+import asyncio
+import time
+import unittest
+
+from swarm_benchmark.core.dag_executor import DAGExecutor, DependencyCycleError, TaskGraph
+from swarm_benchmark.core.models import Result, ResultStatus, Task
+from swarm_benchmark.core.parallel_executor import ExecutionMode, ParallelExecutor, ResourceLimits
+from swarm_benchmark.core.task_scheduler import TaskScheduler
+
+
+def _chain(length: int):
+    tasks = [Task(objective=f"t{i}") for i in range(length)]
+    for before, after in zip(tasks, tasks[1:]):
+        after.dependencies.append(before.id)
+    return tasks
+
+
+class TestTaskGraph(unittest.TestCase):
+    """Test TaskGraph indexing, cycles and critical path."""
+
+    def test_cycle_is_reported(self):
+        """Test a cycle raises with the tasks that form it."""
+        a, b, c, d = (Task(objective=name) for name in "abcd")
+        b.dependencies.append(a.id)
+        c.dependencies.append(b.id)
+        a.dependencies.append(c.id)
+        d.dependencies.append(a.id)
+
+        with self.assertRaises(DependencyCycleError) as error:
+            TaskGraph([a, b, c, d])
+        cycle = error.exception.cycle
+        self.assertEqual(cycle[0], cycle[-1])
+        self.assertEqual(set(cycle), {a.id, b.id, c.id})
+        with self.assertRaises(DependencyCycleError):
+            TaskScheduler()._calculate_dependency_levels([a, b, c, d])
+
+    def test_critical_path_and_subtasks(self):
+        """Test subtasks gate their parent and the longest chain is found."""
+        parent = Task(objective="parent")
+        sub1 = Task(objective="sub1", parent_task_id=parent.id)
+        sub2 = Task(objective="sub2")
+        parent.subtasks.append(sub2.id)
+        prep = Task(objective="prep")
+        sub2.dependencies.append(prep.id)
+
+        graph = TaskGraph([parent, sub1, sub2, prep], estimate=lambda t: 1.5 if t is sub1 else 1.0)
+        self.assertEqual(set(graph.dependencies[parent.id]), {sub1.id, sub2.id})
+        self.assertEqual(graph.critical_path(), [prep.id, sub2.id, parent.id])
+        self.assertEqual(graph.rank[sub1.id], 2.5)
+
+    def test_deep_graph_without_recursion(self):
+        """Test long chains index and level without hitting the recursion limit."""
+        tasks = _chain(20000)
+        graph = TaskGraph(reversed(tasks))
+
+        self.assertEqual(graph.order[0], tasks[0].id)
+        self.assertEqual(graph.rank[tasks[0].id], 20000)
+        levels = TaskScheduler()._calculate_dependency_levels(tasks)
+        self.assertEqual(levels[tasks[-1].id], 19999)
+
+
+class TestDAGExecutor(unittest.TestCase):
+    """Test DAGExecutor ordering, concurrency and failure handling."""
+
+    def test_dependencies_and_concurrency(self):
+        """Test dependents wait, branches overlap and the limit is honoured."""
+        running = set()
+        peak = [0]
+        finished = []
+
+        async def run(task):
+            running.add(task.id)
+            peak[0] = max(peak[0], len(running))
+            await asyncio.sleep(0.05)
+            running.discard(task.id)
+            finished.append(task.objective)
+            return Result(task_id=task.id, status=ResultStatus.SUCCESS)
+
+        root = Task(objective="root")
+        branches = [Task(objective=f"branch{i}", dependencies=[root.id]) for i in range(6)]
+        join = Task(objective="join", dependencies=[b.id for b in branches])
+
+        start = time.perf_counter()
+        results = asyncio.run(DAGExecutor(run, max_concurrency=3).execute([join, *branches, root]))
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(len(results), 8)
+        self.assertEqual(finished[0], "root")
+        self.assertEqual(finished[-1], "join")
+        self.assertEqual(peak[0], 3)
+        self.assertLess(elapsed, 0.05 * 8)
+
+    def test_critical_path_starts_first(self):
+        """Test the head of the longest chain is dispatched before short branches."""
+        order = []
+
+        async def run(task):
+            order.append(task.objective)
+            return Result(task_id=task.id)
+
+        short = Task(objective="short", priority=5)
+        chain = _chain(3)
+        asyncio.run(DAGExecutor(run, max_concurrency=1).execute([short, *chain]))
+
+        self.assertEqual(order[0], "t0")
+
+    def test_failure_cancels_dependents(self):
+        """Test failed tasks cancel everything downstream but not siblings."""
+        async def run(task):
+            if task.objective == "t1":
+                raise RuntimeError("boom")
+            return Result(task_id=task.id, status=ResultStatus.SUCCESS)
+
+        chain = _chain(4)
+        sibling = Task(objective="sibling", dependencies=[chain[0].id])
+        results = asyncio.run(DAGExecutor(run).execute(chain + [sibling]))
+
+        self.assertEqual(results[chain[1].id].status, ResultStatus.ERROR)
+        self.assertEqual(results[chain[1].id].errors, ["boom"])
+        self.assertEqual(results[chain[2].id].status, ResultStatus.CANCELLED)
+        self.assertEqual(results[chain[3].id].status, ResultStatus.CANCELLED)
+        self.assertEqual(results[sibling.id].status, ResultStatus.SUCCESS)
+
+
+class GraphExecutor(ParallelExecutor):
+    """Executor that records dispatch order instead of running strategies."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.dispatch_order = []
+
+    async def _execute_task(self, task: Task) -> Result:
+        self.dispatch_order.append(task.objective)
+        await asyncio.sleep(0.01)
+        return Result(task_id=task.id, status=ResultStatus.SUCCESS)
+
+
+class TestParallelExecutorGraph(unittest.TestCase):
+    """Test ParallelExecutor.execute_graph."""
+
+    def test_execute_graph(self):
+        """Test the worker pool runs tasks only after their dependencies."""
+        async def run_test():
+            executor = GraphExecutor(
+                mode=ExecutionMode.ASYNCIO,
+                limits=ResourceLimits(max_cpu_percent=1e9, max_memory_mb=1e9, max_concurrent_tasks=4)
+            )
+            await executor.start()
+            tasks = _chain(5)
+            tasks.append(Task(objective="side", dependencies=[tasks[0].id]))
+            results = await executor.execute_graph(list(reversed(tasks)))
+            await executor.stop()
+            return executor, results
+
+        executor, results = asyncio.run(run_test())
+
+        self.assertEqual(len(results), 6)
+        chain_order = [name for name in executor.dispatch_order if name != "side"]
+        self.assertEqual(chain_order, ["t0", "t1", "t2", "t3", "t4"])
+        self.assertFalse(executor._waiters)
+
+
+if __name__ == "__main__":
+    unittest.main()
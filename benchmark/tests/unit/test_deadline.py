@@ -0,0 +1,177 @@
+"""Unit tests for per-task deadlines."""
+
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+import psutil
+
+from swarm_benchmark.core.claude_flow_executor import ClaudeFlowExecutor
+from swarm_benchmark.core.deadline import effective_timeout
+from swarm_benchmark.core.models import Result, ResultStatus, Task, TaskStatus
+from swarm_benchmark.core.parallel_executor import ExecutionMode, ParallelExecutor, ResourceLimits
+
+
+class HangingStrategy:
+    """Strategy stand-in that sleeps, or blocks, for the seconds in the task parameters."""
+    
+    async def execute(self, task):
+        time.sleep(task.parameters.get("block", 0))
+        await asyncio.sleep(task.parameters.get("sleep", 0))
+        return Result(task_id=task.id, status=ResultStatus.SUCCESS)
+
+
+def _limits(**overrides) -> ResourceLimits:
+    values = dict(max_cpu_percent=1e9, max_memory_mb=1e9, max_concurrent_tasks=1)
+    values.update(overrides)
+    return ResourceLimits(**values)
+
+
+class TestEffectiveTimeout(unittest.TestCase):
+    """Test effective_timeout."""
+    
+    def test_tightest_positive(self):
+        """Test unset and non-positive timeouts are ignored."""
+        self.assertEqual(effective_timeout(3600, None, 0, 300), 300)
+        self.assertIsNone(effective_timeout(None, 0))
+
+
+@patch('swarm_benchmark.strategies.create_strategy', side_effect=lambda name: HangingStrategy())
+class TestExecutorDeadlines(unittest.TestCase):
+    """Test ParallelExecutor deadlines in every execution mode."""
+    
+    def _run(self, mode: ExecutionMode):
+        async def run_test():
+            executor = ParallelExecutor(mode=mode, limits=_limits())
+            await executor.start()
+            hung = Task(objective="hung", parameters={"sleep": 30}, timeout=0.2)
+            quick = Task(objective="quick")
+            await executor.submit_batch([(hung, 2), (quick, 1)])
+            start = time.perf_counter()
+            completed = await executor.wait_for_completion(timeout=10)
+            elapsed = time.perf_counter() - start
+            await executor.stop()
+            return executor, hung, quick, completed, elapsed
+        
+        return asyncio.run(run_test())
+    
+    def _check(self, executor, hung, quick, completed, elapsed):
+        self.assertTrue(completed)
+        self.assertLess(elapsed, 5)
+        result = executor.completed_tasks[hung.id]
+        self.assertEqual(result.status, ResultStatus.TIMEOUT)
+        self.assertEqual(hung.status, TaskStatus.TIMEOUT)
+        self.assertGreaterEqual(result.performance_metrics.execution_time, 0.2)
+        self.assertIsNotNone(result.started_at)
+        self.assertEqual(executor.completed_tasks[quick.id].status, ResultStatus.SUCCESS)
+        self.assertEqual(executor.metrics.tasks_timed_out, 1)
+    
+    def test_asyncio_mode(self, mock_create_strategy):
+        """Test a hung coroutine times out and the worker takes the next task."""
+        self._check(*self._run(ExecutionMode.ASYNCIO))
+    
+    def test_thread_mode(self, mock_create_strategy):
+        """Test the single pool thread is freed for the next task."""
+        self._check(*self._run(ExecutionMode.THREAD))
+    
+    def test_blocked_thread_keeps_its_slot(self, mock_create_strategy):
+        """Test a thread still blocked after its deadline is not counted as free."""
+        async def run_test():
+            executor = ParallelExecutor(mode=ExecutionMode.THREAD,
+                                        limits=_limits(max_concurrent_tasks=2))
+            await executor.start()
+            hung = Task(objective="hung", parameters={"block": 1.0}, timeout=0.2)
+            await executor.submit_task(hung)
+            await executor.wait_for_completion(timeout=5)
+            held = executor.admission.in_flight
+            await asyncio.sleep(1.5)
+            freed = executor.admission.in_flight
+            await executor.stop()
+            return executor.completed_tasks[hung.id], held, freed
+        
+        result, held, freed = asyncio.run(run_test())
+        
+        self.assertEqual(result.status, ResultStatus.TIMEOUT)
+        self.assertEqual(held, 1)
+        self.assertEqual(freed, 0)
+    
+    def test_process_mode_recycles_stuck_worker(self, mock_create_strategy):
+        """Test a worker blocking past its deadline is killed and its pool replaced."""
+        async def run_test():
+            # Two admission slots but a single pool process
+            executor = ParallelExecutor(mode=ExecutionMode.PROCESS,
+                                        limits=_limits(max_concurrent_tasks=2))
+            await executor.start()
+            first_pool = executor.process_executor
+            stuck_pid = executor._process_board.pids[0]
+            hung = Task(objective="hung", parameters={"block": 30}, timeout=0.2)
+            quick = Task(objective="quick")
+            await executor.submit_batch([(hung, 2), (quick, 1)])
+            start = time.perf_counter()
+            completed = await executor.wait_for_completion(timeout=10)
+            elapsed = time.perf_counter() - start
+            after = Task(objective="after")
+            await executor.submit_task(after)
+            await executor.wait_for_completion(timeout=10)
+            replaced = executor.process_executor is not first_pool
+            await executor.stop()
+            return executor, (hung, quick, after), completed, elapsed, replaced, stuck_pid
+        
+        executor, tasks, completed, elapsed, replaced, stuck_pid = asyncio.run(run_test())
+        hung, quick, after = tasks
+        
+        self.assertTrue(completed)
+        self.assertLess(elapsed, 5)
+        self.assertTrue(replaced)
+        self.assertEqual(executor.completed_tasks[hung.id].status, ResultStatus.TIMEOUT)
+        self.assertEqual(executor.completed_tasks[quick.id].status, ResultStatus.SUCCESS)
+        self.assertEqual(executor.completed_tasks[after.id].status, ResultStatus.SUCCESS)
+        self.assertFalse(psutil.pid_exists(stuck_pid))
+
+
+class TestClaudeFlowTimeout(unittest.TestCase):
+    """Test ClaudeFlowExecutor subprocess timeouts."""
+    
+    def test_timeout_kills_process_group_off_main_thread(self):
+        """Test a timed-out command and its children are killed from a worker thread."""
+        executor = ClaudeFlowExecutor(claude_flow_path="claude-flow", retry_attempts=1)
+        command = ["sh", "-c", "sleep 30 & echo $!; wait"]
+        outcome = {}
+        
+        thread = threading.Thread(
+            target=lambda: outcome.update(result=executor._execute_command(command, timeout=0.5))
+        )
+        thread.start()
+        thread.join(10)
+        
+        result = outcome["result"]
+        self.assertTrue(result.timeout)
+        self.assertLess(result.duration, 5)
+        child = int(result.stdout.split()[0])
+        deadline = time.time() + 5
+        while psutil.pid_exists(child) and time.time() < deadline:
+            try:
+                if psutil.Process(child).status() == psutil.STATUS_ZOMBIE:
+                    break
+            except psutil.NoSuchProcess:
+                break
+            time.sleep(0.05)
+        else:
+            self.assertFalse(psutil.pid_exists(child))
+    
+    def test_leaked_children_are_stopped(self):
+        """Test children that outlive a finished command are reported and stopped."""
+        executor = ClaudeFlowExecutor(claude_flow_path="claude-flow", retry_attempts=1,
+                                      grace_period=0.3)
+        result = executor._execute_command(["sh", "-c", "sleep 30 & echo $!"], timeout=10)
+        
+        self.assertTrue(result.success)
+        self.assertFalse(result.timeout)
+        self.assertLess(result.duration, 5)
+        self.assertEqual(result.leaked_pids, [int(result.stdout)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,230 @@
+"""Unit tests for learned task durations and expected-finish scheduling."""
+
+import asyncio
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from swarm_benchmark.core.duration_model import DurationEstimator, task_complexity
+from swarm_benchmark.core.models import (
+    Agent, AgentStatus, AgentType, Benchmark, PerformanceMetrics, Result, ResultStatus,
+    StrategyType, Task, TaskStatus
+)
+from swarm_benchmark.core.orchestration_manager import (
+    OrchestrationConfig, OrchestrationManager, ProgressTracker
+)
+from swarm_benchmark.core.parallel_executor import ExecutionMode, ParallelExecutor
+from swarm_benchmark.core.task_scheduler import SchedulingAlgorithm, TaskScheduler
+from swarm_benchmark.output.sqlite_manager import SQLiteManager, SCHEMA_VERSION
+
+
+def _task(complexity: str = "simple", strategy: StrategyType = StrategyType.DEVELOPMENT) -> Task:
+    return Task(objective="build", strategy=strategy, parameters={"complexity": complexity})
+
+
+def _result(task: Task, agent_id: str, seconds: float,
+            status: ResultStatus = ResultStatus.SUCCESS) -> Result:
+    return Result(task_id=task.id, agent_id=agent_id, status=status,
+                  performance_metrics=PerformanceMetrics(execution_time=seconds))
+
+
+class TestDurationEstimator(unittest.TestCase):
+    """Test EWMA estimates, pooled fallbacks and censoring."""
+
+    def test_fallback_chain(self):
+        """Test exact, pooled and default estimates."""
+        model = DurationEstimator(alpha=0.5, default_duration=30.0)
+        self.assertEqual(model.estimate("a", _task()), 30.0)
+
+        for seconds in (4.0, 8.0):
+            model.observe("a", _task(), seconds)
+        model.observe("b", _task(), 2.0)
+
+        self.assertEqual(model.estimate("a", _task()), 6.0)
+        self.assertEqual(model.estimate("b", _task()), 2.0)
+        self.assertEqual(model.estimate("c", _task()), 4.0)  # pooled over agents, EWMA
+        self.assertEqual(model.estimate("c", _task("complex")), 4.0)  # strategy only
+        self.assertEqual(model.estimate("c", _task(strategy=StrategyType.TESTING)), 4.0)
+        self.assertEqual(model.estimate("a", _task(), quantile=1.0), 8.0)
+        self.assertEqual(model.agent_estimates(_task()), {"a": 6.0, "b": 2.0})
+
+    def test_censored_results_are_skipped(self):
+        """Test timeouts, cancellations and zero times do not train the model."""
+        model = DurationEstimator()
+        task = _task()
+        task.assigned_agents.append("a")
+
+        self.assertFalse(model.observe_result(_result(task, "a", 50.0, ResultStatus.TIMEOUT), task))
+        self.assertFalse(model.observe_result(_result(task, "a", 0.0), task))
+        self.assertTrue(model.observe_result(_result(task, "", 3.0), task))
+        self.assertEqual(model.agent_estimates(task), {"a": 3.0})
+
+    def test_task_complexity(self):
+        """Test explicit and size-based complexity buckets."""
+        self.assertEqual(task_complexity(_task("heavy")), "heavy")
+        self.assertEqual(task_complexity(Task(objective="fix typo")), "simple")
+        self.assertEqual(task_complexity(Task(objective="word " * 20, description="word " * 50,
+                                              parameters={str(i): i for i in range(10)})),
+                         "complex")
+
+
+class TestShortestExpectedFinish(unittest.TestCase):
+    """Test SHORTEST_EXPECTED_FINISH scheduling."""
+
+    def _scheduler(self, model: DurationEstimator) -> TaskScheduler:
+        return TaskScheduler(algorithm=SchedulingAlgorithm.SHORTEST_EXPECTED_FINISH,
+                             enable_work_stealing=False, duration_model=model)
+
+    def test_faster_agent_gets_more_work(self):
+        """Test tasks go to the agent predicted to finish them first."""
+        model = DurationEstimator()
+        model.observe("slow", _task(), 4.0)
+        model.observe("fast", _task(), 1.0)
+        agents = [Agent(id="slow"), Agent(id="fast")]
+
+        scheduler = self._scheduler(model)
+        assignments = scheduler.schedule_tasks([_task() for _ in range(10)], agents)
+
+        self.assertEqual([len(assignments[agent]) for agent in agents], [2, 8])
+        self.assertEqual(dict(scheduler.agent_expected_load), {"slow": 8.0, "fast": 8.0})
+
+    def test_longest_tasks_placed_first(self):
+        """Test LPT order across agents without history of their own."""
+        model = DurationEstimator()
+        model.observe("", _task("complex"), 6.0)
+        model.observe("", _task("simple"), 1.0)
+        agents = [Agent(id=f"a{i}") for i in range(3)]
+        short = [_task("simple") for _ in range(4)]
+        long = [_task("complex") for _ in range(2)]
+
+        assignments = self._scheduler(model).schedule_tasks(short + long, agents)
+
+        self.assertEqual(assignments[agents[0]], [long[0]])
+        self.assertEqual(assignments[agents[1]], [long[1]])
+        self.assertEqual(assignments[agents[2]], short)
+
+    def test_completed_batches_leave_no_expected_load(self):
+        """Test a second batch is scheduled like the first once the first completes."""
+        model = DurationEstimator()
+        model.observe("slow", _task(), 4.0)
+        model.observe("fast", _task(), 1.0)
+        agents = [Agent(id="slow"), Agent(id="fast")]
+        scheduler = self._scheduler(model)
+
+        counts = []
+        for _ in range(2):
+            tasks = [_task() for _ in range(10)]
+            assignments = scheduler.schedule_tasks(tasks, agents)
+            counts.append([len(assignments[agent]) for agent in agents])
+            for task in tasks[:-1]:
+                scheduler.mark_task_completed(task.id)
+            scheduler.release_task(tasks[-1].id)
+            scheduler.release_task(tasks[-1].id)  # releasing twice is harmless
+
+        self.assertEqual(counts, [[2, 8], [2, 8]])
+        self.assertEqual(dict(scheduler.agent_expected_load), {"slow": 0.0, "fast": 0.0})
+        self.assertNotIn(tasks[-1].id, scheduler.completed_tasks)
+
+
+class TestOrchestrationDurations(unittest.TestCase):
+    """Test durations learned by OrchestrationManager feed the scheduler."""
+
+    def test_pool_agent_history_reaches_scheduler(self):
+        """Test durations are learned per pool agent, not per strategy label."""
+        config = OrchestrationConfig(
+            execution_mode=ExecutionMode.ASYNCIO,
+            scheduling_algorithm=SchedulingAlgorithm.SHORTEST_EXPECTED_FINISH,
+            enable_work_stealing=False,
+            progress_reporting=False
+        )
+        manager = OrchestrationManager(config)
+        agents = [Agent(id=agent_id, type=AgentType.DEVELOPER, status=AgentStatus.IDLE)
+                  for agent_id in ("first", "second")]
+        manager.agent_pool = agents
+        manager.active_agents = {agent.id: agent for agent in agents}
+
+        async def execute(executor, task):
+            await asyncio.sleep(0.01)
+            return Result(task_id=task.id, agent_id="development-agent", status=ResultStatus.SUCCESS)
+
+        async def run_test():
+            benchmark = Benchmark()
+            for _ in range(4):
+                benchmark.add_task(_task())
+            await manager.executor.start()
+            try:
+                await manager._execute_parallel_benchmarks([benchmark])
+            finally:
+                await manager.executor.stop()
+
+        with patch.object(ParallelExecutor, "_execute_async", execute):
+            asyncio.run(run_test())
+
+        estimates = manager.duration_model.agent_estimates(_task())
+        self.assertEqual(set(estimates), {"first", "second"})
+
+        task = _task()
+        manager.scheduler.schedule_tasks([task], agents)
+        agent_id, expected = manager.scheduler._expected_durations[task.id]
+        self.assertEqual(expected, estimates[agent_id])
+
+
+class TestDurationPersistence(unittest.TestCase):
+    """Test the duration model round trip through the results database."""
+
+    def test_save_and_load(self):
+        """Test stats, including sketches, survive a save and load."""
+        model = DurationEstimator()
+        for seconds in (1.0, 2.0, 3.0, 10.0):
+            model.observe("a", _task(), seconds)
+
+        async def run_test(output_dir: Path):
+            async with SQLiteManager() as manager:
+                db_path = await manager.save_duration_model(model, output_dir)
+            async with SQLiteManager(db_path) as manager:
+                return db_path, await manager.load_duration_model()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path, loaded = asyncio.run(run_test(Path(tmp)))
+            with sqlite3.connect(db_path) as conn:
+                self.assertEqual(conn.execute("PRAGMA user_version").fetchone()[0], SCHEMA_VERSION)
+                self.assertEqual(conn.execute("SELECT COUNT(*) FROM duration_stats").fetchone()[0], 4)
+
+        self.assertEqual(len(loaded), len(model))
+        for quantile in (None, 0.5, 0.9):
+            self.assertEqual(loaded.estimate("a", _task(), quantile),
+                             model.estimate("a", _task(), quantile))
+        self.assertEqual(loaded.agent_estimates(_task()), model.agent_estimates(_task()))
+
+
+class TestProgressEstimate(unittest.TestCase):
+    """Test ProgressTracker time remaining."""
+
+    def test_model_driven_estimate(self):
+        """Test the longest predicted agent queue is reported."""
+        model = DurationEstimator()
+        model.observe("a", _task(), 2.0)
+        model.observe("b", _task(), 3.0)
+        tasks = [_task() for _ in range(4)]
+        for task, agent_id in zip(tasks, ["a", "a", "b", "b"]):
+            task.assigned_agents.append(agent_id)
+        tasks[3].status = TaskStatus.COMPLETED
+
+        tracker = ProgressTracker(duration_model=model)
+        tracker.track(tasks)
+
+        self.assertEqual(tracker.get_estimated_time_remaining(), 4.0)
+        tracker.update(tasks_completed=1, tasks_running=1, tasks_queued=2)
+        self.assertIn("~4s remaining", tracker.get_progress_report())
+
+    def test_average_time_fallback(self):
+        """Test the count-based estimate without tracked tasks."""
+        tracker = ProgressTracker()
+        tracker.update(tasks_completed=2, tasks_running=2, tasks_queued=4)
+        self.assertEqual(tracker.get_estimated_time_remaining(5.0), 15.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+"""Unit tests for the JSON output writer."""
+
+import asyncio
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from swarm_benchmark.core.models import Benchmark, Result, ResultStatus, Task
+from swarm_benchmark.output.json_writer import JSONWriter
+
+
+def _benchmark(results: int = 5) -> Benchmark:
+    benchmark = Benchmark(name="stream-test")
+    for i in range(results):
+        task = Task(objective=f"objective {i}")
+        benchmark.add_task(task)
+        benchmark.add_result(Result(task_id=task.id, status=ResultStatus.SUCCESS))
+    return benchmark
+
+
+class TestJSONWriter(unittest.TestCase):
+    """Test JSONWriter document and streaming output."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_save_benchmark_json(self):
+        """Test the whole-document format is unchanged."""
+        benchmark = _benchmark()
+        path = asyncio.run(JSONWriter().save_benchmark(benchmark, self.output_dir))
+
+        data = json.loads(path.read_text())
+        self.assertEqual(data["id"], benchmark.id)
+        self.assertEqual(len(data["results"]), 5)
+        self.assertEqual(data["metrics"]["total_tasks"], 5)
+
+    def test_streamed_json_matches_document(self):
+        """Test an incrementally written array closes into the same document."""
+        benchmark = _benchmark()
+        writer = JSONWriter()
+        document = json.loads(asyncio.run(writer.save_benchmark(benchmark, self.output_dir)).read_text())
+
+        async def stream_results():
+            async with writer.stream(benchmark, self.output_dir, format_type="json", batch_size=2) as stream:
+                for result in benchmark.results:
+                    await stream.write_result(result)
+            return stream.path
+
+        streamed = json.loads(asyncio.run(stream_results()).read_text())
+        self.assertEqual(streamed, document)
+
+    def test_ndjson_stream_round_trip(self):
+        """Test NDJSON streams hold header, results and summary records."""
+        benchmark = _benchmark()
+        path = asyncio.run(JSONWriter().save_benchmark(benchmark, self.output_dir, format_type="ndjson"))
+
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        self.assertEqual([r["type"] for r in records], ["benchmark"] + ["result"] * 5 + ["summary"])
+        self.assertEqual(records[-1]["metrics"]["completed_tasks"], 5)
+        self.assertEqual(
+            [r["task_id"] for r in JSONWriter.read_results(path)],
+            [r.task_id for r in benchmark.results]
+        )
+
+    def test_partial_stream_is_readable(self):
+        """Test results flushed before a crash can be read back."""
+        benchmark = _benchmark(7)
+        writer = JSONWriter()
+
+        async def crash_mid_run(format_type):
+            stream = writer.stream(benchmark, self.output_dir, format_type=format_type, batch_size=3)
+            for result in benchmark.results:
+                await stream.write_result(result)
+            # Simulate a crash: the file is never closed and a record is torn.
+            stream._file.write('{"id": "torn')
+            stream._file.flush()
+            self.addCleanup(stream._file.close)
+            return stream.path
+
+        for format_type in ("ndjson", "json"):
+            path = asyncio.run(crash_mid_run(format_type))
+            recovered = list(JSONWriter.read_results(path))
+            self.assertEqual(
+                [r["id"] for r in recovered],
+                [r.id for r in benchmark.results[:6]],
+                format_type
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+"""Unit tests for claude-flow output parsing."""
+
+import json
+import unittest
+
+from swarm_benchmark.core.integration_utils import (
+    JSONBlockDecoder, OutputParser, OutputStreamParser
+)
+
+
+SAMPLE_OUTPUT = "\n".join([
+    "🚀 Starting swarm",
+    "Swarm ID: swarm-42",
+    "Task created: task-1",
+    "Agent coder started",
+    "  compiling src/app.ts ... done",
+    "Created file: src/app.py",
+    "Modified file: README.md",
+    "⚠️ Warning: slow agent",
+    "❌ Error: Task created: task-bad",
+    "ERROR: timeout",
+    "✅ Task completed: task-1",
+    "✅ 12 tests passed",
+    "❌ 1 test failed",
+    "Coverage: 87.5%",
+    "Stored in memory: swarm/result",
+    "Agent coder completed",
+    "Duration: 2.5m\r",
+    "",
+])
+
+
+def per_pattern_parse(output: str) -> dict:
+    """Reference parse: every pattern searched on every line."""
+    result = OutputParser.empty_result()
+    for line in output.split("\n"):
+        for name, pattern in OutputParser.PATTERNS.items():
+            if match := pattern.search(line):
+                OutputParser._store(name, match, result)
+    return result
+
+
+class TestOutputParser(unittest.TestCase):
+    """Test the single-pass OutputParser."""
+
+    def test_parse_output(self):
+        """Test all fields are extracted, including overlapping matches."""
+        result = OutputParser.parse_output(SAMPLE_OUTPUT)
+
+        self.assertEqual(result, per_pattern_parse(SAMPLE_OUTPUT))
+        self.assertEqual(result["swarm_id"], "swarm-42")
+        self.assertEqual(result["tasks"]["created"], ["task-1", "task-bad"])
+        self.assertEqual(result["tasks"]["completed"], ["task-1"])
+        self.assertEqual(result["agents"], {"started": ["coder"], "completed": ["coder"]})
+        self.assertEqual(result["errors"], ["Task created: task-bad", "timeout"])
+        self.assertEqual(result["warnings"], ["slow agent"])
+        self.assertEqual(result["tests"], {"passed": 12, "failed": 1, "coverage": 87.5})
+        self.assertEqual(result["duration"], 150.0)
+
+    def test_chunked_feed_matches(self):
+        """Test feeding arbitrary chunks gives the same result."""
+        expected = OutputParser.parse_output(SAMPLE_OUTPUT)
+        for size in (1, 3, 7, 64):
+            parser = OutputStreamParser()
+            for i in range(0, len(SAMPLE_OUTPUT), size):
+                parser.feed(SAMPLE_OUTPUT[i:i + size])
+            self.assertEqual(parser.close(), expected)
+
+
+class TestJSONBlockDecoder(unittest.TestCase):
+    """Test JSON extraction from free-form output."""
+
+    def test_nested_objects(self):
+        """Test nested objects are returned whole and invalid braces skipped."""
+        output = 'result {not json} {"a": {"b": [1, {"c": null}]}} then {"d": "}"}'
+
+        self.assertEqual(OutputParser.extract_json_blocks(output),
+                         [{"a": {"b": [1, {"c": None}]}}, {"d": "}"}])
+
+    def test_objects_split_across_chunks(self):
+        """Test objects cut at any point are completed by later chunks."""
+        blocks = [{"task": 1, "ok": True, "score": -1.5e3, "tags": ["x"], "err": None},
+                  {"nested": {"deep": {"value": "a b"}}}]
+        output = "log line {\n" + json.dumps(blocks[0]) + "\n" + json.dumps(blocks[1], indent=2) + " {"
+        for size in (1, 2, 5, 17):
+            decoder = JSONBlockDecoder()
+            found = []
+            for i in range(0, len(output), size):
+                found.extend(decoder.feed(output[i:i + size]))
+            found.extend(decoder.close())
+            self.assertEqual(found, blocks)
+
+    def test_held_text_is_bounded(self):
+        """Test an unterminated object is dropped once past max_bytes."""
+        decoder = JSONBlockDecoder(max_bytes=100)
+        decoder.feed('{"values": [')
+        for _ in range(50):
+            decoder.feed("1, ")
+        self.assertEqual(decoder._buffer, "")
+        self.assertEqual(decoder.feed(' {"a": 1}'), [{"a": 1}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,243 @@
+"""Unit tests for the parallel executor."""
+
+import unittest
+import asyncio
+import time
+from dataclasses import fields
+from swarm_benchmark.core.parallel_executor import (
+    ParallelExecutor, ExecutionMode, ResourceLimits, TaskPriority,
+    AdmissionController, ResourceMonitor,
+    _task_to_message, _message_to_task, _result_to_tuple, _result_from_tuple
+)
+from swarm_benchmark.core.models import (
+    Task, Result, ResultStatus, StrategyType, CoordinationMode,
+    PerformanceMetrics, QualityMetrics, ResourceUsage
+)
+from swarm_benchmark.core.result_store import ResultStore, ResultRow
+
+
+class RecordingExecutor(ParallelExecutor):
+    """Executor that records dispatch order instead of running strategies."""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.dispatch_order = []
+    
+    async def _execute_task(self, task: Task) -> Result:
+        self.dispatch_order.append(task.objective)
+        return Result(task_id=task.id, status=ResultStatus.SUCCESS)
+
+
+def _limits(**overrides) -> ResourceLimits:
+    values = dict(max_cpu_percent=1e9, max_memory_mb=1e9, max_concurrent_tasks=1)
+    values.update(overrides)
+    return ResourceLimits(**values)
+
+
+class TestTaskPriority(unittest.TestCase):
+    """Test TaskPriority ordering."""
+    
+    def test_higher_priority_first(self):
+        """Higher priority values sort first."""
+        low = TaskPriority(1, Task(), 1.0)
+        high = TaskPriority(5, Task(), 2.0)
+        self.assertLess(high, low)
+    
+    def test_fifo_within_priority(self):
+        """Equal priorities fall back to enqueue time, then sequence."""
+        first = TaskPriority(1, Task(), 1.0, sequence=0)
+        second = TaskPriority(1, Task(), 1.0, sequence=1)
+        later = TaskPriority(1, Task(), 2.0, sequence=0)
+        self.assertLess(first, second)
+        self.assertLess(second, later)
+
+
+class TestParallelExecutorQueue(unittest.TestCase):
+    """Test asyncio-native dispatch in ParallelExecutor."""
+    
+    def test_batch_dispatch_respects_priority(self):
+        """Batch submissions dispatch by priority then FIFO."""
+        async def run_test():
+            executor = RecordingExecutor(mode=ExecutionMode.ASYNCIO, limits=_limits())
+            executor.running = True  # enqueue before workers start
+            await executor.submit_batch([
+                (Task(objective="low-1"), 1),
+                (Task(objective="high"), 5),
+                (Task(objective="low-2"), 1),
+            ])
+            await executor.start()
+            completed = await executor.wait_for_completion(timeout=5)
+            await executor.stop()
+            return executor, completed
+        
+        executor, completed = asyncio.run(run_test())
+        
+        self.assertTrue(completed)
+        self.assertEqual(executor.dispatch_order, ["high", "low-1", "low-2"])
+        self.assertEqual(executor.metrics.tasks_completed, 3)
+    
+    def test_full_queue_applies_backpressure(self):
+        """Submitting past max_queue_size waits instead of raising."""
+        async def run_test():
+            executor = RecordingExecutor(
+                mode=ExecutionMode.ASYNCIO,
+                limits=_limits(max_concurrent_tasks=2, max_queue_size=2)
+            )
+            await executor.start()
+            tasks = [(Task(objective=f"task-{i}"), 1) for i in range(20)]
+            task_ids = await executor.submit_batch(tasks)
+            completed = await executor.wait_for_completion(timeout=5)
+            await executor.stop()
+            return executor, task_ids, completed
+        
+        executor, task_ids, completed = asyncio.run(run_test())
+        
+        self.assertTrue(completed)
+        self.assertEqual(len(task_ids), 20)
+        self.assertEqual(len(executor.completed_tasks), 20)
+        self.assertEqual(executor.get_queue_size(), 0)
+    
+    def test_cancelled_batch_counts_only_enqueued_tasks(self):
+        """A batch cancelled while blocked on a full queue does not strand completion."""
+        async def run_test():
+            executor = RecordingExecutor(mode=ExecutionMode.ASYNCIO,
+                                         limits=_limits(max_queue_size=2))
+            executor.running = True  # enqueue before workers start
+            tasks = [(Task(objective=f"task-{i}"), 1) for i in range(5)]
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(executor.submit_batch(tasks), timeout=0.1)
+            queued = executor.metrics.tasks_queued
+            await executor.start()
+            completed = await executor.wait_for_completion(timeout=5)
+            await executor.stop()
+            return executor, queued, completed
+        
+        executor, queued, completed = asyncio.run(run_test())
+        
+        self.assertEqual(queued, 2)
+        self.assertTrue(completed)
+        self.assertEqual(executor.metrics.tasks_completed, 2)
+    
+    def test_results_recorded_in_result_store(self):
+        """Completed results land in the columnar store when one is given."""
+        async def run_test():
+            store = ResultStore()
+            executor = RecordingExecutor(
+                mode=ExecutionMode.ASYNCIO, limits=_limits(), result_store=store
+            )
+            await executor.start()
+            task_ids = await executor.submit_batch([(Task(objective=f"t{i}"), 1) for i in range(5)])
+            await executor.wait_for_completion(timeout=5)
+            await executor.stop()
+            return executor, store, task_ids
+        
+        executor, store, task_ids = asyncio.run(run_test())
+        
+        self.assertEqual(len(store), 5)
+        for task_id in task_ids:
+            row = executor.completed_tasks[task_id]
+            self.assertIsInstance(row, ResultRow)
+            self.assertEqual(row.task_id, task_id)
+            self.assertEqual(row.status, ResultStatus.SUCCESS)
+
+
+
+class TestAdmissionControl(unittest.TestCase):
+    """Test headroom-driven admission control."""
+    
+    def test_capacity_scales_with_headroom(self):
+        """Capacity is full below the reserve band and shrinks inside it."""
+        limits = ResourceLimits(max_cpu_percent=100.0, max_memory_mb=1000.0,
+                                max_concurrent_tasks=10, headroom_reserve=0.2)
+        monitor = ResourceMonitor(limits)
+        
+        monitor.current_usage.cpu_percent = 50.0
+        monitor.current_usage.memory_mb = 100.0
+        self.assertEqual(monitor.admission_capacity(), 10)
+        
+        monitor.current_usage.cpu_percent = 90.0  # half the reserve left
+        self.assertEqual(monitor.admission_capacity(), 5)
+        
+        monitor.current_usage.memory_mb = 2000.0  # over the limit
+        self.assertEqual(monitor.admission_capacity(), limits.min_admitted_tasks)
+    
+    def test_waiters_resume_on_release_and_capacity_change(self):
+        """Blocked acquirers wake on release or when capacity grows."""
+        async def run_test():
+            controller = AdmissionController(capacity=2)
+            controller.set_capacity(1)
+            self.assertEqual(await controller.acquire(), 0.0)
+            
+            waiters = [asyncio.create_task(controller.acquire()) for _ in range(2)]
+            await asyncio.sleep(0)
+            self.assertFalse(any(w.done() for w in waiters))
+            
+            controller.release()
+            await asyncio.sleep(0)
+            self.assertEqual(sum(w.done() for w in waiters), 1)
+            
+            controller.set_capacity(2)
+            await asyncio.gather(*waiters)
+            return controller.in_flight
+        
+        self.assertEqual(asyncio.run(run_test()), 2)
+    
+    def test_cancelled_task_returns_admission_slot(self):
+        """A task cancelled right after admission does not leak its slot."""
+        async def run_test():
+            executor = RecordingExecutor(mode=ExecutionMode.ASYNCIO, limits=_limits())
+            await executor._lock.acquire()  # park the task between admission and execution
+            run = asyncio.create_task(executor._run_task(Task(), time.time(), "worker-0"))
+            await asyncio.sleep(0)
+            admitted = executor.admission.in_flight
+            run.cancel()
+            executor._lock.release()
+            with self.assertRaises(asyncio.CancelledError):
+                await run
+            return executor, admitted
+        
+        executor, admitted = asyncio.run(run_test())
+        
+        self.assertEqual(admitted, 1)
+        self.assertEqual(executor.admission.in_flight, 0)
+        self.assertEqual(executor.metrics.tasks_running, 0)
+
+
+
+class TestProcessMessages(unittest.TestCase):
+    """Test the compact process-pool message protocol."""
+    
+    def test_task_message_round_trip(self):
+        """Strategy-relevant task fields survive the round trip."""
+        task = Task(objective="Build API", description="desc",
+                    strategy=StrategyType.DEVELOPMENT, mode=CoordinationMode.MESH,
+                    parameters={"language": "python"})
+        rebuilt = _message_to_task(_task_to_message(task))
+        
+        self.assertEqual(rebuilt.id, task.id)
+        self.assertEqual(rebuilt.objective, task.objective)
+        self.assertEqual(rebuilt.description, task.description)
+        self.assertEqual(rebuilt.strategy, task.strategy)
+        self.assertEqual(rebuilt.mode, task.mode)
+        self.assertEqual(rebuilt.parameters, task.parameters)
+    
+    def test_result_tuple_round_trip(self):
+        """Results rehydrate from flat tuples unchanged."""
+        result = Result(
+            task_id="task1", agent_id="agent1", status=ResultStatus.PARTIAL,
+            output={"key": "value"}, errors=["e"], warnings=["w"],
+            performance_metrics=PerformanceMetrics(execution_time=1.5, retry_count=2),
+            quality_metrics=QualityMetrics(overall_quality=0.9, review_score=0.7),
+            resource_usage=ResourceUsage(cpu_percent=12.5, disk_bytes_write=4096),
+            execution_details={"step": 1}
+        )
+        values = _result_to_tuple(result)
+        
+        self.assertTrue(all(not hasattr(v, "__dataclass_fields__") for v in values))
+        self.assertEqual(_result_from_tuple(values), result)
+        metric_fields = sum(len(fields(cls)) for cls in (PerformanceMetrics, QualityMetrics, ResourceUsage))
+        self.assertEqual(len(values), 7 + metric_fields + 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+"""Unit tests for the columnar (Parquet) output writer."""
+
+import asyncio
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+from swarm_benchmark.core.models import (
+    Benchmark, BenchmarkConfig, CoordinationMode, PerformanceMetrics, QualityMetrics,
+    Result, ResultStatus, StrategyType, Task
+)
+from swarm_benchmark.output.parquet_writer import (
+    ParquetWriter, ParquetReader, FALLBACK_SUFFIX, read_columnar
+)
+
+
+def _benchmark(name: str, strategy: StrategyType, results: int = 4) -> Benchmark:
+    benchmark = Benchmark(
+        name=name,
+        config=BenchmarkConfig(strategy=strategy, mode=CoordinationMode.MESH),
+        created_at=datetime(2024, 5, 1, 9, 30),
+    )
+    for i in range(results):
+        task = Task(objective=f"objective {i}", parameters={"i": i},
+                    started_at=datetime(2024, 5, 1, 9, 30, 0, 250000))
+        benchmark.add_task(task)
+        benchmark.add_result(Result(
+            task_id=task.id,
+            agent_id=f"agent-{i}",
+            status=ResultStatus.SUCCESS if i else ResultStatus.FAILURE,
+            output={"answer": i},
+            errors=[] if i else ["boom"],
+            performance_metrics=PerformanceMetrics(execution_time=i / 4, retry_count=i),
+            quality_metrics=QualityMetrics(overall_quality=0.5, review_score=0.25 if i else None),
+            started_at=datetime(2024, 5, 1, 9, 30, 1, 123456),
+        ))
+    return benchmark
+
+
+class TestParquetWriter(unittest.TestCase):
+    """Test ParquetWriter and ParquetReader with the pure-Python format."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self._tmp.name)
+        self.writer = ParquetWriter(use_pyarrow=False)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_round_trip_models(self):
+        """Test results and tasks load back into equal models."""
+        benchmark = _benchmark("columnar", StrategyType.RESEARCH)
+        root = asyncio.run(self.writer.save_benchmark(benchmark, self.output_dir))
+        reader = ParquetReader(root)
+
+        self.assertEqual(reader.load_results(), benchmark.results)
+        self.assertEqual(reader.load_tasks(), benchmark.tasks)
+
+        path = (root / "results" / "date=2024-05-01" / "strategy=research" / "mode=mesh"
+                / f"{benchmark.id}{FALLBACK_SUFFIX}")
+        columns = read_columnar(path)
+        self.assertEqual(columns["retry_count"], [0, 1, 2, 3])
+        self.assertEqual(columns["review_score"], [None, 0.25, 0.25, 0.25])
+
+    def test_partition_filters(self):
+        """Test reads can be restricted to strategy partitions."""
+        research = _benchmark("research", StrategyType.RESEARCH, results=2)
+        analysis = _benchmark("analysis", StrategyType.ANALYSIS, results=3)
+
+        async def save_both():
+            await self.writer.save_benchmark(research, self.output_dir)
+            return await self.writer.save_benchmark(analysis, self.output_dir)
+
+        reader = ParquetReader(asyncio.run(save_both()))
+
+        self.assertEqual(len(reader.load_results()), 5)
+        self.assertEqual(reader.load_results(strategy="analysis"), analysis.results)
+        columns = reader.read_table("results", strategy="research")
+        self.assertEqual(columns["strategy"], ["research", "research"])
+        self.assertEqual(columns["date"], ["2024-05-01", "2024-05-01"])
+        self.assertEqual(reader.load_results(date="2023-01-01"), [])
+        with self.assertRaises(ValueError):
+            reader.read_table("agents")
+
+    def test_samples_table(self):
+        """Test collector interval samples are written as a time series."""
+        benchmark = _benchmark("samples", StrategyType.AUTO, results=1)
+        samples = [
+            {"timestamp": "2024-05-01T09:30:00.500000", "duration_ms": 1.5,
+             "process_count": 2, "total_cpu_percent": 12.5, "total_memory_mb": 64.0},
+            {"timestamp": "2024-05-01T09:30:01", "duration_ms": 1.25,
+             "process_count": 3, "total_cpu_percent": 20.0, "total_memory_mb": 80.0},
+        ]
+        root = asyncio.run(self.writer.save_benchmark(benchmark, self.output_dir, samples=samples))
+
+        loaded = ParquetReader(root).load_samples()
+        self.assertEqual([s["timestamp"] for s in loaded],
+                         [datetime(2024, 5, 1, 9, 30, 0, 500000), datetime(2024, 5, 1, 9, 30, 1)])
+        self.assertEqual([s["process_count"] for s in loaded], [2, 3])
+        self.assertEqual(loaded[1]["total_memory_mb"], 80.0)
+        self.assertEqual(loaded[0]["benchmark_id"], benchmark.id)
+
+    def test_nullable_int_columns(self):
+        """Test None in an int column, e.g. a task without a timeout, round-trips."""
+        benchmark = _benchmark("nullable", StrategyType.AUTO, results=2)
+        benchmark.tasks[0].timeout = None
+        root = asyncio.run(self.writer.save_benchmark(benchmark, self.output_dir))
+
+        self.assertEqual([t.timeout for t in ParquetReader(root).load_tasks()],
+                         [None, benchmark.tasks[1].timeout])
+
+
+if __name__ == "__main__":
+    unittest.main()
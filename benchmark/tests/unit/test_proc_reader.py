@@ -0,0 +1,80 @@
+"""Unit tests for the /proc process metrics reader."""
+
+import subprocess
+import sys
+import time
+import errno
+import unittest
+from unittest.mock import patch
+
+import psutil
+
+from swarm_benchmark.metrics.performance_collector import sample_process
+from swarm_benchmark.metrics.proc_reader import ProcReader
+
+
+@unittest.skipUnless(ProcReader.available(), "requires Linux /proc")
+class TestProcReader(unittest.TestCase):
+    """Test ProcReader against psutil."""
+
+    def setUp(self):
+        self.reader = ProcReader()
+        self.addCleanup(self.reader.close)
+        self.process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(10)"])
+        self.addCleanup(self.process.wait)
+        self.addCleanup(self.process.kill)
+        time.sleep(0.2)
+
+    def test_matches_psutil(self):
+        """Test the fast path produces the same ProcessMetrics as psutil."""
+        expected = sample_process(psutil.Process(self.process.pid))
+        actual = self.reader.sample(self.process.pid)
+
+        self.assertEqual(actual.pid, expected.pid)
+        self.assertEqual(actual.name, expected.name)
+        self.assertEqual(actual.num_threads, expected.num_threads)
+        self.assertEqual(actual.num_fds, expected.num_fds)
+        self.assertAlmostEqual(actual.create_time, expected.create_time, places=2)
+        self.assertAlmostEqual(actual.memory_mb, expected.memory_mb, places=1)
+        self.assertEqual(actual.cpu_percent, 0.0)
+
+        # Second sample reports CPU since the first
+        self.assertGreaterEqual(self.reader.sample(self.process.pid).cpu_percent, 0.0)
+        no_fds = ProcReader(track_fds=False)
+        self.addCleanup(no_fds.close)
+        self.assertEqual(no_fds.sample(self.process.pid).num_fds, 0)
+
+    def test_exited_process(self):
+        """Test an exited process raises NoSuchProcess and releases its files."""
+        self.reader.sample(self.process.pid)
+        self.process.kill()
+        self.process.wait()
+
+        with self.assertRaises(psutil.NoSuchProcess):
+            self.reader.sample(self.process.pid)
+        self.assertEqual(self.reader._open_pids, 0)
+
+    def test_read_errors_map_to_psutil(self):
+        """Test unreadable /proc files raise psutil errors and release their files."""
+        pid = self.process.pid
+        for error, expected in ((PermissionError(errno.EACCES, "denied"), psutil.AccessDenied),
+                                (OSError(errno.EIO, "I/O error"), psutil.NoSuchProcess)):
+            self.reader.sample(pid)
+            with patch.object(self.reader, "_read", side_effect=error):
+                with self.assertRaises(expected):
+                    self.reader.sample(pid)
+            self.assertNotIn(pid, self.reader._entries)
+            self.assertEqual(self.reader._open_pids, 0)
+
+    def test_open_file_cap(self):
+        """Test processes past the open-file cap are read per sample."""
+        self.reader.MAX_OPEN_PIDS = 0
+        metrics = self.reader.sample(self.process.pid)
+
+        self.assertEqual(metrics.pid, self.process.pid)
+        self.assertEqual(self.reader._open_pids, 0)
+        self.assertEqual(self.reader.sample(self.process.pid).name, metrics.name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,230 @@
+"""Unit tests for streaming process execution."""
+
+import asyncio
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import psutil
+
+from swarm_benchmark.core.process_tree import ProcessTree
+from swarm_benchmark.metrics.process_tracker import OutputCapture, ProcessTracker
+from swarm_benchmark.metrics.sampler import SamplingDaemon
+
+
+# Writes progress lines, then enough output to overflow a small retention cap
+CHATTY_SCRIPT = (
+    "import sys, time; "
+    "print('Task created: task-1', flush=True); "
+    "time.sleep(0.2); "
+    "print('Agent coder started'); "
+    "print('Created file: app.py'); "
+    "print('Error: disk full', file=sys.stderr); "
+    "[print('line %d ' % i + 'x' * 90) for i in range(2000)]; "
+    "print('Task completed: task-1')"
+)
+
+# Starts a child that outlives the script, printing the child's pid
+LEAKY_SCRIPT = (
+    "import subprocess, sys; "
+    "child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)']); "
+    "print(child.pid)"
+)
+
+# Ignores SIGTERM (inherited by its child) and never finishes
+STUBBORN_SCRIPT = (
+    "import signal, subprocess, sys, time; "
+    "signal.signal(signal.SIGTERM, signal.SIG_IGN); "
+    "child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)']); "
+    "print(child.pid, flush=True); "
+    "time.sleep(30)"
+)
+
+
+def _gone(pid: int, timeout: float = 5.0) -> bool:
+    """Whether ``pid`` exits (or is left a zombie) within ``timeout``."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if psutil.Process(pid).status() == psutil.STATUS_ZOMBIE:
+                return True
+        except psutil.NoSuchProcess:
+            return True
+        time.sleep(0.05)
+    return False
+
+
+class TestOutputCapture(unittest.TestCase):
+    """Test OutputCapture retention and spilling."""
+
+    def test_spills_past_cap(self):
+        """Test the newest lines stay in memory and all lines go to disk."""
+        with tempfile.TemporaryDirectory() as tmp:
+            capture = OutputCapture("stdout", max_bytes=20, spill_dir=Path(tmp))
+            capture.append("first", 6)
+            self.assertIsNone(capture.spill_path)
+            for i in range(10):
+                capture.append(f"line {i}", 7)
+            capture.close()
+
+            self.assertEqual(capture.line_count, 11)
+            self.assertEqual(capture.text, "line 8\nline 9")
+            lines = capture.spill_path.read_text().splitlines()
+            self.assertEqual(lines[0], "first")
+            self.assertEqual(len(lines), 11)
+
+
+class TestProcessTrackerStreaming(unittest.TestCase):
+    """Test ProcessTracker's asyncio subprocess path."""
+
+    def setUp(self):
+        self.sampler = SamplingDaemon()
+        self.addCleanup(self.sampler.stop)
+        self.tracker = ProcessTracker(claude_flow_path=sys.executable, sampler=self.sampler)
+
+    def test_streams_and_parses_output(self):
+        """Test lines are parsed as they arrive and long output spills."""
+        with tempfile.TemporaryDirectory() as tmp:
+            result = asyncio.run(self.tracker.execute_command_async(
+                ["-c", CHATTY_SCRIPT], max_output_bytes=10_000, spill_dir=Path(tmp)
+            ))
+
+            self.assertTrue(result.success)
+            self.assertEqual(result.output_size, 2005)
+            self.assertEqual(result.error_count, 1)
+            self.assertLessEqual(len(result.stdout), 10_000)
+            self.assertTrue(result.stdout.endswith("Task completed: task-1"))
+            self.assertIsNone(result.stderr_path)
+            self.assertEqual(result.stderr, "Error: disk full")
+            spilled = result.stdout_path.read_text().splitlines()
+            self.assertEqual(len(spilled), 2004)
+            self.assertEqual(spilled[0], "Task created: task-1")
+
+        self.assertEqual(result.parsed_output["tasks"]["created"], ["task-1"])
+        self.assertEqual(result.parsed_output["files"]["created"], ["app.py"])
+        self.assertEqual(result.parsed_output["errors"], ["disk full"])
+
+        events = {event["type"]: event for event in result.events}
+        self.assertIn("agent_started", events)
+        # The first line was timestamped before the script's sleep finished
+        self.assertGreaterEqual(
+            events["agent_started"]["timestamp"] - events["task_started"]["timestamp"], 0.15
+        )
+
+    def test_timeout_keeps_partial_output(self):
+        """Test a timed-out process is killed with its output so far."""
+        result = self.tracker.execute_command(
+            ["-c", "import time; print('ready', flush=True); time.sleep(30)"], timeout=0.5
+        )
+
+        self.assertFalse(result.success)
+        self.assertEqual(result.exit_code, -15)
+        self.assertEqual(result.stdout, "ready")
+        self.assertIn("timed out after 0.5 seconds", result.stderr)
+        self.assertLess(result.duration, 5)
+        self.assertEqual(result.leaked_pids, [])
+
+
+class TestProcessTree(unittest.TestCase):
+    """Test ProcessTree discovery and signalling around the leader's lifetime."""
+
+    def _spawn(self, script):
+        leader = subprocess.Popen([sys.executable, "-c", script], stdout=subprocess.PIPE,
+                                  start_new_session=True)
+        self.addCleanup(leader.stdout.close)
+        tree = ProcessTree(leader.pid)
+        self.addCleanup(tree.terminate, 0.1)
+        child = int(leader.stdout.readline())
+        return leader, tree, child
+
+    def test_live_leader_skips_session_scan(self):
+        """Test descendants of a running leader come from its child list."""
+        leader, tree, child = self._spawn(STUBBORN_SCRIPT)
+
+        with patch("psutil.pids", side_effect=AssertionError("session scan")):
+            self.assertEqual([p.pid for p in tree.descendants()], [child])
+
+        tree.terminate(0.1)
+        leader.wait(timeout=5)
+        self.assertTrue(_gone(child))
+
+    def test_reaped_leader_group_is_not_signalled(self):
+        """Test orphans are found by session and signalled one by one once the leader is reaped."""
+        leader, tree, child = self._spawn(LEAKY_SCRIPT)
+        leader.wait(timeout=5)
+
+        self.assertEqual(tree.audit(), [child])
+        with patch("os.killpg") as killpg:
+            tree.terminate(0.3)
+
+        killpg.assert_not_called()
+        self.assertTrue(_gone(child))
+
+
+class TestProcessTreeCleanup(unittest.TestCase):
+    """Test ProcessTracker stops and audits whole process trees."""
+
+    def setUp(self):
+        self.sampler = SamplingDaemon()
+        self.addCleanup(self.sampler.stop)
+        self.tracker = ProcessTracker(claude_flow_path=sys.executable, sampler=self.sampler,
+                                      grace_period=0.3)
+
+    def test_reports_and_stops_leaked_descendants(self):
+        """Test a child that outlives the command is reported and stopped."""
+        result = self.tracker.execute_command(["-c", LEAKY_SCRIPT], timeout=10)
+        child = int(result.stdout)
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.leaked_pids, [child])
+        self.assertTrue(_gone(child))
+
+    def test_timeout_escalates_to_sigkill(self):
+        """Test a tree ignoring SIGTERM is killed after the grace period."""
+        result = self.tracker.execute_command(["-c", STUBBORN_SCRIPT], timeout=0.5)
+        child = int(result.stdout)
+
+        self.assertEqual(result.exit_code, -15)
+        self.assertLess(result.duration, 5)
+        self.assertEqual(result.leaked_pids, [])
+        self.assertTrue(_gone(child))
+
+    def test_cancel_stops_tree_off_the_event_loop(self):
+        """Test a cancelled command's tree is stopped without stalling other tasks."""
+        async def run():
+            gaps = []
+            
+            async def tick():
+                last = time.perf_counter()
+                while True:
+                    await asyncio.sleep(0.01)
+                    now = time.perf_counter()
+                    gaps.append(now - last)
+                    last = now
+            
+            command = asyncio.ensure_future(
+                self.tracker.execute_command_async(["-c", STUBBORN_SCRIPT], timeout=30))
+            await asyncio.sleep(0.5)
+            tree = [p.pid for p in psutil.Process().children(recursive=True)]
+            ticker = asyncio.ensure_future(tick())
+            command.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await command
+            ticker.cancel()
+            return tree, gaps
+        
+        tree, gaps = asyncio.run(run())
+        
+        self.assertEqual(len(tree), 2)
+        # SIGTERM is ignored, so the 0.3 s grace period passes while the loop keeps ticking
+        self.assertGreater(len(gaps), 10)
+        self.assertLess(max(gaps), 0.2)
+        self.assertTrue(all(_gone(pid) for pid in tree))
+
+
+if __name__ == "__main__":
+    unittest.main()
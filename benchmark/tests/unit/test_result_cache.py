@@ -0,0 +1,164 @@
+"""Unit tests for the persistent result cache."""
+
+import asyncio
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from swarm_benchmark.cli.main import cli
+from swarm_benchmark.core.models import BenchmarkConfig, StrategyType, Task
+from swarm_benchmark.core.optimized_benchmark_engine import OptimizedBenchmarkEngine
+from swarm_benchmark.core.result_cache import ResultCache, fingerprint
+
+
+class TestFingerprint(unittest.TestCase):
+    """Test cache keys cover the whole configuration."""
+
+    def test_key_changes_with_inputs(self):
+        """Test every input except output-only settings changes the key."""
+        config = BenchmarkConfig(strategy=StrategyType.RESEARCH)
+        key = fingerprint(config, "objective", [Task(objective="a")], "1.0.0")
+
+        self.assertEqual(key, fingerprint(BenchmarkConfig(strategy=StrategyType.RESEARCH),
+                                          "objective", [Task(objective="a")], "1.0.0"))
+        self.assertEqual(key, fingerprint(BenchmarkConfig(strategy=StrategyType.RESEARCH,
+                                                          output_directory="/elsewhere"),
+                                          "objective", [Task(objective="a")], "1.0.0"))
+        variants = [
+            fingerprint(BenchmarkConfig(strategy=StrategyType.RESEARCH, max_agents=9),
+                        "objective", [Task(objective="a")], "1.0.0"),
+            fingerprint(config, "other objective", [Task(objective="a")], "1.0.0"),
+            fingerprint(config, "objective", [Task(objective="a", parameters={"n": 1})], "1.0.0"),
+            fingerprint(config, "objective", [Task(objective="a")], "1.0.1"),
+        ]
+        self.assertEqual(len({key, *variants}), 5)
+
+    def test_parameters_are_canonical_json(self):
+        """Test set order is normalized and values without a JSON form are rejected."""
+        config = BenchmarkConfig()
+
+        def key(parameters):
+            return fingerprint(config, "objective", [Task(objective="a", parameters=parameters)])
+
+        self.assertEqual(key({"tags": {"b", "a", "c"}}), key({"tags": frozenset("cab")}))
+        self.assertEqual(key({"strategy": StrategyType.RESEARCH}), key({"strategy": "research"}))
+        with self.assertRaises(TypeError):
+            key({"handle": object()})
+        with self.assertRaises(TypeError):
+            key({("a", "b"): 1})
+
+
+class TestResultCache(unittest.TestCase):
+    """Test ResultCache storage, expiry and eviction."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.cache = ResultCache(Path(self.tmp.name))
+        self.addCleanup(self.cache.close)
+
+    def test_persistence_and_stats(self):
+        """Test values and counters survive reopening the cache."""
+        self.assertIsNone(self.cache.get("k"))
+        self.cache.put("k", {"benchmark_id": "b1", "results": [1, 2]}, strategy="research")
+        self.assertEqual(self.cache.get("k"), {"benchmark_id": "b1", "results": [1, 2]})
+        self.cache.close()
+
+        reopened = ResultCache(Path(self.tmp.name))
+        self.addCleanup(reopened.close)
+        self.assertEqual(reopened.get("k")["benchmark_id"], "b1")
+        stats = reopened.stats()
+        self.assertEqual((stats["entries"], stats["hits"], stats["misses"]), (1, 2, 1))
+
+    def test_ttl_and_invalidation(self):
+        """Test expired entries miss and filters delete only matching entries."""
+        self.cache.put("old", 1, ttl=0.01)
+        self.cache.put("a", 2, strategy="research", mode="mesh")
+        self.cache.put("b", 3, strategy="research", mode="centralized")
+        self.cache.put("c", 4, strategy="development", mode="mesh")
+        time.sleep(0.02)
+
+        self.assertIsNone(self.cache.get("old"))
+        self.assertEqual(self.cache.invalidate(strategy="research", mode="mesh"), 1)
+        self.assertEqual(self.cache.invalidate(strategy="research"), 1)
+        self.assertEqual(self.cache.get("c"), 4)
+        self.assertEqual(self.cache.clear(), 1)
+        self.assertEqual(self.cache.stats()["hits"], 0)
+
+    def test_lru_eviction(self):
+        """Test the least recently used entries go first once over max_bytes."""
+        cache = ResultCache(Path(self.tmp.name) / "small.db", max_bytes=250)
+        self.addCleanup(cache.close)
+        for key in ("a", "b", "c"):
+            cache.put(key, "x" * 100)
+            time.sleep(0.01)
+        self.assertIsNone(cache.get("a"))
+
+        cache.get("b")
+        time.sleep(0.01)
+        cache.put("d", "x" * 100)
+        self.assertIsNone(cache.get("c"))
+        self.assertIsNotNone(cache.get("b"))
+        self.assertEqual(cache.stats()["evictions"], 2)
+
+    def test_async_calls_leave_the_event_loop(self):
+        """Test the async methods run the database calls on another thread."""
+        threads = []
+        get = self.cache.get
+
+        def recording_get(key):
+            threads.append(threading.current_thread())
+            return get(key)
+
+        self.cache.get = recording_get
+
+        async def main():
+            await self.cache.put_async("k", [1], strategy="research")
+            value = await self.cache.get_async("k")
+            stats = await self.cache.stats_async()
+            return value, stats, threading.current_thread()
+
+        value, stats, loop_thread = asyncio.run(main())
+        self.assertEqual(value, [1])
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], loop_thread)
+
+
+class TestOptimizedEngineCache(unittest.TestCase):
+    """Test OptimizedBenchmarkEngine reuses cached results across instances."""
+
+    def test_rerun_is_cached(self):
+        """Test an unchanged rerun is served from the cache and a changed one is not."""
+        with tempfile.TemporaryDirectory() as tmp:
+            def run(**overrides):
+                config = BenchmarkConfig(output_directory=tmp, output_formats=[], **overrides)
+                engine = OptimizedBenchmarkEngine(config, claude_flow_version="test")
+                try:
+                    return asyncio.run(engine.run_benchmark("Analyze data"))
+                finally:
+                    engine.result_cache.close()
+
+            first = run()
+            second = run()
+            third = run(max_agents=2)
+
+            self.assertFalse(first.get("cached", False))
+            self.assertTrue(second["cached"])
+            self.assertEqual(second["benchmark_id"], first["benchmark_id"])
+            self.assertFalse(third.get("cached", False))
+
+            runner = CliRunner()
+            result = runner.invoke(cli, ["cache", "invalidate", "--strategy", "auto",
+                                         "--output-dir", tmp])
+            self.assertIn("Invalidated 2 cached results", result.output)
+            result = runner.invoke(cli, ["cache", "stats", "--format", "json", "--output-dir", tmp])
+            self.assertIn('"entries": 0', result.output)
+
+
+if __name__ == "__main__":
+    unittest.main()
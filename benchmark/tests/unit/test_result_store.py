@@ -0,0 +1,91 @@
+"""Unit tests for the columnar result store."""
+
+import unittest
+from datetime import datetime, timezone
+
+from swarm_benchmark.core.models import (
+    Result, ResultStatus, PerformanceMetrics, QualityMetrics, ResourceUsage
+)
+from swarm_benchmark.core.result_store import ResultStore, ResultRow
+
+
+def _result(**overrides):
+    values = dict(
+        task_id="task-1",
+        agent_id="agent-1",
+        status=ResultStatus.SUCCESS,
+        performance_metrics=PerformanceMetrics(execution_time=1.25, retry_count=2),
+        quality_metrics=QualityMetrics(overall_quality=0.9, review_score=0.5),
+        resource_usage=ResourceUsage(peak_memory_mb=128.0, network_bytes_sent=4096),
+        started_at=datetime(2024, 5, 1, 12, 0, 0, 123456),
+        completed_at=datetime(2024, 5, 1, 12, 0, 1, 654321),
+    )
+    values.update(overrides)
+    return Result(**values)
+
+
+class TestResultStore(unittest.TestCase):
+    """Test ResultStore and ResultRow."""
+
+    def test_round_trip(self):
+        """Test stored rows materialize back to equal results."""
+        results = [
+            _result(),
+            _result(id="not-a-uuid", status=ResultStatus.ERROR, errors=["boom"],
+                    output={"answer": 42}, started_at=None, completed_at=None),
+            _result(created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+                    quality_metrics=QualityMetrics()),
+        ]
+        store = ResultStore()
+        store.extend(results)
+
+        self.assertEqual(len(store), 3)
+        self.assertEqual(store.to_results(), results)
+        for row, result in zip(store, results):
+            self.assertIsInstance(row, ResultRow)
+            self.assertEqual(row, result)
+        self.assertIsNone(store[2].quality_metrics.review_score)
+        self.assertIsInstance(store[0].performance_metrics.retry_count, int)
+        self.assertEqual(store[-1].created_at.tzinfo, timezone.utc)
+
+    def test_row_view_writes_through(self):
+        """Test mutations through a row view are stored."""
+        store = ResultStore()
+        row = store.append(_result())
+
+        row.status = ResultStatus.TIMEOUT
+        row.agent_id = "agent-2"
+        row.performance_metrics.execution_time = 3.5
+        row.resource_usage.cpu_percent = 40.0
+        row.errors.append("late")
+        row.completed_at = None
+
+        again = store[0]
+        self.assertEqual(again.status, ResultStatus.TIMEOUT)
+        self.assertEqual(again.agent_id, "agent-2")
+        self.assertEqual(again.performance_metrics.execution_time, 3.5)
+        self.assertEqual(again.resource_usage.cpu_percent, 40.0)
+        self.assertEqual(again.errors, ["late"])
+        self.assertIsNone(again.duration())
+        with self.assertRaises(AttributeError):
+            again.performance_metrics.not_a_metric
+
+    def test_columns_and_lazy_allocation(self):
+        """Test numeric columns are exposed and untouched columns stay empty."""
+        store = ResultStore()
+        for i in range(100):
+            store.append(Result(performance_metrics=PerformanceMetrics(execution_time=i / 10)))
+
+        times = store.column("execution_time")
+        self.assertEqual(len(times), 100)
+        self.assertAlmostEqual(float(times[55]), 5.5)
+        self.assertEqual(list(store.column("resource_usage.cpu_percent")), [0.0] * 100)
+        self.assertIsNone(store._metrics["resource_usage.cpu_percent"].data)
+        with self.assertRaises(KeyError):
+            store.column("unknown")
+        with self.assertRaises(IndexError):
+            store[100]
+
+
+if __name__ == "__main__":
+    unittest.main()
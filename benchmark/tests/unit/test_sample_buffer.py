@@ -0,0 +1,90 @@
+"""Unit tests for tiered metric sample storage."""
+
+import json
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+from swarm_benchmark.metrics.performance_collector import PerformanceCollector, ProcessMetrics
+from swarm_benchmark.metrics.sample_buffer import TieredSampleBuffer
+
+
+class TestTieredSampleBuffer(unittest.TestCase):
+    """Test TieredSampleBuffer downsampling."""
+
+    def test_bounded_and_downsampled(self):
+        """Test old samples fold into 1 s and 10 s rows within fixed capacity."""
+        buffer = TieredSampleBuffer(capacity=10)
+        for i in range(1000):
+            buffer.append(timestamp=1000 + i * 0.05, cpu_percent=float(i % 10),
+                          memory_mb=500.0 if i == 3 else 100.0, disk_read_bytes=i * 10)
+
+        rows = list(buffer.rows())
+        self.assertLessEqual(len(buffer), 3 * 10 + 2)
+        self.assertEqual(len(rows), len(buffer))
+        self.assertEqual(buffer.sample_count, 1000)
+        self.assertEqual(buffer.peak_memory_mb, 500.0)
+        self.assertAlmostEqual(buffer.cpu_percent_sum / buffer.sample_count, 4.5)
+        self.assertEqual(buffer.last["disk_read_bytes"] - buffer.first["disk_read_bytes"], 9990)
+
+        timestamps = [row["timestamp"] for row in rows]
+        self.assertEqual(timestamps, sorted(timestamps))
+        self.assertEqual({row["samples"] for row in rows[-10:]}, {1.0})
+        self.assertIn(20.0, {row["samples"] for row in rows})
+        self.assertTrue(any(row["samples"] > 20 for row in rows))
+
+        one_second = next(row for row in rows if row["samples"] == 20)
+        self.assertAlmostEqual(one_second["cpu_percent"], 4.5)
+        self.assertEqual([row["timestamp"] for row in buffer.tail(3)], timestamps[-3:])
+
+
+class TestPerformanceCollectorBuffer(unittest.TestCase):
+    """Test PerformanceCollector summaries from the tiered buffer."""
+
+    def _samples(self, count: int):
+        start = datetime(2024, 5, 1, 12, 0, 0)
+        for i in range(count):
+            yield SimpleNamespace(
+                timestamp=start + timedelta(milliseconds=50 * i),
+                duration_ms=1.0,
+                processes=[ProcessMetrics(pid=1, name="a", cpu_percent=10.0, memory_mb=50.0 + i % 7),
+                           ProcessMetrics(pid=2, name="b", cpu_percent=5.0, memory_mb=25.0)],
+                system_metrics={"network_io": {"bytes_sent": 1000 + i, "bytes_recv": 0},
+                                "disk_io": {"read_bytes": 0, "write_bytes": 2 * i}}
+            )
+
+    def test_summaries_survive_downsampling(self):
+        """Test detailed and raw summaries with more samples than capacity."""
+        collector = PerformanceCollector(buffer_capacity=50)
+        collector._start_time = 0.0
+        for sample in self._samples(2000):
+            collector.record_sample(sample)
+
+        detailed = collector.get_detailed_metrics()
+        self.assertEqual(detailed["summary"]["sample_count"], 2000)
+        self.assertEqual(len(detailed["intervals"]), 100)
+        last = detailed["intervals"][-1]
+        self.assertEqual(last["timestamp"], "2024-05-01T12:01:39.950000")
+        self.assertEqual(last["process_count"], 2)
+        self.assertEqual(last["total_cpu_percent"], 15.0)
+        self.assertEqual(collector._counter_delta("net_bytes_sent"), 1999)
+        self.assertEqual(collector._counter_delta("disk_write_bytes"), 3998)
+        self.assertEqual(collector._counter_delta("disk_read_bytes"), 0)
+        self.assertLessEqual(len(collector._metrics_buffer), 3 * 50 + 2)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "raw.json"
+            collector.save_raw_metrics(path)
+            raw = json.loads(path.read_text())
+
+        self.assertEqual(raw["collection_info"]["sample_count"], 2000)
+        self.assertEqual(raw["intervals"][-1]["processes"][0]["name"], "a")
+        self.assertEqual(raw["intervals"][-1]["system"]["network_io"]["bytes_sent"], 2999)
+        self.assertGreater(raw["intervals"][0]["samples"], 1)
+        self.assertEqual(raw["intervals"][0]["peak_memory_mb"], 81.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+"""Unit tests for the shared sampling daemon."""
+
+import subprocess
+import sys
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+import psutil
+
+from swarm_benchmark.metrics.process_tracker import ProcessTracker
+from swarm_benchmark.metrics.sampler import SamplerSubscription, SamplingDaemon
+
+
+# Parent that spawns a sleeping child so the tracked tree has two processes
+TREE_SCRIPT = (
+    "import subprocess, sys, time; "
+    "child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(5)']); "
+    "time.sleep(5)"
+)
+
+
+# Three generations: the parent, a child and a grandchild
+NESTED_SCRIPT = (
+    "import subprocess, sys, time; "
+    "child = subprocess.Popen([sys.executable, '-c', %r]); "
+    "time.sleep(5)"
+) % TREE_SCRIPT
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestSamplingDaemon(unittest.TestCase):
+    """Test SamplingDaemon and its use by ProcessTracker."""
+
+    def setUp(self):
+        self.sampler = SamplingDaemon()
+
+    def tearDown(self):
+        self.sampler.stop()
+
+    def _spawn_tree(self, script: str = TREE_SCRIPT) -> subprocess.Popen:
+        process = subprocess.Popen([sys.executable, "-c", script])
+
+        def cleanup():
+            if process.poll() is None:
+                for child in psutil.Process(process.pid).children(recursive=True):
+                    child.kill()
+                process.kill()
+            process.wait()
+
+        self.addCleanup(cleanup)
+        return process
+
+    def test_fans_out_process_trees(self):
+        """Test subscriptions share ticks and see child processes."""
+        process = self._spawn_tree()
+        tree = self.sampler.register(process.pid, interval=0.02)
+        root_only = self.sampler.register(process.pid, interval=0.02, include_children=False,
+                                          system=False, io=True)
+
+        self.assertTrue(_wait_for(lambda: any(len(s.processes) == 2 for s in tree.samples)))
+        self.assertTrue(_wait_for(lambda: len(root_only.samples) > 0))
+
+        sample = root_only.samples[-1]
+        self.assertEqual([pm.pid for pm in sample.processes], [process.pid])
+        self.assertEqual(sample.system_metrics, {})
+        self.assertIn("cpu", tree.samples[-1].system_metrics)
+        self.assertEqual(
+            [t.name for t in threading.enumerate()].count("swarm-benchmark-sampler"), 1
+        )
+
+        tree.close()
+        self.assertFalse(tree.active)
+        count = len(tree.samples)
+        time.sleep(0.1)
+        self.assertEqual(len(tree.samples), count)
+        self.assertTrue(root_only.active)
+
+    def test_tree_follows_descendants_of_live_root(self):
+        """Test trees include grandchildren and shrink to the root once it is gone."""
+        process = self._spawn_tree(NESTED_SCRIPT)
+
+        def tree():
+            return self.sampler._tree(process.pid, self.sampler._children_map())
+
+        self.assertTrue(_wait_for(lambda: len(tree()) == 3))
+        descendants = psutil.Process(process.pid).children(recursive=True)
+        self.assertEqual(tree(), [process.pid] + [p.pid for p in descendants])
+
+        for child in descendants:
+            child.kill()
+        process.kill()
+        process.wait()
+        self.assertEqual(tree(), [process.pid])
+
+    def test_one_process_listing_per_tick(self):
+        """Test a tick lists processes once however many roots are due."""
+        processes = [self._spawn_tree() for _ in range(3)]
+        self.assertTrue(_wait_for(lambda: all(
+            len(psutil.Process(p.pid).children()) == 1 for p in processes)))
+        # Added directly so the sampler thread does not tick concurrently
+        subscriptions = [
+            SamplerSubscription(self.sampler, p.pid, 0.05, None, True, False, False, 10)
+            for p in processes
+        ]
+        self.sampler._subscriptions.update(subscriptions)
+
+        with patch("psutil.process_iter", wraps=psutil.process_iter) as process_iter, \
+                patch.object(psutil.Process, "children", side_effect=AssertionError("rescan")):
+            self.sampler.sample(subscriptions)
+
+        self.assertEqual(process_iter.call_count, 1)
+        for subscription in subscriptions:
+            self.assertEqual(len(subscription.samples[-1].processes), 2)
+
+    def test_process_tracker_uses_shared_sampler(self):
+        """Test commands register with the sampler instead of starting threads."""
+        tracker = ProcessTracker(claude_flow_path=sys.executable, sampler=self.sampler)
+        before = self._thread_count()
+
+        result = tracker.execute_command(["-c", "import time; time.sleep(0.3)"])
+
+        self.assertTrue(result.success)
+        self.assertGreater(self.sampler.tick_count, 0)
+        self.assertGreater(result.resource_usage.peak_memory_mb, 0)
+        self.assertFalse(self.sampler._subscriptions)
+        # Only the sampler thread itself may have been started
+        self.assertLessEqual(self._thread_count(), before + 1)
+
+    @staticmethod
+    def _thread_count() -> int:
+        # asyncio's child watcher threads exit just after the process is reaped
+        return sum(1 for t in threading.enumerate() if "waitpid-" not in t.name)
+
+
+if __name__ == "__main__":
+    unittest.main()
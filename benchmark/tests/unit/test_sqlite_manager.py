@@ -0,0 +1,185 @@
+"""Unit tests for the SQLite output manager."""
+
+import asyncio
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from swarm_benchmark.core.models import (
+    Benchmark, BenchmarkConfig, PerformanceMetrics, ResourceUsage, Result, ResultStatus,
+    StrategyType, Task
+)
+from swarm_benchmark.output.sqlite_manager import SQLiteManager, SCHEMA_VERSION
+
+
+def _benchmark(name: str = "sqlite-test", results: int = 3) -> Benchmark:
+    benchmark = Benchmark(name=name)
+    for i in range(results):
+        task = Task(objective=f"objective {i}")
+        benchmark.add_task(task)
+        benchmark.add_result(Result(task_id=task.id, agent_id=f"agent-{i % 2}",
+                                    status=ResultStatus.SUCCESS))
+    return benchmark
+
+
+class TestSQLiteManager(unittest.TestCase):
+    """Test SQLiteManager persistence."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _count(self, db_path: Path, table: str) -> int:
+        with sqlite3.connect(db_path) as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def test_save_and_query(self):
+        """Test a saved benchmark can be read back."""
+        benchmark = _benchmark()
+
+        async def run_test():
+            async with SQLiteManager() as manager:
+                db_path = await manager.save_benchmark(benchmark, self.output_dir)
+                stored = await manager.get_benchmark(benchmark.id)
+                listed = await manager.query_benchmarks(strategy="auto")
+            return db_path, stored, listed
+
+        db_path, stored, listed = asyncio.run(run_test())
+
+        self.assertEqual(stored["name"], "sqlite-test")
+        self.assertEqual([row["id"] for row in listed], [benchmark.id])
+        self.assertEqual(self._count(db_path, "tasks"), 3)
+        self.assertEqual(self._count(db_path, "results"), 3)
+        with sqlite3.connect(db_path) as conn:
+            self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+            self.assertEqual(conn.execute("PRAGMA user_version").fetchone()[0], SCHEMA_VERSION)
+
+    def test_background_writer_groups_concurrent_saves(self):
+        """Test queued saves from concurrent benchmarks are all committed."""
+        benchmarks = [_benchmark(f"bench-{i}", results=10) for i in range(20)]
+
+        async def run_test():
+            async with SQLiteManager(max_group_size=8) as manager:
+                futures = [await manager.submit_benchmark(b, self.output_dir) for b in benchmarks]
+                return await asyncio.gather(*futures)
+
+        paths = asyncio.run(run_test())
+
+        self.assertEqual(len(set(paths)), 1)
+        self.assertEqual(self._count(paths[0], "benchmarks"), 20)
+        self.assertEqual(self._count(paths[0], "results"), 200)
+
+    def test_resave_replaces_rows(self):
+        """Test saving the same benchmark twice does not duplicate rows."""
+        benchmark = _benchmark()
+
+        async def run_test():
+            async with SQLiteManager() as manager:
+                await manager.save_benchmark(benchmark, self.output_dir)
+                benchmark.add_result(Result(task_id=benchmark.tasks[0].id))
+                return await manager.save_benchmark(benchmark, self.output_dir)
+
+        db_path = asyncio.run(run_test())
+
+        self.assertEqual(self._count(db_path, "benchmarks"), 1)
+        self.assertEqual(self._count(db_path, "results"), 4)
+
+    def test_aggregates_computed_in_sqlite(self):
+        """Test per-strategy and per-benchmark percentiles."""
+        research = Benchmark(name="research", config=BenchmarkConfig(strategy=StrategyType.RESEARCH))
+        for i in range(1, 101):
+            research.add_result(Result(
+                task_id="t", agent_id=f"agent-{i % 2}",
+                status=ResultStatus.SUCCESS if i <= 90 else ResultStatus.FAILURE,
+                performance_metrics=PerformanceMetrics(execution_time=float(i)),
+                resource_usage=ResourceUsage(peak_memory_mb=float(i * 2)),
+            ))
+        analysis = _benchmark("analysis")
+        analysis.config = BenchmarkConfig(strategy=StrategyType.ANALYSIS)
+
+        async def run_test():
+            async with SQLiteManager() as manager:
+                await manager.save_benchmark(research, self.output_dir)
+                await manager.save_benchmark(analysis, self.output_dir)
+                by_strategy = await manager.aggregate_results(group_by="strategy")
+                listed = await manager.query_benchmarks(strategy="research")
+                detail = await manager.get_benchmark(research.id)
+            return by_strategy, listed, detail
+
+        by_strategy, listed, detail = asyncio.run(run_test())
+
+        stats = {row["strategy"]: row for row in by_strategy}
+        self.assertEqual(stats["research"]["results"], 100)
+        self.assertAlmostEqual(stats["research"]["success_rate"], 0.9)
+        self.assertEqual(stats["research"]["p50_execution_time"], 50.0)
+        self.assertEqual(stats["research"]["p95_execution_time"], 95.0)
+        self.assertEqual(stats["research"]["peak_memory_mb"], 200.0)
+        self.assertEqual(stats["analysis"]["results"], 3)
+        self.assertIsNone(stats["analysis"]["p50_execution_time"])
+        self.assertEqual(listed[0]["result_stats"]["p95_execution_time"], 95.0)
+        self.assertEqual(detail["result_stats"]["max_execution_time"], 100.0)
+        self.assertEqual([row["agent_id"] for row in detail["agent_stats"]], ["agent-0", "agent-1"])
+        with self.assertRaises(ValueError):
+            asyncio.run(SQLiteManager().aggregate_results(group_by="objective"))
+
+    def test_migrates_json_metric_columns(self):
+        """Test a schema-1 database with JSON metric blobs is migrated in place."""
+        db_path = self.output_dir / "benchmark_results.db"
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("""
+                CREATE TABLE benchmarks (
+                    id TEXT PRIMARY KEY, name TEXT NOT NULL, description TEXT,
+                    status TEXT NOT NULL, strategy TEXT NOT NULL, mode TEXT NOT NULL,
+                    config TEXT, metrics TEXT, created_at TEXT NOT NULL, started_at TEXT,
+                    completed_at TEXT, duration REAL, error_log TEXT, metadata TEXT
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE results (
+                    id TEXT PRIMARY KEY, benchmark_id TEXT NOT NULL, task_id TEXT NOT NULL,
+                    agent_id TEXT NOT NULL, status TEXT NOT NULL, output TEXT, errors TEXT,
+                    warnings TEXT, performance_metrics TEXT, quality_metrics TEXT,
+                    resource_usage TEXT, execution_details TEXT, created_at TEXT NOT NULL,
+                    started_at TEXT, completed_at TEXT, duration REAL
+                )
+            """)
+            conn.execute("CREATE INDEX idx_results_benchmark_id ON results (benchmark_id)")
+            conn.execute(
+                "INSERT INTO benchmarks (id, name, status, strategy, mode, created_at) "
+                "VALUES ('b1', 'legacy', 'completed', 'auto', 'centralized', '2024-01-01T00:00:00')"
+            )
+            conn.execute(
+                "INSERT INTO results VALUES ('r1', 'b1', 't1', 'a1', 'success', '{}', '[]', '[]', ?, ?, ?, "
+                "'{}', '2024-01-01T00:00:00', NULL, NULL, NULL)",
+                ('{"execution_time": 2.5, "retry_count": 1}',
+                 '{"overall_quality": 0.75, "review_score": null}',
+                 '{"peak_memory_mb": 64.0}')
+            )
+
+        async def run_test():
+            async with SQLiteManager(db_path) as manager:
+                return await manager.get_benchmark("b1")
+
+        detail = asyncio.run(run_test())
+
+        self.assertEqual(detail["result_stats"]["p50_execution_time"], 2.5)
+        with sqlite3.connect(db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            row = conn.execute("SELECT * FROM results WHERE id = 'r1'").fetchone()
+            indexes = {r[1] for r in conn.execute("PRAGMA index_list(results)")}
+            self.assertEqual(conn.execute("PRAGMA user_version").fetchone()[0], SCHEMA_VERSION)
+        self.assertEqual(row["retry_count"], 1)
+        self.assertEqual(row["overall_quality"], 0.75)
+        self.assertIsNone(row["review_score"])
+        self.assertEqual(row["peak_memory_mb"], 64.0)
+        self.assertNotIn("performance_metrics", row.keys())
+        self.assertTrue({"idx_results_benchmark_status", "idx_results_agent_id",
+                         "idx_results_execution_time"} <= indexes)
+
+
+if __name__ == "__main__":
+    unittest.main()
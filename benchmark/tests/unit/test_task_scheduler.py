@@ -0,0 +1,412 @@
+"""Unit tests for task scheduling and work stealing."""
+
+import asyncio
+import itertools
+import random
+import time
+import unittest
+from typing import Dict, List
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+from swarm_benchmark.core.models import (
+    Agent, AgentStatus, AgentType, Result, ResultStatus, StrategyType, Task, TaskStatus
+)
+from swarm_benchmark.core.parallel_executor import ExecutionMode, ParallelExecutor, ResourceLimits
+from swarm_benchmark.core.task_scheduler import SchedulingAlgorithm, TaskScheduler, _min_cost_assignment
+
+
+class SleepingExecutor(ParallelExecutor):
+    """Executor whose tasks sleep for the seconds in their parameters."""
+    
+    async def _execute_task(self, task: Task) -> Result:
+        await asyncio.sleep(task.parameters["sleep"])
+        return Result(task_id=task.id, status=ResultStatus.SUCCESS)
+
+
+class LegacyScheduler(TaskScheduler):
+    """The original O(tasks x agents) algorithms, kept as a reference."""
+    
+    def _schedule_capability_based(self, 
+                                 tasks: List[Task], 
+                                 agents: List[Agent]) -> Dict[Agent, List[Task]]:
+        """Schedule based on agent capabilities."""
+        assignments = {agent: [] for agent in agents}
+        unassigned_tasks = []
+        
+        for task in tasks:
+            # Get required capabilities for task
+            required_caps = self.strategy_capabilities.get(task.strategy, set())
+            
+            # Find best matching agent
+            best_agent = None
+            best_score = -1
+            
+            for agent in agents:
+                agent_caps = self.agent_capabilities.get(agent.id, set())
+                
+                # Calculate capability match score
+                if not required_caps:
+                    score = 1.0  # No specific requirements
+                else:
+                    matching_caps = agent_caps.intersection(required_caps)
+                    score = len(matching_caps) / len(required_caps)
+                
+                # Consider workload
+                workload_factor = 1.0 / (1 + self.agent_workload[agent.id])
+                final_score = score * workload_factor
+                
+                if final_score > best_score:
+                    best_score = final_score
+                    best_agent = agent
+            
+            if best_agent and best_score > 0:
+                assignments[best_agent].append(task)
+                self.agent_workload[best_agent.id] += 1
+            else:
+                unassigned_tasks.append(task)
+        
+        # Distribute unassigned tasks using least loaded
+        if unassigned_tasks:
+            remaining_assignments = self._schedule_least_loaded(unassigned_tasks, agents)
+            for agent, tasks in remaining_assignments.items():
+                assignments[agent].extend(tasks)
+        
+        return assignments
+    
+    def _schedule_priority_based(self, 
+                               tasks: List[Task], 
+                               agents: List[Agent]) -> Dict[Agent, List[Task]]:
+        """Schedule high-priority tasks to best agents."""
+        assignments = {agent: [] for agent in agents}
+        
+        # Rank agents by performance
+        ranked_agents = sorted(agents, key=lambda a: (
+            a.success_rate,
+            -a.average_execution_time,
+            a.total_tasks_completed
+        ), reverse=True)
+        
+        # Assign high-priority tasks to best agents
+        agent_index = 0
+        for task in tasks:
+            if task.priority >= 5:  # High priority threshold
+                # Assign to best available agent
+                agent = ranked_agents[agent_index % len(ranked_agents)]
+                agent_index += 1
+            else:
+                # Use least loaded for normal priority
+                min_load = min(self.agent_workload[a.id] for a in agents)
+                agent = next(a for a in agents if self.agent_workload[a.id] == min_load)
+            
+            assignments[agent].append(task)
+            self.agent_workload[agent.id] += 1
+        
+        return assignments
+    
+    def _schedule_dynamic(self, 
+                        tasks: List[Task], 
+                        agents: List[Agent]) -> Dict[Agent, List[Task]]:
+        """Dynamic scheduling based on multiple factors."""
+        assignments = {agent: [] for agent in agents}
+        
+        for task in tasks:
+            # Calculate scores for each agent
+            agent_scores = []
+            
+            for agent in agents:
+                # Capability match
+                required_caps = self.strategy_capabilities.get(task.strategy, set())
+                agent_caps = self.agent_capabilities.get(agent.id, set())
+                
+                if required_caps:
+                    cap_score = len(agent_caps.intersection(required_caps)) / len(required_caps)
+                else:
+                    cap_score = 0.5  # Neutral score
+                
+                # Workload balance
+                avg_workload = sum(self.agent_workload.values()) / len(agents)
+                workload_score = 1.0 - (self.agent_workload[agent.id] / (avg_workload + 1))
+                
+                # Performance history
+                perf_score = agent.success_rate
+                
+                # Combine scores with weights
+                total_score = (
+                    0.4 * cap_score +
+                    0.3 * workload_score +
+                    0.3 * perf_score
+                )
+                
+                agent_scores.append((total_score, agent))
+            
+            # Select best agent
+            agent_scores.sort(reverse=True)
+            best_agent = agent_scores[0][1]
+            
+            assignments[best_agent].append(task)
+            self.agent_workload[best_agent.id] += 1
+        
+        return assignments
+
+
+def _corpus(seed: int, agent_count: int, task_count: int, distinct_rates: bool):
+    """Random agents (with prior workload) and tasks for a fixed seed."""
+    rng = random.Random(seed)
+    agents = []
+    for i in range(agent_count):
+        agent = Agent(id=f"agent-{i:04d}", type=rng.choice(list(AgentType)))
+        if rng.random() < 0.3:
+            agent.capabilities = rng.sample(
+                ["research", "analysis", "coding", "testing", "profiling", "review"], 2
+            )
+        agent.success_rate = rng.random() if distinct_rates else rng.choice([0.5, 0.9, 1.0])
+        agent.average_execution_time = rng.choice([1.0, 2.0])
+        agent.total_tasks_completed = rng.randrange(3)
+        agents.append(agent)
+    tasks = [
+        Task(id=f"task-{i:05d}", strategy=rng.choice(list(StrategyType)),
+             priority=rng.randrange(1, 10))
+        for i in range(task_count)
+    ]
+    workload = {agent.id: rng.randrange(4) for agent in agents}
+    return agents, tasks, workload
+
+
+class TestIndexedScheduling(unittest.TestCase):
+    """Test indexed algorithms against the original implementations."""
+    
+    def _compare(self, algorithm: str, distinct_rates: bool):
+        for seed in range(5):
+            agents, tasks, workload = _corpus(seed, 40, 400, distinct_rates)
+            outputs = []
+            for scheduler in (LegacyScheduler(), TaskScheduler()):
+                scheduler._initialize_agent_capabilities(agents)
+                scheduler.agent_workload.update(workload)
+                assignments = getattr(scheduler, algorithm)(tasks, agents)
+                outputs.append((
+                    {agent.id: [task.id for task in assigned] for agent, assigned in assignments.items()},
+                    dict(scheduler.agent_workload)
+                ))
+            self.assertEqual(outputs[0], outputs[1], f"seed {seed}")
+    
+    def test_capability_based_matches(self):
+        """Test capability-based scheduling, including score ties."""
+        self._compare("_schedule_capability_based", distinct_rates=False)
+    
+    def test_priority_based_matches(self):
+        """Test priority-based scheduling, including load ties."""
+        self._compare("_schedule_priority_based", distinct_rates=False)
+    
+    def test_dynamic_matches(self):
+        """Test dynamic scheduling (the original cannot break score ties)."""
+        self._compare("_schedule_dynamic", distinct_rates=True)
+    
+    def test_dynamic_ties_go_to_earliest_agent(self):
+        """Test identical agents share dynamic work in list order."""
+        scheduler = TaskScheduler(algorithm=SchedulingAlgorithm.DYNAMIC, enable_work_stealing=False)
+        agents = [Agent(id=f"a{i}", type=AgentType.DEVELOPER) for i in range(3)]
+        tasks = [Task(strategy=StrategyType.DEVELOPMENT) for _ in range(4)]
+        
+        assignments = scheduler.schedule_tasks(tasks, agents)
+        
+        self.assertEqual([len(assignments[agent]) for agent in agents], [2, 1, 1])
+        self.assertIs(assignments[agents[0]][0], tasks[0])
+
+
+@unittest.skipIf(np is None, "requires numpy")
+class TestBatchedDynamicScheduling(unittest.TestCase):
+    """Test the vectorized DYNAMIC scheduling mode."""
+    
+    def _schedule(self, agents, tasks, workload, **options):
+        scheduler = TaskScheduler(algorithm=SchedulingAlgorithm.DYNAMIC,
+                                  enable_work_stealing=False, **options)
+        scheduler.agent_workload.update(workload)
+        assignments = scheduler.schedule_tasks(tasks, agents)
+        return scheduler, assignments
+    
+    def _chunk_score(self, scheduler, agents, workload, assignments) -> float:
+        """Sum of the scores the chunk's tasks were assigned with."""
+        avg_workload = sum(workload.values()) / len(agents)
+        total = 0.0
+        for agent, assigned in assignments.items():
+            for slot, task in enumerate(assigned):
+                required = scheduler.strategy_capabilities.get(task.strategy, set())
+                capability = (len(scheduler.agent_capabilities[agent.id] & required) / len(required)
+                              if required else 0.5)
+                total += (0.4 * capability +
+                          0.3 * (1.0 - (workload[agent.id] + slot) / (avg_workload + 1)) +
+                          0.3 * agent.success_rate)
+        return total
+    
+    def test_single_task_chunks_match_dynamic(self):
+        """Test chunks of one task reproduce the scalar algorithm exactly."""
+        for seed in range(5):
+            agents, tasks, workload = _corpus(seed, 40, 400, distinct_rates=False)
+            outputs = []
+            for options in ({}, {"batch_size": 1}):
+                scheduler, assignments = self._schedule(agents, tasks, workload, **options)
+                outputs.append((
+                    {agent.id: [task.id for task in assigned] for agent, assigned in assignments.items()},
+                    dict(scheduler.agent_workload)
+                ))
+            self.assertEqual(outputs[0], outputs[1], f"seed {seed}")
+    
+    def test_single_task_chunks_match_dynamic_with_unavailable_agent(self):
+        """Test parity when an agent filtered out as unavailable still carries workload."""
+        agents, tasks, workload = _corpus(3, 20, 200, distinct_rates=False)
+        offline = Agent(id="offline", status=AgentStatus.OFFLINE)
+        workload[offline.id] = 50
+        outputs = []
+        for options in ({}, {"batch_size": 1}):
+            scheduler, assignments = self._schedule(agents + [offline], tasks, workload, **options)
+            outputs.append((
+                {agent.id: [task.id for task in assigned] for agent, assigned in assignments.items()},
+                dict(scheduler.agent_workload)
+            ))
+        self.assertNotIn(offline.id, outputs[0][0])
+        self.assertEqual(outputs[0], outputs[1])
+    
+    def test_chunks_assign_every_task_once(self):
+        """Test greedy and optimal chunks place each task on one agent."""
+        agents, tasks, workload = _corpus(7, 30, 500, distinct_rates=False)
+        for optimal in (False, True):
+            scheduler, assignments = self._schedule(agents, tasks, workload,
+                                                    batch_size=64, optimal=optimal)
+            placed = [task.id for assigned in assignments.values() for task in assigned]
+            self.assertCountEqual(placed, [task.id for task in tasks])
+            self.assertEqual(sum(scheduler.agent_workload.values()),
+                             sum(workload.values()) + len(tasks))
+            for agent, assigned in assignments.items():
+                self.assertEqual(scheduler.agent_workload[agent.id], workload[agent.id] + len(assigned))
+    
+    def test_optimal_chunk_scores_at_least_greedy(self):
+        """Test a min-cost chunk never scores below the greedy fill."""
+        for seed in range(3):
+            agents, tasks, workload = _corpus(seed, 12, 60, distinct_rates=True)
+            scores = []
+            for optimal in (False, True):
+                scheduler, assignments = self._schedule(agents, tasks, workload,
+                                                        batch_size=len(tasks), optimal=optimal)
+                scores.append(self._chunk_score(scheduler, agents, workload, assignments))
+            self.assertGreaterEqual(scores[1], scores[0] - 1e-9, f"seed {seed}")
+    
+    def test_min_cost_assignment_matches_brute_force(self):
+        """Test the assignment solver on small rectangular matrices."""
+        rng = np.random.default_rng(0)
+        for _ in range(100):
+            rows = int(rng.integers(1, 5))
+            columns = int(rng.integers(rows, 7))
+            cost = rng.integers(0, 5, (rows, columns)).astype(float)
+            
+            assigned = _min_cost_assignment(cost)
+            
+            self.assertEqual(len(set(assigned)), rows)
+            best = min(sum(cost[row, column] for row, column in enumerate(permutation))
+                       for permutation in itertools.permutations(range(columns), rows))
+            self.assertAlmostEqual(cost[np.arange(rows), assigned].sum(), best)
+
+
+class TestWorkStealing(unittest.TestCase):
+    """Test TaskScheduler's per-agent deques."""
+    
+    def setUp(self):
+        self.scheduler = TaskScheduler(algorithm=SchedulingAlgorithm.ROUND_ROBIN)
+        self.agents = [Agent(name=f"agent-{i}") for i in range(3)]
+    
+    def test_owner_front_thief_back_of_busiest(self):
+        """Test owners take the front and thieves the back of the busiest deque."""
+        busy, lighter, idle = self.agents
+        busy_tasks = [Task(objective=f"busy{i}") for i in range(4)]
+        self.scheduler.enqueue(busy.id, busy_tasks)
+        self.scheduler.enqueue(lighter.id, [Task(objective="light0"), Task(objective="light1")])
+        
+        self.assertEqual(self.scheduler.next_task(busy).objective, "busy0")
+        self.assertEqual(self.scheduler.next_task(idle).objective, "busy3")
+        # Both peers hold two tasks; the tie goes to busy, whose back task is
+        # no longer pending, which leaves lighter as the busiest peer
+        busy_tasks[2].status = TaskStatus.RUNNING
+        self.assertEqual(self.scheduler.next_task(idle).objective, "light1")
+        self.assertEqual(self.scheduler.next_task(idle).objective, "busy1")
+        
+        metrics = self.scheduler.get_metrics()
+        self.assertEqual(metrics.steal_attempts, 3)
+        self.assertEqual(metrics.successful_steals, 3)
+        self.assertGreater(metrics.max_steal_latency, 0)
+        self.assertLessEqual(metrics.average_steal_latency, metrics.max_steal_latency)
+    
+    def test_no_stealing_when_disabled(self):
+        """Test agents only drain their own deque without work stealing."""
+        scheduler = TaskScheduler(enable_work_stealing=False)
+        scheduler.enqueue(self.agents[0].id, [Task()])
+        
+        self.assertIsNone(scheduler.next_task(self.agents[1]))
+        self.assertEqual(scheduler.get_metrics().steal_attempts, 0)
+    
+    def test_stolen_task_credits_thief(self):
+        """Test a stolen task names the thief as its agent and moves its expected load."""
+        busy, _, idle = self.agents
+        tasks = [Task(objective=f"t{i}") for i in range(2)]
+        for task in tasks:
+            task.assigned_agents.append(busy.id)
+            self.scheduler._expected_durations[task.id] = (busy.id, 2.0)
+        self.scheduler.agent_expected_load[busy.id] = 4.0
+        self.scheduler.enqueue(busy.id, tasks)
+        
+        stolen = self.scheduler.next_task(idle)
+        
+        self.assertIs(stolen, tasks[1])
+        self.assertEqual(stolen.assigned_agents, [idle.id])
+        self.assertEqual(tasks[0].assigned_agents, [busy.id])
+        self.assertEqual(self.scheduler.agent_expected_load[busy.id], 2.0)
+        self.assertEqual(self.scheduler.agent_expected_load[idle.id], 2.0)
+    
+    def test_schedule_tasks_leaves_deques_empty(self):
+        """Test only the executor path queues assignments, so no schedule lingers."""
+        for _ in range(2):
+            self.scheduler.schedule_tasks([Task(objective=f"t{i}") for i in range(6)], self.agents)
+        
+        self.assertFalse(any(self.scheduler.agent_queues.values()))
+        self.assertIsNone(self.scheduler.steal_work(self.agents[0]))
+
+
+class TestExecutorWorkStealing(unittest.TestCase):
+    """Test ParallelExecutor driving the scheduler's deques."""
+    
+    def test_skewed_workload_makespan(self):
+        """Test idle agents steal the long tasks piled on one agent."""
+        scheduler = TaskScheduler(algorithm=SchedulingAlgorithm.ROUND_ROBIN)
+        agents = [Agent(name=f"agent-{i}") for i in range(4)]
+        # Round robin puts every long task on the first agent
+        tasks = [Task(objective=f"t{i}", parameters={"sleep": 0.2 if i % 4 == 0 else 0.01})
+                 for i in range(16)]
+        assignments = scheduler.schedule_tasks(tasks, agents)
+        
+        async def run_test():
+            executor = SleepingExecutor(
+                mode=ExecutionMode.ASYNCIO,
+                limits=ResourceLimits(max_cpu_percent=1e9, max_memory_mb=1e9, max_concurrent_tasks=4)
+            )
+            await executor.start()
+            start = time.perf_counter()
+            results = await executor.execute_agent_queues(scheduler, agents, assignments)
+            elapsed = time.perf_counter() - start
+            await executor.stop()
+            return executor, results, elapsed
+        
+        executor, results, elapsed = asyncio.run(run_test())
+        
+        self.assertEqual(len(results), 16)
+        self.assertTrue(all(task.status == TaskStatus.COMPLETED for task in tasks))
+        self.assertEqual(executor.metrics.tasks_completed, 16)
+        # Without stealing the first agent alone needs 4 x 0.2 s
+        self.assertLess(elapsed, 0.5)
+        self.assertGreaterEqual(scheduler.get_metrics().successful_steals, 3)
+        self.assertFalse(any(scheduler.agent_queues.values()))
+
+
+if __name__ == "__main__":
+    unittest.main()